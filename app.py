@@ -1,13 +1,17 @@
-from flask import Flask, request, jsonify, render_template, send_from_directory, redirect, url_for
+from flask import Flask, request, jsonify, render_template, send_from_directory, redirect, url_for, Response, stream_with_context
 import logging
 import os
 from datetime import datetime
 from config import Config
 from models.university_data import get_university_database
-from models.data_crawler import UniversityDataCrawler
-from typing import Dict, Any
+from models.async_runner import async_runner
+from models.location_resolver import location_resolver, UNKNOWN_PROVINCES
+from models.website_resolver import website_resolver
+from models.recommendation_engine import normalize_province, unsupported_reason
+from models.json_response import JSONResponseLayer, dumps_text
+from typing import Dict, Any, Optional
 import json
-import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # 确保日志目录存在
 os.makedirs('logs', exist_ok=True)
@@ -25,12 +29,19 @@ logging.basicConfig(
 app = Flask(__name__)
 app.config.update(Config.APP)
 
-# 配置JSON编码，确保中文字符正确显示
+# 配置JSON编码，确保中文字符正确显示；使用紧凑JSON并按需压缩响应
 app.config['JSON_AS_ASCII'] = False
-app.config['JSONIFY_PRETTYPRINT_REGULAR'] = True
+json_response_layer = JSONResponseLayer(
+    compress_min_size=Config.RESPONSE['COMPRESS_MIN_SIZE'],
+    compress_level=Config.RESPONSE['COMPRESS_LEVEL'],
+    etag=Config.RESPONSE['ETAG']
+)
+json_response_layer.init_app(app, compact=Config.RESPONSE['COMPACT_JSON'])
 
 # 初始化数据库
 config = Config.get_data_source_config()
+config.update(Config.get_storage_config())
+config.update(Config.get_crawler_config())
 db = get_university_database(config)
 
 # 确保数据加载
@@ -41,6 +52,30 @@ try:
 except Exception as e:
     app.logger.error(f"数据加载失败: {e}")
 
+# 加载院校地理位置索引，位置缺失或有误的院校在后台解析
+try:
+    unresolved_count = location_resolver.ensure(db.get_all_universities())
+    app.logger.info(f"地理位置索引已就绪，后台解析{unresolved_count}所院校")
+except Exception as e:
+    app.logger.error(f"地理位置索引加载失败: {e}")
+
+# 官网索引的后台解析复用院校数据库的爬虫（共享HTTP缓存和抓取配置）
+website_resolver.crawler = db.crawler
+
+# 按配置在后台预热各省份的分数线缓存
+if Config.CACHE_WARMUP['ON_STARTUP']:
+    try:
+        from models.cache_warmer import cache_warmer
+        cache_warmer.start_background(
+            db.get_all_universities(),
+            phases=Config.CACHE_WARMUP['PHASES'],
+            years=Config.CACHE_WARMUP['YEARS'],
+            workers=Config.CACHE_WARMUP['WORKERS']
+        )
+        app.logger.info("已在后台启动分数线缓存预热")
+    except Exception as e:
+        app.logger.error(f"启动分数线缓存预热失败: {e}")
+
 # 添加API配置管理的导入
 try:
     from models.api_config import api_config_manager
@@ -69,9 +104,56 @@ def health_check():
         'data_sources': db.get_data_source_status()
     })
 
+# 院校列表接口分页的最大每页数量
+LISTING_MAX_LIMIT = 500
+LISTING_PARAMS = ('fields', 'sort', 'limit', 'offset')
+
+def _listing_params(source) -> Optional[Dict[str, Any]]:
+    """
+    解析院校列表接口的 fields/sort/limit/offset 参数
+    未提供任何参数时返回None（保持原有的完整字典格式）；参数无效时抛出ValueError
+    """
+    if not any(source.get(key) not in (None, '') for key in LISTING_PARAMS):
+        return None
+
+    fields = source.get('fields') or None
+    if isinstance(fields, str):
+        fields = [field.strip() for field in fields.split(',') if field.strip()]
+
+    error = f'limit须在1-{LISTING_MAX_LIMIT}之间，offset不能为负数'
+    limit = source.get('limit')
+    try:
+        limit = int(limit) if limit not in (None, '') else None
+        offset = int(source.get('offset') or 0)
+    except (TypeError, ValueError):
+        raise ValueError(error)
+    if (limit is not None and not 0 < limit <= LISTING_MAX_LIMIT) or offset < 0:
+        raise ValueError(error)
+
+    return {'fields': fields, 'sort': source.get('sort') or None, 'limit': limit, 'offset': offset}
+
+def _listing_response(universities: Dict[str, Any], params: Optional[Dict[str, Any]]):
+    """
+    返回院校列表：无分页参数时 data 为 {院校名称: 完整数据}；
+    有分页参数时 data 为按排序分页、投影后的列表，并附带 total/offset/limit/next_offset
+    """
+    if params is None:
+        return jsonify({
+            'success': True,
+            'count': len(universities),
+            'data': universities
+        })
+
+    page = db.page_universities(list(universities), **params)
+    return jsonify({
+        'success': True,
+        'count': len(page['data']),
+        **page
+    })
+
 @app.route('/api/universities')
 def get_universities():
-    """获取院校列表"""
+    """获取院校列表（支持 fields 字段投影、sort 排序和 limit/offset 分页）"""
     try:
         # 获取查询参数
         category = request.args.get('category', '')
@@ -79,24 +161,18 @@ def get_universities():
         university_type = request.args.get('type', '')
         keyword = request.args.get('keyword', '')
         
-        universities = db.get_all_universities()
+        params = _listing_params(request.args)
         
-        # 应用筛选条件
-        if keyword:
-            universities = db.search_universities(keyword)
-        elif category:
-            universities = db.get_universities_by_category(category)
-        elif province:
-            universities = db.get_universities_by_province(province)
-        elif university_type:
-            universities = db.get_universities_by_type(university_type)
+        # 应用筛选条件（多个条件同时满足）
+        universities = db.filter_universities(keyword, category, province, university_type)
         
-        return jsonify({
-            'success': True,
-            'count': len(universities),
-            'data': universities
-        })
+        return _listing_response(universities, params)
         
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
     except Exception as e:
         app.logger.error(f"获取院校列表失败: {e}")
         return jsonify({
@@ -237,23 +313,18 @@ def recommend_majors():
 
 @app.route('/api/statistics')
 def get_statistics():
-    """获取统计信息"""
+    """获取统计信息（统计结果增量维护，支持 If-None-Match 条件请求）"""
     try:
-        stats = db.get_statistics()
+        etag = db.get_statistics_etag()
+        if request.if_none_match.contains(etag):
+            return Response(status=304, headers={'ETag': f'"{etag}"'})
         
-        # 手动序列化JSON以确保中文字符正确显示
-        import json
-        json_str = json.dumps({
+        response = jsonify({
             'success': True,
-            'data': stats
-        }, ensure_ascii=False, indent=2)
-        
-        # 返回原始JSON字符串
-        from flask import Response
-        return Response(
-            json_str,
-            mimetype='application/json; charset=utf-8'
-        )
+            'data': db.get_statistics()
+        })
+        response.set_etag(etag)
+        return response
         
     except Exception as e:
         app.logger.error(f"获取统计信息失败: {e}")
@@ -376,9 +447,248 @@ def calculate_score_analysis(score: int, province: str, subject: str) -> Dict[st
         "tier_status": "超过一本线" if tier_difference > 0 else "未达一本线" if tier_difference < 0 else "达到一本线"
     }
 
+def _supplement_category(result: Dict[str, list], category: str, min_count: int,
+                         score: int, province: str, subject: str):
+    """推荐数量不足时使用AI数据（高分段冲刺使用顶尖院校）补充到min_count所"""
+    try:
+        from models.realtime_ai_data import realtime_data_manager
+        
+        app.logger.info(f"{category}院校数量不足({len(result[category])}所)，使用AI补充到{min_count}所")
+        
+        # 特殊处理：为高分段冲刺院校补充顶尖院校
+        if category == '冲刺' and score >= 700:
+            # 添加顶尖院校作为冲刺选择
+            top_universities = [
+                "北京大学", "清华大学", "复旦大学", "上海交通大学", "浙江大学",
+                "南京大学", "中国科学技术大学", "哈尔滨工业大学", "西安交通大学",
+                "中山大学", "华中科技大学", "东南大学", "天津大学", "北京航空航天大学",
+                "同济大学", "厦门大学", "北京理工大学", "华南理工大学", "山东大学",
+                "中南大学", "吉林大学", "大连理工大学", "湖南大学", "重庆大学"
+            ]
+            
+            added_count = 0
+            for uni_name in top_universities:
+                if len(result[category]) >= min_count:
+                    break
+                    
+                # 避免重复
+                if any(r['university_name'] == uni_name for r in result[category]):
+                    continue
+                
+                # 为高分段用户生成适当的冲刺院校数据
+                base_score = score + 5 + (added_count * 3)  # 分数略高于用户分数
+                
+                recommendation = {
+                    'university_name': uni_name,
+                    'min_score': base_score,
+                    'avg_score': base_score + 10,
+                    'score_difference': score - base_score,
+                    'category': category,
+                    'probability': f"{45 - (added_count * 2)}%",
+                    'probability_num': 45 - (added_count * 2),
+                    'is_reference_data': True,
+                    'reference_province': '高分段智能推荐',
+                    'data_source': f"高分段补充 - 顶尖院校",
+                    'accuracy_level': 'medium',
+                    'confidence': 0.75,
+                    'university_data': {
+                        'name': uni_name,
+                        'category': '985工程',
+                        'type': '综合类',
+                        'province': '北京' if '北京' in uni_name else '上海' if '上海' in uni_name else province,
+                        'city': '北京' if '北京' in uni_name else '上海' if '上海' in uni_name else '',
+                        'location': {
+                            'province': '北京' if '北京' in uni_name else '上海' if '上海' in uni_name else province,
+                            'city': '北京' if '北京' in uni_name else '上海' if '上海' in uni_name else ''
+                        },
+                        'ranking': {'domestic_rank': added_count + 1},
+                        'advantages': ['计算机科学', '数学', '物理学', '经济学'],
+                        'is_double_first_class': True
+                    }
+                }
+                
+                result[category].append(recommendation)
+                added_count += 1
+            
+            app.logger.info(f"高分段特殊补充{category}院校: {added_count}所")
+            return  # 跳过常规AI补充
+        
+        # 使用实时AI获取推荐数据
+        ai_recommendations = realtime_data_manager.get_realtime_recommendation(score, province, subject)
+        ai_category_data = ai_recommendations.get(category, [])
+        
+        # 补充到最低要求数量
+        existing_names = {r['university_name'] for r in result[category]}
+        candidates = []
+        for ai_data in ai_category_data:
+            if len(result[category]) + len(candidates) >= min_count:
+                break
+            
+            # 避免重复
+            if ai_data['university_name'] in existing_names:
+                continue
+            existing_names.add(ai_data['university_name'])
+            candidates.append(ai_data)
+        
+        added_count = 0
+        for ai_data in candidates:
+            ai_uni_name = ai_data['university_name']
+            
+            # 获取地理位置信息
+            ai_province, ai_city = location_resolver.resolve(ai_uni_name, db.get_all_universities().get(ai_uni_name))
+            if ai_province and ai_province not in UNKNOWN_PROVINCES:
+                ai_location = {'province': ai_province, 'city': ai_city}
+            else:
+                ai_location = {'province': province, 'city': ''}
+            
+            recommendation = {
+                'university_name': ai_uni_name,
+                'min_score': ai_data['min_score'],
+                'avg_score': ai_data['avg_score'],
+                'score_difference': ai_data['score_difference'],
+                'category': category,
+                'probability': f"{65 + (ai_data['min_score'] % 15)}%",
+                'probability_num': 65 + (ai_data['min_score'] % 15),
+                'is_reference_data': True,
+                'reference_province': '实时AI数据',
+                'data_source': f"AI补充 - {ai_data.get('data_source', '智能推算')}",
+                'accuracy_level': 'medium',
+                'confidence': 0.70,
+                'university_data': {
+                    'name': ai_uni_name,
+                    'category': ai_data.get('category', '普通本科'),
+                    'type': '综合类',
+                    'province': ai_location['province'],
+                    'city': ai_location['city'],
+                    'location': {
+                        'province': ai_location['province'],
+                        'city': ai_location['city']
+                    },
+                    'ranking': {'domestic_rank': '未知'},
+                    'advantages': ['计算机科学', '经济学', '管理学'],
+                    'is_double_first_class': False
+                }
+            }
+            
+            result[category].append(recommendation)
+            added_count += 1
+        
+        app.logger.info(f"AI补充{category}院校: {added_count}所，总计{len(result[category])}所")
+        
+    except Exception as e:
+        app.logger.warning(f"AI补充{category}院校失败: {e}")
+
+def _score_recommendation_events(score: int, province: str, subject: str, preferences: list):
+    """
+    按计算顺序产生推荐事件 (事件名, 数据)：
+    score_analysis（分数分析）-> category（各类别的专业API推荐）-> supplement（AI补充）-> complete（汇总）
+    """
+    # 计算分数分析
+    score_analysis = calculate_score_analysis(score, province, subject)
+    yield 'score_analysis', score_analysis
+    
+    # 从 (省份, 科目, 年份) 推荐快照中二分查找各类别的分数窗口
+    universities = db.get_all_universities()
+    app.logger.info(f"获取到{len(universities)}所院校，开始使用专业API分数线快照进行推荐")
+    
+    from models.recommendation_snapshot import get_recommendation_snapshots
+    snapshot = get_recommendation_snapshots(db).get(province, subject, 2023)
+    ranked = snapshot.recommend(score, preferences, {'冲刺': 8, '稳妥': 10, '保底': 6})
+    
+    success_count = ranked['success_count']
+    failed_count = ranked['failed_count']
+    app.logger.info(f"专业API获取完成: 成功{success_count}所，失败{failed_count}所")
+    
+    # 分类返回（已按概率和分数差异排序，院校数据已补充地理位置和排名）
+    result = ranked['recommendations']
+    for category, recommendations in result.items():
+        yield 'category', {'category': category, 'recommendations': list(recommendations)}
+    
+    # 如果使用专业API后推荐数量不足，使用AI数据补充
+    min_required = {'冲刺': 5, '稳妥': 8, '保底': 5}
+    
+    # 特殊处理高分段用户的冲刺院校需求
+    if score >= 700:
+        min_required['冲刺'] = 8  # 高分段用户需要更多冲刺院校
+        
+    for category, min_count in min_required.items():
+        existing_count = len(result[category])
+        if existing_count < min_count:
+            _supplement_category(result, category, min_count, score, province, subject)
+            if len(result[category]) > existing_count:
+                yield 'supplement', {
+                    'category': category,
+                    'recommendations': result[category][existing_count:]
+                }
+    
+    # 统计信息
+    total_professional_api = ranked['total_count']
+    total_ai_supplement = sum(len(result[cat]) for cat in result) - total_professional_api
+    
+    app.logger.info(f"推荐完成 - 专业API: {total_professional_api}所, AI补充: {total_ai_supplement}所")
+    app.logger.info(f"最终结果 - 冲刺: {len(result['冲刺'])}所, 稳妥: {len(result['稳妥'])}所, 保底: {len(result['保底'])}所")
+    
+    yield 'complete', {
+        'input': {
+            'score': score,
+            'province': province,
+            'subject': subject,
+            'preferences': preferences
+        },
+        'total_count': ranked['total_count'],
+        'recommendations': result,
+        'categorized': result,  # 兼容旧版本前端
+        'score_analysis': score_analysis,
+        'summary': {
+            '冲刺院校': len(result['冲刺']),
+            '稳妥院校': len(result['稳妥']),
+            '保底院校': len(result['保底'])
+        },
+        'data_quality': {
+            'professional_api_count': total_professional_api,
+            'ai_supplement_count': total_ai_supplement,
+            'accuracy_message': f'✅ {total_professional_api}所院校使用专业API权威数据，{total_ai_supplement}所使用AI补充数据',
+            'confidence_level': 'high' if total_professional_api > total_ai_supplement else 'medium'
+        },
+        'debug_info': {
+            'total_universities': len(universities),
+            'professional_api_success': success_count,
+            'professional_api_failed': failed_count,
+            'search_criteria': f"{province}_{subject}"
+        }
+    }
+
+# 流式响应格式：ndjson 每行一个 {"event", "data"}；sse 为 server-sent events
+STREAM_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'sse': 'text/event-stream'
+}
+
+def _requested_stream_format(data: Dict[str, Any]) -> Optional[str]:
+    """按请求参数 stream 或 Accept 头确定流式格式，未请求流式响应时返回None"""
+    stream = request.args.get('stream') or data.get('stream')
+    if stream in STREAM_FORMATS:
+        return stream
+    accept = request.headers.get('Accept', '')
+    for stream_format, mimetype in STREAM_FORMATS.items():
+        if mimetype in accept:
+            return stream_format
+    return None
+
+def _encode_stream_event(stream_format: str, event: str, payload: Any) -> str:
+    """将一个事件编码为 ndjson 行或 SSE 消息"""
+    if stream_format == 'sse':
+        return f"event: {event}\ndata: {dumps_text(payload)}\n\n"
+    return dumps_text({'event': event, 'data': payload}) + '\n'
+
 @app.route('/calculate_score', methods=['POST'])
 def calculate_score():
-    """分数计算和院校推荐（使用专业API优先获取准确数据）"""
+    """
+    分数计算和院校推荐（使用专业API优先获取准确数据）
+    
+    默认返回完整JSON；请求参数 stream=ndjson|sse（或 Accept 为对应类型）时按计算进度流式返回：
+    先返回分数分析，再逐个返回各类别推荐和AI补充结果，最后返回汇总信息
+    """
     try:
         data = request.get_json()
         
@@ -392,367 +702,45 @@ def calculate_score():
                 }), 400
         
         score = int(data['score'])
-        province = data['province']
+        province = normalize_province(data['province'])
         subject = data['subject']
         preferences = data.get('preferences', [])
         
-        app.logger.info(f"开始分数计算，使用专业API优先模式 - 分数: {score}, 省份: {province}, 科目: {subject}")
-        
-        # 使用专业API获取准确的院校推荐
-        recommendations = []
-        
-        # 获取基础院校列表
-        universities = db.get_all_universities()
-        app.logger.info(f"获取到{len(universities)}所院校，开始使用专业API获取准确分数线")
-        
-        # 使用专业数据API获取准确分数
-        from models.professional_data_api import ProfessionalDataAPI
-        professional_api = ProfessionalDataAPI()
-        
-        success_count = 0
-        failed_count = 0
-        
-        for name, uni_data in universities.items():
-            try:
-                # 使用专业API获取准确分数线
-                result = professional_api.get_admission_scores(name, province, subject, 2023)
-                
-                if result.get('success'):
-                    score_data = result['data']
-                    min_score = score_data.get('min_score', 0)
-                    avg_score = score_data.get('avg_score', min_score + 15)
-                    rank = score_data.get('rank', 0)
-                    data_source = f"专业API - {result.get('source', '权威数据')}"
-                    confidence = result.get('confidence', 0.95)
-                    
-                    if min_score <= 0:
-                        failed_count += 1
-                        continue
-                    
-                    success_count += 1
-                    
-                    # 推荐逻辑：冲刺、稳妥、保底
-                    score_diff = score - min_score
-                    avg_diff = score - avg_score
-                    
-                    # 更合理的分类逻辑 - 优化高分段冲刺院校推荐
-                    if score >= min_score + 30:
-                        category = "保底"
-                        probability = "95%以上"
-                        probability_num = 95
-                    elif score >= min_score + 20:
-                        category = "保底"
-                        probability = "90-95%"
-                        probability_num = 92
-                    elif score >= min_score + 10:
-                        category = "稳妥" 
-                        probability = "80-90%"
-                        probability_num = 85
-                    elif score >= min_score:
-                        category = "稳妥"
-                        probability = "70-80%"
-                        probability_num = 75
-                    elif score >= min_score - 10:
-                        category = "冲刺"
-                        probability = "50-70%"
-                        probability_num = 60
-                    elif score >= min_score - 20:
-                        category = "冲刺"
-                        probability = "30-50%"
-                        probability_num = 40
-                    elif score >= min_score - 30:
-                        category = "冲刺"
-                        probability = "15-30%"
-                        probability_num = 25
-                    else:
-                        # 特殊处理：如果分数差距太大，但是高分段院校稀缺，仍然作为冲刺推荐
-                        if score >= 650 and min_score >= 650:  # 高分段特殊处理
-                            category = "冲刺"
-                            probability = "10-20%"
-                            probability_num = 15
-                        else:
-                            failed_count += 1
-                            continue  # 分数太低，不推荐
-                    
-                    # 检查偏好匹配
-                    if preferences:
-                        uni_type = uni_data.get('type', '')
-                        if not any(pref in uni_type for pref in preferences):
-                            probability_num -= 10
-                    
-                    # 获取排名信息
-                    ranking = db.get_ranking(name)
-                    
-                    # 确保地理位置信息准确
-                    original_location = uni_data.get('location', {})
-                    original_province = original_location.get('province') or uni_data.get('province', '')
-                    original_city = original_location.get('city') or uni_data.get('city', '')
-                    
-                    # 智能修复地理位置错误
-                    needs_ai_fix = False
-                    if original_province == '北京' and '北京' not in name:
-                        beijing_universities = [
-                            '清华大学', '北京大学', '中国人民大学', '北京师范大学', 
-                            '北京理工大学', '北京航空航天大学', '北京科技大学', '北京化工大学',
-                            '北京邮电大学', '中国农业大学', '北京林业大学', '中国传媒大学',
-                            '中央民族大学', '北京中医药大学', '对外经济贸易大学', '中央财经大学',
-                            '中国政法大学', '华北电力大学', '中国矿业大学(北京)', '中国石油大学(北京)',
-                            '中国地质大学(北京)', '北京工业大学', '首都师范大学', '北京交通大学'
-                        ]
-                        
-                        special_cases = {
-                            '中国地质大学': '湖北',
-                            '中国矿业大学': '江苏',  
-                            '中国石油大学': '山东',
-                            '南京邮电大学': '江苏',
-                            '哈尔滨理工大学': '黑龙江',
-                            '西安电子科技大学': '陕西'
-                        }
-                        
-                        if name in special_cases:
-                            needs_ai_fix = True
-                        elif not any(beijing_uni in name for beijing_uni in beijing_universities):
-                            needs_ai_fix = True
-                    
-                    # 使用AI修复地理位置（如果需要）
-                    if not original_province or not original_city or needs_ai_fix:
-                        try:
-                            from models.realtime_ai_data import RealtimeAIDataProvider
-                            provider = RealtimeAIDataProvider()
-                            import asyncio
-                            ai_location = asyncio.run(provider.get_university_location(name))
-                            if ai_location and ai_location.get('province') not in ['未知省份', '待确认']:
-                                original_province = ai_location['province']
-                                original_city = ai_location['city']
-                        except Exception as e:
-                            app.logger.debug(f"AI地理位置修复失败: {e}")
-                    
-                    # 创建包含正确地理位置的院校数据副本
-                    enhanced_uni_data = uni_data.copy()
-                    enhanced_uni_data['province'] = original_province
-                    enhanced_uni_data['city'] = original_city
-                    if 'location' not in enhanced_uni_data:
-                        enhanced_uni_data['location'] = {}
-                    enhanced_uni_data['location']['province'] = original_province
-                    enhanced_uni_data['location']['city'] = original_city
-                    
-                    recommendations.append({
-                        'university_name': name,
-                        'university_data': enhanced_uni_data,
-                        'ranking': ranking,
-                        'category': category,
-                        'probability': probability,
-                        'probability_num': max(0, probability_num),
-                        'min_score': min_score,
-                        'avg_score': avg_score,
-                        'score_difference': score_diff,
-                        'avg_difference': avg_diff,
-                        'data_source': data_source,
-                        'data_year': 2023,
-                        'confidence': confidence,
-                        'rank': rank,
-                        'is_reference_data': False,  # 专业API数据
-                        'accuracy_level': 'high',
-                        'original_province': province
-                    })
-                    
-                else:
-                    failed_count += 1
-                    app.logger.debug(f"专业API未找到{name}在{province}的数据: {result.get('error', '未知')}")
-                    
-            except Exception as e:
-                failed_count += 1
-                app.logger.debug(f"获取{name}分数线时出错: {e}")
-                continue
-        
-        app.logger.info(f"专业API获取完成: 成功{success_count}所，失败{failed_count}所")
-        
-        # 按概率和分数差异排序
-        recommendations.sort(key=lambda x: (-x['probability_num'], -x['score_difference']))
+        # 推荐基于 (省份, 科目, 年份) 分数线矩阵，超出范围的查询直接返回参数错误
+        unsupported = unsupported_reason(province, subject, 2023)
+        if unsupported:
+            return jsonify({
+                'success': False,
+                'error': unsupported
+            }), 400
         
-        # 分类返回
-        result = {
-            '冲刺': [r for r in recommendations if r['category'] == '冲刺'][:8],
-            '稳妥': [r for r in recommendations if r['category'] == '稳妥'][:10],
-            '保底': [r for r in recommendations if r['category'] == '保底'][:6]
-        }
+        app.logger.info(f"开始分数计算，使用专业API优先模式 - 分数: {score}, 省份: {province}, 科目: {subject}")
         
-        # 如果使用专业API后推荐数量不足，使用AI数据补充
-        min_required = {'冲刺': 5, '稳妥': 8, '保底': 5}
+        events = _score_recommendation_events(score, province, subject, preferences)
         
-        # 特殊处理高分段用户的冲刺院校需求
-        if score >= 700:
-            min_required['冲刺'] = 8  # 高分段用户需要更多冲刺院校
-            
-        for category, min_count in min_required.items():
-            if len(result[category]) < min_count:
+        stream_format = _requested_stream_format(data)
+        if stream_format:
+            def generate():
                 try:
-                    from models.realtime_ai_data import realtime_data_manager
-                    
-                    app.logger.info(f"{category}院校数量不足({len(result[category])}所)，使用AI补充到{min_count}所")
-                    
-                    # 特殊处理：为高分段冲刺院校补充顶尖院校
-                    if category == '冲刺' and score >= 700:
-                        # 添加顶尖院校作为冲刺选择
-                        top_universities = [
-                            "北京大学", "清华大学", "复旦大学", "上海交通大学", "浙江大学",
-                            "南京大学", "中国科学技术大学", "哈尔滨工业大学", "西安交通大学",
-                            "中山大学", "华中科技大学", "东南大学", "天津大学", "北京航空航天大学",
-                            "同济大学", "厦门大学", "北京理工大学", "华南理工大学", "山东大学",
-                            "中南大学", "吉林大学", "大连理工大学", "湖南大学", "重庆大学"
-                        ]
-                        
-                        added_count = 0
-                        for uni_name in top_universities:
-                            if len(result[category]) >= min_count:
-                                break
-                                
-                            # 避免重复
-                            if any(r['university_name'] == uni_name for r in result[category]):
-                                continue
-                            
-                            # 为高分段用户生成适当的冲刺院校数据
-                            base_score = score + 5 + (added_count * 3)  # 分数略高于用户分数
-                            
-                            recommendation = {
-                                'university_name': uni_name,
-                                'min_score': base_score,
-                                'avg_score': base_score + 10,
-                                'score_difference': score - base_score,
-                                'category': category,
-                                'probability': f"{45 - (added_count * 2)}%",
-                                'probability_num': 45 - (added_count * 2),
-                                'is_reference_data': True,
-                                'reference_province': '高分段智能推荐',
-                                'data_source': f"高分段补充 - 顶尖院校",
-                                'accuracy_level': 'medium',
-                                'confidence': 0.75,
-                                'university_data': {
-                                    'name': uni_name,
-                                    'category': '985工程',
-                                    'type': '综合类',
-                                    'province': '北京' if '北京' in uni_name else '上海' if '上海' in uni_name else province,
-                                    'city': '北京' if '北京' in uni_name else '上海' if '上海' in uni_name else '',
-                                    'location': {
-                                        'province': '北京' if '北京' in uni_name else '上海' if '上海' in uni_name else province,
-                                        'city': '北京' if '北京' in uni_name else '上海' if '上海' in uni_name else ''
-                                    },
-                                    'ranking': {'domestic_rank': added_count + 1},
-                                    'advantages': ['计算机科学', '数学', '物理学', '经济学'],
-                                    'is_double_first_class': True
-                                }
-                            }
-                            
-                            result[category].append(recommendation)
-                            added_count += 1
-                        
-                        app.logger.info(f"高分段特殊补充{category}院校: {added_count}所")
-                        continue  # 跳过常规AI补充
-                    
-                    # 使用实时AI获取推荐数据
-                    ai_recommendations = realtime_data_manager.get_realtime_recommendation(score, province, subject)
-                    ai_category_data = ai_recommendations.get(category, [])
-                    
-                    # 补充到最低要求数量
-                    added_count = 0
-                    for ai_data in ai_category_data:
-                        if len(result[category]) >= min_count:
-                            break
-                            
-                        ai_uni_name = ai_data['university_name']
-                        
-                        # 避免重复
-                        if any(r['university_name'] == ai_uni_name for r in result[category]):
-                            continue
-                        
-                        # 获取地理位置信息
-                        try:
-                            from models.realtime_ai_data import RealtimeAIDataProvider
-                            provider = RealtimeAIDataProvider()
-                            import asyncio
-                            ai_location = asyncio.run(provider.get_university_location(ai_uni_name))
-                            if not ai_location or ai_location.get('province') in ['未知省份', '待确认']:
-                                ai_location = {'province': province, 'city': ''}
-                        except:
-                            ai_location = {'province': province, 'city': ''}
-                        
-                        recommendation = {
-                            'university_name': ai_uni_name,
-                            'min_score': ai_data['min_score'],
-                            'avg_score': ai_data['avg_score'],
-                            'score_difference': ai_data['score_difference'],
-                            'category': category,
-                            'probability': f"{65 + (ai_data['min_score'] % 15)}%",
-                            'probability_num': 65 + (ai_data['min_score'] % 15),
-                            'is_reference_data': True,
-                            'reference_province': '实时AI数据',
-                            'data_source': f"AI补充 - {ai_data.get('data_source', '智能推算')}",
-                            'accuracy_level': 'medium',
-                            'confidence': 0.70,
-                            'university_data': {
-                                'name': ai_uni_name,
-                                'category': ai_data.get('category', '普通本科'),
-                                'type': '综合类',
-                                'province': ai_location['province'],
-                                'city': ai_location['city'],
-                                'location': {
-                                    'province': ai_location['province'],
-                                    'city': ai_location['city']
-                                },
-                                'ranking': {'domestic_rank': '未知'},
-                                'advantages': ['计算机科学', '经济学', '管理学'],
-                                'is_double_first_class': False
-                            }
-                        }
-                        
-                        result[category].append(recommendation)
-                        added_count += 1
-                    
-                    app.logger.info(f"AI补充{category}院校: {added_count}所，总计{len(result[category])}所")
-                    
+                    for event, payload in events:
+                        if event == 'complete':
+                            # 推荐列表和分数分析已逐条返回，汇总中不再重复
+                            payload = {key: value for key, value in payload.items()
+                                       if key not in ('recommendations', 'categorized', 'score_analysis')}
+                        yield _encode_stream_event(stream_format, event, payload)
                 except Exception as e:
-                    app.logger.warning(f"AI补充{category}院校失败: {e}")
-        
-        # 统计信息
-        total_professional_api = sum(1 for r in recommendations if r['accuracy_level'] == 'high')
-        total_ai_supplement = sum(len(result[cat]) for cat in result) - total_professional_api
-        
-        # 计算分数分析
-        score_analysis = calculate_score_analysis(score, province, subject)
-        
-        app.logger.info(f"推荐完成 - 专业API: {total_professional_api}所, AI补充: {total_ai_supplement}所")
-        app.logger.info(f"最终结果 - 冲刺: {len(result['冲刺'])}所, 稳妥: {len(result['稳妥'])}所, 保底: {len(result['保底'])}所")
+                    app.logger.error(f"分数计算失败: {e}")
+                    yield _encode_stream_event(stream_format, 'error', {'error': f'计算过程中发生错误: {str(e)}'})
+            
+            return Response(
+                stream_with_context(generate()),
+                mimetype=STREAM_FORMATS[stream_format],
+                headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+            )
         
-        return jsonify({
-            'success': True,
-            'input': {
-                'score': score,
-                'province': province,
-                'subject': subject,
-                'preferences': preferences
-            },
-            'total_count': len(recommendations),
-            'recommendations': result,
-            'categorized': result,  # 兼容旧版本前端
-            'score_analysis': score_analysis,
-            'summary': {
-                '冲刺院校': len(result['冲刺']),
-                '稳妥院校': len(result['稳妥']),
-                '保底院校': len(result['保底'])
-            },
-            'data_quality': {
-                'professional_api_count': total_professional_api,
-                'ai_supplement_count': total_ai_supplement,
-                'accuracy_message': f'✅ {total_professional_api}所院校使用专业API权威数据，{total_ai_supplement}所使用AI补充数据',
-                'confidence_level': 'high' if total_professional_api > total_ai_supplement else 'medium'
-            },
-            'debug_info': {
-                'total_universities': len(universities),
-                'professional_api_success': success_count,
-                'professional_api_failed': failed_count,
-                'search_criteria': f"{province}_{subject}"
-            }
-        })
+        for event, payload in events:
+            if event == 'complete':
+                return jsonify({'success': True, **payload})
         
     except ValueError:
         return jsonify({
@@ -768,12 +756,13 @@ def calculate_score():
 
 @app.route('/api/search_universities')
 def search_universities_api():
-    """搜索院校API"""
+    """搜索院校API（支持 fields 字段投影、sort 排序和 limit/offset 分页）"""
     try:
         keyword = request.args.get('keyword', '')
         category = request.args.get('category', '')
         province = request.args.get('province', '')
         university_type = request.args.get('type', '')
+        params = _listing_params(request.args)
         
         if keyword:
             universities = db.search_universities(keyword)
@@ -786,12 +775,13 @@ def search_universities_api():
         else:
             universities = db.get_all_universities()
         
-        return jsonify({
-            'success': True,
-            'count': len(universities),
-            'data': universities
-        })
+        return _listing_response(universities, params)
         
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
     except Exception as e:
         app.logger.error(f"搜索院校失败: {e}")
         return jsonify({
@@ -939,23 +929,26 @@ def get_university_detail_api(university_name):
 
 @app.route('/api/batch_search', methods=['POST'])
 def batch_search_universities():
-    """批量搜索院校"""
+    """批量搜索院校（请求体中可带 fields/sort/limit/offset，未排序时按请求顺序返回）"""
     try:
         data = request.get_json()
         university_names = data.get('universities', [])
+        params = _listing_params(data)
         
+        # 以院校数据中的名称为键，模糊匹配到的院校在分页和投影时不会被丢弃
         results = {}
         for name in university_names:
             university = db.get_university_by_name(name)
             if university:
-                results[name] = university
+                results[db.resolve_university_name(name) or name] = university
         
-        return jsonify({
-            'success': True,
-            'count': len(results),
-            'data': results
-        })
+        return _listing_response(results, params)
         
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
     except Exception as e:
         app.logger.error(f"批量搜索失败: {e}")
         return jsonify({
@@ -1074,6 +1067,26 @@ def get_admin_data_sources_status():
             'error': str(e)
         }), 500
 
+@app.route('/admin/status')
+def get_admin_system_status():
+    """获取响应层、数据持久化、爬虫和地理位置/官网索引的运行状态（管理员接口，AI缓存见 /api/realtime/cache_status）"""
+    try:
+        return jsonify({
+            'success': True,
+            'response': json_response_layer.get_stats(),
+            'persistence': db.storage.get_stats(),
+            'crawler': db.crawler.web_crawler.get_stats(),
+            'location_index': location_resolver.get_stats(),
+            'website_index': website_resolver.get_stats()
+        })
+        
+    except Exception as e:
+        app.logger.error(f"获取系统状态失败: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 # 志愿填报相关接口
 @app.route('/api/recommendation', methods=['POST'])
 def get_recommendations():
@@ -1099,127 +1112,78 @@ def get_recommendations():
         recommendations = []
         universities = db.get_all_universities()
         
-        for name, uni_data in universities.items():
-            scores = db.get_admission_scores(name, province, 2023)
-            
-            for score_key, score_data in scores.items():
-                if score_data.get('subject') == subject:
-                    min_score = score_data.get('min_score', 0)
-                    avg_score = score_data.get('avg_score', 0)
-                    
-                    # 推荐逻辑：冲刺、稳妥、保底
-                    # 冲刺：分数低于院校线，但在合理范围内
-                    if score >= avg_score + 15:
-                        category = "保底"
-                        probability = "95%以上"
-                        probability_num = 95
-                    elif score >= avg_score:
-                        category = "稳妥" 
-                        probability = "80-90%"
-                        probability_num = 85
-                    elif score >= avg_score - 10:
-                        category = "稳妥"
-                        probability = "70-80%"
-                        probability_num = 75
-                    elif score >= avg_score - 20:
-                        category = "冲刺"
-                        probability = "50-70%"
-                        probability_num = 60
-                    elif score >= avg_score - 30:
-                        category = "冲刺"
-                        probability = "30-50%"
-                        probability_num = 40
-                    elif score >= avg_score - 40:
-                        category = "冲刺"
-                        probability = "15-30%"
-                        probability_num = 25
-                    else:
-                        continue  # 分数太低，不推荐
-                    
-                    # 获取排名信息
-                    ranking = db.get_ranking(name)
-                    
-                    # 确保地理位置信息来自原始院校数据，不受参考数据影响
-                    original_location = uni_data.get('location', {})
-                    original_province = original_location.get('province') or uni_data.get('province', '')
-                    original_city = original_location.get('city') or uni_data.get('city', '')
-                    
-                    # 智能检测明显错误的地理位置并强制修复
-                    needs_ai_fix = False
-                    
-                    # 检测明显的地理位置错误（院校名称与地理位置不符）
-                    if original_province == '北京' and '北京' not in name:
-                        # 排除真正的北京高校
-                        beijing_universities = [
-                            '清华大学', '北京大学', '中国人民大学', '北京师范大学', 
-                            '北京理工大学', '北京航空航天大学', '北京科技大学', '北京化工大学',
-                            '北京邮电大学', '中国农业大学', '北京林业大学', '中国传媒大学',
-                            '中央民族大学', '北京中医药大学', '对外经济贸易大学', '中央财经大学',
-                            '中国政法大学', '华北电力大学', '中国矿业大学(北京)', '中国石油大学(北京)',
-                            '中国地质大学(北京)', '北京工业大学', '首都师范大学', '北京交通大学',
-                            '北京外国语大学', '北京语言大学', '中央音乐学院', '中央美术学院',
-                            '北京体育大学', '中国音乐学院', '中央戏剧学院', '北京电影学院'
-                        ]
-                        
-                        # 特殊处理一些容易误判的院校
-                        special_cases = {
-                            '中国地质大学': '湖北',  # 默认指武汉校区
-                            '中国矿业大学': '江苏',  # 默认指徐州校区  
-                            '中国石油大学': '山东',  # 默认指青岛校区
-                            '南京邮电大学': '江苏',
-                            '哈尔滨理工大学': '黑龙江',
-                            '西安电子科技大学': '陕西'
-                        }
-                        
-                        if name in special_cases:
-                            needs_ai_fix = True
-                            app.logger.info(f"检测到{name}的地理位置错误(显示为北京)，应为{special_cases[name]}，将使用AI修复")
-                        elif not any(beijing_uni in name for beijing_uni in beijing_universities):
-                            needs_ai_fix = True
-                            app.logger.info(f"检测到{name}的地理位置错误(显示为北京)，将使用AI修复")
-                    
-                    # 如果原始地理位置信息不完整或需要修复，尝试从AI获取
-                    if not original_province or not original_city or needs_ai_fix:
-                        try:
-                            from models.realtime_ai_data import RealtimeAIDataProvider
-                            provider = RealtimeAIDataProvider()
-                            import asyncio
-                            ai_location = asyncio.run(provider.get_university_location(name))
-                            if ai_location and ai_location.get('province') not in ['未知省份', '待确认']:
-                                original_province = ai_location['province']
-                                original_city = ai_location['city']
-                                app.logger.info(f"使用AI修复{name}的地理位置: {original_province} {original_city}")
-                        except Exception as e:
-                            app.logger.warning(f"AI修复{name}地理位置失败: {e}")
-                            # 如果AI修复失败，继续使用原始数据
-                    
-                    # 创建包含正确地理位置的院校数据副本
-                    enhanced_uni_data = uni_data.copy()
-                    enhanced_uni_data['province'] = original_province
-                    enhanced_uni_data['city'] = original_city
-                    if 'location' not in enhanced_uni_data:
-                        enhanced_uni_data['location'] = {}
-                    enhanced_uni_data['location']['province'] = original_province
-                    enhanced_uni_data['location']['city'] = original_city
-                    
-                    recommendations.append({
-                        'university_name': name,
-                        'university_data': enhanced_uni_data,
-                        'ranking': ranking,
-                        'category': category,
-                        'probability': probability,
-                        'probability_num': max(0, probability_num),
-                        'min_score': min_score,
-                        'avg_score': avg_score,
-                        'score_difference': score - min_score,
-                        'avg_difference': score - avg_score,
-                        'data_source': score_data.get('data_source', '模拟数据'),
-                        'data_year': 2023,
-                        'reference_province': data_province if is_reference else None,
-                        'is_reference_data': is_reference,
-                        'original_province': province
-                    })
+        # 通过分数线索引直接取出该省份、科目2023年平均分不高于考生分数40分的条目
+        candidates = db.get_scores_in_range(province, subject, 2023, high=score + 40, field='avg_score')
         
+        for name, score_key, score_data in candidates:
+            uni_data = universities.get(name)
+            if not uni_data:
+                continue
+            
+            min_score = score_data.get('min_score', 0)
+            avg_score = score_data.get('avg_score', 0)
+            
+            # 推荐逻辑：冲刺、稳妥、保底
+            # 冲刺：分数低于院校线，但在合理范围内
+            if score >= avg_score + 15:
+                category = "保底"
+                probability = "95%以上"
+                probability_num = 95
+            elif score >= avg_score:
+                category = "稳妥" 
+                probability = "80-90%"
+                probability_num = 85
+            elif score >= avg_score - 10:
+                category = "稳妥"
+                probability = "70-80%"
+                probability_num = 75
+            elif score >= avg_score - 20:
+                category = "冲刺"
+                probability = "50-70%"
+                probability_num = 60
+            elif score >= avg_score - 30:
+                category = "冲刺"
+                probability = "30-50%"
+                probability_num = 40
+            elif score >= avg_score - 40:
+                category = "冲刺"
+                probability = "15-30%"
+                probability_num = 25
+            else:
+                continue  # 分数太低，不推荐
+            
+            # 获取排名信息
+            ranking = db.get_ranking(name)
+            
+            # 从地理位置索引获取准确的省份和城市，不受参考数据影响
+            original_province, original_city = location_resolver.resolve(name, uni_data)
+            
+            # 创建包含正确地理位置的院校数据副本
+            enhanced_uni_data = uni_data.copy()
+            enhanced_uni_data['province'] = original_province
+            enhanced_uni_data['city'] = original_city
+            enhanced_uni_data['location'] = dict(enhanced_uni_data.get('location') or {})
+            enhanced_uni_data['location']['province'] = original_province
+            enhanced_uni_data['location']['city'] = original_city
+            
+            recommendations.append({
+                'university_name': name,
+                'university_data': enhanced_uni_data,
+                'ranking': ranking,
+                'category': category,
+                'probability': probability,
+                'probability_num': max(0, probability_num),
+                'min_score': min_score,
+                'avg_score': avg_score,
+                'score_difference': score - min_score,
+                'avg_difference': score - avg_score,
+                'data_source': score_data.get('data_source', '模拟数据'),
+                'data_year': 2023,
+                'reference_province': None,
+                'is_reference_data': False,  # 分数线来自所查询省份本身
+                'original_province': province
+            })
+
         # 按类别和分数差异排序
         recommendations.sort(key=lambda x: (
             ['冲刺', '稳妥', '保底'].index(x['category']),
@@ -1317,10 +1281,6 @@ def mock_fill():
 def get_university_details(university_name):
     """获取院校详细信息（增强版）"""
     try:
-        # 初始化AI数据提供器
-        from models.realtime_ai_data import RealtimeAIDataProvider
-        provider = RealtimeAIDataProvider()
-        
         # 获取基础院校数据
         university = db.get_university_by_name(university_name)
         if not university:
@@ -1329,30 +1289,28 @@ def get_university_details(university_name):
                 'error': '未找到该院校'
             }), 404
         
-        # 使用AI获取准确的地理位置信息
+        # 在副本上补充地理位置和官网，不修改数据库中的记录（否则与院校索引、统计不一致）
+        university = dict(university)
+        university['location'] = dict(university.get('location') or {})
+        
+        # 从地理位置索引获取准确的地理位置信息
         try:
-            import asyncio
-            ai_location = asyncio.run(provider.get_university_location(university_name))
-            if ai_location and ai_location.get('province') not in ['未知省份', '待确认']:
-                # 使用AI获取的准确地理位置
-                university['province'] = ai_location['province']
-                university['city'] = ai_location['city']
+            resolved_province, resolved_city = location_resolver.resolve(university_name, university)
+            if resolved_province and resolved_province not in UNKNOWN_PROVINCES:
+                university['province'] = resolved_province
+                university['city'] = resolved_city
                 if 'location' not in university:
                     university['location'] = {}
-                university['location']['province'] = ai_location['province']
-                university['location']['city'] = ai_location['city']
-                app.logger.info(f"为 {university_name} 使用AI更新地理位置: {ai_location['province']} {ai_location['city']}")
+                university['location']['province'] = resolved_province
+                university['location']['city'] = resolved_city
             else:
-                app.logger.warning(f"AI无法获取 {university_name} 的准确地理位置，使用原始数据")
+                app.logger.warning(f"无法获取 {university_name} 的准确地理位置，使用原始数据")
         except Exception as e:
-            app.logger.warning(f"AI地理位置获取失败: {e}")
+            app.logger.warning(f"地理位置获取失败: {e}")
         
-        # 获取官网
+        # 从官网索引获取官网（未解析或已过期的院校在后台解析）
         try:
-            crawler = UniversityDataCrawler()
-            website = crawler._get_university_website(university_name)
-            university['website'] = website
-            app.logger.info(f"为 {university_name} 获取到最新官网: {website}")
+            university['website'] = website_resolver.resolve(university_name, university)
         except Exception as e:
             app.logger.warning(f"获取官网失败: {e}")
         
@@ -1412,10 +1370,6 @@ def get_university_details(university_name):
 def search_universities():
     """搜索院校（兼容前端调用）"""
     try:
-        # 初始化AI数据提供器
-        from models.realtime_ai_data import RealtimeAIDataProvider
-        provider = RealtimeAIDataProvider()
-        
         keyword = request.args.get('q', '')
         province = request.args.get('province', '')
         university_type = request.args.get('type', '')
@@ -1442,28 +1396,10 @@ def search_universities():
         # 转换数据格式以适配前端
         results = []
         for name, uni_data in universities.items():
-            location = uni_data.get('location', {})
             ranking_data = db.get_ranking(name)
             
-            # 使用AI获取准确的地理位置信息（如果需要）
-            try:
-                # 检查当前地理位置是否准确
-                current_province = location.get('province', '') or uni_data.get('province', '')
-                current_city = location.get('city', '') or uni_data.get('city', '')
-                
-                # 如果地理位置明显错误或为空，尝试使用AI获取
-                if (not current_province or not current_city or 
-                    current_province in ['未知省份', '待确认'] or 
-                    current_city in ['未知城市', '待确认'] or
-                    (current_province == '北京' and name not in ['清华大学', '北京大学', '中国人民大学', '北京师范大学', '北京理工大学', '北京航空航天大学', '北京科技大学', '北京化工大学', '北京邮电大学', '中国农业大学', '北京林业大学', '中国传媒大学', '中央民族大学', '北京中医药大学', '对外经济贸易大学', '中央财经大学', '中国政法大学', '华北电力大学', '中国矿业大学(北京)', '中国石油大学(北京)', '中国地质大学(北京)'])):
-                    
-                    ai_location = asyncio.run(provider.get_university_location(name))
-                    if ai_location and ai_location.get('province') not in ['未知省份', '待确认']:
-                        current_province = ai_location['province']
-                        current_city = ai_location['city']
-                        app.logger.info(f"搜索结果中为 {name} 使用AI更新地理位置: {current_province} {current_city}")
-            except Exception as e:
-                app.logger.warning(f"为 {name} 获取AI地理位置失败: {e}")
+            # 从地理位置索引获取准确的地理位置信息
+            current_province, current_city = location_resolver.resolve(name, uni_data)
             
             # 处理排名信息
             if ranking_data and isinstance(ranking_data, dict):
@@ -1564,21 +1500,12 @@ def get_batch_realtime_scores():
                 'error': '请提供院校列表'
             }), 400
         
-        from models.realtime_ai_data import RealtimeDataManager
-        
-        manager = RealtimeDataManager()
-        
-        # 使用异步方式批量获取
-        import asyncio
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        from models.realtime_ai_data import realtime_data_manager
         
-        try:
-            scores_data = loop.run_until_complete(
-                manager.batch_get_scores(universities, province, subject, year)
-            )
-        finally:
-            loop.close()
+        # 在后台事件循环中批量获取
+        scores_data = async_runner.run(
+            realtime_data_manager.batch_get_scores(universities, province, subject, year)
+        )
         
         return jsonify({
             'success': True,
@@ -1606,21 +1533,12 @@ def get_all_provinces_scores(university_name):
         subject = request.args.get('subject', '理科')
         year = int(request.args.get('year', 2023))
         
-        from models.realtime_ai_data import RealtimeDataManager
-        
-        manager = RealtimeDataManager()
-        
-        # 使用异步方式获取全国分数线
-        import asyncio
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        from models.realtime_ai_data import realtime_data_manager
         
-        try:
-            province_scores = loop.run_until_complete(
-                manager.get_all_provinces_scores(university_name, subject, year)
-            )
-        finally:
-            loop.close()
+        # 在后台事件循环中获取全国分数线
+        province_scores = async_runner.run(
+            realtime_data_manager.get_all_provinces_scores(university_name, subject, year)
+        )
         
         return jsonify({
             'success': True,
@@ -1686,52 +1604,29 @@ def get_cache_status():
     """获取AI缓存状态"""
     try:
         from models.realtime_ai_data import RealtimeAIDataProvider
+        from models.http_session import http_session_manager
+        from models.fanout_scheduler import fanout_scheduler
+        from models.single_flight import single_flight
+        from models.cache_warmer import cache_warmer
         
         provider = RealtimeAIDataProvider()
         
         # 查询缓存统计
-        import sqlite3
-        with sqlite3.connect(provider.cache_db) as conn:
-            cursor = conn.execute("""
-                SELECT 
-                    query_type,
-                    COUNT(*) as total_count,
-                    COUNT(CASE WHEN expires_at > datetime('now') THEN 1 END) as valid_count,
-                    COUNT(CASE WHEN expires_at <= datetime('now') THEN 1 END) as expired_count
-                FROM ai_cache 
-                GROUP BY query_type
-            """)
-            
-            cache_stats = {}
-            for row in cursor.fetchall():
-                query_type, total, valid, expired = row
-                cache_stats[query_type] = {
-                    'total': total,
-                    'valid': valid,
-                    'expired': expired
-                }
-            
-            # 总体统计
-            cursor = conn.execute("""
-                SELECT 
-                    COUNT(*) as total,
-                    COUNT(CASE WHEN expires_at > datetime('now') THEN 1 END) as valid,
-                    COUNT(CASE WHEN expires_at <= datetime('now') THEN 1 END) as expired
-                FROM ai_cache
-            """)
-            
-            total_stats = cursor.fetchone()
+        cache_statistics = provider.cache_store.get_statistics()
         
         return jsonify({
             'success': True,
             'cache_file': provider.cache_db,
             'cache_duration_hours': provider.cache_duration.total_seconds() / 3600,
-            'overall_stats': {
-                'total_entries': total_stats[0],
-                'valid_entries': total_stats[1],
-                'expired_entries': total_stats[2]
-            },
-            'by_query_type': cache_stats,
+            'overall_stats': cache_statistics['overall_stats'],
+            'by_query_type': cache_statistics['by_query_type'],
+            'store_stats': dict(provider.cache_store.stats),
+            'memory_cache': provider.memory_cache.get_stats(),
+            'http_pool': http_session_manager.get_stats(),
+            'scheduler': fanout_scheduler.get_stats(),
+            'single_flight': single_flight.get_stats(),
+            'maintenance': provider.cache_maintainer.get_stats(),
+            'warmup': cache_warmer.get_status(),
             'ai_services': provider.get_ai_services()
         })
         
@@ -1750,14 +1645,8 @@ def clean_expired_cache():
         
         provider = RealtimeAIDataProvider()
         
-        # 获取清理前的统计
-        import sqlite3
-        with sqlite3.connect(provider.cache_db) as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM ai_cache WHERE expires_at <= datetime('now')")
-            expired_count = cursor.fetchone()[0]
-        
         # 清理过期缓存
-        provider.clean_expired_cache()
+        expired_count = provider.clean_expired_cache()
         
         return jsonify({
             'success': True,
@@ -1909,9 +1798,8 @@ def get_ai_scores_for_university(university_name):
                 "广东", "广西", "海南", "四川", "贵州", "云南", "陕西", "甘肃", "青海"
             ]
         
-        # 使用专业数据API替代AI数据提供器
-        from models.professional_data_api import ProfessionalDataAPI
-        professional_api = ProfessionalDataAPI()
+        # 使用共享的专业数据API实例替代AI数据提供器
+        from models.professional_data_api import professional_api
         
         results = {}
         success_count = 0
@@ -1997,9 +1885,8 @@ def get_ai_scores_batch():
                 'error': '请提供院校列表'
             }), 400
         
-        # 使用专业数据API替代AI数据提供器
-        from models.professional_data_api import ProfessionalDataAPI
-        professional_api = ProfessionalDataAPI()
+        # 使用共享的专业数据API实例替代AI数据提供器
+        from models.professional_data_api import professional_api
         
         all_results = {}
         total_success = 0
@@ -2072,6 +1959,25 @@ def get_ai_scores_batch():
             'error': str(e)
         }), 500
 
+# 批量查询分数线的最大条数和并行线程数
+PROVINCE_SCORES_BATCH_LIMIT = 200
+province_scores_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="province-scores")
+
+def _format_province_scores(result: Dict[str, Any]) -> Dict[str, Any]:
+    """将专业API结果格式化为前端使用的分数线数据"""
+    scores_data = result['data']
+    return {
+        'min_score': scores_data.get('min_score'),
+        'avg_score': scores_data.get('avg_score', scores_data.get('min_score', 0) + 15),
+        'max_score': scores_data.get('max_score', scores_data.get('min_score', 0) + 50),
+        'rank': scores_data.get('rank'),
+        'batch': scores_data.get('batch', '本科一批A段'),
+        'enrollment': scores_data.get('enrollment', 50),
+        'data_source': f"专业API - {result.get('source', '权威数据')}",
+        'confidence': result.get('confidence', 0.95),
+        'major_scores': []  # 专业分数线可以后续扩展
+    }
+
 @app.route('/api/university_scores_by_province/<university_name>', methods=['POST'])
 def get_university_scores_by_province(university_name):
     """根据用户选择的省份获取大学录取分数线（使用专业API）"""
@@ -2084,9 +1990,7 @@ def get_university_scores_by_province(university_name):
         app.logger.info(f"使用专业API获取{university_name}在{selected_province}省的录取分数线")
         
         # 使用专业数据API获取准确的录取分数线
-        from models.professional_data_api import ProfessionalDataAPI
-        
-        professional_api = ProfessionalDataAPI()
+        from models.professional_data_api import professional_api
         result = professional_api.get_admission_scores(university_name, selected_province, subject, year)
         
         if result['success']:
@@ -2101,17 +2005,7 @@ def get_university_scores_by_province(university_name):
                 'province': selected_province,
                 'subject': subject,
                 'year': year,
-                'scores': {
-                    'min_score': scores_data.get('min_score'),
-                    'avg_score': scores_data.get('avg_score', scores_data.get('min_score', 0) + 15),
-                    'max_score': scores_data.get('max_score', scores_data.get('min_score', 0) + 50),
-                    'rank': scores_data.get('rank'),
-                    'batch': scores_data.get('batch', '本科一批A段'),
-                    'enrollment': scores_data.get('enrollment', 50),
-                    'data_source': f"专业API - {result.get('source', '权威数据')}",
-                    'confidence': result.get('confidence', 0.95),
-                    'major_scores': []  # 专业分数线可以后续扩展
-                },
+                'scores': _format_province_scores(result),
                 'basic_info': basic_info,
                 'data_source_type': 'professional_api',
                 'accuracy_level': 'high',
@@ -2139,6 +2033,120 @@ def get_university_scores_by_province(university_name):
             'error': str(e)
         }), 500
 
+def _lookup_province_scores(university_name: str, province: str, subject: str, year: int) -> Dict[str, Any]:
+    """查询一条 (院校, 省份, 科目, 年份) 的分数线，返回精简结果"""
+    from models.professional_data_api import professional_api
+    
+    item = {
+        'university_name': university_name,
+        'province': province,
+        'subject': subject,
+        'year': year
+    }
+    try:
+        result = professional_api.get_admission_scores(university_name, province, subject, year)
+    except Exception as e:
+        return dict(item, success=False, error=str(e))
+    
+    if not result['success']:
+        return dict(item, success=False,
+                    error=f"暂无{university_name}在{province}省{year}年{subject}的录取数据")
+    
+    return dict(
+        item,
+        success=True,
+        scores=_format_province_scores(result),
+        last_updated=result.get('last_updated')
+    )
+
+@app.route('/api/university_scores_by_province/batch', methods=['POST'])
+def get_university_scores_by_province_batch():
+    """
+    批量获取多所院校在指定省份的录取分数线
+    
+    请求体: {"queries": [{"university_name", "province", "subject", "year"}, ...],
+             "format": "json" | "ndjson"}
+    ndjson格式按完成顺序逐行返回结果，每行带有对应查询的下标 index
+    """
+    try:
+        data = request.get_json() or {}
+        queries = data.get('queries') or []
+        
+        if not isinstance(queries, list) or not queries:
+            return jsonify({
+                'success': False,
+                'error': '缺少查询列表queries'
+            }), 400
+        
+        if len(queries) > PROVINCE_SCORES_BATCH_LIMIT:
+            return jsonify({
+                'success': False,
+                'error': f'单次最多查询{PROVINCE_SCORES_BATCH_LIMIT}条'
+            }), 400
+        
+        # 规范化查询参数，相同的查询只计算一次
+        keys = []
+        for index, query in enumerate(queries):
+            if not isinstance(query, dict):
+                return jsonify({
+                    'success': False,
+                    'error': f'第{index}条查询必须是对象'
+                }), 400
+            university_name = query.get('university_name') or query.get('university') or ''
+            if not isinstance(university_name, str) or not university_name.strip():
+                return jsonify({
+                    'success': False,
+                    'error': '每条查询都必须包含university_name'
+                }), 400
+            province = query.get('province') or '北京'
+            subject = query.get('subject') or '理科'
+            if not isinstance(province, str) or not isinstance(subject, str):
+                return jsonify({
+                    'success': False,
+                    'error': f'第{index}条查询的province和subject必须是字符串'
+                }), 400
+            try:
+                year = int(query.get('year') or 2023)
+            except (TypeError, ValueError):
+                return jsonify({
+                    'success': False,
+                    'error': f'第{index}条查询的year必须是整数'
+                }), 400
+            keys.append((university_name.strip(), province, subject, year))
+        
+        futures = {key: province_scores_executor.submit(_lookup_province_scores, *key) for key in dict.fromkeys(keys)}
+        
+        wants_ndjson = (data.get('format') == 'ndjson' or
+                        'application/x-ndjson' in request.headers.get('Accept', ''))
+        if wants_ndjson:
+            positions = {}
+            for index, key in enumerate(keys):
+                positions.setdefault(key, []).append(index)
+            
+            def generate():
+                for future in as_completed(list(futures.values())):
+                    result = future.result()
+                    key = (result['university_name'], result['province'], result['subject'], result['year'])
+                    for index in positions[key]:
+                        yield dumps_text(dict(result, index=index)) + '\n'
+            
+            return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+        
+        results = [futures[key].result() for key in keys]
+        return jsonify({
+            'success': True,
+            'count': len(results),
+            'found': sum(1 for result in results if result['success']),
+            'results': results
+        })
+        
+    except Exception as e:
+        app.logger.error(f"批量获取录取分数线失败: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/api/provinces')
 def get_provinces_list():
     """获取所有省份列表，用于前端选择器"""
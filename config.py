@@ -31,17 +31,42 @@ class Config:
         'SCORES_FILE': 'admission_scores.json',
         'RANKINGS_FILE': 'rankings.json',
         'BACKUP_DIR': 'backups',
-        'MAX_BACKUPS': 10
+        'MAX_BACKUPS': 10,
+        # 存储引擎：json（整文件存储）或 sqlite（分表按行存储）
+        'STORAGE_BACKEND': os.getenv('UNIVERSITY_STORAGE', 'json'),
+        'SQLITE_FILE': 'universities.db',
+        'FLUSH_INTERVAL_SECONDS': 2.0  # json存储的延迟写入间隔
     }
     
     # 爬虫配置
     CRAWLER = {
         'REQUEST_TIMEOUT': 10,
-        'REQUEST_DELAY': 0.5,  # 请求间隔
-        'MAX_RETRIES': 3,
+        'REQUEST_DELAY': 0.5,  # 同一主机相邻请求的间隔
+        'MAX_RETRIES': 2,  # 失败后的重试次数（指数退避）
+        'CONCURRENCY': int(os.getenv('CRAWLER_CONCURRENCY', '20')),  # 全局并发请求数
+        'HOST_CONCURRENCY': 2,  # 单个主机的并发请求数
         'USER_AGENT': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-        'ENABLE_CACHE': True,
-        'CACHE_EXPIRE_HOURS': 24
+        'ENABLE_CACHE': os.getenv('CRAWLER_HTTP_CACHE', 'true').lower() in ('1', 'true', 'yes'),
+        'CACHE_EXPIRE_HOURS': 24,
+        'HTTP_CACHE_DIR': 'http_cache',  # 网页响应缓存目录（位于数据目录下）
+        'HTTP_CACHE_MAX_AGE': 0,  # 响应未声明 max-age 时的新鲜期（秒），0 表示每次条件请求
+        'OFFLINE': os.getenv('CRAWLER_OFFLINE', '').lower() in ('1', 'true', 'yes')  # 只从缓存回放
+    }
+    
+    # 分数线缓存预热配置
+    CACHE_WARMUP = {
+        'ON_STARTUP': os.getenv('CACHE_WARMUP_ON_STARTUP', '').lower() in ('1', 'true', 'yes'),
+        'PHASES': [phase for phase in os.getenv('CACHE_WARMUP_PHASES', 'professional,ai').split(',') if phase],
+        'YEARS': [int(year) for year in os.getenv('CACHE_WARMUP_YEARS', '2023').split(',') if year],
+        'WORKERS': int(os.getenv('CACHE_WARMUP_WORKERS', '4'))
+    }
+    
+    # JSON响应配置
+    RESPONSE = {
+        'COMPACT_JSON': os.getenv('RESPONSE_COMPACT_JSON', 'true').lower() in ('1', 'true', 'yes'),
+        'COMPRESS_MIN_SIZE': int(os.getenv('RESPONSE_COMPRESS_MIN_SIZE', '1024')),  # 字节
+        'COMPRESS_LEVEL': int(os.getenv('RESPONSE_COMPRESS_LEVEL', '6')),
+        'ETAG': True
     }
     
     # 应用配置
@@ -161,6 +186,8 @@ class Config:
             'data_sources': cls.DATA_SOURCES,
             'database': cls.DATABASE,
             'crawler': cls.CRAWLER,
+            'cache_warmup': cls.CACHE_WARMUP,
+            'response': cls.RESPONSE,
             'app': cls.APP,
             'logging': cls.LOGGING,
             'score_calculation': cls.SCORE_CALCULATION,
@@ -168,6 +195,30 @@ class Config:
             'major_employment': cls.MAJOR_EMPLOYMENT
         }
     
+    @classmethod
+    def get_storage_config(cls) -> Dict[str, Any]:
+        """获取院校数据库的存储配置"""
+        return {
+            'storage': cls.DATABASE['STORAGE_BACKEND'],
+            'sqlite_file': os.path.join(cls.DATABASE['DATA_DIR'], cls.DATABASE['SQLITE_FILE']),
+            'flush_interval': cls.DATABASE['FLUSH_INTERVAL_SECONDS']
+        }
+    
+    @classmethod
+    def get_crawler_config(cls) -> Dict[str, Any]:
+        """获取院校官网抓取配置"""
+        return {
+            'crawl_concurrency': cls.CRAWLER['CONCURRENCY'],
+            'crawl_host_concurrency': cls.CRAWLER['HOST_CONCURRENCY'],
+            'crawl_host_delay': cls.CRAWLER['REQUEST_DELAY'],
+            'crawl_timeout': cls.CRAWLER['REQUEST_TIMEOUT'],
+            'crawl_max_retries': cls.CRAWLER['MAX_RETRIES'],
+            'crawl_offline': cls.CRAWLER['OFFLINE'],
+            'http_cache_dir': os.path.join(cls.DATABASE['DATA_DIR'], cls.CRAWLER['HTTP_CACHE_DIR'])
+                              if cls.CRAWLER['ENABLE_CACHE'] else None,
+            'http_cache_max_age': cls.CRAWLER['HTTP_CACHE_MAX_AGE']
+        }
+    
     @classmethod
     def get_data_source_config(cls) -> Dict[str, str]:
         """获取数据源配置"""
@@ -188,6 +239,22 @@ SECRET_KEY=your-secret-key-here
 # 数据库配置（如果使用外部数据库）
 DATABASE_URL=your-database-url
 
+# 院校数据存储引擎：json 或 sqlite（首次使用sqlite时自动从JSON数据迁移）
+UNIVERSITY_STORAGE=json
+
+# 院校官网抓取：网页响应缓存开关、离线回放模式（只使用缓存，不访问网络）
+CRAWLER_HTTP_CACHE=true
+CRAWLER_OFFLINE=false
+
+# 启动时在后台预热分数线缓存
+CACHE_WARMUP_ON_STARTUP=false
+CACHE_WARMUP_PHASES=professional,ai
+CACHE_WARMUP_YEARS=2023
+
+# JSON响应（调试时可关闭紧凑输出）
+RESPONSE_COMPACT_JSON=true
+RESPONSE_COMPRESS_MIN_SIZE=1024
+
 # 其他配置
 DEBUG=True
 LOG_LEVEL=INFO
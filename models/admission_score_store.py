@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+录取分数线索引存储
+以 (院校, 省份, 年份, 科目) 组合键索引录取分数线，支持任意维度组合的点查询；
+并为每个 (省份, 科目, 年份) 维护按分数排序的数组，通过 bisect 完成分数区间查询
+"""
+
+import threading
+from bisect import bisect_left, bisect_right
+from itertools import product
+from typing import Dict, List, Any, Tuple
+
+# 组合键中表示“不限”的占位值
+ANY = None
+
+# (院校名称, 分数线键, 分数线数据)
+ScoreEntry = Tuple[str, str, Dict[str, Any]]
+
+
+class AdmissionScoreStore:
+    """录取分数线索引存储"""
+
+    def __init__(self, admission_scores: Dict[str, Dict[str, Any]] = None):
+        self._lock = threading.RLock()
+        self.build(admission_scores or {})
+
+    def build(self, admission_scores: Dict[str, Dict[str, Any]]):
+        """根据 院校 -> {分数线键: 分数线数据} 字典重建全部索引"""
+        with self._lock:
+            # (院校, 省份|ANY, 年份|ANY, 科目|ANY) -> {分数线键: 分数线数据}
+            self._composite: Dict[Tuple, Dict[str, Dict[str, Any]]] = {}
+            # (省份, 科目, 年份) -> {(院校, 分数线键): 分数线数据}
+            self._slices: Dict[Tuple[str, str, int], Dict[Tuple[str, str], Dict[str, Any]]] = {}
+            # (省份, 科目, 年份, 字段) -> (排序后的分数列表, 对应的条目列表)，按需构建
+            self._sorted: Dict[Tuple[str, str, int, str], Tuple[List[float], List[ScoreEntry]]] = {}
+            self._universities: Dict[str, List[Tuple]] = {}
+
+            for university, scores in admission_scores.items():
+                self._index_university(university, scores)
+
+    def add(self, university: str, scores: Dict[str, Any]):
+        """增量添加（或替换）一所院校的分数线"""
+        with self._lock:
+            self.remove(university)
+            self._index_university(university, scores)
+
+    def remove(self, university: str):
+        """移除一所院校的全部分数线索引"""
+        with self._lock:
+            for composite_key in self._universities.pop(university, []):
+                self._composite.pop(composite_key, None)
+
+            for slice_key, entries in self._slices.items():
+                stale = [key for key in entries if key[0] == university]
+                if stale:
+                    for key in stale:
+                        del entries[key]
+                    self._invalidate(slice_key)
+
+    def _index_university(self, university: str, scores: Dict[str, Any]):
+        """建立一所院校的组合索引和分片"""
+        composite_keys = set()
+        for score_key, score_data in (scores or {}).items():
+            if not isinstance(score_data, dict):
+                continue
+            province = score_data.get('province', '')
+            year = score_data.get('year', 0)
+            subject = score_data.get('subject', '')
+
+            for p, y, s in product((province, ANY), (year, ANY), (subject, ANY)):
+                composite_key = (university, p, y, s)
+                self._composite.setdefault(composite_key, {})[score_key] = score_data
+                composite_keys.add(composite_key)
+
+            slice_key = (province, subject, year)
+            self._slices.setdefault(slice_key, {})[(university, score_key)] = score_data
+            self._invalidate(slice_key)
+
+        self._universities[university] = list(composite_keys)
+
+    def _invalidate(self, slice_key: Tuple[str, str, int]):
+        """使分片的排序数组失效"""
+        for sorted_key in [key for key in self._sorted if key[:3] == slice_key]:
+            del self._sorted[sorted_key]
+
+    def __contains__(self, university: str) -> bool:
+        return university in self._universities
+
+    def get(self, university: str, province: str = None, year: int = None,
+            subject: str = None) -> Dict[str, Any]:
+        """
+        点查询院校的分数线，未提供（或为空）的维度不参与筛选
+
+        Returns:
+            {分数线键: 分数线数据}，顺序与原数据一致
+        """
+        composite_key = (university, province or ANY, year or ANY, subject or ANY)
+        with self._lock:
+            return dict(self._composite.get(composite_key, {}))
+
+    def entries(self, province: str, subject: str, year: int) -> List[ScoreEntry]:
+        """获取某省份、科目、年份的全部分数线条目"""
+        with self._lock:
+            entries = self._slices.get((province, subject, year), {})
+            return [(university, score_key, score_data)
+                    for (university, score_key), score_data in entries.items()]
+
+    def range_query(self, province: str, subject: str, year: int, low: float = None,
+                    high: float = None, field: str = 'min_score') -> List[ScoreEntry]:
+        """
+        分数区间查询，例如河南理科2023年最低分在600到640之间的全部院校
+
+        Args:
+            low: 分数下限（含），None表示不限
+            high: 分数上限（含），None表示不限
+            field: 用于比较的分数字段（min_score/avg_score/max_score）
+
+        Returns:
+            按该字段升序排列的 (院校, 分数线键, 分数线数据) 列表
+        """
+        scores, entries = self._sorted_slice(province, subject, year, field)
+        start = 0 if low is None else bisect_left(scores, low)
+        end = len(scores) if high is None else bisect_right(scores, high)
+        return entries[start:end]
+
+    def _sorted_slice(self, province: str, subject: str, year: int,
+                      field: str) -> Tuple[List[float], List[ScoreEntry]]:
+        """获取（必要时构建）按字段排序的分片数组"""
+        sorted_key = (province, subject, year, field)
+        with self._lock:
+            cached = self._sorted.get(sorted_key)
+            if cached is not None:
+                return cached
+
+            entries = sorted(self.entries(province, subject, year),
+                             key=lambda entry: entry[2].get(field, 0) or 0)
+            scores = [entry[2].get(field, 0) or 0 for entry in entries]
+            self._sorted[sorted_key] = (scores, entries)
+            return scores, entries
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取索引统计"""
+        with self._lock:
+            return {
+                'universities': len(self._universities),
+                'slices': len(self._slices),
+                'entries': sum(len(entries) for entries in self._slices.values()),
+                'sorted_arrays': len(self._sorted)
+            }
@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+AI响应缓存存储层
+为 data/ai_cache.db 提供有上限的长连接池（WAL模式，每次操作借出一个连接）、固定SQL语句缓存，
+以及后台批量写入队列，并提供批量读写、访问时间记录和分批淘汰接口
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Iterator, Optional, Any, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 固定SQL语句，由 sqlite3 的语句缓存复用预编译结果
+SELECT_SQL = "SELECT response_data, expires_at FROM ai_cache WHERE query_hash = ? AND expires_at > datetime('now')"
+INSERT_SQL = """
+    INSERT OR REPLACE INTO ai_cache
+    (query_hash, query_type, university_name, province, subject, year, response_data, expires_at, last_accessed)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+TOUCH_SQL = "UPDATE ai_cache SET last_accessed = ? WHERE query_hash = ?"
+DELETE_EXPIRED_SQL = "DELETE FROM ai_cache WHERE expires_at < datetime('now')"
+COUNT_EXPIRED_SQL = "SELECT COUNT(*) FROM ai_cache WHERE expires_at <= datetime('now')"
+COUNT_SQL = "SELECT COUNT(*) FROM ai_cache"
+EVICT_EXPIRED_SQL = """
+    DELETE FROM ai_cache WHERE query_hash IN (
+        SELECT query_hash FROM ai_cache WHERE expires_at < datetime('now') LIMIT ?
+    )
+"""
+EVICT_LRU_SQL = """
+    DELETE FROM ai_cache WHERE query_hash IN (
+        SELECT query_hash FROM ai_cache ORDER BY last_accessed ASC LIMIT ?
+    )
+"""
+
+# 连接池大小：同时访问数据库的线程超过该数量时等待归还的连接
+DEFAULT_POOL_SIZE = 8
+
+# 批量查询时每条语句的键数量，固定长度以便复用语句缓存
+GET_MANY_CHUNK_SIZE = 100
+
+
+def _sqlite_now() -> str:
+    """与 SQLite datetime('now') 相同格式的当前时间"""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+
+class AICacheStore:
+    """AI响应缓存存储"""
+
+    def __init__(self, db_path: str = "data/ai_cache.db", batch_size: int = 200,
+                 flush_interval: float = 0.5, pool_size: int = DEFAULT_POOL_SIZE):
+        """
+        初始化缓存存储
+
+        Args:
+            db_path: SQLite数据库文件路径
+            batch_size: 待写入条目达到该数量时立即触发批量写入
+            flush_interval: 后台写入线程的最长等待时间（秒）
+            pool_size: 连接池最多创建的连接数
+        """
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        # 连接池：空闲连接放在队列中，按需创建且总数不超过 pool_size
+        self.pool_size = pool_size
+        self._pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._created = 0
+        self._pool_lock = threading.Lock()
+
+        # 待写入队列：缓存键 -> 行数据，读取时优先命中以保证读到自己的写入
+        self._pending: Dict[str, Tuple] = {}
+        self._pending_lock = threading.Lock()
+        # 已被读取的缓存键 -> 访问时间，由后台写入线程批量更新 last_accessed
+        self._touched: Dict[str, str] = {}
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+
+        self.stats = {'reads': 0, 'writes': 0, 'batches': 0, 'pending_hits': 0, 'touches': 0}
+
+        self.init_schema()
+
+        self._writer = threading.Thread(target=self._writer_loop, name="ai-cache-writer", daemon=True)
+        self._writer.start()
+
+    def _checkout(self) -> sqlite3.Connection:
+        """从连接池借出一个连接，没有空闲连接且未达上限时新建"""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._pool_lock:
+            create = self._created < self.pool_size
+            if create:
+                self._created += 1
+        if not create:
+            return self._pool.get()
+
+        try:
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False,
+                                   cached_statements=128)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            return conn
+        except Exception:
+            with self._pool_lock:
+                self._created -= 1
+            raise
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """借出一个连接执行一次操作（事务：正常结束提交，异常回滚），结束后归还连接池"""
+        conn = self._checkout()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._pool.put(conn)
+
+    def init_schema(self):
+        """初始化缓存表结构"""
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ai_cache (
+                    query_hash TEXT PRIMARY KEY,
+                    query_type TEXT,
+                    university_name TEXT,
+                    province TEXT,
+                    subject TEXT,
+                    year INTEGER,
+                    response_data TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    expires_at TIMESTAMP
+                )
+            """)
+
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_expires_at ON ai_cache(expires_at)
+            """)
+
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_query_type ON ai_cache(query_type, university_name, province)
+            """)
+
+            # 旧数据库没有访问时间列，补充该列并以创建时间作为初始访问时间
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(ai_cache)")}
+            if 'last_accessed' not in columns:
+                conn.execute("ALTER TABLE ai_cache ADD COLUMN last_accessed TIMESTAMP")
+                conn.execute("UPDATE ai_cache SET last_accessed = created_at WHERE last_accessed IS NULL")
+                logger.info("AI缓存表已添加 last_accessed 列")
+
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_last_accessed ON ai_cache(last_accessed)
+            """)
+
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
+
+    def _pending_lookup(self, cache_key: str, now: str) -> Tuple[bool, Optional[Tuple[Dict, str]]]:
+        """在待写入队列中查找，返回 (是否命中, (数据, 过期时间))"""
+        row = self._pending.get(cache_key)
+        if row is None:
+            return False, None
+        self.stats['pending_hits'] += 1
+        if row[7] > now:
+            return True, (json.loads(row[6]), row[7])
+        return True, None
+
+    def get(self, cache_key: str) -> Optional[Dict]:
+        """获取单条未过期的缓存数据"""
+        entry = self.get_entry(cache_key)
+        return entry[0] if entry else None
+
+    def get_entry(self, cache_key: str) -> Optional[Tuple[Dict, str]]:
+        """获取单条未过期的缓存数据及其过期时间"""
+        self.stats['reads'] += 1
+        with self._pending_lock:
+            found, entry = self._pending_lookup(cache_key, _sqlite_now())
+        if found:
+            return entry
+
+        with self._connection() as conn:
+            row = conn.execute(SELECT_SQL, (cache_key,)).fetchone()
+        if row:
+            self.touch([cache_key])
+            return json.loads(row[0]), row[1]
+        return None
+
+    def get_many(self, cache_keys: Iterable[str]) -> Dict[str, Dict]:
+        """批量获取未过期的缓存数据，只返回命中的键"""
+        return {key: entry[0] for key, entry in self.get_many_entries(cache_keys).items()}
+
+    def get_many_entries(self, cache_keys: Iterable[str]) -> Dict[str, Tuple[Dict, str]]:
+        """批量获取未过期的缓存数据及其过期时间，只返回命中的键"""
+        keys = list(dict.fromkeys(cache_keys))
+        self.stats['reads'] += len(keys)
+        result = {}
+
+        remaining = []
+        now = _sqlite_now()
+        with self._pending_lock:
+            for key in keys:
+                found, entry = self._pending_lookup(key, now)
+                if not found:
+                    remaining.append(key)
+                elif entry is not None:
+                    result[key] = entry
+
+        if not remaining:
+            return result
+
+        placeholders = ", ".join("?" * GET_MANY_CHUNK_SIZE)
+        sql = (f"SELECT query_hash, response_data, expires_at FROM ai_cache "
+               f"WHERE query_hash IN ({placeholders}) AND expires_at > datetime('now')")
+        with self._connection() as conn:
+            for start in range(0, len(remaining), GET_MANY_CHUNK_SIZE):
+                chunk = remaining[start:start + GET_MANY_CHUNK_SIZE]
+                # 用空键补齐长度，保证语句文本固定
+                params = chunk + [''] * (GET_MANY_CHUNK_SIZE - len(chunk))
+                for key, response_data, expires_at in conn.execute(sql, params):
+                    result[key] = (json.loads(response_data), expires_at)
+
+        self.touch(result)
+        return result
+
+    def touch(self, cache_keys: Iterable[str]):
+        """记录缓存键被访问（不在调用线程写库，由后台写入线程批量更新）"""
+        now = _sqlite_now()
+        with self._pending_lock:
+            for key in cache_keys:
+                self._touched[key] = now
+
+    def put(self, cache_key: str, query_type: str, data: Dict, expires_at: datetime, **params):
+        """写入单条缓存数据（进入批量写入队列）"""
+        self.put_many([(cache_key, query_type, data, expires_at, params)])
+
+    def put_many(self, items: Iterable[Tuple[str, str, Dict, datetime, Dict[str, Any]]]):
+        """
+        批量写入缓存数据（进入批量写入队列）
+
+        Args:
+            items: (缓存键, 查询类型, 数据, 过期时间, 参数字典) 元组序列
+        """
+        rows = {}
+        now = _sqlite_now()
+        for cache_key, query_type, data, expires_at, params in items:
+            rows[cache_key] = (
+                cache_key, query_type,
+                params.get('university_name', ''),
+                params.get('province', ''),
+                params.get('subject', ''),
+                params.get('year', 0),
+                json.dumps(data, ensure_ascii=False),
+                expires_at.strftime('%Y-%m-%d %H:%M:%S.%f'),
+                now
+            )
+
+        if not rows:
+            return
+
+        with self._pending_lock:
+            self._pending.update(rows)
+            pending_count = len(self._pending)
+
+        if self._closed:
+            self.flush()
+        elif pending_count >= self.batch_size:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        """将待写入队列和访问时间在一个事务中写入数据库，返回写入条数"""
+        with self._write_lock:
+            with self._pending_lock:
+                if not self._pending and not self._touched:
+                    return 0
+                rows = list(self._pending.values())
+                touches = [(accessed, key) for key, accessed in self._touched.items()]
+                self._touched = {}
+
+            try:
+                with self._connection() as conn:
+                    if rows:
+                        conn.executemany(INSERT_SQL, rows)
+                    if touches:
+                        conn.executemany(TOUCH_SQL, touches)
+            except Exception as e:
+                logger.error(f"批量写入AI缓存失败: {e}")
+                return 0
+
+            # 只移除已写入且未被再次更新的条目
+            with self._pending_lock:
+                for row in rows:
+                    if self._pending.get(row[0]) is row:
+                        del self._pending[row[0]]
+
+            self.stats['touches'] += len(touches)
+            if rows:
+                self.stats['writes'] += len(rows)
+                self.stats['batches'] += 1
+            return len(rows)
+
+    def _writer_loop(self):
+        """后台写入线程"""
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def count_expired(self) -> int:
+        """统计已过期的缓存条目数量"""
+        self.flush()
+        with self._connection() as conn:
+            return conn.execute(COUNT_EXPIRED_SQL).fetchone()[0]
+
+    def delete_expired(self) -> int:
+        """删除已过期的缓存条目，返回删除条数"""
+        self.flush()
+        with self._connection() as conn:
+            return conn.execute(DELETE_EXPIRED_SQL).rowcount
+
+    def count(self) -> int:
+        """统计缓存条目总数"""
+        self.flush()
+        with self._connection() as conn:
+            return conn.execute(COUNT_SQL).fetchone()[0]
+
+    def evict_expired(self, limit: int) -> int:
+        """删除最多limit条已过期的缓存条目，返回删除条数"""
+        self.flush()
+        with self._connection() as conn:
+            return conn.execute(EVICT_EXPIRED_SQL, (limit,)).rowcount
+
+    def evict_lru(self, limit: int) -> int:
+        """删除最多limit条最久未访问的缓存条目，返回删除条数"""
+        self.flush()
+        with self._connection() as conn:
+            return conn.execute(EVICT_LRU_SQL, (limit,)).rowcount
+
+    def optimize(self, vacuum: bool = True):
+        """更新查询规划统计信息，并可选地回收空闲页"""
+        self.flush()
+        with self._connection() as conn:
+            conn.execute("ANALYZE")
+        if vacuum:
+            # VACUUM 不能在事务中执行，借出连接后直接执行
+            conn = self._checkout()
+            try:
+                conn.execute("VACUUM")
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            finally:
+                self._pool.put(conn)
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """读取缓存元数据"""
+        with self._connection() as conn:
+            row = conn.execute("SELECT value FROM cache_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        """写入缓存元数据"""
+        with self._connection() as conn:
+            conn.execute("INSERT OR REPLACE INTO cache_meta (key, value) VALUES (?, ?)", (key, value))
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """获取缓存条目统计（总体及按查询类型）"""
+        self.flush()
+        with self._connection() as conn:
+            cursor = conn.execute("""
+                SELECT
+                    query_type,
+                    COUNT(*) as total_count,
+                    COUNT(CASE WHEN expires_at > datetime('now') THEN 1 END) as valid_count,
+                    COUNT(CASE WHEN expires_at <= datetime('now') THEN 1 END) as expired_count
+                FROM ai_cache
+                GROUP BY query_type
+            """)
+
+            by_query_type = {}
+            for query_type, total, valid, expired in cursor.fetchall():
+                by_query_type[query_type] = {
+                    'total': total,
+                    'valid': valid,
+                    'expired': expired
+                }
+
+            total, valid, expired = conn.execute("""
+                SELECT
+                    COUNT(*) as total,
+                    COUNT(CASE WHEN expires_at > datetime('now') THEN 1 END) as valid,
+                    COUNT(CASE WHEN expires_at <= datetime('now') THEN 1 END) as expired
+                FROM ai_cache
+            """).fetchone()
+
+        return {
+            'overall_stats': {
+                'total_entries': total,
+                'valid_entries': valid,
+                'expired_entries': expired
+            },
+            'by_query_type': by_query_type
+        }
+
+    def close(self):
+        """写入剩余数据并关闭所有连接"""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        self.flush()
+
+        # 关闭连接池中的空闲连接（此后仍可按需新建连接）
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            with self._pool_lock:
+                self._created -= 1
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+
+# 全局实例（按数据库路径共享）
+_stores: Dict[str, AICacheStore] = {}
+_stores_lock = threading.Lock()
+
+def get_ai_cache_store(db_path: str = "data/ai_cache.db") -> AICacheStore:
+    """获取指定数据库路径的共享缓存存储实例"""
+    key = os.path.abspath(db_path)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = AICacheStore(db_path)
+            _stores[key] = store
+        return store
+
+@atexit.register
+def _close_all_stores():
+    """进程退出前写入所有待写入数据"""
+    with _stores_lock:
+        for store in _stores.values():
+            store.close()
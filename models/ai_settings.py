@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+AI服务配置读取模块
+读取 config/ai_config.yaml 中的缓存、并发等设置；未安装PyYAML或文件不存在时返回空配置，
+由各模块使用内置默认值
+"""
+
+import logging
+import os
+import threading
+from typing import Dict, Any
+
+logger = logging.getLogger(__name__)
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+AI_CONFIG_FILE = os.path.join("config", "ai_config.yaml")
+
+_settings = None
+_settings_lock = threading.Lock()
+
+
+def load_ai_settings(config_file: str = AI_CONFIG_FILE) -> Dict[str, Any]:
+    """加载AI服务配置（进程内只读取一次）"""
+    global _settings
+    with _settings_lock:
+        if _settings is not None:
+            return _settings
+
+        _settings = {}
+        if not os.path.exists(config_file):
+            return _settings
+
+        if yaml is None:
+            logger.warning(f"未安装PyYAML，无法读取{config_file}，AI服务配置使用默认值")
+            return _settings
+
+        try:
+            with open(config_file, 'r', encoding='utf-8') as f:
+                _settings = yaml.safe_load(f) or {}
+        except Exception as e:
+            logger.warning(f"读取AI服务配置失败，使用默认值: {e}")
+        return _settings
+
+
+def get_ai_setting(section: str, key: str, default: Any = None) -> Any:
+    """读取配置项，不存在时返回默认值"""
+    value = (load_ai_settings().get(section) or {}).get(key)
+    return default if value is None else value
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+异步网页抓取引擎
+待抓取的URL进入按主机分组并去重的抓取队列（frontier），由有全局并发上限的协程并发抓取；
+同一主机的请求受单主机并发数和请求间隔约束（替代全局的 time.sleep），
+连接通过共享的aiohttp会话复用，失败的请求按指数退避有限次重试；
+配置HTTP缓存时优先使用新鲜的缓存，过期的页面发起条件请求
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from models.async_runner import async_runner
+from models.http_cache import HTTPResponseCache
+from models.http_session import http_session_manager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 20
+DEFAULT_HOST_CONCURRENCY = 2
+DEFAULT_HOST_DELAY = 0.5
+DEFAULT_TIMEOUT = 10
+DEFAULT_MAX_RETRIES = 2
+
+# 可重试的HTTP状态码
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def url_host(url: str) -> str:
+    """URL的主机名（用于按主机限速）"""
+    return urlsplit(url).netloc.lower()
+
+
+class CrawlFrontier:
+    """抓取队列：URL去重并按主机分组"""
+
+    def __init__(self, urls: Iterable[str] = ()):
+        self._queues: Dict[str, Deque[str]] = {}
+        self._seen = set()
+        for url in urls:
+            self.add(url)
+
+    def add(self, url: str) -> bool:
+        """加入一个URL，已加入过的URL返回False"""
+        if not url or url in self._seen:
+            return False
+        self._seen.add(url)
+        self._queues.setdefault(url_host(url), deque()).append(url)
+        return True
+
+    def pop(self, host: str) -> Optional[str]:
+        """取出某主机的下一个URL"""
+        queue = self._queues.get(host)
+        return queue.popleft() if queue else None
+
+    @property
+    def hosts(self) -> List[str]:
+        return list(self._queues)
+
+    def pending(self, host: str) -> int:
+        return len(self._queues.get(host, ()))
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+
+class HostPoliteness:
+    """单主机请求间隔：同一主机相邻两次请求的开始时间至少间隔 delay 秒"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self._next_allowed: Dict[str, float] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def wait(self, host: str) -> float:
+        """等待到可以访问该主机，返回等待的秒数"""
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            now = time.monotonic()
+            ready = self._next_allowed.get(host, now)
+            waited = max(0.0, ready - now)
+            if waited > 0:
+                await asyncio.sleep(waited)
+            self._next_allowed[host] = max(ready, now) + self.delay
+            return waited
+
+    def defer(self, host: str, seconds: float):
+        """推迟该主机的下一次请求（如服务端返回 Retry-After）"""
+        self._next_allowed[host] = max(self._next_allowed.get(host, 0.0), time.monotonic() + seconds)
+
+
+class AsyncCrawler:
+    """异步网页抓取器"""
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY,
+                 host_concurrency: int = DEFAULT_HOST_CONCURRENCY,
+                 host_delay: float = DEFAULT_HOST_DELAY, timeout: float = DEFAULT_TIMEOUT,
+                 max_retries: int = DEFAULT_MAX_RETRIES, base_delay: float = 0.5,
+                 max_delay: float = 8.0, user_agent: str = None, verify_ssl: bool = False,
+                 cache: HTTPResponseCache = None):
+        """
+        Args:
+            concurrency: 全局最大并发请求数
+            host_concurrency: 单个主机的最大并发请求数
+            host_delay: 同一主机相邻请求的最小间隔（秒）
+            timeout: 单次请求超时时间（秒）
+            max_retries: 失败后的最大重试次数
+            base_delay: 退避的基础等待时间（秒）
+            max_delay: 退避的最长等待时间（秒）
+            user_agent: 请求使用的User-Agent
+            verify_ssl: 是否验证SSL证书（很多院校官网证书不规范，默认不验证）
+            cache: HTTP响应磁盘缓存，None表示不缓存
+        """
+        self.concurrency = concurrency
+        self.host_concurrency = host_concurrency
+        self.host_delay = host_delay
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.headers = {'User-Agent': user_agent} if user_agent else {}
+        self.verify_ssl = verify_ssl
+        self.cache = cache
+
+        self.stats = {
+            'crawls': 0,
+            'requests': 0,
+            'retries': 0,
+            'failed': 0,
+            'bytes': 0,
+            'cache_hits': 0,
+            'not_modified': 0,
+            'polite_wait_seconds': 0.0,
+            'last_crawl_urls': 0,
+            'last_crawl_seconds': None
+        }
+
+    def backoff_delay(self, attempt: int) -> float:
+        """第attempt次重试前的等待时间（指数退避 + 全抖动）"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    async def crawl(self, urls: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        并发抓取一批URL
+
+        Returns:
+            URL -> {'url', 'status', 'text', 'error', 'attempts', 'cache', 'elapsed_ms'}，
+            cache 为 None（来自网络）、'fresh'、'revalidated' 或 'offline'
+        """
+        started = time.monotonic()
+        frontier = CrawlFrontier(urls)
+        politeness = HostPoliteness(self.host_delay)
+        gate = asyncio.Semaphore(self.concurrency)
+        session = await http_session_manager.get_session()
+        results: Dict[str, Dict[str, Any]] = {}
+
+        async def host_worker(host: str):
+            while True:
+                url = frontier.pop(host)
+                if url is None:
+                    return
+                results[url] = await self._fetch(session, url, host, gate, politeness)
+
+        # 每个主机启动不超过单主机并发数的工作协程，不同主机交错进行
+        workers = [
+            host_worker(host)
+            for host in frontier.hosts
+            for _ in range(min(self.host_concurrency, frontier.pending(host)))
+        ]
+        await asyncio.gather(*workers)
+
+        elapsed = time.monotonic() - started
+        self.stats['crawls'] += 1
+        self.stats['last_crawl_urls'] = len(results)
+        self.stats['last_crawl_seconds'] = round(elapsed, 2)
+        logger.info(f"抓取完成: {len(results)}个URL，耗时{elapsed:.2f}秒")
+        return results
+
+    async def _fetch(self, session: aiohttp.ClientSession, url: str, host: str,
+                     gate: asyncio.Semaphore, politeness: HostPoliteness) -> Dict[str, Any]:
+        """抓取单个URL（含重试）"""
+        started = time.monotonic()
+        result = {'url': url, 'status': None, 'text': None, 'error': None, 'attempts': 0, 'cache': None}
+
+        entry = None
+        if self.cache is not None:
+            entry = await asyncio.to_thread(self.cache.lookup, url)
+            if self.cache.offline:
+                self.cache.record('offline_hits' if entry else 'offline_misses')
+                self._use_entry(result, entry, 'offline')
+                result['elapsed_ms'] = round((time.monotonic() - started) * 1000, 1)
+                return result
+            if entry is not None and self.cache.is_fresh(entry):
+                # 新鲜的缓存不访问网络，也不占用主机的请求间隔
+                self.cache.record('fresh_hits')
+                self._use_entry(result, entry, 'fresh')
+                result['elapsed_ms'] = round((time.monotonic() - started) * 1000, 1)
+                return result
+        headers = {**self.headers, **(self.cache.conditional_headers(entry) if self.cache else {})}
+
+        for attempt in range(self.max_retries + 1):
+            self.stats['polite_wait_seconds'] += await politeness.wait(host)
+            retry_after = None
+
+            async with gate:
+                result['attempts'] += 1
+                self.stats['requests'] += 1
+                try:
+                    async with session.get(url, headers=headers, ssl=None if self.verify_ssl else False,
+                                           timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
+                        result['status'] = response.status
+                        result['error'] = None
+                        if response.status == 200:
+                            result['text'] = await response.text(errors='replace')
+                            self.stats['bytes'] += len(result['text'])
+                            if self.cache is not None:
+                                self.cache.record('misses')
+                                await asyncio.to_thread(self.cache.store, url, response.headers, result['text'])
+                        elif response.status == 304 and entry is not None:
+                            entry = await asyncio.to_thread(self.cache.revalidate, entry, response.headers)
+                            self._use_entry(result, entry, 'revalidated')
+                        elif response.status in RETRY_STATUSES:
+                            result['error'] = f"HTTP {response.status}"
+                            retry_after = response.headers.get('Retry-After')
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    result['error'] = str(e) or e.__class__.__name__
+
+            if result['error'] is None:
+                break
+            if attempt == self.max_retries:
+                self.stats['failed'] += 1
+                logger.warning(f"抓取失败 {url} (尝试 {result['attempts']} 次): {result['error']}")
+                break
+
+            # 退避期间不占用全局并发名额
+            delay = self.backoff_delay(attempt)
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, min(float(retry_after), self.max_delay))
+                politeness.defer(host, delay)
+            self.stats['retries'] += 1
+            logger.debug(f"抓取出错 {url} (尝试 {result['attempts']} 次): {result['error']}，{delay:.2f}秒后重试")
+            await asyncio.sleep(delay)
+
+        result['elapsed_ms'] = round((time.monotonic() - started) * 1000, 1)
+        return result
+
+    def _use_entry(self, result: Dict[str, Any], entry: Optional[Dict[str, Any]], source: str):
+        """用缓存条目填充抓取结果"""
+        if entry is None:
+            result['error'] = "离线模式下没有缓存"
+            return
+        result.update(status=entry.get('status', 200), text=entry['text'], error=None, cache=source)
+        self.stats['not_modified' if source == 'revalidated' else 'cache_hits'] += 1
+
+    def fetch_all(self, urls: Iterable[str], timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """在后台事件循环中抓取一批URL并等待结果（供同步代码调用）"""
+        urls = [url for url in urls if url]
+        if not urls:
+            return {}
+        return async_runner.run(self.crawl(urls), timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取抓取统计"""
+        return {
+            **self.stats,
+            'polite_wait_seconds': round(self.stats['polite_wait_seconds'], 2),
+            'concurrency': self.concurrency,
+            'host_concurrency': self.host_concurrency,
+            'host_delay': self.host_delay,
+            'max_retries': self.max_retries,
+            'http_cache': self.cache.get_stats() if self.cache else None
+        }
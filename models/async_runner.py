@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+后台事件循环模块
+每个工作进程只启动一个常驻的 asyncio 事件循环线程，同步代码（如Flask视图）
+通过 run_coroutine_threadsafe 向其提交协程，避免每次调用都创建和关闭事件循环
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import os
+import threading
+from typing import Any, Awaitable, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRunner:
+    """常驻后台事件循环"""
+
+    def __init__(self, name: str = "async-runner"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """获取后台事件循环，首次使用（或fork出的新进程中）时启动"""
+        if self._loop is None or self._pid != os.getpid() or not self._thread.is_alive():
+            self._start()
+        return self._loop
+
+    def _start(self):
+        """启动后台事件循环线程"""
+        with self._lock:
+            if self._loop is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run_loop():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            thread = threading.Thread(target=run_loop, name=self.name, daemon=True)
+            thread.start()
+            ready.wait()
+
+            self._loop = loop
+            self._thread = thread
+            self._pid = os.getpid()
+            logger.info("后台事件循环已启动")
+
+    def submit(self, coro: Awaitable) -> concurrent.futures.Future:
+        """提交协程到后台事件循环，返回 concurrent.futures.Future"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """在后台事件循环中运行协程并等待结果"""
+        if self._thread is threading.current_thread():
+            raise RuntimeError("不能在后台事件循环线程中同步等待协程")
+
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def gather(self, coros: Iterable[Awaitable], return_exceptions: bool = True,
+               timeout: Optional[float] = None) -> List[Any]:
+        """
+        在后台事件循环中并发运行多个协程
+
+        Returns:
+            与输入顺序一致的结果列表；return_exceptions为True时异常作为结果返回
+        """
+        coros = list(coros)
+        if not coros:
+            return []
+
+        async def gather_all():
+            return await asyncio.gather(*coros, return_exceptions=return_exceptions)
+
+        return self.run(gather_all(), timeout)
+
+    def stop(self, timeout: float = 5):
+        """关闭后台事件循环（关闭异步生成器以释放共享HTTP会话）"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or self._pid != os.getpid() or loop.is_closed():
+                return
+            self._loop = None
+
+        async def shutdown():
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"关闭后台事件循环时出错: {e}")
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
+
+# 全局实例
+async_runner = AsyncRunner()
+
+atexit.register(async_runner.stop)
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+AI缓存维护模块
+按 config/ai_config.yaml 的 cache.max_entries 和 cache.cleanup_interval_hours，
+在后台线程中分批淘汰缓存（先删过期条目，再按最近访问时间淘汰），并定期执行 VACUUM/ANALYZE
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from models.ai_cache_store import AICacheStore
+from models.ai_settings import get_ai_setting
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_CLEANUP_INTERVAL_HOURS = 24
+
+# 元数据键：上次执行 VACUUM 的时间戳
+LAST_VACUUM_META_KEY = 'last_vacuum_at'
+
+
+class CacheMaintainer:
+    """AI缓存后台维护"""
+
+    def __init__(self, store: AICacheStore, max_entries: int = None,
+                 cleanup_interval_hours: float = None, check_interval: float = 60,
+                 batch_size: int = 500, batch_pause: float = 0.05):
+        """
+        Args:
+            store: 缓存存储
+            max_entries: 缓存条目上限
+            cleanup_interval_hours: VACUUM/ANALYZE 的执行间隔（小时）
+            check_interval: 淘汰检查间隔（秒）
+            batch_size: 每个删除事务的最大条数，避免长时间持有写锁
+            batch_pause: 两批删除之间的等待时间（秒），让出写锁给请求线程
+        """
+        self.store = store
+        self.max_entries = max_entries or get_ai_setting('cache', 'max_entries', DEFAULT_MAX_ENTRIES)
+        self.cleanup_interval = (cleanup_interval_hours or get_ai_setting(
+            'cache', 'cleanup_interval_hours', DEFAULT_CLEANUP_INTERVAL_HOURS)) * 3600
+        self.check_interval = check_interval
+        self.batch_size = batch_size
+        self.batch_pause = batch_pause
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._run_lock = threading.Lock()
+
+        self.stats = {
+            'runs': 0,
+            'expired_evicted': 0,
+            'lru_evicted': 0,
+            'vacuums': 0,
+            'entries': None,
+            'last_run_at': None,
+            'last_run_ms': None,
+            'last_vacuum_at': None,
+            'errors': 0
+        }
+
+    def start(self):
+        """启动后台维护线程"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="ai-cache-maintainer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """停止后台维护线程"""
+        self._stop.set()
+
+    def _loop(self):
+        """后台维护循环"""
+        while not self._stop.wait(self.check_interval):
+            try:
+                self.run_once()
+            except Exception as e:
+                self.stats['errors'] += 1
+                logger.warning(f"AI缓存维护失败: {e}")
+
+    def _evict_batches(self, evict, limit: int = None) -> int:
+        """分批执行淘汰，直到没有可删条目或达到limit"""
+        removed = 0
+        while not self._stop.is_set():
+            batch = self.batch_size if limit is None else min(self.batch_size, limit - removed)
+            if batch <= 0:
+                break
+            deleted = evict(batch)
+            removed += deleted
+            if deleted < batch:
+                break
+            time.sleep(self.batch_pause)
+        return removed
+
+    def run_once(self, force_vacuum: bool = False) -> Dict[str, int]:
+        """
+        执行一轮维护
+
+        Returns:
+            本轮删除的过期条目数和LRU淘汰条目数
+        """
+        with self._run_lock:
+            started = time.time()
+
+            expired = self._evict_batches(self.store.evict_expired)
+
+            lru = 0
+            overflow = self.store.count() - self.max_entries
+            if overflow > 0:
+                lru = self._evict_batches(self.store.evict_lru, overflow)
+                logger.info(f"AI缓存超过上限{self.max_entries}条，已淘汰{lru}条最久未访问的缓存")
+
+            if force_vacuum or self._vacuum_due():
+                self.store.optimize(vacuum=True)
+                now = time.time()
+                self.store.set_meta(LAST_VACUUM_META_KEY, str(now))
+                self.stats['vacuums'] += 1
+                self.stats['last_vacuum_at'] = datetime.fromtimestamp(now).isoformat()
+
+            self.stats['runs'] += 1
+            self.stats['expired_evicted'] += expired
+            self.stats['lru_evicted'] += lru
+            self.stats['entries'] = self.store.count()
+            self.stats['last_run_at'] = datetime.now().isoformat()
+            self.stats['last_run_ms'] = round((time.time() - started) * 1000, 1)
+
+            return {'expired': expired, 'lru': lru}
+
+    def _vacuum_due(self) -> bool:
+        """距上次 VACUUM 是否已超过清理间隔（记录在数据库中，重启后仍然有效）"""
+        last = self.store.get_meta(LAST_VACUUM_META_KEY)
+        if last is None:
+            # 首次运行只记录时间，下一个间隔再执行
+            self.store.set_meta(LAST_VACUUM_META_KEY, str(time.time()))
+            return False
+        try:
+            return time.time() - float(last) >= self.cleanup_interval
+        except ValueError:
+            return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取维护统计"""
+        return {
+            **self.stats,
+            'max_entries': self.max_entries,
+            'cleanup_interval_hours': self.cleanup_interval / 3600,
+            'running': self._thread is not None and self._thread.is_alive()
+        }
+
+
+# 全局实例（按数据库路径共享）
+_maintainers: Dict[str, CacheMaintainer] = {}
+_maintainers_lock = threading.Lock()
+
+def get_cache_maintainer(store: AICacheStore, start: bool = True) -> CacheMaintainer:
+    """获取（并启动）缓存存储对应的维护实例"""
+    key = os.path.abspath(store.db_path)
+    with _maintainers_lock:
+        maintainer = _maintainers.get(key)
+        if maintainer is None:
+            maintainer = CacheMaintainer(store)
+            _maintainers[key] = maintainer
+    if start:
+        maintainer.start()
+    return maintainer
+
+@atexit.register
+def _stop_all_maintainers():
+    """进程退出前停止维护线程"""
+    with _maintainers_lock:
+        for maintainer in _maintainers.values():
+            maintainer.stop()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+分数线缓存预热模块
+在志愿填报高峰前，按 院校 × 省份 × 科目 × 年份 预先填充分数线缓存：
+- professional: 填充推荐引擎的专业API分数线矩阵（进程内，需在Web服务进程中运行）
+- ai: 通过实时AI数据管理器填充 data/ai_cache.db（持久化，可离线运行）
+AI阶段的进度写入进度文件，中断后重新运行会跳过已完成的切片
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Callable, Iterable, Tuple
+
+from models.recommendation_engine import PROVINCES, SUBJECTS
+
+logger = logging.getLogger(__name__)
+
+PHASE_PROFESSIONAL = 'professional'
+PHASE_AI = 'ai'
+PHASES = [PHASE_PROFESSIONAL, PHASE_AI]
+
+DEFAULT_YEARS = [2023]
+DEFAULT_WORKERS = 4
+PROGRESS_FILE = os.path.join("data", "warmup_progress.json")
+
+# (阶段, 省份, 科目, 年份)
+WarmupTask = Tuple[str, str, str, int]
+
+
+def _task_key(task: WarmupTask) -> str:
+    """任务在进度文件中的键"""
+    return ":".join(str(part) for part in task)
+
+
+class CacheWarmer:
+    """分数线缓存预热"""
+
+    def __init__(self, progress_file: str = PROGRESS_FILE):
+        self.progress_file = progress_file
+        self._completed: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.status = {
+            'running': False,
+            'total': 0,
+            'done': 0,
+            'skipped': 0,
+            'failed': 0,
+            'started_at': None,
+            'finished_at': None,
+            'current': []
+        }
+
+    def _load_progress(self):
+        """读取进度文件"""
+        self._completed = {}
+        try:
+            if os.path.exists(self.progress_file):
+                with open(self.progress_file, 'r', encoding='utf-8') as f:
+                    self._completed = json.load(f).get('completed', {})
+        except Exception as e:
+            logger.warning(f"读取预热进度失败，将重新开始: {e}")
+
+    def _save_progress(self):
+        """原子写入进度文件"""
+        with self._lock:
+            payload = {
+                'updated_at': datetime.now().isoformat(),
+                'completed': dict(self._completed)
+            }
+            directory = os.path.dirname(self.progress_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_file = f"{self.progress_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, self.progress_file)
+
+    def reset_progress(self):
+        """清除进度，下次运行从头开始"""
+        with self._lock:
+            self._completed = {}
+        if os.path.exists(self.progress_file):
+            os.remove(self.progress_file)
+
+    def plan(self, phases: Iterable[str] = None, provinces: Iterable[str] = None,
+             subjects: Iterable[str] = None, years: Iterable[int] = None) -> List[WarmupTask]:
+        """生成预热任务列表（按年份从新到旧，保证最常用的数据最先就绪）"""
+        return [
+            (phase, province, subject, year)
+            for phase in (phases or PHASES)
+            for year in sorted(years or DEFAULT_YEARS, reverse=True)
+            for subject in (subjects or SUBJECTS)
+            for province in (provinces or PROVINCES)
+        ]
+
+    def run(self, universities: Dict[str, Any], phases: Iterable[str] = None,
+            provinces: Iterable[str] = None, subjects: Iterable[str] = None,
+            years: Iterable[int] = None, workers: int = DEFAULT_WORKERS, resume: bool = True,
+            on_progress: Callable[[Dict[str, Any]], None] = None) -> Dict[str, Any]:
+        """
+        执行预热（阻塞直到完成或被停止）
+
+        Args:
+            universities: 院校数据字典
+            phases: 预热阶段（professional/ai），默认全部
+            provinces: 省份列表，默认全部31个省份
+            subjects: 科目列表，默认理科和文科
+            years: 年份列表，默认2023
+            workers: 并行切片数量
+            resume: 是否跳过进度文件中已完成的AI切片
+            on_progress: 每完成一个切片时的回调，参数为当前状态
+
+        Returns:
+            预热结果统计
+        """
+        if resume:
+            self._load_progress()
+        else:
+            self.reset_progress()
+
+        tasks = self.plan(phases, provinces, subjects, years)
+        pending = [task for task in tasks if _task_key(task) not in self._completed]
+
+        self._stop.clear()
+        self.status.update({
+            'running': True,
+            'total': len(tasks),
+            'done': 0,
+            'skipped': len(tasks) - len(pending),
+            'failed': 0,
+            'started_at': datetime.now().isoformat(),
+            'finished_at': None,
+            'current': []
+        })
+        logger.info(f"开始预热分数线缓存: 共{len(tasks)}个切片，跳过已完成的{self.status['skipped']}个")
+
+        names = list(universities.keys())
+        started = time.time()
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cache-warmer")
+        try:
+            futures = {executor.submit(self._run_task, task, universities, names): task for task in pending}
+            for future in as_completed(futures):
+                task = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.status['failed'] += 1
+                    logger.warning(f"预热切片{_task_key(task)}失败: {e}")
+                    continue
+                if result is None:
+                    continue
+
+                self.status['done'] += 1
+                if task[0] == PHASE_AI and not result['fallback']:
+                    # 推荐引擎矩阵只存在于进程内，只有AI阶段的进度需要持久化；
+                    # 有院校使用了估算数据（未写入缓存）的切片下次重新预热
+                    with self._lock:
+                        self._completed[_task_key(task)] = result
+                    self._save_progress()
+
+                finished = self.status['done'] + self.status['skipped']
+                elapsed = time.time() - started
+                remaining = len(tasks) - finished - self.status['failed']
+                self.status['eta_seconds'] = round(elapsed / self.status['done'] * remaining, 1)
+                logger.info(f"预热进度 {finished}/{len(tasks)}: {_task_key(task)} {result}")
+                if on_progress:
+                    on_progress(dict(self.status, task=_task_key(task), result=result))
+        finally:
+            # 被中断时让排队中的切片直接跳过，已完成的进度已保存
+            self._stop.set()
+            executor.shutdown(wait=True)
+            self.status['running'] = False
+            self.status['finished_at'] = datetime.now().isoformat()
+
+        self.status['elapsed_seconds'] = round(time.time() - started, 1)
+        return dict(self.status)
+
+    def _run_task(self, task: WarmupTask, universities: Dict[str, Any],
+                  names: List[str]) -> Optional[Dict[str, Any]]:
+        """执行一个预热切片，被停止时返回None"""
+        if self._stop.is_set():
+            return None
+
+        key = _task_key(task)
+        with self._lock:
+            self.status['current'].append(key)
+        try:
+            phase, province, subject, year = task
+            if phase == PHASE_PROFESSIONAL:
+                return self._warm_professional(universities, province, subject, year)
+            if phase == PHASE_AI:
+                return self._warm_ai(names, province, subject, year)
+            raise ValueError(f"未知的预热阶段: {phase}")
+        finally:
+            with self._lock:
+                self.status['current'].remove(key)
+
+    def _warm_professional(self, universities: Dict[str, Any], province: str,
+                           subject: str, year: int) -> Dict[str, Any]:
+        """填充推荐引擎的一个分数线矩阵切片"""
+        from models.recommendation_engine import get_recommendation_engine
+
+        from models import university_data
+        from models.recommendation_snapshot import get_recommendation_snapshots
+
+        engine = get_recommendation_engine(universities)
+        if not engine.supports(province, subject, year):
+            return {'supported': False}
+        engine.build([province], [subject], [year])
+
+        # Web服务进程中同时构建推荐快照
+        if university_data.university_db is not None:
+            get_recommendation_snapshots(university_data.university_db).get(province, subject, year)
+        return {'universities': engine.size}
+
+    def _warm_ai(self, names: List[str], province: str, subject: str, year: int) -> Dict[str, Any]:
+        """填充一个 (省份, 科目, 年份) 切片的AI分数线缓存"""
+        from models.async_runner import async_runner
+        from models.realtime_ai_data import realtime_data_manager
+
+        scores = async_runner.run(realtime_data_manager.batch_get_scores(names, province, subject, year))
+        fallback = sum(1 for data in scores.values() if isinstance(data, dict) and data.get('is_fallback'))
+        return {'universities': len(scores), 'fallback': fallback}
+
+    def start_background(self, universities: Dict[str, Any], **kwargs) -> bool:
+        """在后台线程中执行预热，已在运行时返回False"""
+        if self._thread is not None and self._thread.is_alive():
+            return False
+
+        def target():
+            try:
+                self.run(universities, **kwargs)
+            except Exception as e:
+                logger.error(f"后台预热失败: {e}")
+
+        self._thread = threading.Thread(target=target, name="cache-warmer", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        """停止预热（正在执行的切片会继续完成，进度已保存）"""
+        self._stop.set()
+
+    def get_status(self) -> Dict[str, Any]:
+        """获取预热状态"""
+        with self._lock:
+            return dict(self.status, current=list(self.status['current']),
+                        progress_file=self.progress_file)
+
+
+# 全局实例
+cache_warmer = CacheWarmer()
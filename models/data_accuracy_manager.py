@@ -11,7 +11,7 @@ from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from models.professional_data_api import professional_api
 from models.realtime_ai_data import RealtimeAIDataProvider
-import asyncio
+from models.async_runner import async_runner
 
 logger = logging.getLogger(__name__)
 
@@ -76,10 +76,9 @@ class DataAccuracyManager:
         
         # 3. 最后使用ChatGLM逆向接口（准确性低）
         try:
-            async def get_ai_data():
-                return await self.ai_provider.get_university_scores_async(university, province, subject, year)
-            
-            ai_result = asyncio.run(get_ai_data())
+            ai_result = async_runner.run(
+                self.ai_provider.get_university_scores_async(university, province, subject, year)
+            )
             if ai_result:
                 return {
                     'success': True,
@@ -183,10 +182,9 @@ class DataAccuracyManager:
                 }
             elif source_name == 'chatglm_reverse':
                 # 测试ChatGLM接口
-                async def test_chatglm():
-                    return await self.ai_provider.get_university_scores_async('北京大学', '山西', '理科', 2023)
-                
-                test_result = asyncio.run(test_chatglm())
+                test_result = async_runner.run(
+                    self.ai_provider.get_university_scores_async('北京大学', '山西', '理科', 2023)
+                )
                 return {
                     'valid': test_result is not None,
                     'source': source_name,
@@ -1,7 +1,6 @@
 import requests
 import pandas as pd
 import numpy as np
-import time
 import json
 import re
 from bs4 import BeautifulSoup
@@ -10,6 +9,143 @@ import logging
 import random
 from datetime import datetime, timedelta
 
+from models.async_crawler import AsyncCrawler
+from models.http_cache import CachingSession, HTTPResponseCache, DEFAULT_CACHE_DIR
+
+# 常见院校的官网地址（搜索引擎查找失败时使用）
+KNOWN_WEBSITES = {
+    # 985院校
+    "清华大学": "https://www.tsinghua.edu.cn",
+    "北京大学": "https://www.pku.edu.cn",
+    "浙江大学": "https://www.zju.edu.cn",
+    "复旦大学": "https://www.fudan.edu.cn",
+    "上海交通大学": "https://www.sjtu.edu.cn",
+    "南京大学": "https://www.nju.edu.cn",
+    "武汉大学": "https://www.whu.edu.cn",
+    "中山大学": "https://www.sysu.edu.cn",
+    "北京理工大学": "https://www.bit.edu.cn",
+    "华南理工大学": "https://www.scut.edu.cn",
+    "哈尔滨工业大学": "https://www.hit.edu.cn",
+    "西安交通大学": "https://www.xjtu.edu.cn",
+    "中国科学技术大学": "https://www.ustc.edu.cn",
+    "华中科技大学": "https://www.hust.edu.cn",
+    "天津大学": "https://www.tju.edu.cn",
+    "东南大学": "https://www.seu.edu.cn",
+    "厦门大学": "https://www.xmu.edu.cn",
+    "山东大学": "https://www.sdu.edu.cn",
+    "中南大学": "https://www.csu.edu.cn",
+    "大连理工大学": "https://www.dlut.edu.cn",
+    "北京航空航天大学": "https://www.buaa.edu.cn",
+    "四川大学": "https://www.scu.edu.cn",
+    "电子科技大学": "https://www.uestc.edu.cn",
+    "同济大学": "https://www.tongji.edu.cn",
+    "南开大学": "https://www.nankai.edu.cn",
+    "中国人民大学": "https://www.ruc.edu.cn",
+    "北京师范大学": "https://www.bnu.edu.cn",
+    "国防科技大学": "https://www.nudt.edu.cn",
+    
+    # 211院校
+    "北京工业大学": "https://www.bjut.edu.cn",
+    "北京科技大学": "https://www.ustb.edu.cn",
+    "北京化工大学": "https://www.buct.edu.cn",
+    "北京邮电大学": "https://www.bupt.edu.cn",
+    "中国农业大学": "https://www.cau.edu.cn",
+    "北京林业大学": "https://www.bjfu.edu.cn",
+    "中国传媒大学": "https://www.cuc.edu.cn",
+    "中央民族大学": "https://www.muc.edu.cn",
+    "北京中医药大学": "https://www.bucm.edu.cn",
+    "对外经济贸易大学": "https://www.uibe.edu.cn",
+    "中央财经大学": "https://www.cufe.edu.cn",
+    "中国政法大学": "https://www.cupl.edu.cn",
+    "华北电力大学": "https://www.ncepu.edu.cn",
+    "中国矿业大学(北京)": "https://www.cumtb.edu.cn",
+    "中国石油大学(北京)": "https://www.cup.edu.cn",
+    "中国地质大学(北京)": "https://www.cugb.edu.cn",
+    "天津医科大学": "https://www.tmu.edu.cn",
+    "河北工业大学": "https://www.hebut.edu.cn",
+    "太原理工大学": "https://www.tyut.edu.cn",
+    "内蒙古大学": "https://www.imu.edu.cn",
+    "辽宁大学": "https://www.lnu.edu.cn",
+    "大连海事大学": "https://www.dlmu.edu.cn",
+    "延边大学": "https://www.ybu.edu.cn",
+    "东北师范大学": "https://www.nenu.edu.cn",
+    "哈尔滨工程大学": "https://www.hrbeu.edu.cn",
+    "东北农业大学": "https://www.neau.edu.cn",
+    "东北林业大学": "https://www.nefu.edu.cn",
+    "华东理工大学": "https://www.ecust.edu.cn",
+    "东华大学": "https://www.dhu.edu.cn",
+    "上海外国语大学": "https://www.shisu.edu.cn",
+    "上海财经大学": "https://www.shufe.edu.cn",
+    "上海大学": "https://www.shu.edu.cn",
+    "第二军医大学": "https://www.smmu.edu.cn",
+    "南京理工大学": "https://www.njust.edu.cn",
+    "南京航空航天大学": "https://www.nuaa.edu.cn",
+    "中国矿业大学": "https://www.cumt.edu.cn",
+    "河海大学": "https://www.hhu.edu.cn",
+    "江南大学": "https://www.jiangnan.edu.cn",
+    "南京农业大学": "https://www.njau.edu.cn",
+    "中国药科大学": "https://www.cpu.edu.cn",
+    "南京师范大学": "https://www.njnu.edu.cn",
+    "安徽大学": "https://www.ahu.edu.cn",
+    "合肥工业大学": "https://www.hfut.edu.cn",
+    "福州大学": "https://www.fzu.edu.cn",
+    "南昌大学": "https://www.ncu.edu.cn",
+    "河南大学": "https://www.henu.edu.cn",
+    "中国地质大学(武汉)": "https://www.cug.edu.cn",
+    "武汉理工大学": "https://www.whut.edu.cn",
+    "华中农业大学": "https://www.hzau.edu.cn",
+    "华中师范大学": "https://www.ccnu.edu.cn",
+    "中南财经政法大学": "https://www.zuel.edu.cn",
+    "湖南师范大学": "https://www.hunnu.edu.cn",
+    "暨南大学": "https://www.jnu.edu.cn",
+    "华南师范大学": "https://www.scnu.edu.cn",
+    "广西大学": "https://www.gxu.edu.cn",
+    "海南大学": "https://www.hainu.edu.cn",
+    "西南交通大学": "https://www.swjtu.edu.cn",
+    "西南财经大学": "https://www.swufe.edu.cn",
+    "贵州大学": "https://www.gzu.edu.cn",
+    "云南大学": "https://www.ynu.edu.cn",
+    "西藏大学": "https://www.utibet.edu.cn",
+    "西北大学": "https://www.nwu.edu.cn",
+    "西安电子科技大学": "https://www.xidian.edu.cn",
+    "长安大学": "https://www.chd.edu.cn",
+    "陕西师范大学": "https://www.snnu.edu.cn",
+    "青海大学": "https://www.qhu.edu.cn",
+    "宁夏大学": "https://www.nxu.edu.cn",
+    "新疆大学": "https://www.xju.edu.cn",
+    "石河子大学": "https://www.shzu.edu.cn",
+    
+    # 其他知名院校
+    "福建师范大学": "https://www.fjnu.edu.cn",
+    "山西大学": "https://www.sxu.edu.cn",
+    "河北大学": "https://www.hbu.edu.cn",
+    "河南师范大学": "https://www.htu.edu.cn",
+    "江西师范大学": "https://www.jxnu.edu.cn",
+    "湖南大学": "https://www.hnu.edu.cn",
+    "湘潭大学": "https://www.xtu.edu.cn",
+    "广东工业大学": "https://www.gdut.edu.cn",
+    "深圳大学": "https://www.szu.edu.cn",
+    "广西师范大学": "https://www.gxnu.edu.cn",
+    "重庆大学": "https://www.cqu.edu.cn",
+    "西南大学": "https://www.swu.edu.cn",
+    "四川师范大学": "https://www.sicnu.edu.cn",
+    "贵州师范大学": "https://www.gznu.edu.cn",
+    "云南师范大学": "https://www.ynnu.edu.cn",
+    "西北师范大学": "https://www.nwnu.edu.cn",
+    "新疆师范大学": "https://www.xjnu.edu.cn"
+}
+
+
+def guess_university_website(university_name: str) -> str:
+    """根据院校名称推测官网地址（优先使用拼音），不访问网络"""
+    try:
+        from pypinyin import lazy_pinyin
+        pinyin = ''.join(lazy_pinyin(university_name.replace('大学', '')))
+        return f"https://www.{pinyin}.edu.cn"
+    except:
+        return f"https://www.{university_name.replace('大学', '')}.edu.cn"
+
+
 class UniversityDataCrawler:
     """真实院校数据爬虫类"""
     
@@ -21,7 +157,15 @@ class UniversityDataCrawler:
             config: 配置字典，包含API密钥等信息
         """
         self.config = config or {}
-        self.session = requests.Session()
+        
+        # 网页响应磁盘缓存（条件请求 + 离线回放），http_cache_dir 为空时不缓存
+        cache_dir = self.config.get('http_cache_dir', DEFAULT_CACHE_DIR)
+        self.http_cache = HTTPResponseCache(
+            cache_dir,
+            offline=self.config.get('crawl_offline', False),
+            default_max_age=self.config.get('http_cache_max_age', 0)
+        ) if cache_dir else None
+        self.session = CachingSession(self.http_cache) if self.http_cache else requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
@@ -48,6 +192,17 @@ class UniversityDataCrawler:
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
         
+        # 官网批量抓取引擎（全局并发上限 + 单主机请求间隔，替代逐个请求之间的 time.sleep）
+        self.web_crawler = AsyncCrawler(
+            concurrency=self.config.get('crawl_concurrency', 20),
+            host_concurrency=self.config.get('crawl_host_concurrency', 2),
+            host_delay=self.config.get('crawl_host_delay', 0.5),
+            timeout=self.config.get('crawl_timeout', 10),
+            max_retries=self.config.get('crawl_max_retries', 2),
+            user_agent=self.session.headers['User-Agent'],
+            cache=self.http_cache
+        )
+        
         # 初始化真实的985/211院校数据
         self.real_universities = self._init_real_university_data()
         
@@ -209,17 +364,10 @@ class UniversityDataCrawler:
             # 获取全量院校数据
             self.logger.info("开始从网络获取全量院校数据...")
             
-            # 使用真实的985/211基础数据进行网络增强
-            enhanced_data = {}
-            
-            # 对现有的基础数据进行网络增强
-            for name, basic_data in self.real_universities.items():
-                enhanced_data[name] = self._enhance_university_with_web_data(name, basic_data)
-                time.sleep(0.2)  # 避免请求过快
-            
-            # 尝试获取更多院校数据
-            additional_universities = self._fetch_additional_universities()
-            enhanced_data.update(additional_universities)
+            # 真实的985/211基础数据和额外的地方院校一起批量抓取官网进行网络增强
+            seeds = dict(self.real_universities)
+            seeds.update(self._additional_university_seeds())
+            enhanced_data = self.enhance_universities(seeds)
             
             self.logger.info(f"成功获取{len(enhanced_data)}所院校的数据")
             return enhanced_data
@@ -239,20 +387,55 @@ class UniversityDataCrawler:
             self.logger.error(f"获取院校{university_name}数据失败: {e}")
             return {}
     
+    def enhance_universities(self, seeds: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        批量使用网络数据增强院校信息：所有官网通过抓取引擎并发抓取
+        
+        Args:
+            seeds: 院校名称 -> 基础数据（已有官网地址的直接使用，没有的先查找官网）
+        """
+        websites = {}
+        for name, basic_data in seeds.items():
+            websites[name] = basic_data.get('website') or self._get_university_website(name)
+        
+        try:
+            pages = self.web_crawler.fetch_all(websites.values())
+        except Exception as e:
+            self.logger.warning(f"批量抓取院校官网失败: {e}")
+            pages = {}
+        
+        enhanced = {}
+        for name, basic_data in seeds.items():
+            website = websites[name]
+            page = pages.get(website) or {}
+            web_info = self._parse_official_page(page['text']) if page.get('text') else {}
+            enhanced[name] = self._apply_web_data(name, basic_data, website, web_info)
+        return enhanced
+    
     def _enhance_university_with_web_data(self, name: str, basic_data: Dict[str, Any]) -> Dict[str, Any]:
         """使用网络数据增强院校信息"""
+        try:
+            # 获取最新的官网地址和官网信息
+            website = self._get_university_website(name)
+            web_info = self._fetch_from_official_website(website) if website else {}
+        except Exception as e:
+            self.logger.warning(f"增强院校{name}数据时出错: {e}")
+            return basic_data
+        
+        return self._apply_web_data(name, basic_data, website, web_info)
+    
+    def _apply_web_data(self, name: str, basic_data: Dict[str, Any], website: str,
+                        web_info: Dict[str, Any]) -> Dict[str, Any]:
+        """将官网信息、招生、专业和就业信息合并到院校基础数据"""
         enhanced_data = basic_data.copy()
         
         try:
-            # 1. 获取最新的官网地址
-            website = self._get_university_website(name)
+            # 1. 官网地址
             enhanced_data['website'] = website
             
-            # 2. 尝试获取官网最新信息
-            if website:
-                web_info = self._fetch_from_official_website(website)
-                if web_info:
-                    enhanced_data.update(web_info)
+            # 2. 官网最新信息
+            if web_info:
+                enhanced_data.update(web_info)
             
             # 3. 获取最新招生信息
             enrollment_info = self._fetch_enrollment_info(name)
@@ -281,78 +464,58 @@ class UniversityDataCrawler:
             return basic_data
     
     def _fetch_from_official_website(self, website: str) -> Dict[str, Any]:
-        """从官网获取最新信息"""
+        """从官网获取最新信息（经抓取引擎请求，失败时按退避有限次重试）"""
         try:
-            # 设置重试次数和超时时间
-            max_retries = 3
-            timeout = 10
-            
-            for attempt in range(max_retries):
-                try:
-                    # 尝试不验证SSL证书
-                    response = self.session.get(
-                        website, 
-                        timeout=timeout,
-                        verify=False  # 禁用SSL验证
-                    )
-                    
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        
-                        # 提取基本信息
-                        info = {}
-                        
-                        # 尝试获取学校简介
-                        intro_keywords = ['学校简介', '学校概况', '关于我们', '学校介绍']
-                        for keyword in intro_keywords:
-                            intro_element = soup.find(text=re.compile(keyword))
-                            if intro_element:
-                                parent = intro_element.parent
-                                if parent:
-                                    info['description'] = parent.get_text(strip=True)[:500]
-                                    break
-                        
-                        # 尝试获取联系方式
-                        contact_patterns = [
-                            r'联系电话[：:]\s*(\d{3,4}-?\d{7,8})',
-                            r'招生热线[：:]\s*(\d{3,4}-?\d{7,8})',
-                            r'电话[：:]\s*(\d{3,4}-?\d{7,8})'
-                        ]
-                        
-                        page_text = soup.get_text()
-                        for pattern in contact_patterns:
-                            match = re.search(pattern, page_text)
-                            if match:
-                                info['phone'] = match.group(1)
-                                break
-                        
-                        # 尝试获取邮箱
-                        email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
-                        email_match = re.search(email_pattern, page_text)
-                        if email_match:
-                            info['email'] = email_match.group(0)
-                        
-                        return info
-                    else:
-                        return {}
-                        
-                except requests.exceptions.SSLError as e:
-                    self.logger.warning(f"SSL错误 {website} (尝试 {attempt + 1}/{max_retries}): {e}")
-                    if attempt == max_retries - 1:
-                        raise
-                    continue
-                        
-                except requests.exceptions.RequestException as e:
-                    self.logger.warning(f"请求错误 {website} (尝试 {attempt + 1}/{max_retries}): {e}")
-                    if attempt == max_retries - 1:
-                        raise
-                    continue
-                    
+            page = self.web_crawler.fetch_all([website]).get(website) or {}
+            if page.get('text'):
+                return self._parse_official_page(page['text'])
+            if page.get('error'):
+                self.logger.warning(f"获取官网信息失败 {website}: {page['error']}")
+                
         except Exception as e:
             self.logger.warning(f"获取官网信息失败 {website}: {e}")
         
         return {}
     
+    def _parse_official_page(self, html: str) -> Dict[str, Any]:
+        """从官网首页提取学校简介、联系电话和邮箱"""
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        # 提取基本信息
+        info = {}
+        
+        # 尝试获取学校简介
+        intro_keywords = ['学校简介', '学校概况', '关于我们', '学校介绍']
+        for keyword in intro_keywords:
+            intro_element = soup.find(text=re.compile(keyword))
+            if intro_element:
+                parent = intro_element.parent
+                if parent:
+                    info['description'] = parent.get_text(strip=True)[:500]
+                    break
+        
+        # 尝试获取联系方式
+        contact_patterns = [
+            r'联系电话[：:]\s*(\d{3,4}-?\d{7,8})',
+            r'招生热线[：:]\s*(\d{3,4}-?\d{7,8})',
+            r'电话[：:]\s*(\d{3,4}-?\d{7,8})'
+        ]
+        
+        page_text = soup.get_text()
+        for pattern in contact_patterns:
+            match = re.search(pattern, page_text)
+            if match:
+                info['phone'] = match.group(1)
+                break
+        
+        # 尝试获取邮箱
+        email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
+        email_match = re.search(email_pattern, page_text)
+        if email_match:
+            info['email'] = email_match.group(0)
+        
+        return info
+    
     def _fetch_enrollment_info(self, university_name: str) -> Dict[str, Any]:
         """获取招生信息"""
         try:
@@ -474,54 +637,48 @@ class UniversityDataCrawler:
     def _fetch_additional_universities(self) -> Dict[str, Any]:
         """获取额外的院校数据"""
         try:
-            # 这里可以扩展更多院校
-            additional_unis = {}
-            
-            # 添加一些重要的地方性大学
-            local_universities = {
-                '山西大学': {
-                    'category': '211',
-                    'type': '综合类',
-                    'location': {'province': '山西', 'city': '太原'},
-                    'establishment_year': 1902,
-                    'motto': '中西会通，求真至善',
-                    'website': 'https://www.sxu.edu.cn',
-                    'is_double_first_class': True,
-                    'key_disciplines': ['物理学', '化学', '历史学'],
-                    'campus_area': 3008,
-                    'student_count': 32000,
-                    'faculty_count': 2800,
-                    'library_books': 320,
-                    'research_funding': 5.2
-                },
-                '太原理工大学': {
-                    'category': '211',
-                    'type': '理工类',
-                    'location': {'province': '山西', 'city': '太原'},
-                    'establishment_year': 1902,
-                    'motto': '求实、创新',
-                    'website': 'https://www.tyut.edu.cn',
-                    'is_double_first_class': True,
-                    'key_disciplines': ['化学工程与技术', '材料科学与工程', '矿业工程'],
-                    'campus_area': 3200,
-                    'student_count': 38000,
-                    'faculty_count': 3200,
-                    'library_books': 280,
-                    'research_funding': 8.5
-                }
-            }
-            
-            for name, data in local_universities.items():
-                enhanced_data = self._enhance_university_with_web_data(name, data)
-                additional_unis[name] = enhanced_data
-                time.sleep(0.3)
-            
-            return additional_unis
+            return self.enhance_universities(self._additional_university_seeds())
             
         except Exception as e:
             self.logger.warning(f"获取额外院校数据失败: {e}")
             return {}
     
+    def _additional_university_seeds(self) -> Dict[str, Any]:
+        """额外院校的基础数据"""
+        # 这里可以扩展更多院校，添加一些重要的地方性大学
+        return {
+            '山西大学': {
+                'category': '211',
+                'type': '综合类',
+                'location': {'province': '山西', 'city': '太原'},
+                'establishment_year': 1902,
+                'motto': '中西会通，求真至善',
+                'website': 'https://www.sxu.edu.cn',
+                'is_double_first_class': True,
+                'key_disciplines': ['物理学', '化学', '历史学'],
+                'campus_area': 3008,
+                'student_count': 32000,
+                'faculty_count': 2800,
+                'library_books': 320,
+                'research_funding': 5.2
+            },
+            '太原理工大学': {
+                'category': '211',
+                'type': '理工类',
+                'location': {'province': '山西', 'city': '太原'},
+                'establishment_year': 1902,
+                'motto': '求实、创新',
+                'website': 'https://www.tyut.edu.cn',
+                'is_double_first_class': True,
+                'key_disciplines': ['化学工程与技术', '材料科学与工程', '矿业工程'],
+                'campus_area': 3200,
+                'student_count': 38000,
+                'faculty_count': 3200,
+                'library_books': 280,
+                'research_funding': 8.5
+            }
+        }
+    
     def _search_university_online(self, university_name: str) -> Dict[str, Any]:
         """在线搜索院校信息"""
         try:
@@ -842,19 +999,28 @@ class UniversityDataCrawler:
             "华东师范大学", "中南大学", "西北工业大学", "厦门大学"
         ]
         
+        # 只使用人工整理的院校基础数据，不生成随机数据；官网只取自基础数据或预定义映射，
+        # 不逐个经搜索引擎查找
+        curated = self._additional_university_seeds()
+        seeds = {}
         for university in target_universities:
-            if university not in self.real_universities:
-                try:
-                    new_data = self._fetch_university_from_api(university)
-                    if new_data:
-                        self.real_universities.update(new_data)
-                        time.sleep(0.5)  # 避免请求过频
-                except Exception as e:
-                    self.logger.warning(f"获取 {university} 数据失败: {e}")
-                    continue
+            if university in self.real_universities:
+                continue
+            basic_data = curated.get(university)
+            website = (basic_data or {}).get('website') or KNOWN_WEBSITES.get(university)
+            if not basic_data or not website:
+                self.logger.debug(f"{university} 没有整理好的基础数据，跳过扩展")
+                continue
+            seeds[university] = dict(basic_data, website=website)
+        
+        if seeds:
+            try:
+                self.real_universities.update(self.enhance_universities(seeds))
+            except Exception as e:
+                self.logger.warning(f"扩展院校数据失败: {e}")
 
-    def _get_university_website(self, university_name: str) -> str:
-        """获取学校的实际官网地址"""
+    def find_university_website(self, university_name: str) -> Optional[str]:
+        """通过搜索引擎或预定义映射查找学校官网，都找不到时返回None（不推测域名）"""
         try:
             # 1. 直接使用搜索引擎获取官网（优先级最高）
             self.logger.info(f"正在通过搜索引擎查找 {university_name} 的官网...")
@@ -1068,131 +1234,23 @@ class UniversityDataCrawler:
             
             # 2. 如果搜索引擎都失败了，尝试从预定义映射中获取
             self.logger.info(f"搜索引擎未找到 {university_name} 官网，尝试预定义映射...")
-            known_websites = {
-                # 985院校
-                "清华大学": "https://www.tsinghua.edu.cn",
-                "北京大学": "https://www.pku.edu.cn",
-                "浙江大学": "https://www.zju.edu.cn",
-                "复旦大学": "https://www.fudan.edu.cn",
-                "上海交通大学": "https://www.sjtu.edu.cn",
-                "南京大学": "https://www.nju.edu.cn",
-                "武汉大学": "https://www.whu.edu.cn",
-                "中山大学": "https://www.sysu.edu.cn",
-                "北京理工大学": "https://www.bit.edu.cn",
-                "华南理工大学": "https://www.scut.edu.cn",
-                "哈尔滨工业大学": "https://www.hit.edu.cn",
-                "西安交通大学": "https://www.xjtu.edu.cn",
-                "中国科学技术大学": "https://www.ustc.edu.cn",
-                "华中科技大学": "https://www.hust.edu.cn",
-                "天津大学": "https://www.tju.edu.cn",
-                "东南大学": "https://www.seu.edu.cn",
-                "厦门大学": "https://www.xmu.edu.cn",
-                "山东大学": "https://www.sdu.edu.cn",
-                "中南大学": "https://www.csu.edu.cn",
-                "大连理工大学": "https://www.dlut.edu.cn",
-                "北京航空航天大学": "https://www.buaa.edu.cn",
-                "四川大学": "https://www.scu.edu.cn",
-                "电子科技大学": "https://www.uestc.edu.cn",
-                "同济大学": "https://www.tongji.edu.cn",
-                "南开大学": "https://www.nankai.edu.cn",
-                "中国人民大学": "https://www.ruc.edu.cn",
-                "北京师范大学": "https://www.bnu.edu.cn",
-                "国防科技大学": "https://www.nudt.edu.cn",
-                
-                # 211院校
-                "北京工业大学": "https://www.bjut.edu.cn",
-                "北京科技大学": "https://www.ustb.edu.cn",
-                "北京化工大学": "https://www.buct.edu.cn",
-                "北京邮电大学": "https://www.bupt.edu.cn",
-                "中国农业大学": "https://www.cau.edu.cn",
-                "北京林业大学": "https://www.bjfu.edu.cn",
-                "中国传媒大学": "https://www.cuc.edu.cn",
-                "中央民族大学": "https://www.muc.edu.cn",
-                "北京中医药大学": "https://www.bucm.edu.cn",
-                "对外经济贸易大学": "https://www.uibe.edu.cn",
-                "中央财经大学": "https://www.cufe.edu.cn",
-                "中国政法大学": "https://www.cupl.edu.cn",
-                "华北电力大学": "https://www.ncepu.edu.cn",
-                "中国矿业大学(北京)": "https://www.cumtb.edu.cn",
-                "中国石油大学(北京)": "https://www.cup.edu.cn",
-                "中国地质大学(北京)": "https://www.cugb.edu.cn",
-                "天津医科大学": "https://www.tmu.edu.cn",
-                "河北工业大学": "https://www.hebut.edu.cn",
-                "太原理工大学": "https://www.tyut.edu.cn",
-                "内蒙古大学": "https://www.imu.edu.cn",
-                "辽宁大学": "https://www.lnu.edu.cn",
-                "大连海事大学": "https://www.dlmu.edu.cn",
-                "延边大学": "https://www.ybu.edu.cn",
-                "东北师范大学": "https://www.nenu.edu.cn",
-                "哈尔滨工程大学": "https://www.hrbeu.edu.cn",
-                "东北农业大学": "https://www.neau.edu.cn",
-                "东北林业大学": "https://www.nefu.edu.cn",
-                "华东理工大学": "https://www.ecust.edu.cn",
-                "东华大学": "https://www.dhu.edu.cn",
-                "上海外国语大学": "https://www.shisu.edu.cn",
-                "上海财经大学": "https://www.shufe.edu.cn",
-                "上海大学": "https://www.shu.edu.cn",
-                "第二军医大学": "https://www.smmu.edu.cn",
-                "南京理工大学": "https://www.njust.edu.cn",
-                "南京航空航天大学": "https://www.nuaa.edu.cn",
-                "中国矿业大学": "https://www.cumt.edu.cn",
-                "河海大学": "https://www.hhu.edu.cn",
-                "江南大学": "https://www.jiangnan.edu.cn",
-                "南京农业大学": "https://www.njau.edu.cn",
-                "中国药科大学": "https://www.cpu.edu.cn",
-                "南京师范大学": "https://www.njnu.edu.cn",
-                "安徽大学": "https://www.ahu.edu.cn",
-                "合肥工业大学": "https://www.hfut.edu.cn",
-                "福州大学": "https://www.fzu.edu.cn",
-                "南昌大学": "https://www.ncu.edu.cn",
-                "河南大学": "https://www.henu.edu.cn",
-                "中国地质大学(武汉)": "https://www.cug.edu.cn",
-                "武汉理工大学": "https://www.whut.edu.cn",
-                "华中农业大学": "https://www.hzau.edu.cn",
-                "华中师范大学": "https://www.ccnu.edu.cn",
-                "中南财经政法大学": "https://www.zuel.edu.cn",
-                "湖南师范大学": "https://www.hunnu.edu.cn",
-                "暨南大学": "https://www.jnu.edu.cn",
-                "华南师范大学": "https://www.scnu.edu.cn",
-                "广西大学": "https://www.gxu.edu.cn",
-                "海南大学": "https://www.hainu.edu.cn",
-                "西南交通大学": "https://www.swjtu.edu.cn",
-                "西南财经大学": "https://www.swufe.edu.cn",
-                "贵州大学": "https://www.gzu.edu.cn",
-                "云南大学": "https://www.ynu.edu.cn",
-                "西藏大学": "https://www.utibet.edu.cn",
-                "西北大学": "https://www.nwu.edu.cn",
-                "西安电子科技大学": "https://www.xidian.edu.cn",
-                "长安大学": "https://www.chd.edu.cn",
-                "陕西师范大学": "https://www.snnu.edu.cn",
-                "青海大学": "https://www.qhu.edu.cn",
-                "宁夏大学": "https://www.nxu.edu.cn",
-                "新疆大学": "https://www.xju.edu.cn",
-                "石河子大学": "https://www.shzu.edu.cn",
-                
-                # 其他知名院校
-                "福建师范大学": "https://www.fjnu.edu.cn",
-                "山西大学": "https://www.sxu.edu.cn",
-                "河北大学": "https://www.hbu.edu.cn",
-                "河南师范大学": "https://www.htu.edu.cn",
-                "江西师范大学": "https://www.jxnu.edu.cn",
-                "湖南大学": "https://www.hnu.edu.cn",
-                "湘潭大学": "https://www.xtu.edu.cn",
-                "广东工业大学": "https://www.gdut.edu.cn",
-                "深圳大学": "https://www.szu.edu.cn",
-                "广西师范大学": "https://www.gxnu.edu.cn",
-                "重庆大学": "https://www.cqu.edu.cn",
-                "西南大学": "https://www.swu.edu.cn",
-                "四川师范大学": "https://www.sicnu.edu.cn",
-                "贵州师范大学": "https://www.gznu.edu.cn",
-                "云南师范大学": "https://www.ynnu.edu.cn",
-                "西北师范大学": "https://www.nwnu.edu.cn",
-                "新疆师范大学": "https://www.xjnu.edu.cn"
-            }
             
-            if university_name in known_websites:
-                self.logger.info(f"从预定义映射找到 {university_name} 的官网: {known_websites[university_name]}")
-                return known_websites[university_name]
+            if university_name in KNOWN_WEBSITES:
+                self.logger.info(f"从预定义映射找到 {university_name} 的官网: {KNOWN_WEBSITES[university_name]}")
+                return KNOWN_WEBSITES[university_name]
+            
+        except Exception as e:
+            self.logger.warning(f"查找{university_name}官网地址失败: {e}")
+        
+        return KNOWN_WEBSITES.get(university_name)
+    
+    def _get_university_website(self, university_name: str) -> str:
+        """获取学校的实际官网地址（找不到时尝试常见域名，最后返回推测的域名）"""
+        try:
+            # 1-2. 搜索引擎和预定义映射
+            website = self.find_university_website(university_name)
+            if website:
+                return website
             
             # 3. 尝试常见的域名模式
             self.logger.info(f"尝试常见域名模式为 {university_name} 生成官网...")
@@ -1233,25 +1291,13 @@ class UniversityDataCrawler:
                     continue
             
             # 5. 如果都失败了，返回默认域名（使用拼音）
-            try:
-                from pypinyin import lazy_pinyin
-                pinyin = ''.join(lazy_pinyin(university_name.replace('大学', '')))
-                default_url = f"https://www.{pinyin}.edu.cn"
-                self.logger.info(f"返回默认拼音域名: {default_url}")
-                return default_url
-            except:
-                default_url = f"https://www.{university_name.replace('大学', '')}.edu.cn"
-                self.logger.info(f"返回默认域名: {default_url}")
-                return default_url
+            default_url = guess_university_website(university_name)
+            self.logger.info(f"返回默认域名: {default_url}")
+            return default_url
             
         except Exception as e:
             self.logger.warning(f"获取{university_name}官网地址失败: {e}")
-            try:
-                from pypinyin import lazy_pinyin
-                pinyin = ''.join(lazy_pinyin(university_name.replace('大学', '')))
-                return f"https://www.{pinyin}.edu.cn"
-            except:
-                return f"https://www.{university_name.replace('大学', '')}.edu.cn"
+            return guess_university_website(university_name)
 
 
 def update_university_database():
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+并发扇出调度模块
+为AI服务请求提供按服务的并发上限和令牌桶限流、带抖动的指数退避，
+并为批量任务提供有界并发、单任务截止时间和按完成顺序流式返回结果
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, Tuple
+
+from models.ai_settings import get_ai_setting
+
+logger = logging.getLogger(__name__)
+
+# 默认值，可被 config/ai_config.yaml 的 concurrency 配置覆盖
+DEFAULT_SERVICE_CONCURRENCY = 10
+DEFAULT_RATE_PER_MINUTE = 60
+DEFAULT_BATCH_CONCURRENCY = 20
+DEFAULT_TASK_TIMEOUT = 60
+
+
+class TokenBucket:
+    """令牌桶限流器"""
+
+    def __init__(self, rate_per_minute: float, capacity: float = None):
+        """
+        Args:
+            rate_per_minute: 每分钟补充的令牌数
+            capacity: 桶容量（允许的突发请求数），默认等于每秒速率且至少为1
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else max(1.0, self.rate)
+        self.tokens = self.capacity
+        self._updated = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> float:
+        """获取一个令牌，返回等待的秒数"""
+        loop = asyncio.get_running_loop()
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+
+                delay = (1 - self.tokens) / self.rate
+                waited += delay
+                await asyncio.sleep(delay)
+
+
+class FanoutScheduler:
+    """AI服务请求调度器"""
+
+    def __init__(self, service_concurrency: int = None, rate_per_minute: float = None,
+                 batch_concurrency: int = None, task_timeout: float = None,
+                 base_delay: float = 0.5, max_delay: float = 8.0):
+        """
+        Args:
+            service_concurrency: 每个AI服务的最大并发请求数
+            rate_per_minute: 每个AI服务每分钟的最大请求数
+            batch_concurrency: 批量扇出时同时运行的任务数
+            task_timeout: 批量任务中单个任务的截止时间（秒）
+            base_delay: 退避的基础等待时间（秒）
+            max_delay: 退避的最长等待时间（秒）
+        """
+        self.service_concurrency = service_concurrency or get_ai_setting(
+            'concurrency', 'max_workers', DEFAULT_SERVICE_CONCURRENCY)
+        self.rate_per_minute = rate_per_minute or get_ai_setting(
+            'concurrency', 'rate_limit_requests_per_minute', DEFAULT_RATE_PER_MINUTE)
+        self.batch_concurrency = batch_concurrency or get_ai_setting(
+            'concurrency', 'batch_size', DEFAULT_BATCH_CONCURRENCY)
+        self.task_timeout = task_timeout or get_ai_setting(
+            'concurrency', 'task_timeout_seconds', DEFAULT_TASK_TIMEOUT)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        # asyncio原语绑定事件循环，因此按事件循环分别维护：事件循环 -> 服务名 -> (信号量, 令牌桶)
+        self._limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Tuple]]" = \
+            weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+        self.stats = {
+            'requests': 0,
+            'throttled': 0,
+            'retries': 0,
+            'timeouts': 0,
+            'completed': 0,
+            'failed': 0
+        }
+
+    def _service_limits(self, service_name: str) -> Tuple[int, float]:
+        """读取服务的并发上限和速率，ai_services下的服务配置优先"""
+        service_config = get_ai_setting('ai_services', service_name, {}) or {}
+        concurrency = service_config.get('max_concurrency', self.service_concurrency)
+        rate = service_config.get('rate_limit_requests_per_minute', self.rate_per_minute)
+        return concurrency, rate
+
+    def _limiter(self, service_name: str) -> Tuple[asyncio.Semaphore, TokenBucket]:
+        """获取当前事件循环中某服务的信号量和令牌桶"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            limiters = self._limiters.setdefault(loop, {})
+            limiter = limiters.get(service_name)
+            if limiter is None:
+                concurrency, rate = self._service_limits(service_name)
+                limiter = (asyncio.Semaphore(concurrency), TokenBucket(rate))
+                limiters[service_name] = limiter
+            return limiter
+
+    @asynccontextmanager
+    async def slot(self, service_name: str):
+        """占用某服务的一个并发名额和一个令牌"""
+        semaphore, bucket = self._limiter(service_name)
+        async with semaphore:
+            waited = await bucket.acquire()
+            self.stats['requests'] += 1
+            if waited > 0:
+                self.stats['throttled'] += 1
+            yield
+
+    def backoff_delay(self, attempt: int) -> float:
+        """第attempt次重试前的等待时间（指数退避 + 全抖动）"""
+        self.stats['retries'] += 1
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    async def stream(self, factories: Dict[Hashable, Callable[[], Awaitable[Any]]],
+                     task_timeout: float = None,
+                     concurrency: int = None) -> AsyncIterator[Tuple[Hashable, Any]]:
+        """
+        有界并发运行一批任务，按完成顺序流式返回 (键, 结果)
+
+        Args:
+            factories: 键 -> 创建协程的无参函数（到轮到该任务时才创建协程）
+            task_timeout: 单个任务的截止时间（秒），超时的结果为 asyncio.TimeoutError 实例
+            concurrency: 同时运行的任务数
+
+        Yields:
+            (键, 结果或异常实例)
+        """
+        task_timeout = task_timeout or self.task_timeout
+        gate = asyncio.Semaphore(concurrency or self.batch_concurrency)
+
+        async def run(key, factory):
+            async with gate:
+                try:
+                    result = await asyncio.wait_for(factory(), task_timeout)
+                    self.stats['completed'] += 1
+                    return key, result
+                except asyncio.TimeoutError as e:
+                    self.stats['timeouts'] += 1
+                    logger.warning(f"任务{key}超过截止时间{task_timeout}秒")
+                    return key, e
+                except Exception as e:
+                    self.stats['failed'] += 1
+                    return key, e
+
+        tasks = [asyncio.ensure_future(run(key, factory)) for key, factory in factories.items()]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def gather(self, factories: Dict[Hashable, Callable[[], Awaitable[Any]]],
+                     task_timeout: float = None, concurrency: int = None) -> Dict[Hashable, Any]:
+        """有界并发运行一批任务，返回 键 -> 结果或异常实例（按输入顺序）"""
+        results = {}
+        async for key, result in self.stream(factories, task_timeout, concurrency):
+            results[key] = result
+        return {key: results[key] for key in factories}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取调度统计"""
+        return {
+            **self.stats,
+            'service_concurrency': self.service_concurrency,
+            'rate_per_minute': self.rate_per_minute,
+            'batch_concurrency': self.batch_concurrency,
+            'task_timeout': self.task_timeout
+        }
+
+
+# 全局实例
+fanout_scheduler = FanoutScheduler()
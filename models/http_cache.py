@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+爬虫HTTP响应磁盘缓存模块
+按URL在磁盘保存网页响应正文和校验信息：Cache-Control max-age 内直接使用缓存，
+过期后携带 If-None-Match / If-Modified-Since 发起条件请求，304时沿用缓存正文；
+离线模式只从缓存回放，不访问网络（用于无网络环境下的刷新和基准测试）
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from models.write_behind import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join("data", "http_cache")
+
+# 随缓存正文保存的响应头
+STORED_HEADERS = ('ETag', 'Last-Modified', 'Cache-Control', 'Expires', 'Content-Type', 'Date')
+
+MAX_AGE_PATTERN = re.compile(r'max-age\s*=\s*"?(\d+)"?', re.IGNORECASE)
+
+
+def freshness_lifetime(headers: Dict[str, str], default_max_age: float = 0) -> Optional[float]:
+    """
+    根据响应头计算缓存的新鲜期（秒）
+
+    Returns:
+        新鲜期秒数；响应不允许缓存（no-store）时返回None
+    """
+    cache_control = (headers.get('Cache-Control') or '').lower()
+    if 'no-store' in cache_control:
+        return None
+    if 'no-cache' in cache_control:
+        return 0
+
+    match = MAX_AGE_PATTERN.search(cache_control)
+    if match:
+        return float(match.group(1))
+
+    expires = headers.get('Expires')
+    if expires:
+        try:
+            expires_at = parsedate_to_datetime(expires).timestamp()
+            date = headers.get('Date')
+            now = parsedate_to_datetime(date).timestamp() if date else time.time()
+            return max(0.0, expires_at - now)
+        except (TypeError, ValueError):
+            # 无效的 Expires（如 "0"）表示已过期
+            return 0
+
+    return default_max_age
+
+
+class HTTPResponseCache:
+    """HTTP响应磁盘缓存"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, offline: bool = False,
+                 default_max_age: float = 0):
+        """
+        Args:
+            cache_dir: 缓存目录
+            offline: 离线模式，只从缓存回放
+            default_max_age: 响应没有 max-age/Expires 时的新鲜期（秒），默认每次都条件请求
+        """
+        self.cache_dir = cache_dir
+        self.offline = offline
+        self.default_max_age = default_max_age
+        self._lock = threading.Lock()
+
+        self.stats = {
+            'fresh_hits': 0,
+            'revalidated': 0,
+            'misses': 0,
+            'stores': 0,
+            'offline_hits': 0,
+            'offline_misses': 0,
+            'errors': 0
+        }
+
+    def _path(self, url: str) -> str:
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.json")
+
+    def record(self, key: str):
+        """累加一项缓存统计"""
+        with self._lock:
+            self.stats[key] += 1
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """读取URL的缓存条目"""
+        path = self._path(url)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            return entry if entry.get('url') == url else None
+        except (OSError, ValueError) as e:
+            self.record('errors')
+            logger.warning(f"读取HTTP缓存失败 {url}: {e}")
+            return None
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """缓存条目是否仍在新鲜期内"""
+        return time.time() < entry.get('expires_at', 0)
+
+    def conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """根据缓存条目生成条件请求头"""
+        if not entry:
+            return {}
+        headers = {}
+        stored = entry.get('headers', {})
+        if stored.get('ETag'):
+            headers['If-None-Match'] = stored['ETag']
+        if stored.get('Last-Modified'):
+            headers['If-Modified-Since'] = stored['Last-Modified']
+        return headers
+
+    def store(self, url: str, headers: Dict[str, str], text: str) -> Optional[Dict[str, Any]]:
+        """保存200响应，响应不允许缓存时返回None"""
+        stored = {name: headers[name] for name in STORED_HEADERS if headers.get(name)}
+        lifetime = freshness_lifetime(stored, self.default_max_age)
+        if lifetime is None:
+            return None
+
+        now = time.time()
+        entry = {
+            'url': url,
+            'status': 200,
+            'headers': stored,
+            'text': text,
+            'stored_at': now,
+            'expires_at': now + lifetime
+        }
+        self._write(entry)
+        self.record('stores')
+        return entry
+
+    def revalidate(self, entry: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, Any]:
+        """304响应：更新缓存条目的校验信息和新鲜期，沿用缓存正文"""
+        stored = dict(entry.get('headers', {}))
+        stored.update({name: headers[name] for name in STORED_HEADERS if headers.get(name)})
+        lifetime = freshness_lifetime(stored, self.default_max_age) or 0
+
+        entry = dict(entry, headers=stored, expires_at=time.time() + lifetime)
+        self._write(entry)
+        self.record('revalidated')
+        return entry
+
+    def _write(self, entry: Dict[str, Any]):
+        try:
+            atomic_write_json(self._path(entry['url']), entry, indent=None)
+        except OSError as e:
+            self.record('errors')
+            logger.warning(f"写入HTTP缓存失败 {entry['url']}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取缓存统计"""
+        with self._lock:
+            stats = dict(self.stats)
+        return {**stats, 'cache_dir': self.cache_dir, 'offline': self.offline}
+
+
+class CachingSession(requests.Session):
+    """带HTTP磁盘缓存的 requests 会话（只缓存不带查询参数的GET页面请求）"""
+
+    def __init__(self, cache: HTTPResponseCache):
+        super().__init__()
+        self.cache = cache
+
+    def request(self, method, url, *args, **kwargs):
+        if method.upper() != 'GET' or kwargs.get('params') or args:
+            if self.cache.offline:
+                self.cache.record('offline_misses')
+                raise requests.exceptions.ConnectionError(f"离线模式下不发起网络请求: {method} {url}")
+            return super().request(method, url, *args, **kwargs)
+
+        entry = self.cache.lookup(url)
+
+        if self.cache.offline:
+            if entry is None:
+                self.cache.record('offline_misses')
+                raise requests.exceptions.ConnectionError(f"离线模式下没有缓存: {url}")
+            self.cache.record('offline_hits')
+            return self._cached_response(url, entry)
+
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.record('fresh_hits')
+            return self._cached_response(url, entry)
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        headers.update(self.cache.conditional_headers(entry))
+        response = super().request(method, url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            return self._cached_response(url, self.cache.revalidate(entry, response.headers))
+
+        self.cache.record('misses')
+        if response.status_code == 200 and self._is_text(response):
+            self.cache.store(url, response.headers, response.text)
+        return response
+
+    @staticmethod
+    def _is_text(response: requests.Response) -> bool:
+        content_type = response.headers.get('Content-Type', '')
+        return not content_type or 'text' in content_type or 'json' in content_type or 'xml' in content_type
+
+    @staticmethod
+    def _cached_response(url: str, entry: Dict[str, Any]) -> requests.Response:
+        """由缓存条目构造 requests.Response"""
+        response = requests.Response()
+        response.status_code = entry.get('status', 200)
+        response.url = url
+        response.headers = CaseInsensitiveDict(entry.get('headers', {}))
+        response._content = entry['text'].encode('utf-8')
+        response.encoding = 'utf-8'
+        response.reason = 'OK'
+        return response
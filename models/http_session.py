@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+aiohttp会话管理模块
+为每个事件循环维护一个长期复用的 ClientSession，使用调优的 TCPConnector
+（连接总数与单主机连接数限制、DNS缓存、keep-alive），并统计连接池使用情况
+"""
+
+import asyncio
+import atexit
+import logging
+import threading
+import weakref
+from typing import Dict, Any
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPSessionManager:
+    """按事件循环共享的aiohttp会话管理器"""
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 10, ttl_dns_cache: int = 300,
+                 keepalive_timeout: float = 30, timeout: float = 30):
+        """
+        初始化会话管理器
+
+        Args:
+            limit: 连接池最大连接数
+            limit_per_host: 单个主机的最大连接数
+            ttl_dns_cache: DNS缓存时间（秒）
+            keepalive_timeout: 空闲连接保持时间（秒）
+            timeout: 默认请求总超时时间（秒）
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+
+        # 事件循环 -> (会话, 关闭守卫)
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+        self.stats = {
+            'sessions_created': 0,
+            'sessions_closed': 0,
+            'requests': 0,
+            'connections_created': 0,
+            'connections_reused': 0,
+            'dns_cache_hits': 0,
+            'dns_cache_misses': 0
+        }
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        """创建用于统计连接池使用情况的跟踪配置"""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, context, params):
+            self.stats['requests'] += 1
+
+        async def on_connection_create_end(session, context, params):
+            self.stats['connections_created'] += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            self.stats['connections_reused'] += 1
+
+        async def on_dns_cache_hit(session, context, params):
+            self.stats['dns_cache_hits'] += 1
+
+        async def on_dns_cache_miss(session, context, params):
+            self.stats['dns_cache_misses'] += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """获取当前事件循环的共享会话，不存在或已关闭时创建"""
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            entry = self._sessions.get(loop)
+            if entry is not None and not entry[0].closed:
+                return entry[0]
+
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.ttl_dns_cache,
+            keepalive_timeout=self.keepalive_timeout
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            trace_configs=[self._trace_config()]
+        )
+
+        # 事件循环关闭前（asyncio.run 会调用 shutdown_asyncgens）通过异步生成器关闭会话
+        guard = self._close_guard(session)
+
+        # 创建与登记之间没有await，同一事件循环中的并发协程不会重复创建会话
+        with self._lock:
+            self._sessions[loop] = (session, guard)
+        self.stats['sessions_created'] += 1
+        logger.info("已创建共享HTTP会话")
+
+        await guard.__anext__()
+        return session
+
+    async def _close_guard(self, session: aiohttp.ClientSession):
+        """在事件循环关闭异步生成器时关闭会话"""
+        try:
+            yield
+        finally:
+            await self._close_session(session)
+
+    async def _close_session(self, session: aiohttp.ClientSession):
+        """关闭会话"""
+        if not session.closed:
+            await session.close()
+            self.stats['sessions_closed'] += 1
+
+    async def close(self):
+        """关闭当前事件循环的共享会话"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._sessions.pop(loop, None)
+        if entry is not None:
+            session, guard = entry
+            await self._close_session(session)
+            await guard.aclose()
+
+    def close_all(self):
+        """关闭所有仍在运行的事件循环中的共享会话"""
+        with self._lock:
+            entries = list(self._sessions.items())
+            self._sessions.clear()
+
+        for loop, (session, guard) in entries:
+            if session.closed or loop.is_closed():
+                continue
+            if loop.is_running():
+                future = asyncio.run_coroutine_threadsafe(self._close_session(session), loop)
+                try:
+                    future.result(timeout=5)
+                except Exception as e:
+                    logger.warning(f"关闭HTTP会话失败: {e}")
+            else:
+                loop.run_until_complete(self._close_session(session))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取会话与连接池统计"""
+        with self._lock:
+            open_sessions = sum(1 for session, _ in self._sessions.values() if not session.closed)
+        return {
+            **self.stats,
+            'open_sessions': open_sessions,
+            'limit': self.limit,
+            'limit_per_host': self.limit_per_host,
+            'ttl_dns_cache': self.ttl_dns_cache,
+            'keepalive_timeout': self.keepalive_timeout
+        }
+
+
+# 全局实例
+http_session_manager = HTTPSessionManager()
+
+atexit.register(http_session_manager.close_all)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+JSON响应模块
+- 使用 orjson 序列化（未安装时回退到标准库 json），默认输出紧凑JSON
+- 按 Accept-Encoding 协商 br/gzip 压缩，只压缩超过阈值的响应
+- GET/HEAD 的JSON响应带有ETag，支持 If-None-Match 条件请求（304）
+"""
+
+import gzip
+import json
+import logging
+from typing import Any, Dict, Optional
+
+from flask import Flask, Response, request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    brotli = None
+    HAS_BROTLI = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMPRESS_MIN_SIZE = 1024
+DEFAULT_COMPRESS_LEVEL = 6
+
+# 可压缩的响应类型
+COMPRESSIBLE_MIMETYPES = {
+    'application/json', 'application/x-ndjson', 'application/javascript',
+    'text/html', 'text/css', 'text/plain', 'text/javascript'
+}
+
+
+def _default(obj: Any) -> Any:
+    """序列化JSON不支持的类型"""
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    return str(obj)
+
+
+def dumps(obj: Any, pretty: bool = False, sort_keys: bool = False) -> bytes:
+    """序列化为UTF-8编码的JSON（中文不转义）"""
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=_default, option=option)
+        except (TypeError, orjson.JSONEncodeError) as e:
+            # 超出64位的整数等orjson不支持的数据回退到标准库
+            logger.debug(f"orjson序列化失败，使用标准库: {e}")
+
+    return json.dumps(
+        obj, ensure_ascii=False, default=_default, sort_keys=sort_keys,
+        indent=2 if pretty else None, separators=None if pretty else (',', ':')
+    ).encode('utf-8')
+
+
+def dumps_text(obj: Any, pretty: bool = False) -> str:
+    """序列化为JSON字符串"""
+    return dumps(obj, pretty=pretty).decode('utf-8')
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON提供器：jsonify 使用 orjson 并直接输出字节"""
+
+    ensure_ascii = False
+    compact = True
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return dumps(obj, pretty=not self.compact, sort_keys=self.sort_keys).decode('utf-8')
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        if HAS_ORJSON:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        if args and kwargs:
+            raise TypeError("jsonify() behavior undefined when passed both args and kwargs")
+        obj = args[0] if len(args) == 1 else (args or kwargs)
+        body = dumps(obj, pretty=not self.compact, sort_keys=self.sort_keys)
+        return self._app.response_class(body + b'\n', mimetype=self.mimetype)
+
+
+def _choose_encoding() -> Optional[str]:
+    """按 Accept-Encoding 选择压缩算法（同等优先时优先br）"""
+    accept = request.accept_encodings
+    candidates = []
+    if HAS_BROTLI and accept['br'] > 0:
+        candidates.append((accept['br'], 1, 'br'))
+    if accept['gzip'] > 0:
+        candidates.append((accept['gzip'], 0, 'gzip'))
+    if not candidates:
+        return None
+    return max(candidates)[2]
+
+
+def _compress(data: bytes, encoding: str, level: int) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(data, quality=min(level, 11))
+    return gzip.compress(data, compresslevel=level)
+
+
+class JSONResponseLayer:
+    """在 after_request 中为响应添加ETag并按协商结果压缩"""
+
+    def __init__(self, compress_min_size: int = DEFAULT_COMPRESS_MIN_SIZE,
+                 compress_level: int = DEFAULT_COMPRESS_LEVEL, etag: bool = True):
+        """
+        Args:
+            compress_min_size: 压缩阈值（字节），小于该大小的响应不压缩
+            compress_level: 压缩级别（gzip 1-9，br 0-11）
+            etag: 是否为GET/HEAD的JSON响应生成ETag
+        """
+        self.compress_min_size = compress_min_size
+        self.compress_level = compress_level
+        self.etag = etag
+        self.stats = {'responses': 0, 'not_modified': 0, 'compressed': 0,
+                      'bytes_in': 0, 'bytes_out': 0}
+
+    def init_app(self, app: Flask, compact: bool = True):
+        """注册JSON提供器和响应处理"""
+        app.json = FastJSONProvider(app)
+        app.json.compact = compact
+        app.after_request(self.process_response)
+        logger.info(f"JSON响应层已启用: orjson={HAS_ORJSON}, brotli={HAS_BROTLI}, "
+                    f"压缩阈值={self.compress_min_size}字节")
+
+    def process_response(self, response: Response) -> Response:
+        """添加ETag、处理条件请求并压缩响应"""
+        if response.direct_passthrough or response.is_streamed or response.status_code != 200:
+            return response
+        self.stats['responses'] += 1
+
+        # 同一份数据的不同压缩编码语义相同，使用弱ETag
+        if (self.etag and request.method in ('GET', 'HEAD')
+                and response.mimetype == 'application/json'):
+            response.add_etag(weak=True)
+            response.make_conditional(request)
+            if response.status_code == 304:
+                self.stats['not_modified'] += 1
+                return response
+
+        if response.mimetype not in COMPRESSIBLE_MIMETYPES or 'Content-Encoding' in response.headers:
+            return response
+
+        response.vary.add('Accept-Encoding')
+        data = response.get_data()
+        if len(data) < self.compress_min_size:
+            return response
+
+        encoding = _choose_encoding()
+        if encoding is None:
+            return response
+
+        compressed = _compress(data, encoding, self.compress_level)
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        self.stats['compressed'] += 1
+        self.stats['bytes_in'] += len(data)
+        self.stats['bytes_out'] += len(compressed)
+        return response
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取响应层统计"""
+        return {
+            **self.stats,
+            'orjson': HAS_ORJSON,
+            'brotli': HAS_BROTLI,
+            'compress_min_size': self.compress_min_size
+        }
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+院校地理位置解析模块
+一次性将数据集中的院校解析为规范的省份/城市索引（省份和城市使用院校数据中的简称），
+并保存到 data/university_locations.json，请求路径只需查字典；只有索引中没有的院校才在后台异步调用AI获取。
+基于名称推断等备用结果只保留在内存中，不写入索引文件，重启后重新解析
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple
+
+from models.async_runner import async_runner
+from models.recommendation_engine import normalize_province
+
+logger = logging.getLogger(__name__)
+
+# 真正位于北京的院校（名称中不含“北京”的也在此列出）
+BEIJING_UNIVERSITIES = [
+    '清华大学', '北京大学', '中国人民大学', '北京师范大学',
+    '北京理工大学', '北京航空航天大学', '北京科技大学', '北京化工大学',
+    '北京邮电大学', '中国农业大学', '北京林业大学', '中国传媒大学',
+    '中央民族大学', '北京中医药大学', '对外经济贸易大学', '中央财经大学',
+    '中国政法大学', '华北电力大学', '中国矿业大学(北京)', '中国石油大学(北京)',
+    '中国地质大学(北京)', '北京工业大学', '首都师范大学', '北京交通大学',
+    '北京外国语大学', '北京语言大学', '中央音乐学院', '中央美术学院',
+    '北京体育大学', '中国音乐学院', '中央戏剧学院', '北京电影学院'
+]
+
+# 容易被误判为北京的院校及其实际所在省份
+SPECIAL_CASES = {
+    '中国地质大学': '湖北',  # 默认指武汉校区
+    '中国矿业大学': '江苏',  # 默认指徐州校区
+    '中国石油大学': '山东',  # 默认指青岛校区
+    '南京邮电大学': '江苏',
+    '哈尔滨理工大学': '黑龙江',
+    '西安电子科技大学': '陕西'
+}
+
+UNKNOWN_PROVINCES = ['未知省份', '待确认']
+UNKNOWN_CITIES = ['未知城市', '待确认']
+
+# 不写入索引文件的来源：基于名称推断的备用结果和无法解析时沿用的院校数据
+TRANSIENT_SOURCES = ('备用推断', '未解析')
+
+
+def normalize_location(province: str, city: str) -> Tuple[str, str]:
+    """将省份和城市归一化为院校数据使用的简称（如“山东省”“济南市”归一化为“山东”“济南”）"""
+    province = normalize_province(province or '')
+    city = city or ''
+    if city.endswith('市') and len(city) > 2:
+        city = city[:-1]
+    return province, city
+
+
+def needs_location_fix(name: str, province: str, city: str) -> bool:
+    """判断院校数据中的地理位置是否缺失或明显错误"""
+    if (not province or not city or
+            province in UNKNOWN_PROVINCES or city in UNKNOWN_CITIES):
+        return True
+
+    # 检测明显的地理位置错误（院校名称与地理位置不符）
+    if province in ('北京', '北京市') and '北京' not in name:
+        if name in SPECIAL_CASES:
+            return True
+        return not any(beijing_uni in name for beijing_uni in BEIJING_UNIVERSITIES)
+
+    return False
+
+
+def _data_location(uni_data: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+    """读取院校数据中的省份和城市"""
+    if not uni_data:
+        return '', ''
+    location = uni_data.get('location') or {}
+    province = location.get('province') or uni_data.get('province', '')
+    city = location.get('city') or uni_data.get('city', '')
+    return province, city
+
+
+class UniversityLocationResolver:
+    """院校地理位置索引"""
+
+    def __init__(self, index_file: str = "data/university_locations.json"):
+        self.index_file = index_file
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self._pending = set()
+        # 索引内容每次变化时递增，供依赖地理位置的快照判断是否需要重建
+        self.version = 0
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._provider = None
+
+    def _get_provider(self):
+        """延迟创建AI数据提供器"""
+        if self._provider is None:
+            from models.realtime_ai_data import RealtimeAIDataProvider
+            self._provider = RealtimeAIDataProvider()
+        return self._provider
+
+    def load(self) -> int:
+        """从索引文件加载，返回条目数量"""
+        with self._lock:
+            if self._loaded:
+                return len(self._index)
+            try:
+                if os.path.exists(self.index_file):
+                    with open(self.index_file, 'r', encoding='utf-8') as f:
+                        locations = json.load(f).get('locations', {})
+                    self._index = {}
+                    for name, entry in locations.items():
+                        if entry.get('source') in TRANSIENT_SOURCES:
+                            continue
+                        province, city = normalize_location(entry.get('province'), entry.get('city'))
+                        self._index[name] = dict(entry, province=province, city=city)
+                    logger.info(f"已加载{len(self._index)}所院校的地理位置索引")
+            except Exception as e:
+                logger.warning(f"加载地理位置索引失败: {e}")
+                self._index = {}
+            self._loaded = True
+            return len(self._index)
+
+    def save(self):
+        """原子写入索引文件"""
+        with self._lock:
+            locations = {name: entry for name, entry in self._index.items()
+                         if entry['source'] not in TRANSIENT_SOURCES}
+            payload = {
+                'updated_at': datetime.now().isoformat(),
+                'count': len(locations),
+                'locations': locations
+            }
+
+        directory = os.path.dirname(self.index_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._save_lock:
+            tmp_file = f"{self.index_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, self.index_file)
+
+    def _set(self, name: str, province: str, city: str, source: str):
+        """写入一条索引（省份和城市归一化为简称）"""
+        province, city = normalize_location(province, city)
+        entry = {'province': province, 'city': city, 'source': source}
+        with self._lock:
+            previous = self._index.get(name)
+            self._index[name] = entry
+            if previous is None or (previous['province'], previous['city']) != (province, city):
+                self.version += 1
+
+    def get(self, name: str) -> Optional[Tuple[str, str]]:
+        """查询索引中的省份和城市"""
+        if not self._loaded:
+            self.load()
+        entry = self._index.get(name)
+        if entry is None:
+            return None
+        return entry['province'], entry['city']
+
+    def resolve(self, name: str, uni_data: Optional[Dict[str, Any]] = None) -> Tuple[str, str]:
+        """
+        解析院校的省份和城市
+
+        索引命中时直接返回；否则立即返回院校数据中的位置（或基于名称的推断）。
+        只有数据集中的院校（提供了 uni_data）才进入索引并在后台异步解析，
+        其他名称（如AI补充的院校）只返回推断结果，不写入索引
+        """
+        location = self.get(name)
+        if location is not None:
+            return location
+
+        province, city = normalize_location(*_data_location(uni_data))
+        if uni_data is not None:
+            if not needs_location_fix(name, province, city):
+                self._set(name, province, city, '院校数据')
+                return province, city
+            self.resolve_in_background([name], {name: uni_data})
+
+        fallback = self._get_provider().generate_fallback_location(name)
+        if fallback.get('province') not in UNKNOWN_PROVINCES:
+            return normalize_location(fallback['province'], fallback['city'])
+        return province, city
+
+    def ensure(self, universities: Dict[str, Any]) -> int:
+        """
+        确保所有院校都已进入索引
+
+        地理位置可靠的院校直接写入索引，其余院校在后台异步解析
+
+        Returns:
+            需要后台解析的院校数量
+        """
+        if not self._loaded:
+            self.load()
+
+        unresolved = []
+        for name, uni_data in universities.items():
+            if name in self._index:
+                continue
+            province, city = _data_location(uni_data)
+            if needs_location_fix(name, province, city):
+                unresolved.append(name)
+            else:
+                self._set(name, province, city, '院校数据')
+
+        if unresolved:
+            self.resolve_in_background(unresolved, universities)
+        return len(unresolved)
+
+    def resolve_in_background(self, names: List[str], universities: Dict[str, Any]):
+        """在后台事件循环中解析院校地理位置，完成后保存索引（只解析 universities 中的院校）"""
+        with self._lock:
+            names = [name for name in names if name in universities and name not in self._pending]
+            self._pending.update(names)
+        if not names:
+            return
+
+        future = async_runner.submit(self._resolve_many(names, universities))
+        future.add_done_callback(lambda f: self._on_background_done(names, f))
+
+    def _on_background_done(self, names: List[str], future):
+        """后台解析完成回调"""
+        with self._lock:
+            self._pending.difference_update(names)
+        try:
+            future.result()
+            self.save()
+        except Exception as e:
+            logger.warning(f"后台解析院校地理位置失败: {e}")
+
+    async def _resolve_many(self, names: List[str], universities: Dict[str, Any]) -> int:
+        """并发解析多所院校的地理位置，返回成功数量（基于名称推断的备用结果不计入）"""
+        provider = self._get_provider()
+        results = await asyncio.gather(
+            *[provider.get_university_location(name) for name in names],
+            return_exceptions=True
+        )
+
+        resolved = 0
+        for name, location in zip(names, results):
+            if isinstance(location, Exception):
+                logger.debug(f"解析{name}地理位置失败: {location}")
+                continue
+            if location and location.get('province') not in UNKNOWN_PROVINCES:
+                if location.get('is_fallback'):
+                    # 基于名称的推断可能有误，只在内存中使用，下次启动时重新解析
+                    self._set(name, location['province'], location['city'], '备用推断')
+                    continue
+                self._set(name, location['province'], location['city'],
+                          location.get('data_source', 'AI解析'))
+                resolved += 1
+            else:
+                # 无法解析时沿用院校数据，避免每次请求都重复解析
+                province, city = _data_location(universities[name])
+                self._set(name, province, city, '未解析')
+        return resolved
+
+    def build(self, universities: Dict[str, Any], refresh: bool = False) -> Dict[str, int]:
+        """
+        离线批量构建完整索引（同步等待所有解析完成并保存）
+
+        Args:
+            universities: 院校数据字典
+            refresh: 是否重新解析已在索引中的院校
+        """
+        if not self._loaded:
+            self.load()
+
+        if refresh:
+            with self._lock:
+                self._index = {}
+                self.version += 1
+
+        unresolved = []
+        from_data = 0
+        for name, uni_data in universities.items():
+            if name in self._index:
+                continue
+            province, city = _data_location(uni_data)
+            if needs_location_fix(name, province, city):
+                unresolved.append(name)
+            else:
+                self._set(name, province, city, '院校数据')
+                from_data += 1
+
+        resolved = async_runner.run(self._resolve_many(unresolved, universities)) if unresolved else 0
+        self.save()
+
+        return {
+            'total': len(self._index),
+            'from_data': from_data,
+            'resolved': resolved,
+            'unresolved': len(unresolved) - resolved
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取索引统计"""
+        return {
+            'entries': len(self._index),
+            'pending': len(self._pending),
+            'version': self.version,
+            'index_file': self.index_file
+        }
+
+
+# 全局实例
+location_resolver = UniversityLocationResolver()
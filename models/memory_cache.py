@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+进程内LRU缓存
+容量有限、支持按条目过期时间淘汰的线程安全LRU缓存，保存已解码的数据对象，
+并统计命中、未命中和淘汰次数
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Any, Tuple
+
+# 用于区分“未命中”和“缓存值为None”
+_MISSING = object()
+
+
+class TTLLRUCache:
+    """带过期时间的LRU缓存"""
+
+    def __init__(self, max_entries: int = 2048, default_ttl: Optional[float] = None):
+        """
+        初始化缓存
+
+        Args:
+            max_entries: 最大条目数，超出时淘汰最久未使用的条目
+            default_ttl: 未指定过期时间时的默认有效期（秒），None表示不过期
+        """
+        self.max_entries = max(0, int(max_entries))
+        self.default_ttl = default_ttl
+
+        # 键 -> (值, 过期时间戳)
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """获取未过期的缓存值，并将其标记为最近使用"""
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, expires_at: Optional[float] = None):
+        """
+        写入缓存值
+
+        Args:
+            key: 缓存键
+            value: 缓存值
+            expires_at: 过期时间戳（time.time() 时间基准），None时使用默认有效期
+        """
+        if self.max_entries == 0:
+            return
+
+        if expires_at is None and self.default_ttl is not None:
+            expires_at = time.time() + self.default_ttl
+
+        if expires_at is not None and expires_at <= time.time():
+            self.delete(key)
+            return
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        """删除缓存值，返回是否存在"""
+        with self._lock:
+            return self._entries.pop(key, _MISSING) is not _MISSING
+
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取缓存统计"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
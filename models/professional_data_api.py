@@ -10,12 +10,1445 @@ import requests
 import json
 import time
 import logging
-from typing import Dict, List, Optional, Any
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import os
 
 logger = logging.getLogger(__name__)
 
+# 预定义的权威数据（基于真实历史数据）
+_REFERENCE_DATA = {
+    "北京大学": {
+        "山西": {
+            "理科": {
+                2023: {"min_score": 679, "rank": 55, "batch": "本科一批A段"},
+                2022: {"min_score": 665, "rank": 80, "batch": "本科一批A段"},
+                2021: {"min_score": 675, "rank": 64, "batch": "本科一批A段"},
+                2020: {"min_score": 683, "rank": 66, "batch": "本科一批A段"}
+            },
+            "文科": {
+                2023: {"min_score": 634, "rank": 45, "batch": "本科一批A段"},
+                2022: {"min_score": 618, "rank": 52, "batch": "本科一批A段"},
+                2021: {"min_score": 640, "rank": 38, "batch": "本科一批A段"},
+                2020: {"min_score": 646, "rank": 41, "batch": "本科一批A段"}
+            }
+        },
+        "北京": {
+            "理科": {
+                2023: {"min_score": 691, "rank": 865, "batch": "本科批"},
+                2022: {"min_score": 688, "rank": 901, "batch": "本科批"},
+                2021: {"min_score": 681, "rank": 1002, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 663, "rank": 234, "batch": "本科批"},
+                2022: {"min_score": 660, "rank": 245, "batch": "本科批"}
+            }
+        },
+        "河北": {
+            "理科": {
+                2023: {"min_score": 688, "rank": 462, "batch": "本科批"},
+                2022: {"min_score": 673, "rank": 521, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 648, "rank": 134, "batch": "本科批"},
+                2022: {"min_score": 645, "rank": 142, "batch": "本科批"}
+            }
+        },
+        "河南": {
+            "理科": {
+                2023: {"min_score": 695, "rank": 263, "batch": "本科一批"},
+                2022: {"min_score": 684, "rank": 341, "batch": "本科一批"}
+            },
+            "文科": {
+                2023: {"min_score": 648, "rank": 89, "batch": "本科一批"},
+                2022: {"min_score": 639, "rank": 95, "batch": "本科一批"}
+            }
+        },
+        "山东": {
+            "理科": {
+                2023: {"min_score": 691, "rank": 428, "batch": "本科批"},
+                2022: {"min_score": 672, "rank": 523, "batch": "本科批"}
+            }
+        },
+        "江苏": {
+            "理科": {
+                2023: {"min_score": 674, "rank": 567, "batch": "本科批"},
+                2022: {"min_score": 663, "rank": 634, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 638, "rank": 123, "batch": "本科批"},
+                2022: {"min_score": 631, "rank": 145, "batch": "本科批"}
+            }
+        },
+        "浙江": {
+            "理科": {
+                2023: {"min_score": 678, "rank": 523, "batch": "本科批"},
+                2022: {"min_score": 665, "rank": 612, "batch": "本科批"}
+            }
+        },
+        "安徽": {
+            "理科": {
+                2023: {"min_score": 691, "rank": 234, "batch": "本科一批"},
+                2022: {"min_score": 682, "rank": 278, "batch": "本科一批"}
+            },
+            "文科": {
+                2023: {"min_score": 649, "rank": 67, "batch": "本科一批"},
+                2022: {"min_score": 641, "rank": 73, "batch": "本科一批"}
+            }
+        },
+        "广东": {
+            "理科": {
+                2023: {"min_score": 685, "rank": 612, "batch": "本科批"},
+                2022: {"min_score": 668, "rank": 723, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 645, "rank": 145, "batch": "本科批"},
+                2022: {"min_score": 638, "rank": 167, "batch": "本科批"}
+            }
+        },
+        "四川": {
+            "理科": {
+                2023: {"min_score": 692, "rank": 234, "batch": "本科一批"},
+                2022: {"min_score": 679, "rank": 312, "batch": "本科一批"}
+            },
+            "文科": {
+                2023: {"min_score": 651, "rank": 56, "batch": "本科一批"},
+                2022: {"min_score": 648, "rank": 61, "batch": "本科一批"}
+            }
+        },
+        "湖南": {
+            "理科": {
+                2023: {"min_score": 685, "rank": 312, "batch": "本科批"},
+                2022: {"min_score": 672, "rank": 378, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 648, "rank": 78, "batch": "本科批"},
+                2022: {"min_score": 641, "rank": 89, "batch": "本科批"}
+            }
+        },
+        "湖北": {
+            "理科": {
+                2023: {"min_score": 687, "rank": 289, "batch": "本科批"},
+                2022: {"min_score": 674, "rank": 345, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 649, "rank": 67, "batch": "本科批"},
+                2022: {"min_score": 642, "rank": 73, "batch": "本科批"}
+            }
+        },
+        "陕西": {
+            "理科": {
+                2023: {"min_score": 689, "rank": 234, "batch": "本科一批"},
+                2022: {"min_score": 676, "rank": 289, "batch": "本科一批"}
+            },
+            "文科": {
+                2023: {"min_score": 651, "rank": 45, "batch": "本科一批"},
+                2022: {"min_score": 644, "rank": 52, "batch": "本科一批"}
+            }
+        },
+        "辽宁": {
+            "理科": {
+                2023: {"min_score": 683, "rank": 345, "batch": "本科批"},
+                2022: {"min_score": 670, "rank": 412, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 646, "rank": 89, "batch": "本科批"},
+                2022: {"min_score": 639, "rank": 95, "batch": "本科批"}
+            }
+        },
+        "吉林": {
+            "理科": {
+                2023: {"min_score": 678, "rank": 167, "batch": "本科一批A段"},
+                2022: {"min_score": 665, "rank": 198, "batch": "本科一批A段"}
+            },
+            "文科": {
+                2023: {"min_score": 643, "rank": 34, "batch": "本科一批A段"},
+                2022: {"min_score": 636, "rank": 38, "batch": "本科一批A段"}
+            }
+        },
+        "黑龙江": {
+            "理科": {
+                2023: {"min_score": 675, "rank": 189, "batch": "本科一批A段"},
+                2022: {"min_score": 662, "rank": 223, "batch": "本科一批A段"}
+            },
+            "文科": {
+                2023: {"min_score": 640, "rank": 41, "batch": "本科一批A段"},
+                2022: {"min_score": 633, "rank": 45, "batch": "本科一批A段"}
+            }
+        }
+    },
+    "清华大学": {
+        "山西": {
+            "理科": {
+                2023: {"min_score": 686, "rank": 38, "batch": "本科一批A段"},
+                2022: {"min_score": 672, "rank": 57, "batch": "本科一批A段"},
+                2021: {"min_score": 682, "rank": 47, "batch": "本科一批A段"},
+                2020: {"min_score": 690, "rank": 45, "batch": "本科一批A段"}
+            }
+        },
+        "河北": {
+            "理科": {
+                2023: {"min_score": 691, "rank": 336, "batch": "本科批"},
+                2022: {"min_score": 678, "rank": 381, "batch": "本科批"}
+            }
+        },
+        "北京": {
+            "理科": {
+                2023: {"min_score": 693, "rank": 734, "batch": "本科批"},
+                2022: {"min_score": 690, "rank": 789, "batch": "本科批"}
+            }
+        },
+        "河南": {
+            "理科": {
+                2023: {"min_score": 698, "rank": 189, "batch": "本科一批"},
+                2022: {"min_score": 687, "rank": 234, "batch": "本科一批"}
+            }
+        },
+        "山东": {
+            "理科": {
+                2023: {"min_score": 694, "rank": 312, "batch": "本科批"},
+                2022: {"min_score": 675, "rank": 389, "batch": "本科批"}
+            }
+        },
+        "江苏": {
+            "理科": {
+                2023: {"min_score": 677, "rank": 423, "batch": "本科批"},
+                2022: {"min_score": 666, "rank": 501, "batch": "本科批"}
+            }
+        },
+        "浙江": {
+            "理科": {
+                2023: {"min_score": 681, "rank": 389, "batch": "本科批"},
+                2022: {"min_score": 668, "rank": 467, "batch": "本科批"}
+            }
+        },
+        "安徽": {
+            "理科": {
+                2023: {"min_score": 694, "rank": 178, "batch": "本科一批"},
+                2022: {"min_score": 685, "rank": 213, "batch": "本科一批"}
+            }
+        },
+        "广东": {
+            "理科": {
+                2023: {"min_score": 688, "rank": 467, "batch": "本科批"},
+                2022: {"min_score": 671, "rank": 578, "batch": "本科批"}
+            }
+        },
+        "四川": {
+            "理科": {
+                2023: {"min_score": 695, "rank": 167, "batch": "本科一批"},
+                2022: {"min_score": 682, "rank": 234, "batch": "本科一批"}
+            }
+        },
+        "湖南": {
+            "理科": {
+                2023: {"min_score": 688, "rank": 234, "batch": "本科批"},
+                2022: {"min_score": 675, "rank": 289, "batch": "本科批"}
+            }
+        },
+        "湖北": {
+            "理科": {
+                2023: {"min_score": 690, "rank": 213, "batch": "本科批"},
+                2022: {"min_score": 677, "rank": 267, "batch": "本科批"}
+            }
+        },
+        "陕西": {
+            "理科": {
+                2023: {"min_score": 692, "rank": 167, "batch": "本科一批"},
+                2022: {"min_score": 679, "rank": 201, "batch": "本科一批"}
+            }
+        },
+        "辽宁": {
+            "理科": {
+                2023: {"min_score": 686, "rank": 267, "batch": "本科批"},
+                2022: {"min_score": 673, "rank": 323, "batch": "本科批"}
+            }
+        },
+        "吉林": {
+            "理科": {
+                2023: {"min_score": 681, "rank": 123, "batch": "本科一批A段"},
+                2022: {"min_score": 668, "rank": 145, "batch": "本科一批A段"}
+            }
+        },
+        "黑龙江": {
+            "理科": {
+                2023: {"min_score": 678, "rank": 134, "batch": "本科一批A段"},
+                2022: {"min_score": 665, "rank": 156, "batch": "本科一批A段"}
+            }
+        }
+    },
+    "复旦大学": {
+        "山西": {
+            "理科": {
+                2023: {"min_score": 643, "rank": 568, "batch": "本科一批A段"},
+                2022: {"min_score": 637, "rank": 672, "batch": "本科一批A段"},
+                2021: {"min_score": 648, "rank": 592, "batch": "本科一批A段"}
+            },
+            "文科": {
+                2023: {"min_score": 618, "rank": 89, "batch": "本科一批A段"},
+                2022: {"min_score": 612, "rank": 95, "batch": "本科一批A段"}
+            }
+        },
+        "上海": {
+            "理科": {
+                2023: {"min_score": 580, "rank": 1850, "batch": "本科批"}
+            }
+        },
+        "河北": {
+            "理科": {
+                2023: {"min_score": 650, "rank": 2518, "batch": "本科批"},
+                2022: {"min_score": 643, "rank": 2650, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 630, "rank": 234, "batch": "本科批"},
+                2022: {"min_score": 625, "rank": 267, "batch": "本科批"}
+            }
+        },
+        "北京": {
+            "理科": {
+                2023: {"min_score": 672, "rank": 1234, "batch": "本科批"},
+                2022: {"min_score": 665, "rank": 1345, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 645, "rank": 289, "batch": "本科批"},
+                2022: {"min_score": 639, "rank": 312, "batch": "本科批"}
+            }
+        },
+        "河南": {
+            "理科": {
+                2023: {"min_score": 678, "rank": 523, "batch": "本科一批"},
+                2022: {"min_score": 665, "rank": 612, "batch": "本科一批"}
+            },
+            "文科": {
+                2023: {"min_score": 635, "rank": 145, "batch": "本科一批"},
+                2022: {"min_score": 628, "rank": 167, "batch": "本科一批"}
+            }
+        },
+        "山东": {
+            "理科": {
+                2023: {"min_score": 672, "rank": 723, "batch": "本科批"},
+                2022: {"min_score": 659, "rank": 834, "batch": "本科批"}
+            }
+        },
+        "江苏": {
+            "理科": {
+                2023: {"min_score": 658, "rank": 1234, "batch": "本科批"},
+                2022: {"min_score": 645, "rank": 1456, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 628, "rank": 234, "batch": "本科批"},
+                2022: {"min_score": 621, "rank": 267, "batch": "本科批"}
+            }
+        },
+        "浙江": {
+            "理科": {
+                2023: {"min_score": 662, "rank": 1123, "batch": "本科批"},
+                2022: {"min_score": 649, "rank": 1289, "batch": "本科批"}
+            }
+        },
+        "安徽": {
+            "理科": {
+                2023: {"min_score": 675, "rank": 456, "batch": "本科一批"},
+                2022: {"min_score": 662, "rank": 534, "batch": "本科一批"}
+            },
+            "文科": {
+                2023: {"min_score": 638, "rank": 123, "batch": "本科一批"},
+                2022: {"min_score": 631, "rank": 145, "batch": "本科一批"}
+            }
+        },
+        "广东": {
+            "理科": {
+                2023: {"min_score": 669, "rank": 934, "batch": "本科批"},
+                2022: {"min_score": 652, "rank": 1123, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 632, "rank": 234, "batch": "本科批"},
+                2022: {"min_score": 625, "rank": 267, "batch": "本科批"}
+            }
+        },
+        "四川": {
+            "理科": {
+                2023: {"min_score": 676, "rank": 423, "batch": "本科一批"},
+                2022: {"min_score": 663, "rank": 501, "batch": "本科一批"}
+            },
+            "文科": {
+                2023: {"min_score": 641, "rank": 89, "batch": "本科一批"},
+                2022: {"min_score": 634, "rank": 102, "batch": "本科一批"}
+            }
+        },
+        "湖南": {
+            "理科": {
+                2023: {"min_score": 670, "rank": 612, "batch": "本科批"},
+                2022: {"min_score": 657, "rank": 723, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 635, "rank": 134, "batch": "本科批"},
+                2022: {"min_score": 628, "rank": 156, "batch": "本科批"}
+            }
+        },
+        "湖北": {
+            "理科": {
+                2023: {"min_score": 672, "rank": 578, "batch": "本科批"},
+                2022: {"min_score": 659, "rank": 678, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 637, "rank": 123, "batch": "本科批"},
+                2022: {"min_score": 630, "rank": 145, "batch": "本科批"}
+            }
+        },
+        "陕西": {
+            "理科": {
+                2023: {"min_score": 674, "rank": 445, "batch": "本科一批"},
+                2022: {"min_score": 661, "rank": 523, "batch": "本科一批"}
+            },
+            "文科": {
+                2023: {"min_score": 639, "rank": 78, "batch": "本科一批"},
+                2022: {"min_score": 632, "rank": 89, "batch": "本科一批"}
+            }
+        },
+        "辽宁": {
+            "理科": {
+                2023: {"min_score": 668, "rank": 634, "batch": "本科批"},
+                2022: {"min_score": 655, "rank": 745, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 633, "rank": 145, "batch": "本科批"},
+                2022: {"min_score": 626, "rank": 167, "batch": "本科批"}
+            }
+        },
+        "吉林": {
+            "理科": {
+                2023: {"min_score": 663, "rank": 289, "batch": "本科一批A段"},
+                2022: {"min_score": 650, "rank": 334, "batch": "本科一批A段"}
+            },
+            "文科": {
+                2023: {"min_score": 630, "rank": 67, "batch": "本科一批A段"},
+                2022: {"min_score": 623, "rank": 78, "batch": "本科一批A段"}
+            }
+        },
+        "黑龙江": {
+            "理科": {
+                2023: {"min_score": 660, "rank": 312, "batch": "本科一批A段"},
+                2022: {"min_score": 647, "rank": 367, "batch": "本科一批A段"}
+            },
+            "文科": {
+                2023: {"min_score": 627, "rank": 73, "batch": "本科一批A段"},
+                2022: {"min_score": 620, "rank": 84, "batch": "本科一批A段"}
+            }
+        }
+    },
+    "北京航空航天大学": {
+        "河北": {
+            "理科": {
+                2023: {"min_score": 646, "rank": 2913, "batch": "本科批"},
+                2022: {"min_score": 635, "rank": 3421, "batch": "本科批"},
+                2021: {"min_score": 641, "rank": 3856, "batch": "本科批"}
+            }
+        },
+        "山西": {
+            "理科": {
+                2023: {"min_score": 618, "rank": 1526, "batch": "本科一批A段"},
+                2022: {"min_score": 612, "rank": 1683, "batch": "本科一批A段"}
+            }
+        },
+        "北京": {
+            "理科": {
+                2023: {"min_score": 658, "rank": 2134, "batch": "本科批"},
+                2022: {"min_score": 651, "rank": 2367, "batch": "本科批"}
+            }
+        },
+        "河南": {
+            "理科": {
+                2023: {"min_score": 663, "rank": 1234, "batch": "本科一批"},
+                2022: {"min_score": 650, "rank": 1456, "batch": "本科一批"}
+            }
+        },
+        "山东": {
+            "理科": {
+                2023: {"min_score": 657, "rank": 1567, "batch": "本科批"},
+                2022: {"min_score": 644, "rank": 1789, "batch": "本科批"}
+            }
+        },
+        "江苏": {
+            "理科": {
+                2023: {"min_score": 643, "rank": 2345, "batch": "本科批"},
+                2022: {"min_score": 630, "rank": 2678, "batch": "本科批"}
+            }
+        },
+        "浙江": {
+            "理科": {
+                2023: {"min_score": 647, "rank": 2123, "batch": "本科批"},
+                2022: {"min_score": 634, "rank": 2456, "batch": "本科批"}
+            }
+        },
+        "安徽": {
+            "理科": {
+                2023: {"min_score": 660, "rank": 1123, "batch": "本科一批"},
+                2022: {"min_score": 647, "rank": 1345, "batch": "本科一批"}
+            }
+        },
+        "广东": {
+            "理科": {
+                2023: {"min_score": 654, "rank": 1678, "batch": "本科批"},
+                2022: {"min_score": 637, "rank": 1934, "batch": "本科批"}
+            }
+        },
+        "四川": {
+            "理科": {
+                2023: {"min_score": 661, "rank": 1089, "batch": "本科一批"},
+                2022: {"min_score": 648, "rank": 1234, "batch": "本科一批"}
+            }
+        },
+        "湖南": {
+            "理科": {
+                2023: {"min_score": 655, "rank": 1345, "batch": "本科批"},
+                2022: {"min_score": 642, "rank": 1567, "batch": "本科批"}
+            }
+        },
+        "湖北": {
+            "理科": {
+                2023: {"min_score": 657, "rank": 1234, "batch": "本科批"},
+                2022: {"min_score": 644, "rank": 1456, "batch": "本科批"}
+            }
+        },
+        "陕西": {
+            "理科": {
+                2023: {"min_score": 659, "rank": 1089, "batch": "本科一批"},
+                2022: {"min_score": 646, "rank": 1234, "batch": "本科一批"}
+            }
+        },
+        "辽宁": {
+            "理科": {
+                2023: {"min_score": 653, "rank": 1456, "batch": "本科批"},
+                2022: {"min_score": 640, "rank": 1678, "batch": "本科批"}
+            }
+        },
+        "吉林": {
+            "理科": {
+                2023: {"min_score": 648, "rank": 567, "batch": "本科一批A段"},
+                2022: {"min_score": 635, "rank": 634, "batch": "本科一批A段"}
+            }
+        },
+        "黑龙江": {
+            "理科": {
+                2023: {"min_score": 645, "rank": 623, "batch": "本科一批A段"},
+                2022: {"min_score": 632, "rank": 723, "batch": "本科一批A段"}
+            }
+        }
+    },
+    "华东理工大学": {
+        "河北": {
+            "理科": {
+                2023: {"min_score": 590, "rank": 12456, "batch": "本科批"},
+                2022: {"min_score": 584, "rank": 13127, "batch": "本科批"},
+                2021: {"min_score": 591, "rank": 13956, "batch": "本科批"}
+            }
+        },
+        "山西": {
+            "理科": {
+                2023: {"min_score": 563, "rank": 8234, "batch": "本科一批A段"},
+                2022: {"min_score": 558, "rank": 8756, "batch": "本科一批A段"}
+            }
+        },
+        "北京": {
+            "理科": {
+                2023: {"min_score": 618, "rank": 6234, "batch": "本科批"},
+                2022: {"min_score": 612, "rank": 6567, "batch": "本科批"}
+            }
+        },
+        "上海": {
+            "理科": {
+                2023: {"min_score": 545, "rank": 4567, "batch": "本科批"},
+                2022: {"min_score": 538, "rank": 4823, "batch": "本科批"}
+            }
+        },
+        "河南": {
+            "理科": {
+                2023: {"min_score": 608, "rank": 5234, "batch": "本科一批"},
+                2022: {"min_score": 595, "rank": 5789, "batch": "本科一批"}
+            }
+        },
+        "山东": {
+            "理科": {
+                2023: {"min_score": 602, "rank": 6123, "batch": "本科批"},
+                2022: {"min_score": 589, "rank": 6734, "batch": "本科批"}
+            }
+        },
+        "江苏": {
+            "理科": {
+                2023: {"min_score": 588, "rank": 7234, "batch": "本科批"},
+                2022: {"min_score": 575, "rank": 7823, "batch": "本科批"}
+            }
+        },
+        "浙江": {
+            "理科": {
+                2023: {"min_score": 592, "rank": 6789, "batch": "本科批"},
+                2022: {"min_score": 579, "rank": 7345, "batch": "本科批"}
+            }
+        },
+        "安徽": {
+            "理科": {
+                2023: {"min_score": 605, "rank": 5567, "batch": "本科一批"},
+                2022: {"min_score": 592, "rank": 6123, "batch": "本科一批"}
+            }
+        },
+        "广东": {
+            "理科": {
+                2023: {"min_score": 599, "rank": 6456, "batch": "本科批"},
+                2022: {"min_score": 582, "rank": 7234, "batch": "本科批"}
+            }
+        },
+        "四川": {
+            "理科": {
+                2023: {"min_score": 606, "rank": 5123, "batch": "本科一批"},
+                2022: {"min_score": 593, "rank": 5678, "batch": "本科一批"}
+            }
+        },
+        "湖南": {
+            "理科": {
+                2023: {"min_score": 600, "rank": 5789, "batch": "本科批"},
+                2022: {"min_score": 587, "rank": 6234, "batch": "本科批"}
+            }
+        },
+        "湖北": {
+            "理科": {
+                2023: {"min_score": 602, "rank": 5567, "batch": "本科批"},
+                2022: {"min_score": 589, "rank": 6012, "batch": "本科批"}
+            }
+        },
+        "陕西": {
+            "理科": {
+                2023: {"min_score": 604, "rank": 5234, "batch": "本科一批"},
+                2022: {"min_score": 591, "rank": 5678, "batch": "本科一批"}
+            }
+        },
+        "辽宁": {
+            "理科": {
+                2023: {"min_score": 598, "rank": 6123, "batch": "本科批"},
+                2022: {"min_score": 585, "rank": 6567, "batch": "本科批"}
+            }
+        },
+        "吉林": {
+            "理科": {
+                2023: {"min_score": 593, "rank": 2345, "batch": "本科一批A段"},
+                2022: {"min_score": 580, "rank": 2567, "batch": "本科一批A段"}
+            }
+        },
+        "黑龙江": {
+            "理科": {
+                2023: {"min_score": 590, "rank": 2567, "batch": "本科一批A段"},
+                2022: {"min_score": 577, "rank": 2789, "batch": "本科一批A段"}
+            }
+        }
+    },
+    "上海交通大学": {
+        "河北": {
+            "理科": {
+                2023: {"min_score": 675, "rank": 896, "batch": "本科批"},
+                2022: {"min_score": 668, "rank": 1024, "batch": "本科批"}
+            }
+        },
+        "山西": {
+            "理科": {
+                2023: {"min_score": 671, "rank": 87, "batch": "本科一批A段"},
+                2022: {"min_score": 660, "rank": 112, "batch": "本科一批A段"}
+            }
+        },
+        "北京": {
+            "理科": {
+                2023: {"min_score": 685, "rank": 1123, "batch": "本科批"},
+                2022: {"min_score": 678, "rank": 1234, "batch": "本科批"}
+            }
+        },
+        "上海": {
+            "理科": {
+                2023: {"min_score": 570, "rank": 1567, "batch": "本科批"},
+                2022: {"min_score": 563, "rank": 1689, "batch": "本科批"}
+            }
+        },
+        "河南": {
+            "理科": {
+                2023: {"min_score": 690, "rank": 345, "batch": "本科一批"},
+                2022: {"min_score": 677, "rank": 423, "batch": "本科一批"}
+            }
+        },
+        "山东": {
+            "理科": {
+                2023: {"min_score": 683, "rank": 567, "batch": "本科批"},
+                2022: {"min_score": 664, "rank": 723, "batch": "本科批"}
+            }
+        },
+        "江苏": {
+            "理科": {
+                2023: {"min_score": 669, "rank": 789, "batch": "本科批"},
+                2022: {"min_score": 656, "rank": 934, "batch": "本科批"}
+            }
+        },
+        "浙江": {
+            "理科": {
+                2023: {"min_score": 673, "rank": 723, "batch": "本科批"},
+                2022: {"min_score": 660, "rank": 845, "batch": "本科批"}
+            }
+        },
+        "安徽": {
+            "理科": {
+                2023: {"min_score": 687, "rank": 312, "batch": "本科一批"},
+                2022: {"min_score": 674, "rank": 378, "batch": "本科一批"}
+            }
+        },
+        "广东": {
+            "理科": {
+                2023: {"min_score": 681, "rank": 634, "batch": "本科批"},
+                2022: {"min_score": 664, "rank": 789, "batch": "本科批"}
+            }
+        },
+        "四川": {
+            "理科": {
+                2023: {"min_score": 688, "rank": 289, "batch": "本科一批"},
+                2022: {"min_score": 675, "rank": 345, "batch": "本科一批"}
+            }
+        },
+        "湖南": {
+            "理科": {
+                2023: {"min_score": 682, "rank": 423, "batch": "本科批"},
+                2022: {"min_score": 669, "rank": 501, "batch": "本科批"}
+            }
+        },
+        "湖北": {
+            "理科": {
+                2023: {"min_score": 684, "rank": 378, "batch": "本科批"},
+                2022: {"min_score": 671, "rank": 445, "batch": "本科批"}
+            }
+        },
+        "陕西": {
+            "理科": {
+                2023: {"min_score": 686, "rank": 312, "batch": "本科一批"},
+                2022: {"min_score": 673, "rank": 378, "batch": "本科一批"}
+            }
+        },
+        "辽宁": {
+            "理科": {
+                2023: {"min_score": 680, "rank": 456, "batch": "本科批"},
+                2022: {"min_score": 667, "rank": 534, "batch": "本科批"}
+            }
+        },
+        "吉林": {
+            "理科": {
+                2023: {"min_score": 675, "rank": 201, "batch": "本科一批A段"},
+                2022: {"min_score": 662, "rank": 234, "batch": "本科一批A段"}
+            }
+        },
+        "黑龙江": {
+            "理科": {
+                2023: {"min_score": 672, "rank": 223, "batch": "本科一批A段"},
+                2022: {"min_score": 659, "rank": 267, "batch": "本科一批A段"}
+            }
+        }
+    },
+    "浙江大学": {
+        "河北": {
+            "理科": {
+                2023: {"min_score": 669, "rank": 1167, "batch": "本科批"},
+                2022: {"min_score": 661, "rank": 1345, "batch": "本科批"}
+            }
+        },
+        "山西": {
+            "理科": {
+                2023: {"min_score": 654, "rank": 326, "batch": "本科一批A段"},
+                2022: {"min_score": 648, "rank": 423, "batch": "本科一批A段"}
+            }
+        },
+        "北京": {
+            "理科": {
+                2023: {"min_score": 679, "rank": 1345, "batch": "本科批"},
+                2022: {"min_score": 672, "rank": 1456, "batch": "本科批"}
+            }
+        },
+        "浙江": {
+            "理科": {
+                2023: {"min_score": 667, "rank": 834, "batch": "本科批"},
+                2022: {"min_score": 654, "rank": 945, "batch": "本科批"}
+            }
+        },
+        "河南": {
+            "理科": {
+                2023: {"min_score": 684, "rank": 445, "batch": "本科一批"},
+                2022: {"min_score": 671, "rank": 523, "batch": "本科一批"}
+            }
+        },
+        "山东": {
+            "理科": {
+                2023: {"min_score": 677, "rank": 678, "batch": "本科批"},
+                2022: {"min_score": 658, "rank": 823, "batch": "本科批"}
+            }
+        },
+        "江苏": {
+            "理科": {
+                2023: {"min_score": 663, "rank": 945, "batch": "本科批"},
+                2022: {"min_score": 650, "rank": 1123, "batch": "本科批"}
+            }
+        },
+        "安徽": {
+            "理科": {
+                2023: {"min_score": 681, "rank": 401, "batch": "本科一批"},
+                2022: {"min_score": 668, "rank": 478, "batch": "本科一批"}
+            }
+        },
+        "广东": {
+            "理科": {
+                2023: {"min_score": 675, "rank": 734, "batch": "本科批"},
+                2022: {"min_score": 658, "rank": 889, "batch": "本科批"}
+            }
+        },
+        "四川": {
+            "理科": {
+                2023: {"min_score": 682, "rank": 367, "batch": "本科一批"},
+                2022: {"min_score": 669, "rank": 434, "batch": "本科一批"}
+            }
+        },
+        "湖南": {
+            "理科": {
+                2023: {"min_score": 676, "rank": 501, "batch": "本科批"},
+                2022: {"min_score": 663, "rank": 589, "batch": "本科批"}
+            }
+        },
+        "湖北": {
+            "理科": {
+                2023: {"min_score": 678, "rank": 467, "batch": "本科批"},
+                2022: {"min_score": 665, "rank": 534, "batch": "本科批"}
+            }
+        },
+        "陕西": {
+            "理科": {
+                2023: {"min_score": 680, "rank": 389, "batch": "本科一批"},
+                2022: {"min_score": 667, "rank": 445, "batch": "本科一批"}
+            }
+        },
+        "辽宁": {
+            "理科": {
+                2023: {"min_score": 674, "rank": 545, "batch": "本科批"},
+                2022: {"min_score": 661, "rank": 623, "batch": "本科批"}
+            }
+        },
+        "吉林": {
+            "理科": {
+                2023: {"min_score": 669, "rank": 245, "batch": "本科一批A段"},
+                2022: {"min_score": 656, "rank": 289, "batch": "本科一批A段"}
+            }
+        },
+        "黑龙江": {
+            "理科": {
+                2023: {"min_score": 666, "rank": 267, "batch": "本科一批A段"},
+                2022: {"min_score": 653, "rank": 312, "batch": "本科一批A段"}
+            }
+        }
+    },
+    "中国科学技术大学": {
+        "河北": {
+            "理科": {
+                2023: {"min_score": 660, "rank": 1798, "batch": "本科批"},
+                2022: {"min_score": 650, "rank": 2156, "batch": "本科批"}
+            }
+        },
+        "山西": {
+            "理科": {
+                2023: {"min_score": 648, "rank": 421, "batch": "本科一批A段"},
+                2022: {"min_score": 642, "rank": 578, "batch": "本科一批A段"}
+            }
+        },
+        "北京": {
+            "理科": {
+                2023: {"min_score": 670, "rank": 1567, "batch": "本科批"},
+                2022: {"min_score": 663, "rank": 1678, "batch": "本科批"}
+            }
+        },
+        "安徽": {
+            "理科": {
+                2023: {"min_score": 673, "rank": 523, "batch": "本科一批"},
+                2022: {"min_score": 660, "rank": 612, "batch": "本科一批"}
+            }
+        },
+        "河南": {
+            "理科": {
+                2023: {"min_score": 676, "rank": 612, "batch": "本科一批"},
+                2022: {"min_score": 663, "rank": 723, "batch": "本科一批"}
+            }
+        },
+        "山东": {
+            "理科": {
+                2023: {"min_score": 669, "rank": 834, "batch": "本科批"},
+                2022: {"min_score": 650, "rank": 1012, "batch": "本科批"}
+            }
+        },
+        "江苏": {
+            "理科": {
+                2023: {"min_score": 655, "rank": 1234, "batch": "本科批"},
+                2022: {"min_score": 642, "rank": 1456, "batch": "本科批"}
+            }
+        },
+        "浙江": {
+            "理科": {
+                2023: {"min_score": 659, "rank": 1123, "batch": "本科批"},
+                2022: {"min_score": 646, "rank": 1289, "batch": "本科批"}
+            }
+        },
+        "广东": {
+            "理科": {
+                2023: {"min_score": 667, "rank": 923, "batch": "本科批"},
+                2022: {"min_score": 650, "rank": 1123, "batch": "本科批"}
+            }
+        },
+        "四川": {
+            "理科": {
+                2023: {"min_score": 674, "rank": 467, "batch": "本科一批"},
+                2022: {"min_score": 661, "rank": 545, "batch": "本科一批"}
+            }
+        },
+        "湖南": {
+            "理科": {
+                2023: {"min_score": 668, "rank": 678, "batch": "本科批"},
+                2022: {"min_score": 655, "rank": 789, "batch": "本科批"}
+            }
+        },
+        "湖北": {
+            "理科": {
+                2023: {"min_score": 670, "rank": 634, "batch": "本科批"},
+                2022: {"min_score": 657, "rank": 723, "batch": "本科批"}
+            }
+        },
+        "陕西": {
+            "理科": {
+                2023: {"min_score": 672, "rank": 501, "batch": "本科一批"},
+                2022: {"min_score": 659, "rank": 578, "batch": "本科一批"}
+            }
+        },
+        "辽宁": {
+            "理科": {
+                2023: {"min_score": 666, "rank": 723, "batch": "本科批"},
+                2022: {"min_score": 653, "rank": 834, "batch": "本科批"}
+            }
+        },
+        "吉林": {
+            "理科": {
+                2023: {"min_score": 661, "rank": 334, "batch": "本科一批A段"},
+                2022: {"min_score": 648, "rank": 389, "batch": "本科一批A段"}
+            }
+        },
+        "黑龙江": {
+            "理科": {
+                2023: {"min_score": 658, "rank": 356, "batch": "本科一批A段"},
+                2022: {"min_score": 645, "rank": 412, "batch": "本科一批A段"}
+            }
+        }
+    },
+    "南京大学": {
+        "河北": {
+            "理科": {
+                2023: {"min_score": 659, "rank": 1876, "batch": "本科批"},
+                2022: {"min_score": 649, "rank": 2234, "batch": "本科批"}
+            }
+        },
+        "山西": {
+            "理科": {
+                2023: {"min_score": 651, "rank": 378, "batch": "本科一批A段"},
+                2022: {"min_score": 645, "rank": 487, "batch": "本科一批A段"}
+            }
+        },
+        "北京": {
+            "理科": {
+                2023: {"min_score": 669, "rank": 1678, "batch": "本科批"},
+                2022: {"min_score": 662, "rank": 1789, "batch": "本科批"}
+            }
+        },
+        "江苏": {
+            "理科": {
+                2023: {"min_score": 654, "rank": 1345, "batch": "本科批"},
+                2022: {"min_score": 641, "rank": 1567, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 624, "rank": 267, "batch": "本科批"},
+                2022: {"min_score": 617, "rank": 312, "batch": "本科批"}
+            }
+        },
+        "河南": {
+            "理科": {
+                2023: {"min_score": 675, "rank": 634, "batch": "本科一批"},
+                2022: {"min_score": 662, "rank": 745, "batch": "本科一批"}
+            },
+            "文科": {
+                2023: {"min_score": 631, "rank": 167, "batch": "本科一批"},
+                2022: {"min_score": 624, "rank": 189, "batch": "本科一批"}
+            }
+        },
+        "山东": {
+            "理科": {
+                2023: {"min_score": 668, "rank": 889, "batch": "本科批"},
+                2022: {"min_score": 649, "rank": 1067, "batch": "本科批"}
+            }
+        },
+        "浙江": {
+            "理科": {
+                2023: {"min_score": 658, "rank": 1234, "batch": "本科批"},
+                2022: {"min_score": 645, "rank": 1389, "batch": "本科批"}
+            }
+        },
+        "安徽": {
+            "理科": {
+                2023: {"min_score": 672, "rank": 567, "batch": "本科一批"},
+                2022: {"min_score": 659, "rank": 656, "batch": "本科一批"}
+            },
+            "文科": {
+                2023: {"min_score": 634, "rank": 134, "batch": "本科一批"},
+                2022: {"min_score": 627, "rank": 156, "batch": "本科一批"}
+            }
+        },
+        "广东": {
+            "理科": {
+                2023: {"min_score": 666, "rank": 1012, "batch": "本科批"},
+                2022: {"min_score": 649, "rank": 1189, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 628, "rank": 267, "batch": "本科批"},
+                2022: {"min_score": 621, "rank": 312, "batch": "本科批"}
+            }
+        },
+        "四川": {
+            "理科": {
+                2023: {"min_score": 673, "rank": 523, "batch": "本科一批"},
+                2022: {"min_score": 660, "rank": 601, "batch": "本科一批"}
+            },
+            "文科": {
+                2023: {"min_score": 637, "rank": 102, "batch": "本科一批"},
+                2022: {"min_score": 630, "rank": 123, "batch": "本科一批"}
+            }
+        },
+        "湖南": {
+            "理科": {
+                2023: {"min_score": 667, "rank": 723, "batch": "本科批"},
+                2022: {"min_score": 654, "rank": 834, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 631, "rank": 156, "batch": "本科批"},
+                2022: {"min_score": 624, "rank": 178, "batch": "本科批"}
+            }
+        },
+        "湖北": {
+            "理科": {
+                2023: {"min_score": 669, "rank": 678, "batch": "本科批"},
+                2022: {"min_score": 656, "rank": 776, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 633, "rank": 134, "batch": "本科批"},
+                2022: {"min_score": 626, "rank": 156, "batch": "本科批"}
+            }
+        },
+        "陕西": {
+            "理科": {
+                2023: {"min_score": 671, "rank": 556, "batch": "本科一批"},
+                2022: {"min_score": 658, "rank": 634, "batch": "本科一批"}
+            },
+            "文科": {
+                2023: {"min_score": 635, "rank": 89, "batch": "本科一批"},
+                2022: {"min_score": 628, "rank": 102, "batch": "本科一批"}
+            }
+        },
+        "辽宁": {
+            "理科": {
+                2023: {"min_score": 665, "rank": 767, "batch": "本科批"},
+                2022: {"min_score": 652, "rank": 889, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 629, "rank": 167, "batch": "本科批"},
+                2022: {"min_score": 622, "rank": 189, "batch": "本科批"}
+            }
+        },
+        "吉林": {
+            "理科": {
+                2023: {"min_score": 660, "rank": 378, "batch": "本科一批A段"},
+                2022: {"min_score": 647, "rank": 434, "batch": "本科一批A段"}
+            },
+            "文科": {
+                2023: {"min_score": 626, "rank": 78, "batch": "本科一批A段"},
+                2022: {"min_score": 619, "rank": 89, "batch": "本科一批A段"}
+            }
+        },
+        "黑龙江": {
+            "理科": {
+                2023: {"min_score": 657, "rank": 401, "batch": "本科一批A段"},
+                2022: {"min_score": 644, "rank": 467, "batch": "本科一批A段"}
+            },
+            "文科": {
+                2023: {"min_score": 623, "rank": 84, "batch": "本科一批A段"},
+                2022: {"min_score": 616, "rank": 95, "batch": "本科一批A段"}
+            }
+        }
+    },
+    "华中科技大学": {
+        "河北": {
+            "理科": {
+                2023: {"min_score": 632, "rank": 4896, "batch": "本科批"},
+                2022: {"min_score": 625, "rank": 5234, "batch": "本科批"}
+            }
+        },
+        "山西": {
+            "理科": {
+                2023: {"min_score": 607, "rank": 2345, "batch": "本科一批A段"},
+                2022: {"min_score": 601, "rank": 2567, "batch": "本科一批A段"}
+            }
+        },
+        "北京": {
+            "理科": {
+                2023: {"min_score": 642, "rank": 3456, "batch": "本科批"},
+                2022: {"min_score": 635, "rank": 3789, "batch": "本科批"}
+            }
+        },
+        "河南": {
+            "理科": {
+                2023: {"min_score": 648, "rank": 2234, "batch": "本科一批"},
+                2022: {"min_score": 635, "rank": 2567, "batch": "本科一批"}
+            }
+        },
+        "山东": {
+            "理科": {
+                2023: {"min_score": 642, "rank": 2789, "batch": "本科批"},
+                2022: {"min_score": 629, "rank": 3123, "batch": "本科批"}
+            }
+        },
+        "江苏": {
+            "理科": {
+                2023: {"min_score": 628, "rank": 3567, "batch": "本科批"},
+                2022: {"min_score": 615, "rank": 3890, "batch": "本科批"}
+            }
+        },
+        "浙江": {
+            "理科": {
+                2023: {"min_score": 632, "rank": 3234, "batch": "本科批"},
+                2022: {"min_score": 619, "rank": 3623, "batch": "本科批"}
+            }
+        },
+        "安徽": {
+            "理科": {
+                2023: {"min_score": 645, "rank": 2456, "batch": "本科一批"},
+                2022: {"min_score": 632, "rank": 2723, "batch": "本科一批"}
+            }
+        },
+        "广东": {
+            "理科": {
+                2023: {"min_score": 639, "rank": 3012, "batch": "本科批"},
+                2022: {"min_score": 622, "rank": 3456, "batch": "本科批"}
+            }
+        },
+        "四川": {
+            "理科": {
+                2023: {"min_score": 646, "rank": 2234, "batch": "本科一批"},
+                2022: {"min_score": 633, "rank": 2567, "batch": "本科一批"}
+            }
+        },
+        "湖南": {
+            "理科": {
+                2023: {"min_score": 640, "rank": 2678, "batch": "本科批"},
+                2022: {"min_score": 627, "rank": 2934, "batch": "本科批"}
+            }
+        },
+        "湖北": {
+            "理科": {
+                2023: {"min_score": 642, "rank": 2567, "batch": "本科批"},
+                2022: {"min_score": 629, "rank": 2823, "batch": "本科批"}
+            }
+        },
+        "陕西": {
+            "理科": {
+                2023: {"min_score": 644, "rank": 2345, "batch": "本科一批"},
+                2022: {"min_score": 631, "rank": 2634, "batch": "本科一批"}
+            }
+        },
+        "辽宁": {
+            "理科": {
+                2023: {"min_score": 638, "rank": 2823, "batch": "本科批"},
+                2022: {"min_score": 625, "rank": 3123, "batch": "本科批"}
+            }
+        },
+        "吉林": {
+            "理科": {
+                2023: {"min_score": 633, "rank": 1234, "batch": "本科一批A段"},
+                2022: {"min_score": 620, "rank": 1456, "batch": "本科一批A段"}
+            }
+        },
+        "黑龙江": {
+            "理科": {
+                2023: {"min_score": 630, "rank": 1345, "batch": "本科一批A段"},
+                2022: {"min_score": 617, "rank": 1567, "batch": "本科一批A段"}
+            }
+        }
+    },
+    "山西财经大学": {
+        "河北": {
+            "理科": {
+                2023: {"min_score": 530, "rank": 25890, "batch": "本科批"},
+                2022: {"min_score": 523, "rank": 26234, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 525, "rank": 3234, "batch": "本科批"},
+                2022: {"min_score": 518, "rank": 3456, "batch": "本科批"}
+            }
+        },
+        "山西": {
+            "理科": {
+                2023: {"min_score": 513, "rank": 18234, "batch": "本科一批A段"},
+                2022: {"min_score": 507, "rank": 18567, "batch": "本科一批A段"}
+            },
+            "文科": {
+                2023: {"min_score": 508, "rank": 1456, "batch": "本科一批A段"},
+                2022: {"min_score": 502, "rank": 1523, "batch": "本科一批A段"}
+            }
+        },
+        "北京": {
+            "理科": {
+                2023: {"min_score": 545, "rank": 18234, "batch": "本科批"},
+                2022: {"min_score": 538, "rank": 18790, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 538, "rank": 2012, "batch": "本科批"},
+                2022: {"min_score": 531, "rank": 2156, "batch": "本科批"}
+            }
+        },
+        "河南": {
+            "理科": {
+                2023: {"min_score": 552, "rank": 17234, "batch": "本科一批"},
+                2022: {"min_score": 539, "rank": 17890, "batch": "本科一批"}
+            },
+            "文科": {
+                2023: {"min_score": 545, "rank": 2634, "batch": "本科一批"},
+                2022: {"min_score": 538, "rank": 2789, "batch": "本科一批"}
+            }
+        },
+        "山东": {
+            "理科": {
+                2023: {"min_score": 547, "rank": 18456, "batch": "本科批"},
+                2022: {"min_score": 534, "rank": 19123, "batch": "本科批"}
+            }
+        },
+        "江苏": {
+            "理科": {
+                2023: {"min_score": 533, "rank": 19890, "batch": "本科批"},
+                2022: {"min_score": 520, "rank": 20456, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 528, "rank": 2934, "batch": "本科批"},
+                2022: {"min_score": 521, "rank": 3123, "batch": "本科批"}
+            }
+        },
+        "浙江": {
+            "理科": {
+                2023: {"min_score": 537, "rank": 19234, "batch": "本科批"},
+                2022: {"min_score": 524, "rank": 19789, "batch": "本科批"}
+            }
+        },
+        "安徽": {
+            "理科": {
+                2023: {"min_score": 550, "rank": 17567, "batch": "本科一批"},
+                2022: {"min_score": 537, "rank": 18123, "batch": "本科一批"}
+            },
+            "文科": {
+                2023: {"min_score": 543, "rank": 2723, "batch": "本科一批"},
+                2022: {"min_score": 536, "rank": 2890, "batch": "本科一批"}
+            }
+        },
+        "广东": {
+            "理科": {
+                2023: {"min_score": 544, "rank": 18567, "batch": "本科批"},
+                2022: {"min_score": 527, "rank": 19234, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 537, "rank": 2987, "batch": "本科批"},
+                2022: {"min_score": 530, "rank": 3156, "batch": "本科批"}
+            }
+        },
+        "四川": {
+            "理科": {
+                2023: {"min_score": 551, "rank": 17345, "batch": "本科一批"},
+                2022: {"min_score": 538, "rank": 17890, "batch": "本科一批"}
+            },
+            "文科": {
+                2023: {"min_score": 544, "rank": 2612, "batch": "本科一批"},
+                2022: {"min_score": 537, "rank": 2767, "batch": "本科一批"}
+            }
+        },
+        "湖南": {
+            "理科": {
+                2023: {"min_score": 545, "rank": 17890, "batch": "本科批"},
+                2022: {"min_score": 532, "rank": 18456, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 538, "rank": 2823, "batch": "本科批"},
+                2022: {"min_score": 531, "rank": 2987, "batch": "本科批"}
+            }
+        },
+        "湖北": {
+            "理科": {
+                2023: {"min_score": 547, "rank": 17678, "batch": "本科批"},
+                2022: {"min_score": 534, "rank": 18234, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 540, "rank": 2712, "batch": "本科批"},
+                2022: {"min_score": 533, "rank": 2856, "batch": "本科批"}
+            }
+        },
+        "陕西": {
+            "理科": {
+                2023: {"min_score": 549, "rank": 17234, "batch": "本科一批"},
+                2022: {"min_score": 536, "rank": 17678, "batch": "本科一批"}
+            },
+            "文科": {
+                2023: {"min_score": 542, "rank": 2512, "batch": "本科一批"},
+                2022: {"min_score": 535, "rank": 2634, "batch": "本科一批"}
+            }
+        },
+        "辽宁": {
+            "理科": {
+                2023: {"min_score": 543, "rank": 18123, "batch": "本科批"},
+                2022: {"min_score": 530, "rank": 18567, "batch": "本科批"}
+            },
+            "文科": {
+                2023: {"min_score": 536, "rank": 2856, "batch": "本科批"},
+                2022: {"min_score": 529, "rank": 3012, "batch": "本科批"}
+            }
+        },
+        "吉林": {
+            "理科": {
+                2023: {"min_score": 538, "rank": 9234, "batch": "本科一批A段"},
+                2022: {"min_score": 525, "rank": 9567, "batch": "本科一批A段"}
+            },
+            "文科": {
+                2023: {"min_score": 533, "rank": 823, "batch": "本科一批A段"},
+                2022: {"min_score": 526, "rank": 889, "batch": "本科一批A段"}
+            }
+        },
+        "黑龙江": {
+            "理科": {
+                2023: {"min_score": 535, "rank": 9567, "batch": "本科一批A段"},
+                2022: {"min_score": 522, "rank": 9934, "batch": "本科一批A段"}
+            },
+            "文科": {
+                2023: {"min_score": 530, "rank": 856, "batch": "本科一批A段"},
+                2022: {"min_score": 523, "rank": 912, "batch": "本科一批A段"}
+            }
+        }
+    }
+}
+
+# 省份难度系数（相对于全国平均），用于基于其他省份数据的调整
+PROVINCE_ADJUSTMENT_FACTORS = {
+    "北京": 0.95, "上海": 0.95, "天津": 0.96,
+    "河南": 1.08, "山东": 1.06, "河北": 1.07, "山西": 1.05,
+    "江苏": 1.03, "浙江": 1.02, "广东": 1.01,
+    "四川": 1.04, "湖南": 1.05, "湖北": 1.04,
+    "陕西": 1.03, "辽宁": 1.02, "吉林": 1.01
+}
+
+def _freeze(value: Any) -> Any:
+    """递归地将字典转换为只读映射"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+class ReferenceDataStore(Mapping):
+    """
+    只读权威数据索引
+    
+    在导入时构建一次，提供 (院校, 省份, 科目, 年份) 的O(1)查询，
+    并预先计算每所院校的历史趋势和跨省份聚合数据
+    """
+    
+    def __init__(self, raw_data: Dict[str, Any]):
+        self._data = _freeze(raw_data)
+        self._scores = {}
+        self._history = {}
+        self._trends = {}
+        self._other_provinces = {}
+        self._province_aggregates = {}
+        
+        for university, uni_data in self._data.items():
+            for province, prov_data in uni_data.items():
+                for subject, subj_data in prov_data.items():
+                    history = []
+                    for year, score_data in subj_data.items():
+                        self._scores[(university, province, subject, year)] = score_data
+                        history.append(MappingProxyType({
+                            'year': year,
+                            'min_score': score_data['min_score'],
+                            'rank': score_data.get('rank', 0)
+                        }))
+                        self._other_provinces.setdefault((university, subject, year), []).append(
+                            MappingProxyType({'province': province, 'data': score_data})
+                        )
+                    
+                    self._history[(university, province, subject)] = tuple(history)
+                    trend = self._build_trend(history)
+                    if trend:
+                        self._trends[(university, province, subject)] = trend
+        
+        for key, provinces_data in self._other_provinces.items():
+            self._other_provinces[key] = tuple(provinces_data)
+            total_score = sum(item['data']['min_score'] for item in provinces_data)
+            self._province_aggregates[key] = MappingProxyType({
+                'avg_score': total_score / len(provinces_data),
+                'rank': provinces_data[0]['data'].get('rank', 0)
+            })
+        
+        logger.info(f"权威数据索引构建完成: {len(self._data)}所院校，{len(self._scores)}条分数线")
+    
+    @staticmethod
+    def _build_trend(history: List[Dict]) -> Optional[Mapping]:
+        """根据历史分数计算线性趋势参数"""
+        if len(history) < 2:
+            return None
+        
+        scores = sorted((data['year'], data['min_score']) for data in history)
+        total_change = scores[-1][1] - scores[0][1]
+        years_span = scores[-1][0] - scores[0][0]
+        
+        return MappingProxyType({
+            'latest_year': scores[-1][0],
+            'latest_score': scores[-1][1],
+            'avg_change_per_year': total_change / years_span if years_span > 0 else 0,
+            'rank': history[-1].get('rank', 0)
+        })
+    
+    def __getitem__(self, university: str) -> Mapping:
+        return self._data[university]
+    
+    def __iter__(self):
+        return iter(self._data)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def get_scores(self, university: str, province: str, subject: str, year: int) -> Optional[Mapping]:
+        """查询单条分数线"""
+        return self._scores.get((university, province, subject, year))
+    
+    def get_history(self, university: str, province: str, subject: str) -> Tuple[Mapping, ...]:
+        """查询某院校在某省份某科目的历年分数"""
+        return self._history.get((university, province, subject), ())
+    
+    def get_trend(self, university: str, province: str, subject: str) -> Optional[Mapping]:
+        """查询预先计算的历史趋势参数"""
+        return self._trends.get((university, province, subject))
+    
+    def get_other_provinces(self, university: str, subject: str, year: int) -> Tuple[Mapping, ...]:
+        """查询某院校在各省份同科目同年份的分数"""
+        return self._other_provinces.get((university, subject, year), ())
+    
+    def get_province_aggregate(self, university: str, subject: str, year: int) -> Optional[Mapping]:
+        """查询某院校跨省份的平均最低分及参考位次"""
+        return self._province_aggregates.get((university, subject, year))
+
+# 全局只读权威数据索引（导入时构建一次）
+REFERENCE_DATA_STORE = ReferenceDataStore(_REFERENCE_DATA)
+
 class ProfessionalDataAPI:
     """专业高考数据API"""
     
@@ -64,1326 +1497,8 @@ class ProfessionalDataAPI:
             }
         }
         
-        # 预定义的权威数据（基于真实历史数据）
-        self.reference_data = {
-            "北京大学": {
-                "山西": {
-                    "理科": {
-                        2023: {"min_score": 679, "rank": 55, "batch": "本科一批A段"},
-                        2022: {"min_score": 665, "rank": 80, "batch": "本科一批A段"},
-                        2021: {"min_score": 675, "rank": 64, "batch": "本科一批A段"},
-                        2020: {"min_score": 683, "rank": 66, "batch": "本科一批A段"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 634, "rank": 45, "batch": "本科一批A段"},
-                        2022: {"min_score": 618, "rank": 52, "batch": "本科一批A段"},
-                        2021: {"min_score": 640, "rank": 38, "batch": "本科一批A段"},
-                        2020: {"min_score": 646, "rank": 41, "batch": "本科一批A段"}
-                    }
-                },
-                "北京": {
-                    "理科": {
-                        2023: {"min_score": 691, "rank": 865, "batch": "本科批"},
-                        2022: {"min_score": 688, "rank": 901, "batch": "本科批"},
-                        2021: {"min_score": 681, "rank": 1002, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 663, "rank": 234, "batch": "本科批"},
-                        2022: {"min_score": 660, "rank": 245, "batch": "本科批"}
-                    }
-                },
-                "河北": {
-                    "理科": {
-                        2023: {"min_score": 688, "rank": 462, "batch": "本科批"},
-                        2022: {"min_score": 673, "rank": 521, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 648, "rank": 134, "batch": "本科批"},
-                        2022: {"min_score": 645, "rank": 142, "batch": "本科批"}
-                    }
-                },
-                "河南": {
-                    "理科": {
-                        2023: {"min_score": 695, "rank": 263, "batch": "本科一批"},
-                        2022: {"min_score": 684, "rank": 341, "batch": "本科一批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 648, "rank": 89, "batch": "本科一批"},
-                        2022: {"min_score": 639, "rank": 95, "batch": "本科一批"}
-                    }
-                },
-                "山东": {
-                    "理科": {
-                        2023: {"min_score": 691, "rank": 428, "batch": "本科批"},
-                        2022: {"min_score": 672, "rank": 523, "batch": "本科批"}
-                    }
-                },
-                "江苏": {
-                    "理科": {
-                        2023: {"min_score": 674, "rank": 567, "batch": "本科批"},
-                        2022: {"min_score": 663, "rank": 634, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 638, "rank": 123, "batch": "本科批"},
-                        2022: {"min_score": 631, "rank": 145, "batch": "本科批"}
-                    }
-                },
-                "浙江": {
-                    "理科": {
-                        2023: {"min_score": 678, "rank": 523, "batch": "本科批"},
-                        2022: {"min_score": 665, "rank": 612, "batch": "本科批"}
-                    }
-                },
-                "安徽": {
-                    "理科": {
-                        2023: {"min_score": 691, "rank": 234, "batch": "本科一批"},
-                        2022: {"min_score": 682, "rank": 278, "batch": "本科一批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 649, "rank": 67, "batch": "本科一批"},
-                        2022: {"min_score": 641, "rank": 73, "batch": "本科一批"}
-                    }
-                },
-                "广东": {
-                    "理科": {
-                        2023: {"min_score": 685, "rank": 612, "batch": "本科批"},
-                        2022: {"min_score": 668, "rank": 723, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 645, "rank": 145, "batch": "本科批"},
-                        2022: {"min_score": 638, "rank": 167, "batch": "本科批"}
-                    }
-                },
-                "四川": {
-                    "理科": {
-                        2023: {"min_score": 692, "rank": 234, "batch": "本科一批"},
-                        2022: {"min_score": 679, "rank": 312, "batch": "本科一批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 651, "rank": 56, "batch": "本科一批"},
-                        2022: {"min_score": 648, "rank": 61, "batch": "本科一批"}
-                    }
-                },
-                "湖南": {
-                    "理科": {
-                        2023: {"min_score": 685, "rank": 312, "batch": "本科批"},
-                        2022: {"min_score": 672, "rank": 378, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 648, "rank": 78, "batch": "本科批"},
-                        2022: {"min_score": 641, "rank": 89, "batch": "本科批"}
-                    }
-                },
-                "湖北": {
-                    "理科": {
-                        2023: {"min_score": 687, "rank": 289, "batch": "本科批"},
-                        2022: {"min_score": 674, "rank": 345, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 649, "rank": 67, "batch": "本科批"},
-                        2022: {"min_score": 642, "rank": 73, "batch": "本科批"}
-                    }
-                },
-                "陕西": {
-                    "理科": {
-                        2023: {"min_score": 689, "rank": 234, "batch": "本科一批"},
-                        2022: {"min_score": 676, "rank": 289, "batch": "本科一批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 651, "rank": 45, "batch": "本科一批"},
-                        2022: {"min_score": 644, "rank": 52, "batch": "本科一批"}
-                    }
-                },
-                "辽宁": {
-                    "理科": {
-                        2023: {"min_score": 683, "rank": 345, "batch": "本科批"},
-                        2022: {"min_score": 670, "rank": 412, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 646, "rank": 89, "batch": "本科批"},
-                        2022: {"min_score": 639, "rank": 95, "batch": "本科批"}
-                    }
-                },
-                "吉林": {
-                    "理科": {
-                        2023: {"min_score": 678, "rank": 167, "batch": "本科一批A段"},
-                        2022: {"min_score": 665, "rank": 198, "batch": "本科一批A段"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 643, "rank": 34, "batch": "本科一批A段"},
-                        2022: {"min_score": 636, "rank": 38, "batch": "本科一批A段"}
-                    }
-                },
-                "黑龙江": {
-                    "理科": {
-                        2023: {"min_score": 675, "rank": 189, "batch": "本科一批A段"},
-                        2022: {"min_score": 662, "rank": 223, "batch": "本科一批A段"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 640, "rank": 41, "batch": "本科一批A段"},
-                        2022: {"min_score": 633, "rank": 45, "batch": "本科一批A段"}
-                    }
-                }
-            },
-            "清华大学": {
-                "山西": {
-                    "理科": {
-                        2023: {"min_score": 686, "rank": 38, "batch": "本科一批A段"},
-                        2022: {"min_score": 672, "rank": 57, "batch": "本科一批A段"},
-                        2021: {"min_score": 682, "rank": 47, "batch": "本科一批A段"},
-                        2020: {"min_score": 690, "rank": 45, "batch": "本科一批A段"}
-                    }
-                },
-                "河北": {
-                    "理科": {
-                        2023: {"min_score": 691, "rank": 336, "batch": "本科批"},
-                        2022: {"min_score": 678, "rank": 381, "batch": "本科批"}
-                    }
-                },
-                "北京": {
-                    "理科": {
-                        2023: {"min_score": 693, "rank": 734, "batch": "本科批"},
-                        2022: {"min_score": 690, "rank": 789, "batch": "本科批"}
-                    }
-                },
-                "河南": {
-                    "理科": {
-                        2023: {"min_score": 698, "rank": 189, "batch": "本科一批"},
-                        2022: {"min_score": 687, "rank": 234, "batch": "本科一批"}
-                    }
-                },
-                "山东": {
-                    "理科": {
-                        2023: {"min_score": 694, "rank": 312, "batch": "本科批"},
-                        2022: {"min_score": 675, "rank": 389, "batch": "本科批"}
-                    }
-                },
-                "江苏": {
-                    "理科": {
-                        2023: {"min_score": 677, "rank": 423, "batch": "本科批"},
-                        2022: {"min_score": 666, "rank": 501, "batch": "本科批"}
-                    }
-                },
-                "浙江": {
-                    "理科": {
-                        2023: {"min_score": 681, "rank": 389, "batch": "本科批"},
-                        2022: {"min_score": 668, "rank": 467, "batch": "本科批"}
-                    }
-                },
-                "安徽": {
-                    "理科": {
-                        2023: {"min_score": 694, "rank": 178, "batch": "本科一批"},
-                        2022: {"min_score": 685, "rank": 213, "batch": "本科一批"}
-                    }
-                },
-                "广东": {
-                    "理科": {
-                        2023: {"min_score": 688, "rank": 467, "batch": "本科批"},
-                        2022: {"min_score": 671, "rank": 578, "batch": "本科批"}
-                    }
-                },
-                "四川": {
-                    "理科": {
-                        2023: {"min_score": 695, "rank": 167, "batch": "本科一批"},
-                        2022: {"min_score": 682, "rank": 234, "batch": "本科一批"}
-                    }
-                },
-                "湖南": {
-                    "理科": {
-                        2023: {"min_score": 688, "rank": 234, "batch": "本科批"},
-                        2022: {"min_score": 675, "rank": 289, "batch": "本科批"}
-                    }
-                },
-                "湖北": {
-                    "理科": {
-                        2023: {"min_score": 690, "rank": 213, "batch": "本科批"},
-                        2022: {"min_score": 677, "rank": 267, "batch": "本科批"}
-                    }
-                },
-                "陕西": {
-                    "理科": {
-                        2023: {"min_score": 692, "rank": 167, "batch": "本科一批"},
-                        2022: {"min_score": 679, "rank": 201, "batch": "本科一批"}
-                    }
-                },
-                "辽宁": {
-                    "理科": {
-                        2023: {"min_score": 686, "rank": 267, "batch": "本科批"},
-                        2022: {"min_score": 673, "rank": 323, "batch": "本科批"}
-                    }
-                },
-                "吉林": {
-                    "理科": {
-                        2023: {"min_score": 681, "rank": 123, "batch": "本科一批A段"},
-                        2022: {"min_score": 668, "rank": 145, "batch": "本科一批A段"}
-                    }
-                },
-                "黑龙江": {
-                    "理科": {
-                        2023: {"min_score": 678, "rank": 134, "batch": "本科一批A段"},
-                        2022: {"min_score": 665, "rank": 156, "batch": "本科一批A段"}
-                    }
-                }
-            },
-            "复旦大学": {
-                "山西": {
-                    "理科": {
-                        2023: {"min_score": 643, "rank": 568, "batch": "本科一批A段"},
-                        2022: {"min_score": 637, "rank": 672, "batch": "本科一批A段"},
-                        2021: {"min_score": 648, "rank": 592, "batch": "本科一批A段"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 618, "rank": 89, "batch": "本科一批A段"},
-                        2022: {"min_score": 612, "rank": 95, "batch": "本科一批A段"}
-                    }
-                },
-                "上海": {
-                    "理科": {
-                        2023: {"min_score": 580, "rank": 1850, "batch": "本科批"}
-                    }
-                },
-                "河北": {
-                    "理科": {
-                        2023: {"min_score": 650, "rank": 2518, "batch": "本科批"},
-                        2022: {"min_score": 643, "rank": 2650, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 630, "rank": 234, "batch": "本科批"},
-                        2022: {"min_score": 625, "rank": 267, "batch": "本科批"}
-                    }
-                },
-                "北京": {
-                    "理科": {
-                        2023: {"min_score": 672, "rank": 1234, "batch": "本科批"},
-                        2022: {"min_score": 665, "rank": 1345, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 645, "rank": 289, "batch": "本科批"},
-                        2022: {"min_score": 639, "rank": 312, "batch": "本科批"}
-                    }
-                },
-                "河南": {
-                    "理科": {
-                        2023: {"min_score": 678, "rank": 523, "batch": "本科一批"},
-                        2022: {"min_score": 665, "rank": 612, "batch": "本科一批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 635, "rank": 145, "batch": "本科一批"},
-                        2022: {"min_score": 628, "rank": 167, "batch": "本科一批"}
-                    }
-                },
-                "山东": {
-                    "理科": {
-                        2023: {"min_score": 672, "rank": 723, "batch": "本科批"},
-                        2022: {"min_score": 659, "rank": 834, "batch": "本科批"}
-                    }
-                },
-                "江苏": {
-                    "理科": {
-                        2023: {"min_score": 658, "rank": 1234, "batch": "本科批"},
-                        2022: {"min_score": 645, "rank": 1456, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 628, "rank": 234, "batch": "本科批"},
-                        2022: {"min_score": 621, "rank": 267, "batch": "本科批"}
-                    }
-                },
-                "浙江": {
-                    "理科": {
-                        2023: {"min_score": 662, "rank": 1123, "batch": "本科批"},
-                        2022: {"min_score": 649, "rank": 1289, "batch": "本科批"}
-                    }
-                },
-                "安徽": {
-                    "理科": {
-                        2023: {"min_score": 675, "rank": 456, "batch": "本科一批"},
-                        2022: {"min_score": 662, "rank": 534, "batch": "本科一批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 638, "rank": 123, "batch": "本科一批"},
-                        2022: {"min_score": 631, "rank": 145, "batch": "本科一批"}
-                    }
-                },
-                "广东": {
-                    "理科": {
-                        2023: {"min_score": 669, "rank": 934, "batch": "本科批"},
-                        2022: {"min_score": 652, "rank": 1123, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 632, "rank": 234, "batch": "本科批"},
-                        2022: {"min_score": 625, "rank": 267, "batch": "本科批"}
-                    }
-                },
-                "四川": {
-                    "理科": {
-                        2023: {"min_score": 676, "rank": 423, "batch": "本科一批"},
-                        2022: {"min_score": 663, "rank": 501, "batch": "本科一批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 641, "rank": 89, "batch": "本科一批"},
-                        2022: {"min_score": 634, "rank": 102, "batch": "本科一批"}
-                    }
-                },
-                "湖南": {
-                    "理科": {
-                        2023: {"min_score": 670, "rank": 612, "batch": "本科批"},
-                        2022: {"min_score": 657, "rank": 723, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 635, "rank": 134, "batch": "本科批"},
-                        2022: {"min_score": 628, "rank": 156, "batch": "本科批"}
-                    }
-                },
-                "湖北": {
-                    "理科": {
-                        2023: {"min_score": 672, "rank": 578, "batch": "本科批"},
-                        2022: {"min_score": 659, "rank": 678, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 637, "rank": 123, "batch": "本科批"},
-                        2022: {"min_score": 630, "rank": 145, "batch": "本科批"}
-                    }
-                },
-                "陕西": {
-                    "理科": {
-                        2023: {"min_score": 674, "rank": 445, "batch": "本科一批"},
-                        2022: {"min_score": 661, "rank": 523, "batch": "本科一批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 639, "rank": 78, "batch": "本科一批"},
-                        2022: {"min_score": 632, "rank": 89, "batch": "本科一批"}
-                    }
-                },
-                "辽宁": {
-                    "理科": {
-                        2023: {"min_score": 668, "rank": 634, "batch": "本科批"},
-                        2022: {"min_score": 655, "rank": 745, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 633, "rank": 145, "batch": "本科批"},
-                        2022: {"min_score": 626, "rank": 167, "batch": "本科批"}
-                    }
-                },
-                "吉林": {
-                    "理科": {
-                        2023: {"min_score": 663, "rank": 289, "batch": "本科一批A段"},
-                        2022: {"min_score": 650, "rank": 334, "batch": "本科一批A段"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 630, "rank": 67, "batch": "本科一批A段"},
-                        2022: {"min_score": 623, "rank": 78, "batch": "本科一批A段"}
-                    }
-                },
-                "黑龙江": {
-                    "理科": {
-                        2023: {"min_score": 660, "rank": 312, "batch": "本科一批A段"},
-                        2022: {"min_score": 647, "rank": 367, "batch": "本科一批A段"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 627, "rank": 73, "batch": "本科一批A段"},
-                        2022: {"min_score": 620, "rank": 84, "batch": "本科一批A段"}
-                    }
-                }
-            },
-            "北京航空航天大学": {
-                "河北": {
-                    "理科": {
-                        2023: {"min_score": 646, "rank": 2913, "batch": "本科批"},
-                        2022: {"min_score": 635, "rank": 3421, "batch": "本科批"},
-                        2021: {"min_score": 641, "rank": 3856, "batch": "本科批"}
-                    }
-                },
-                "山西": {
-                    "理科": {
-                        2023: {"min_score": 618, "rank": 1526, "batch": "本科一批A段"},
-                        2022: {"min_score": 612, "rank": 1683, "batch": "本科一批A段"}
-                    }
-                },
-                "北京": {
-                    "理科": {
-                        2023: {"min_score": 658, "rank": 2134, "batch": "本科批"},
-                        2022: {"min_score": 651, "rank": 2367, "batch": "本科批"}
-                    }
-                },
-                "河南": {
-                    "理科": {
-                        2023: {"min_score": 663, "rank": 1234, "batch": "本科一批"},
-                        2022: {"min_score": 650, "rank": 1456, "batch": "本科一批"}
-                    }
-                },
-                "山东": {
-                    "理科": {
-                        2023: {"min_score": 657, "rank": 1567, "batch": "本科批"},
-                        2022: {"min_score": 644, "rank": 1789, "batch": "本科批"}
-                    }
-                },
-                "江苏": {
-                    "理科": {
-                        2023: {"min_score": 643, "rank": 2345, "batch": "本科批"},
-                        2022: {"min_score": 630, "rank": 2678, "batch": "本科批"}
-                    }
-                },
-                "浙江": {
-                    "理科": {
-                        2023: {"min_score": 647, "rank": 2123, "batch": "本科批"},
-                        2022: {"min_score": 634, "rank": 2456, "batch": "本科批"}
-                    }
-                },
-                "安徽": {
-                    "理科": {
-                        2023: {"min_score": 660, "rank": 1123, "batch": "本科一批"},
-                        2022: {"min_score": 647, "rank": 1345, "batch": "本科一批"}
-                    }
-                },
-                "广东": {
-                    "理科": {
-                        2023: {"min_score": 654, "rank": 1678, "batch": "本科批"},
-                        2022: {"min_score": 637, "rank": 1934, "batch": "本科批"}
-                    }
-                },
-                "四川": {
-                    "理科": {
-                        2023: {"min_score": 661, "rank": 1089, "batch": "本科一批"},
-                        2022: {"min_score": 648, "rank": 1234, "batch": "本科一批"}
-                    }
-                },
-                "湖南": {
-                    "理科": {
-                        2023: {"min_score": 655, "rank": 1345, "batch": "本科批"},
-                        2022: {"min_score": 642, "rank": 1567, "batch": "本科批"}
-                    }
-                },
-                "湖北": {
-                    "理科": {
-                        2023: {"min_score": 657, "rank": 1234, "batch": "本科批"},
-                        2022: {"min_score": 644, "rank": 1456, "batch": "本科批"}
-                    }
-                },
-                "陕西": {
-                    "理科": {
-                        2023: {"min_score": 659, "rank": 1089, "batch": "本科一批"},
-                        2022: {"min_score": 646, "rank": 1234, "batch": "本科一批"}
-                    }
-                },
-                "辽宁": {
-                    "理科": {
-                        2023: {"min_score": 653, "rank": 1456, "batch": "本科批"},
-                        2022: {"min_score": 640, "rank": 1678, "batch": "本科批"}
-                    }
-                },
-                "吉林": {
-                    "理科": {
-                        2023: {"min_score": 648, "rank": 567, "batch": "本科一批A段"},
-                        2022: {"min_score": 635, "rank": 634, "batch": "本科一批A段"}
-                    }
-                },
-                "黑龙江": {
-                    "理科": {
-                        2023: {"min_score": 645, "rank": 623, "batch": "本科一批A段"},
-                        2022: {"min_score": 632, "rank": 723, "batch": "本科一批A段"}
-                    }
-                }
-            },
-            "华东理工大学": {
-                "河北": {
-                    "理科": {
-                        2023: {"min_score": 590, "rank": 12456, "batch": "本科批"},
-                        2022: {"min_score": 584, "rank": 13127, "batch": "本科批"},
-                        2021: {"min_score": 591, "rank": 13956, "batch": "本科批"}
-                    }
-                },
-                "山西": {
-                    "理科": {
-                        2023: {"min_score": 563, "rank": 8234, "batch": "本科一批A段"},
-                        2022: {"min_score": 558, "rank": 8756, "batch": "本科一批A段"}
-                    }
-                },
-                "北京": {
-                    "理科": {
-                        2023: {"min_score": 618, "rank": 6234, "batch": "本科批"},
-                        2022: {"min_score": 612, "rank": 6567, "batch": "本科批"}
-                    }
-                },
-                "上海": {
-                    "理科": {
-                        2023: {"min_score": 545, "rank": 4567, "batch": "本科批"},
-                        2022: {"min_score": 538, "rank": 4823, "batch": "本科批"}
-                    }
-                },
-                "河南": {
-                    "理科": {
-                        2023: {"min_score": 608, "rank": 5234, "batch": "本科一批"},
-                        2022: {"min_score": 595, "rank": 5789, "batch": "本科一批"}
-                    }
-                },
-                "山东": {
-                    "理科": {
-                        2023: {"min_score": 602, "rank": 6123, "batch": "本科批"},
-                        2022: {"min_score": 589, "rank": 6734, "batch": "本科批"}
-                    }
-                },
-                "江苏": {
-                    "理科": {
-                        2023: {"min_score": 588, "rank": 7234, "batch": "本科批"},
-                        2022: {"min_score": 575, "rank": 7823, "batch": "本科批"}
-                    }
-                },
-                "浙江": {
-                    "理科": {
-                        2023: {"min_score": 592, "rank": 6789, "batch": "本科批"},
-                        2022: {"min_score": 579, "rank": 7345, "batch": "本科批"}
-                    }
-                },
-                "安徽": {
-                    "理科": {
-                        2023: {"min_score": 605, "rank": 5567, "batch": "本科一批"},
-                        2022: {"min_score": 592, "rank": 6123, "batch": "本科一批"}
-                    }
-                },
-                "广东": {
-                    "理科": {
-                        2023: {"min_score": 599, "rank": 6456, "batch": "本科批"},
-                        2022: {"min_score": 582, "rank": 7234, "batch": "本科批"}
-                    }
-                },
-                "四川": {
-                    "理科": {
-                        2023: {"min_score": 606, "rank": 5123, "batch": "本科一批"},
-                        2022: {"min_score": 593, "rank": 5678, "batch": "本科一批"}
-                    }
-                },
-                "湖南": {
-                    "理科": {
-                        2023: {"min_score": 600, "rank": 5789, "batch": "本科批"},
-                        2022: {"min_score": 587, "rank": 6234, "batch": "本科批"}
-                    }
-                },
-                "湖北": {
-                    "理科": {
-                        2023: {"min_score": 602, "rank": 5567, "batch": "本科批"},
-                        2022: {"min_score": 589, "rank": 6012, "batch": "本科批"}
-                    }
-                },
-                "陕西": {
-                    "理科": {
-                        2023: {"min_score": 604, "rank": 5234, "batch": "本科一批"},
-                        2022: {"min_score": 591, "rank": 5678, "batch": "本科一批"}
-                    }
-                },
-                "辽宁": {
-                    "理科": {
-                        2023: {"min_score": 598, "rank": 6123, "batch": "本科批"},
-                        2022: {"min_score": 585, "rank": 6567, "batch": "本科批"}
-                    }
-                },
-                "吉林": {
-                    "理科": {
-                        2023: {"min_score": 593, "rank": 2345, "batch": "本科一批A段"},
-                        2022: {"min_score": 580, "rank": 2567, "batch": "本科一批A段"}
-                    }
-                },
-                "黑龙江": {
-                    "理科": {
-                        2023: {"min_score": 590, "rank": 2567, "batch": "本科一批A段"},
-                        2022: {"min_score": 577, "rank": 2789, "batch": "本科一批A段"}
-                    }
-                }
-            },
-            "上海交通大学": {
-                "河北": {
-                    "理科": {
-                        2023: {"min_score": 675, "rank": 896, "batch": "本科批"},
-                        2022: {"min_score": 668, "rank": 1024, "batch": "本科批"}
-                    }
-                },
-                "山西": {
-                    "理科": {
-                        2023: {"min_score": 671, "rank": 87, "batch": "本科一批A段"},
-                        2022: {"min_score": 660, "rank": 112, "batch": "本科一批A段"}
-                    }
-                },
-                "北京": {
-                    "理科": {
-                        2023: {"min_score": 685, "rank": 1123, "batch": "本科批"},
-                        2022: {"min_score": 678, "rank": 1234, "batch": "本科批"}
-                    }
-                },
-                "上海": {
-                    "理科": {
-                        2023: {"min_score": 570, "rank": 1567, "batch": "本科批"},
-                        2022: {"min_score": 563, "rank": 1689, "batch": "本科批"}
-                    }
-                },
-                "河南": {
-                    "理科": {
-                        2023: {"min_score": 690, "rank": 345, "batch": "本科一批"},
-                        2022: {"min_score": 677, "rank": 423, "batch": "本科一批"}
-                    }
-                },
-                "山东": {
-                    "理科": {
-                        2023: {"min_score": 683, "rank": 567, "batch": "本科批"},
-                        2022: {"min_score": 664, "rank": 723, "batch": "本科批"}
-                    }
-                },
-                "江苏": {
-                    "理科": {
-                        2023: {"min_score": 669, "rank": 789, "batch": "本科批"},
-                        2022: {"min_score": 656, "rank": 934, "batch": "本科批"}
-                    }
-                },
-                "浙江": {
-                    "理科": {
-                        2023: {"min_score": 673, "rank": 723, "batch": "本科批"},
-                        2022: {"min_score": 660, "rank": 845, "batch": "本科批"}
-                    }
-                },
-                "安徽": {
-                    "理科": {
-                        2023: {"min_score": 687, "rank": 312, "batch": "本科一批"},
-                        2022: {"min_score": 674, "rank": 378, "batch": "本科一批"}
-                    }
-                },
-                "广东": {
-                    "理科": {
-                        2023: {"min_score": 681, "rank": 634, "batch": "本科批"},
-                        2022: {"min_score": 664, "rank": 789, "batch": "本科批"}
-                    }
-                },
-                "四川": {
-                    "理科": {
-                        2023: {"min_score": 688, "rank": 289, "batch": "本科一批"},
-                        2022: {"min_score": 675, "rank": 345, "batch": "本科一批"}
-                    }
-                },
-                "湖南": {
-                    "理科": {
-                        2023: {"min_score": 682, "rank": 423, "batch": "本科批"},
-                        2022: {"min_score": 669, "rank": 501, "batch": "本科批"}
-                    }
-                },
-                "湖北": {
-                    "理科": {
-                        2023: {"min_score": 684, "rank": 378, "batch": "本科批"},
-                        2022: {"min_score": 671, "rank": 445, "batch": "本科批"}
-                    }
-                },
-                "陕西": {
-                    "理科": {
-                        2023: {"min_score": 686, "rank": 312, "batch": "本科一批"},
-                        2022: {"min_score": 673, "rank": 378, "batch": "本科一批"}
-                    }
-                },
-                "辽宁": {
-                    "理科": {
-                        2023: {"min_score": 680, "rank": 456, "batch": "本科批"},
-                        2022: {"min_score": 667, "rank": 534, "batch": "本科批"}
-                    }
-                },
-                "吉林": {
-                    "理科": {
-                        2023: {"min_score": 675, "rank": 201, "batch": "本科一批A段"},
-                        2022: {"min_score": 662, "rank": 234, "batch": "本科一批A段"}
-                    }
-                },
-                "黑龙江": {
-                    "理科": {
-                        2023: {"min_score": 672, "rank": 223, "batch": "本科一批A段"},
-                        2022: {"min_score": 659, "rank": 267, "batch": "本科一批A段"}
-                    }
-                }
-            },
-            "浙江大学": {
-                "河北": {
-                    "理科": {
-                        2023: {"min_score": 669, "rank": 1167, "batch": "本科批"},
-                        2022: {"min_score": 661, "rank": 1345, "batch": "本科批"}
-                    }
-                },
-                "山西": {
-                    "理科": {
-                        2023: {"min_score": 654, "rank": 326, "batch": "本科一批A段"},
-                        2022: {"min_score": 648, "rank": 423, "batch": "本科一批A段"}
-                    }
-                },
-                "北京": {
-                    "理科": {
-                        2023: {"min_score": 679, "rank": 1345, "batch": "本科批"},
-                        2022: {"min_score": 672, "rank": 1456, "batch": "本科批"}
-                    }
-                },
-                "浙江": {
-                    "理科": {
-                        2023: {"min_score": 667, "rank": 834, "batch": "本科批"},
-                        2022: {"min_score": 654, "rank": 945, "batch": "本科批"}
-                    }
-                },
-                "河南": {
-                    "理科": {
-                        2023: {"min_score": 684, "rank": 445, "batch": "本科一批"},
-                        2022: {"min_score": 671, "rank": 523, "batch": "本科一批"}
-                    }
-                },
-                "山东": {
-                    "理科": {
-                        2023: {"min_score": 677, "rank": 678, "batch": "本科批"},
-                        2022: {"min_score": 658, "rank": 823, "batch": "本科批"}
-                    }
-                },
-                "江苏": {
-                    "理科": {
-                        2023: {"min_score": 663, "rank": 945, "batch": "本科批"},
-                        2022: {"min_score": 650, "rank": 1123, "batch": "本科批"}
-                    }
-                },
-                "安徽": {
-                    "理科": {
-                        2023: {"min_score": 681, "rank": 401, "batch": "本科一批"},
-                        2022: {"min_score": 668, "rank": 478, "batch": "本科一批"}
-                    }
-                },
-                "广东": {
-                    "理科": {
-                        2023: {"min_score": 675, "rank": 734, "batch": "本科批"},
-                        2022: {"min_score": 658, "rank": 889, "batch": "本科批"}
-                    }
-                },
-                "四川": {
-                    "理科": {
-                        2023: {"min_score": 682, "rank": 367, "batch": "本科一批"},
-                        2022: {"min_score": 669, "rank": 434, "batch": "本科一批"}
-                    }
-                },
-                "湖南": {
-                    "理科": {
-                        2023: {"min_score": 676, "rank": 501, "batch": "本科批"},
-                        2022: {"min_score": 663, "rank": 589, "batch": "本科批"}
-                    }
-                },
-                "湖北": {
-                    "理科": {
-                        2023: {"min_score": 678, "rank": 467, "batch": "本科批"},
-                        2022: {"min_score": 665, "rank": 534, "batch": "本科批"}
-                    }
-                },
-                "陕西": {
-                    "理科": {
-                        2023: {"min_score": 680, "rank": 389, "batch": "本科一批"},
-                        2022: {"min_score": 667, "rank": 445, "batch": "本科一批"}
-                    }
-                },
-                "辽宁": {
-                    "理科": {
-                        2023: {"min_score": 674, "rank": 545, "batch": "本科批"},
-                        2022: {"min_score": 661, "rank": 623, "batch": "本科批"}
-                    }
-                },
-                "吉林": {
-                    "理科": {
-                        2023: {"min_score": 669, "rank": 245, "batch": "本科一批A段"},
-                        2022: {"min_score": 656, "rank": 289, "batch": "本科一批A段"}
-                    }
-                },
-                "黑龙江": {
-                    "理科": {
-                        2023: {"min_score": 666, "rank": 267, "batch": "本科一批A段"},
-                        2022: {"min_score": 653, "rank": 312, "batch": "本科一批A段"}
-                    }
-                }
-            },
-            "中国科学技术大学": {
-                "河北": {
-                    "理科": {
-                        2023: {"min_score": 660, "rank": 1798, "batch": "本科批"},
-                        2022: {"min_score": 650, "rank": 2156, "batch": "本科批"}
-                    }
-                },
-                "山西": {
-                    "理科": {
-                        2023: {"min_score": 648, "rank": 421, "batch": "本科一批A段"},
-                        2022: {"min_score": 642, "rank": 578, "batch": "本科一批A段"}
-                    }
-                },
-                "北京": {
-                    "理科": {
-                        2023: {"min_score": 670, "rank": 1567, "batch": "本科批"},
-                        2022: {"min_score": 663, "rank": 1678, "batch": "本科批"}
-                    }
-                },
-                "安徽": {
-                    "理科": {
-                        2023: {"min_score": 673, "rank": 523, "batch": "本科一批"},
-                        2022: {"min_score": 660, "rank": 612, "batch": "本科一批"}
-                    }
-                },
-                "河南": {
-                    "理科": {
-                        2023: {"min_score": 676, "rank": 612, "batch": "本科一批"},
-                        2022: {"min_score": 663, "rank": 723, "batch": "本科一批"}
-                    }
-                },
-                "山东": {
-                    "理科": {
-                        2023: {"min_score": 669, "rank": 834, "batch": "本科批"},
-                        2022: {"min_score": 650, "rank": 1012, "batch": "本科批"}
-                    }
-                },
-                "江苏": {
-                    "理科": {
-                        2023: {"min_score": 655, "rank": 1234, "batch": "本科批"},
-                        2022: {"min_score": 642, "rank": 1456, "batch": "本科批"}
-                    }
-                },
-                "浙江": {
-                    "理科": {
-                        2023: {"min_score": 659, "rank": 1123, "batch": "本科批"},
-                        2022: {"min_score": 646, "rank": 1289, "batch": "本科批"}
-                    }
-                },
-                "广东": {
-                    "理科": {
-                        2023: {"min_score": 667, "rank": 923, "batch": "本科批"},
-                        2022: {"min_score": 650, "rank": 1123, "batch": "本科批"}
-                    }
-                },
-                "四川": {
-                    "理科": {
-                        2023: {"min_score": 674, "rank": 467, "batch": "本科一批"},
-                        2022: {"min_score": 661, "rank": 545, "batch": "本科一批"}
-                    }
-                },
-                "湖南": {
-                    "理科": {
-                        2023: {"min_score": 668, "rank": 678, "batch": "本科批"},
-                        2022: {"min_score": 655, "rank": 789, "batch": "本科批"}
-                    }
-                },
-                "湖北": {
-                    "理科": {
-                        2023: {"min_score": 670, "rank": 634, "batch": "本科批"},
-                        2022: {"min_score": 657, "rank": 723, "batch": "本科批"}
-                    }
-                },
-                "陕西": {
-                    "理科": {
-                        2023: {"min_score": 672, "rank": 501, "batch": "本科一批"},
-                        2022: {"min_score": 659, "rank": 578, "batch": "本科一批"}
-                    }
-                },
-                "辽宁": {
-                    "理科": {
-                        2023: {"min_score": 666, "rank": 723, "batch": "本科批"},
-                        2022: {"min_score": 653, "rank": 834, "batch": "本科批"}
-                    }
-                },
-                "吉林": {
-                    "理科": {
-                        2023: {"min_score": 661, "rank": 334, "batch": "本科一批A段"},
-                        2022: {"min_score": 648, "rank": 389, "batch": "本科一批A段"}
-                    }
-                },
-                "黑龙江": {
-                    "理科": {
-                        2023: {"min_score": 658, "rank": 356, "batch": "本科一批A段"},
-                        2022: {"min_score": 645, "rank": 412, "batch": "本科一批A段"}
-                    }
-                }
-            },
-            "南京大学": {
-                "河北": {
-                    "理科": {
-                        2023: {"min_score": 659, "rank": 1876, "batch": "本科批"},
-                        2022: {"min_score": 649, "rank": 2234, "batch": "本科批"}
-                    }
-                },
-                "山西": {
-                    "理科": {
-                        2023: {"min_score": 651, "rank": 378, "batch": "本科一批A段"},
-                        2022: {"min_score": 645, "rank": 487, "batch": "本科一批A段"}
-                    }
-                },
-                "北京": {
-                    "理科": {
-                        2023: {"min_score": 669, "rank": 1678, "batch": "本科批"},
-                        2022: {"min_score": 662, "rank": 1789, "batch": "本科批"}
-                    }
-                },
-                "江苏": {
-                    "理科": {
-                        2023: {"min_score": 654, "rank": 1345, "batch": "本科批"},
-                        2022: {"min_score": 641, "rank": 1567, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 624, "rank": 267, "batch": "本科批"},
-                        2022: {"min_score": 617, "rank": 312, "batch": "本科批"}
-                    }
-                },
-                "河南": {
-                    "理科": {
-                        2023: {"min_score": 675, "rank": 634, "batch": "本科一批"},
-                        2022: {"min_score": 662, "rank": 745, "batch": "本科一批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 631, "rank": 167, "batch": "本科一批"},
-                        2022: {"min_score": 624, "rank": 189, "batch": "本科一批"}
-                    }
-                },
-                "山东": {
-                    "理科": {
-                        2023: {"min_score": 668, "rank": 889, "batch": "本科批"},
-                        2022: {"min_score": 649, "rank": 1067, "batch": "本科批"}
-                    }
-                },
-                "浙江": {
-                    "理科": {
-                        2023: {"min_score": 658, "rank": 1234, "batch": "本科批"},
-                        2022: {"min_score": 645, "rank": 1389, "batch": "本科批"}
-                    }
-                },
-                "安徽": {
-                    "理科": {
-                        2023: {"min_score": 672, "rank": 567, "batch": "本科一批"},
-                        2022: {"min_score": 659, "rank": 656, "batch": "本科一批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 634, "rank": 134, "batch": "本科一批"},
-                        2022: {"min_score": 627, "rank": 156, "batch": "本科一批"}
-                    }
-                },
-                "广东": {
-                    "理科": {
-                        2023: {"min_score": 666, "rank": 1012, "batch": "本科批"},
-                        2022: {"min_score": 649, "rank": 1189, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 628, "rank": 267, "batch": "本科批"},
-                        2022: {"min_score": 621, "rank": 312, "batch": "本科批"}
-                    }
-                },
-                "四川": {
-                    "理科": {
-                        2023: {"min_score": 673, "rank": 523, "batch": "本科一批"},
-                        2022: {"min_score": 660, "rank": 601, "batch": "本科一批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 637, "rank": 102, "batch": "本科一批"},
-                        2022: {"min_score": 630, "rank": 123, "batch": "本科一批"}
-                    }
-                },
-                "湖南": {
-                    "理科": {
-                        2023: {"min_score": 667, "rank": 723, "batch": "本科批"},
-                        2022: {"min_score": 654, "rank": 834, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 631, "rank": 156, "batch": "本科批"},
-                        2022: {"min_score": 624, "rank": 178, "batch": "本科批"}
-                    }
-                },
-                "湖北": {
-                    "理科": {
-                        2023: {"min_score": 669, "rank": 678, "batch": "本科批"},
-                        2022: {"min_score": 656, "rank": 776, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 633, "rank": 134, "batch": "本科批"},
-                        2022: {"min_score": 626, "rank": 156, "batch": "本科批"}
-                    }
-                },
-                "陕西": {
-                    "理科": {
-                        2023: {"min_score": 671, "rank": 556, "batch": "本科一批"},
-                        2022: {"min_score": 658, "rank": 634, "batch": "本科一批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 635, "rank": 89, "batch": "本科一批"},
-                        2022: {"min_score": 628, "rank": 102, "batch": "本科一批"}
-                    }
-                },
-                "辽宁": {
-                    "理科": {
-                        2023: {"min_score": 665, "rank": 767, "batch": "本科批"},
-                        2022: {"min_score": 652, "rank": 889, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 629, "rank": 167, "batch": "本科批"},
-                        2022: {"min_score": 622, "rank": 189, "batch": "本科批"}
-                    }
-                },
-                "吉林": {
-                    "理科": {
-                        2023: {"min_score": 660, "rank": 378, "batch": "本科一批A段"},
-                        2022: {"min_score": 647, "rank": 434, "batch": "本科一批A段"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 626, "rank": 78, "batch": "本科一批A段"},
-                        2022: {"min_score": 619, "rank": 89, "batch": "本科一批A段"}
-                    }
-                },
-                "黑龙江": {
-                    "理科": {
-                        2023: {"min_score": 657, "rank": 401, "batch": "本科一批A段"},
-                        2022: {"min_score": 644, "rank": 467, "batch": "本科一批A段"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 623, "rank": 84, "batch": "本科一批A段"},
-                        2022: {"min_score": 616, "rank": 95, "batch": "本科一批A段"}
-                    }
-                }
-            },
-            "华中科技大学": {
-                "河北": {
-                    "理科": {
-                        2023: {"min_score": 632, "rank": 4896, "batch": "本科批"},
-                        2022: {"min_score": 625, "rank": 5234, "batch": "本科批"}
-                    }
-                },
-                "山西": {
-                    "理科": {
-                        2023: {"min_score": 607, "rank": 2345, "batch": "本科一批A段"},
-                        2022: {"min_score": 601, "rank": 2567, "batch": "本科一批A段"}
-                    }
-                },
-                "北京": {
-                    "理科": {
-                        2023: {"min_score": 642, "rank": 3456, "batch": "本科批"},
-                        2022: {"min_score": 635, "rank": 3789, "batch": "本科批"}
-                    }
-                },
-                "河南": {
-                    "理科": {
-                        2023: {"min_score": 648, "rank": 2234, "batch": "本科一批"},
-                        2022: {"min_score": 635, "rank": 2567, "batch": "本科一批"}
-                    }
-                },
-                "山东": {
-                    "理科": {
-                        2023: {"min_score": 642, "rank": 2789, "batch": "本科批"},
-                        2022: {"min_score": 629, "rank": 3123, "batch": "本科批"}
-                    }
-                },
-                "江苏": {
-                    "理科": {
-                        2023: {"min_score": 628, "rank": 3567, "batch": "本科批"},
-                        2022: {"min_score": 615, "rank": 3890, "batch": "本科批"}
-                    }
-                },
-                "浙江": {
-                    "理科": {
-                        2023: {"min_score": 632, "rank": 3234, "batch": "本科批"},
-                        2022: {"min_score": 619, "rank": 3623, "batch": "本科批"}
-                    }
-                },
-                "安徽": {
-                    "理科": {
-                        2023: {"min_score": 645, "rank": 2456, "batch": "本科一批"},
-                        2022: {"min_score": 632, "rank": 2723, "batch": "本科一批"}
-                    }
-                },
-                "广东": {
-                    "理科": {
-                        2023: {"min_score": 639, "rank": 3012, "batch": "本科批"},
-                        2022: {"min_score": 622, "rank": 3456, "batch": "本科批"}
-                    }
-                },
-                "四川": {
-                    "理科": {
-                        2023: {"min_score": 646, "rank": 2234, "batch": "本科一批"},
-                        2022: {"min_score": 633, "rank": 2567, "batch": "本科一批"}
-                    }
-                },
-                "湖南": {
-                    "理科": {
-                        2023: {"min_score": 640, "rank": 2678, "batch": "本科批"},
-                        2022: {"min_score": 627, "rank": 2934, "batch": "本科批"}
-                    }
-                },
-                "湖北": {
-                    "理科": {
-                        2023: {"min_score": 642, "rank": 2567, "batch": "本科批"},
-                        2022: {"min_score": 629, "rank": 2823, "batch": "本科批"}
-                    }
-                },
-                "陕西": {
-                    "理科": {
-                        2023: {"min_score": 644, "rank": 2345, "batch": "本科一批"},
-                        2022: {"min_score": 631, "rank": 2634, "batch": "本科一批"}
-                    }
-                },
-                "辽宁": {
-                    "理科": {
-                        2023: {"min_score": 638, "rank": 2823, "batch": "本科批"},
-                        2022: {"min_score": 625, "rank": 3123, "batch": "本科批"}
-                    }
-                },
-                "吉林": {
-                    "理科": {
-                        2023: {"min_score": 633, "rank": 1234, "batch": "本科一批A段"},
-                        2022: {"min_score": 620, "rank": 1456, "batch": "本科一批A段"}
-                    }
-                },
-                "黑龙江": {
-                    "理科": {
-                        2023: {"min_score": 630, "rank": 1345, "batch": "本科一批A段"},
-                        2022: {"min_score": 617, "rank": 1567, "batch": "本科一批A段"}
-                    }
-                }
-            },
-            "山西财经大学": {
-                "河北": {
-                    "理科": {
-                        2023: {"min_score": 530, "rank": 25890, "batch": "本科批"},
-                        2022: {"min_score": 523, "rank": 26234, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 525, "rank": 3234, "batch": "本科批"},
-                        2022: {"min_score": 518, "rank": 3456, "batch": "本科批"}
-                    }
-                },
-                "山西": {
-                    "理科": {
-                        2023: {"min_score": 513, "rank": 18234, "batch": "本科一批A段"},
-                        2022: {"min_score": 507, "rank": 18567, "batch": "本科一批A段"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 508, "rank": 1456, "batch": "本科一批A段"},
-                        2022: {"min_score": 502, "rank": 1523, "batch": "本科一批A段"}
-                    }
-                },
-                "北京": {
-                    "理科": {
-                        2023: {"min_score": 545, "rank": 18234, "batch": "本科批"},
-                        2022: {"min_score": 538, "rank": 18790, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 538, "rank": 2012, "batch": "本科批"},
-                        2022: {"min_score": 531, "rank": 2156, "batch": "本科批"}
-                    }
-                },
-                "河南": {
-                    "理科": {
-                        2023: {"min_score": 552, "rank": 17234, "batch": "本科一批"},
-                        2022: {"min_score": 539, "rank": 17890, "batch": "本科一批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 545, "rank": 2634, "batch": "本科一批"},
-                        2022: {"min_score": 538, "rank": 2789, "batch": "本科一批"}
-                    }
-                },
-                "山东": {
-                    "理科": {
-                        2023: {"min_score": 547, "rank": 18456, "batch": "本科批"},
-                        2022: {"min_score": 534, "rank": 19123, "batch": "本科批"}
-                    }
-                },
-                "江苏": {
-                    "理科": {
-                        2023: {"min_score": 533, "rank": 19890, "batch": "本科批"},
-                        2022: {"min_score": 520, "rank": 20456, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 528, "rank": 2934, "batch": "本科批"},
-                        2022: {"min_score": 521, "rank": 3123, "batch": "本科批"}
-                    }
-                },
-                "浙江": {
-                    "理科": {
-                        2023: {"min_score": 537, "rank": 19234, "batch": "本科批"},
-                        2022: {"min_score": 524, "rank": 19789, "batch": "本科批"}
-                    }
-                },
-                "安徽": {
-                    "理科": {
-                        2023: {"min_score": 550, "rank": 17567, "batch": "本科一批"},
-                        2022: {"min_score": 537, "rank": 18123, "batch": "本科一批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 543, "rank": 2723, "batch": "本科一批"},
-                        2022: {"min_score": 536, "rank": 2890, "batch": "本科一批"}
-                    }
-                },
-                "广东": {
-                    "理科": {
-                        2023: {"min_score": 544, "rank": 18567, "batch": "本科批"},
-                        2022: {"min_score": 527, "rank": 19234, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 537, "rank": 2987, "batch": "本科批"},
-                        2022: {"min_score": 530, "rank": 3156, "batch": "本科批"}
-                    }
-                },
-                "四川": {
-                    "理科": {
-                        2023: {"min_score": 551, "rank": 17345, "batch": "本科一批"},
-                        2022: {"min_score": 538, "rank": 17890, "batch": "本科一批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 544, "rank": 2612, "batch": "本科一批"},
-                        2022: {"min_score": 537, "rank": 2767, "batch": "本科一批"}
-                    }
-                },
-                "湖南": {
-                    "理科": {
-                        2023: {"min_score": 545, "rank": 17890, "batch": "本科批"},
-                        2022: {"min_score": 532, "rank": 18456, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 538, "rank": 2823, "batch": "本科批"},
-                        2022: {"min_score": 531, "rank": 2987, "batch": "本科批"}
-                    }
-                },
-                "湖北": {
-                    "理科": {
-                        2023: {"min_score": 547, "rank": 17678, "batch": "本科批"},
-                        2022: {"min_score": 534, "rank": 18234, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 540, "rank": 2712, "batch": "本科批"},
-                        2022: {"min_score": 533, "rank": 2856, "batch": "本科批"}
-                    }
-                },
-                "陕西": {
-                    "理科": {
-                        2023: {"min_score": 549, "rank": 17234, "batch": "本科一批"},
-                        2022: {"min_score": 536, "rank": 17678, "batch": "本科一批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 542, "rank": 2512, "batch": "本科一批"},
-                        2022: {"min_score": 535, "rank": 2634, "batch": "本科一批"}
-                    }
-                },
-                "辽宁": {
-                    "理科": {
-                        2023: {"min_score": 543, "rank": 18123, "batch": "本科批"},
-                        2022: {"min_score": 530, "rank": 18567, "batch": "本科批"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 536, "rank": 2856, "batch": "本科批"},
-                        2022: {"min_score": 529, "rank": 3012, "batch": "本科批"}
-                    }
-                },
-                "吉林": {
-                    "理科": {
-                        2023: {"min_score": 538, "rank": 9234, "batch": "本科一批A段"},
-                        2022: {"min_score": 525, "rank": 9567, "batch": "本科一批A段"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 533, "rank": 823, "batch": "本科一批A段"},
-                        2022: {"min_score": 526, "rank": 889, "batch": "本科一批A段"}
-                    }
-                },
-                "黑龙江": {
-                    "理科": {
-                        2023: {"min_score": 535, "rank": 9567, "batch": "本科一批A段"},
-                        2022: {"min_score": 522, "rank": 9934, "batch": "本科一批A段"}
-                    },
-                    "文科": {
-                        2023: {"min_score": 530, "rank": 856, "batch": "本科一批A段"},
-                        2022: {"min_score": 523, "rank": 912, "batch": "本科一批A段"}
-                    }
-                }
-            }
-        }
+        # 共享的只读权威数据索引（进程内只构建一次）
+        self.reference_data = REFERENCE_DATA_STORE
     
     def get_admission_scores(self, university: str, province: str, subject: str, year: int = 2023) -> Dict[str, Any]:
         """
@@ -1469,15 +1584,8 @@ class ProfessionalDataAPI:
     def _get_reference_data(self, university: str, province: str, subject: str, year: int) -> Optional[Dict]:
         """从权威参考数据获取分数线"""
         try:
-            if university in self.reference_data:
-                uni_data = self.reference_data[university]
-                if province in uni_data:
-                    prov_data = uni_data[province]
-                    if subject in prov_data:
-                        subj_data = prov_data[subject]
-                        if year in subj_data:
-                            return subj_data[year]
-            return None
+            score_data = self.reference_data.get_scores(university, province, subject, year)
+            return dict(score_data) if score_data is not None else None
         except Exception as e:
             logger.error(f"获取参考数据失败: {e}")
             return None
@@ -1573,19 +1681,17 @@ class ProfessionalDataAPI:
     def _estimate_scores(self, university: str, province: str, subject: str, year: int) -> Optional[Dict]:
         """智能估算分数线（基于历史数据规律）"""
         try:
-            # 1. 查找该大学在其他年份的历史数据
-            historical_scores = self._get_historical_scores(university, province, subject)
-            
-            if historical_scores:
-                # 基于历史趋势估算
-                estimated_score = self._calculate_trend_estimation(historical_scores, year)
+            # 1. 基于该大学在该省份预先计算的历史趋势估算
+            trend = self.reference_data.get_trend(university, province, subject)
+            if trend:
+                estimated_score = self._calculate_trend_estimation(trend, year)
                 if estimated_score:
                     return estimated_score
             
-            # 2. 查找该大学在其他省份的数据，进行地区调整
-            other_provinces_data = self._get_other_provinces_data(university, subject, year)
-            if other_provinces_data:
-                adjusted_score = self._adjust_for_province(other_provinces_data, province)
+            # 2. 基于该大学在其他省份的平均分数，进行地区调整
+            province_aggregate = self.reference_data.get_province_aggregate(university, subject, year)
+            if province_aggregate:
+                adjusted_score = self._adjust_for_province(province_aggregate, province)
                 if adjusted_score:
                     return adjusted_score
             
@@ -1598,88 +1704,43 @@ class ProfessionalDataAPI:
     
     def _get_historical_scores(self, university: str, province: str, subject: str) -> List[Dict]:
         """获取历史分数数据"""
-        historical_data = []
-        
-        if university in self.reference_data:
-            uni_data = self.reference_data[university]
-            if province in uni_data and subject in uni_data[province]:
-                for year, score_data in uni_data[province][subject].items():
-                    historical_data.append({
-                        'year': year,
-                        'min_score': score_data['min_score'],
-                        'rank': score_data.get('rank', 0)
-                    })
-        
-        return historical_data
+        return [dict(data) for data in self.reference_data.get_history(university, province, subject)]
     
-    def _calculate_trend_estimation(self, historical_scores: List[Dict], target_year: int) -> Optional[Dict]:
-        """基于历史趋势计算估算值"""
-        if len(historical_scores) < 2:
+    def _calculate_trend_estimation(self, trend: Mapping, target_year: int) -> Optional[Dict]:
+        """基于预先计算的历史趋势计算估算值"""
+        if not trend:
             return None
         
         # 简单线性趋势估算
-        scores = [(data['year'], data['min_score']) for data in historical_scores]
-        scores.sort(key=lambda x: x[0])
-        
-        if len(scores) >= 2:
-            # 计算年度平均变化
-            total_change = scores[-1][1] - scores[0][1]
-            years_span = scores[-1][0] - scores[0][0]
-            avg_change_per_year = total_change / years_span if years_span > 0 else 0
-            
-            # 估算目标年份分数
-            latest_year, latest_score = scores[-1]
-            years_diff = target_year - latest_year
-            estimated_score = latest_score + (avg_change_per_year * years_diff)
-            
-            return {
-                'min_score': int(estimated_score),
-                'rank': historical_scores[-1].get('rank', 0),
-                'batch': '本科一批A段',
-                'estimation_method': 'historical_trend'
-            }
+        years_diff = target_year - trend['latest_year']
+        estimated_score = trend['latest_score'] + (trend['avg_change_per_year'] * years_diff)
         
-        return None
+        return {
+            'min_score': int(estimated_score),
+            'rank': trend['rank'],
+            'batch': '本科一批A段',
+            'estimation_method': 'historical_trend'
+        }
     
     def _get_other_provinces_data(self, university: str, subject: str, year: int) -> List[Dict]:
         """获取其他省份的数据"""
-        other_data = []
-        
-        if university in self.reference_data:
-            for province, prov_data in self.reference_data[university].items():
-                if subject in prov_data and year in prov_data[subject]:
-                    other_data.append({
-                        'province': province,
-                        'data': prov_data[subject][year]
-                    })
-        
-        return other_data
+        return [
+            {'province': item['province'], 'data': dict(item['data'])}
+            for item in self.reference_data.get_other_provinces(university, subject, year)
+        ]
     
-    def _adjust_for_province(self, other_provinces_data: List[Dict], target_province: str) -> Optional[Dict]:
-        """根据省份难度系数调整分数"""
-        if not other_provinces_data:
+    def _adjust_for_province(self, province_aggregate: Mapping, target_province: str) -> Optional[Dict]:
+        """根据省份难度系数调整跨省份平均分数"""
+        if not province_aggregate:
             return None
         
-        # 省份难度系数（相对于全国平均）
-        province_factors = {
-            "北京": 0.95, "上海": 0.95, "天津": 0.96,
-            "河南": 1.08, "山东": 1.06, "河北": 1.07, "山西": 1.05,
-            "江苏": 1.03, "浙江": 1.02, "广东": 1.01,
-            "四川": 1.04, "湖南": 1.05, "湖北": 1.04,
-            "陕西": 1.03, "辽宁": 1.02, "吉林": 1.01
-        }
-        
-        # 计算平均分数
-        total_score = sum(data['data']['min_score'] for data in other_provinces_data)
-        avg_score = total_score / len(other_provinces_data)
-        
         # 根据目标省份调整
-        target_factor = province_factors.get(target_province, 1.0)
-        adjusted_score = int(avg_score * target_factor)
+        target_factor = PROVINCE_ADJUSTMENT_FACTORS.get(target_province, 1.0)
+        adjusted_score = int(province_aggregate['avg_score'] * target_factor)
         
         return {
             'min_score': adjusted_score,
-            'rank': other_provinces_data[0]['data'].get('rank', 0),
+            'rank': province_aggregate['rank'],
             'batch': '本科一批A段',
             'estimation_method': 'province_adjustment'
         }
@@ -12,24 +12,37 @@ import json
 import time
 import logging
 import asyncio
-import aiohttp
 from typing import Dict, List, Optional, Tuple, Any
 import re
 from datetime import datetime, timedelta
 import hashlib
 from concurrent.futures import ThreadPoolExecutor, as_completed
-import sqlite3
 import os
 import random
 
+from models.ai_cache_store import get_ai_cache_store
+from models.cache_maintainer import get_cache_maintainer
+from models.memory_cache import TTLLRUCache
+from models.http_session import http_session_manager
+from models.async_runner import async_runner
+from models.fanout_scheduler import fanout_scheduler
+from models.single_flight import single_flight
+
 logger = logging.getLogger(__name__)
 
+# 进程内LRU缓存容量，可通过环境变量调整
+MEMORY_CACHE_SIZE = int(os.getenv('AI_MEMORY_CACHE_SIZE', '2048'))
+
+# 所有 RealtimeAIDataProvider 实例共享的内存缓存层，位于SQLite缓存之前
+_memory_cache = TTLLRUCache(MEMORY_CACHE_SIZE)
+
 class RealtimeAIDataProvider:
     """实时AI数据提供器"""
     
     def __init__(self, cache_duration_hours=6):
         self.cache_duration = timedelta(hours=cache_duration_hours)
         self.cache_db = "data/ai_cache.db"
+        self.memory_cache = _memory_cache
         self.init_cache_db()
         
         # 导入API配置管理器
@@ -65,30 +78,9 @@ class RealtimeAIDataProvider:
         
     def init_cache_db(self):
         """初始化缓存数据库"""
-        os.makedirs(os.path.dirname(self.cache_db), exist_ok=True)
-        
-        with sqlite3.connect(self.cache_db) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS ai_cache (
-                    query_hash TEXT PRIMARY KEY,
-                    query_type TEXT,
-                    university_name TEXT,
-                    province TEXT,
-                    subject TEXT,
-                    year INTEGER,
-                    response_data TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    expires_at TIMESTAMP
-                )
-            """)
-            
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_expires_at ON ai_cache(expires_at)
-            """)
-            
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_query_type ON ai_cache(query_type, university_name, province)
-            """)
+        self.cache_store = get_ai_cache_store(self.cache_db)
+        # 后台按配置的条目上限和清理间隔维护缓存
+        self.cache_maintainer = get_cache_maintainer(self.cache_store)
     
     def get_cache_key(self, query_type: str, **params) -> str:
         """生成缓存键"""
@@ -96,40 +88,57 @@ class RealtimeAIDataProvider:
         return hashlib.md5(key_data.encode()).hexdigest()
     
     def get_cached_data(self, cache_key: str) -> Optional[Dict]:
-        """获取缓存数据"""
-        with sqlite3.connect(self.cache_db) as conn:
-            cursor = conn.execute(
-                "SELECT response_data FROM ai_cache WHERE query_hash = ? AND expires_at > datetime('now')",
-                (cache_key,)
-            )
-            row = cursor.fetchone()
-            if row:
-                return json.loads(row[0])
+        """获取缓存数据（先查内存缓存，再查SQLite缓存）"""
+        data = self.memory_cache.get(cache_key)
+        if data is not None:
+            self.cache_store.touch([cache_key])
+            return data
+        
+        entry = self.cache_store.get_entry(cache_key)
+        if entry:
+            data, expires_at = entry
+            self._remember(cache_key, data, expires_at)
+            return data
         return None
     
+    def get_cached_many(self, cache_keys: List[str]) -> Dict[str, Dict]:
+        """批量获取缓存数据，只返回命中的缓存键"""
+        result = {}
+        missing = []
+        for cache_key in cache_keys:
+            data = self.memory_cache.get(cache_key)
+            if data is not None:
+                result[cache_key] = data
+            else:
+                missing.append(cache_key)
+        
+        if result:
+            self.cache_store.touch(result)
+        
+        if missing:
+            for cache_key, (data, expires_at) in self.cache_store.get_many_entries(missing).items():
+                self._remember(cache_key, data, expires_at)
+                result[cache_key] = data
+        
+        return result
+    
     def cache_data(self, cache_key: str, query_type: str, data: Dict, **params):
         """缓存数据"""
         expires_at = datetime.now() + self.cache_duration
-        
-        with sqlite3.connect(self.cache_db) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO ai_cache 
-                (query_hash, query_type, university_name, province, subject, year, response_data, expires_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cache_key, query_type,
-                params.get('university_name', ''),
-                params.get('province', ''),
-                params.get('subject', ''),
-                params.get('year', 0),
-                json.dumps(data, ensure_ascii=False),
-                expires_at
-            ))
+        self.memory_cache.set(cache_key, data, expires_at.timestamp())
+        self.cache_store.put(cache_key, query_type, data, expires_at, **params)
     
-    def clean_expired_cache(self):
-        """清理过期缓存"""
-        with sqlite3.connect(self.cache_db) as conn:
-            conn.execute("DELETE FROM ai_cache WHERE expires_at < datetime('now')")
+    def _remember(self, cache_key: str, data: Dict, expires_at: str):
+        """将SQLite缓存命中的数据放入内存缓存，沿用其过期时间"""
+        try:
+            expiry = datetime.fromisoformat(expires_at).timestamp()
+        except (TypeError, ValueError):
+            expiry = (datetime.now() + self.cache_duration).timestamp()
+        self.memory_cache.set(cache_key, data, expiry)
+    
+    def clean_expired_cache(self) -> int:
+        """清理过期缓存，返回清理条数"""
+        return self.cache_store.delete_expired()
     
     async def query_ai_service(self, service_name: str, prompt: str, max_retries=3) -> Optional[str]:
         """查询AI服务"""
@@ -162,6 +171,7 @@ class RealtimeAIDataProvider:
             return None
         
         for attempt in range(max_retries):
+            retryable = False
             try:
                 if service_name == 'local_llm':
                     # Ollama本地服务
@@ -184,7 +194,9 @@ class RealtimeAIDataProvider:
                         'Authorization': f'Bearer {api_key}'
                     }
                 
-                async with aiohttp.ClientSession() as session:
+                session = await http_session_manager.get_session()
+                # 按服务限制并发数和请求速率
+                async with fanout_scheduler.slot(service_name):
                     async with session.post(
                         api_url,
                         headers=headers,
@@ -200,18 +212,21 @@ class RealtimeAIDataProvider:
                                 return data.get('choices', [{}])[0].get('message', {}).get('content', '')
                             elif service_name == 'qwen':
                                 return data.get('output', {}).get('text', '')
-                        else:
-                            logger.info(f"AI服务{service_name}请求失败: {response.status}")
-                            if response.status == 401:
-                                logger.warning(f"AI服务{service_name}认证失败，请检查API密钥")
                             return None
-                            
+                        
+                        logger.info(f"AI服务{service_name}请求失败: {response.status}")
+                        if response.status == 401:
+                            logger.warning(f"AI服务{service_name}认证失败，请检查API密钥")
+                        # 限流和服务端错误可重试，其余错误直接放弃
+                        retryable = response.status == 429 or response.status >= 500
+                        
             except Exception as e:
                 logger.info(f"AI服务{service_name}连接失败: {e}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(1)
-                    continue
+                retryable = True
+            
+            if not retryable or attempt >= max_retries - 1:
                 return None
+            await asyncio.sleep(fanout_scheduler.backoff_delay(attempt))
         
         return None
     
@@ -224,9 +239,10 @@ class RealtimeAIDataProvider:
         try:
             # 逆向接口通常是同步的，在异步环境中运行
             loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, self.chatglm_reverse.send_message, prompt
-            )
+            async with fanout_scheduler.slot('chatglm_reverse'):
+                response = await loop.run_in_executor(
+                    None, self.chatglm_reverse.send_message, prompt
+                )
             
             if response:
                 logger.info("ChatGLM逆向接口响应成功")
@@ -255,6 +271,15 @@ class RealtimeAIDataProvider:
             logger.info(f"从缓存获取{university_name}在{province}的录取分数线")
             return cached_data
         
+        # 同一缓存键的并发请求合并为一次AI查询
+        return await single_flight.do(
+            cache_key,
+            lambda: self._query_admission_scores(cache_key, university_name, province, subject, year)
+        )
+    
+    async def _query_admission_scores(self, cache_key: str, university_name: str, province: str,
+                                      subject: str, year: int) -> Dict:
+        """调用AI服务查询录取分数线并写入缓存"""
         # 构建AI查询提示
         prompt = f"""请提供{university_name}在{province}省{year}年{subject}的详细录取分数线信息。
 
@@ -536,8 +561,16 @@ class RealtimeAIDataProvider:
             else:
                 logger.warning(f"缓存中{university_name}的地理位置数据无效: {province} {city}，将重新获取")
         
+        # 同一缓存键的并发请求合并为一次查询
+        return await single_flight.do(
+            cache_key,
+            lambda: self._query_university_location(cache_key, university_name)
+        )
+    
+    async def _query_university_location(self, cache_key: str, university_name: str) -> Dict[str, str]:
+        """推断或调用AI服务查询院校地理位置并写入缓存"""
         # 对于地理位置查询，优先使用基于名称的推断，因为更准确
-        fallback_data = self._generate_fallback_location(university_name)
+        fallback_data = self.generate_fallback_location(university_name)
         if fallback_data.get('province') not in ['待确认', '未知省份']:
             logger.info(f"使用基于名称推断的地理位置: {university_name} -> {fallback_data['province']} {fallback_data['city']}")
             
@@ -648,8 +681,8 @@ class RealtimeAIDataProvider:
         
         return data
     
-    def _generate_fallback_location(self, university_name: str) -> Dict[str, str]:
-        """生成备用地理位置数据"""
+    def generate_fallback_location(self, university_name: str) -> Dict[str, str]:
+        """基于院校名称推断备用地理位置数据（结果带 is_fallback 标记）"""
         # 基于院校名称推断地理位置
         location_map = {
             '北京': {'province': '北京市', 'city': '北京市'},
@@ -745,24 +778,48 @@ class RealtimeDataManager:
         self.ai_provider = RealtimeAIDataProvider()
         self.executor = ThreadPoolExecutor(max_workers=10)
     
-    async def batch_get_scores(self, universities: List[str], province: str, subject: str, year: int = 2023) -> Dict[str, Dict]:
-        """批量获取多所大学的录取分数线"""
-        tasks = []
-        for university in universities:
-            task = self.ai_provider.get_university_admission_scores(university, province, subject, year)
-            tasks.append(task)
+    async def iter_batch_scores(self, universities: List[str], province: str, subject: str,
+                                year: int = 2023, task_timeout: float = None):
+        """
+        批量获取多所大学的录取分数线，按完成顺序逐个返回 (院校, 分数线数据)
+
+        已缓存的院校立即返回；未命中的院校按调度器的并发上限查询，
+        失败或超过截止时间的院校返回估算数据
+        """
+        # 一次查询取回所有已缓存的分数线，只对未命中的院校发起请求
+        cache_keys = {
+            university: self.ai_provider.get_cache_key(
+                'admission_scores', university_name=university,
+                province=province, subject=subject, year=year)
+            for university in universities
+        }
+        cached = self.ai_provider.get_cached_many(list(cache_keys.values()))
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        missing = []
+        for university in universities:
+            if cache_keys[university] in cached:
+                yield university, cached[cache_keys[university]]
+            else:
+                missing.append(university)
         
-        scores_data = {}
-        for university, result in zip(universities, results):
-            if isinstance(result, Exception):
-                logger.warning(f"获取{university}分数线失败: {result}")
-                scores_data[university] = self.ai_provider._generate_fallback_scores(university, province, subject, year)
+        factories = {
+            university: (lambda u=university: self.ai_provider.get_university_admission_scores(u, province, subject, year))
+            for university in missing
+        }
+        async for university, result in fanout_scheduler.stream(factories, task_timeout):
+            if isinstance(result, BaseException):
+                logger.warning(f"获取{university}分数线失败: {result!r}")
+                yield university, self.ai_provider._generate_fallback_scores(university, province, subject, year)
             else:
-                scores_data[university] = result
+                yield university, result
+    
+    async def batch_get_scores(self, universities: List[str], province: str, subject: str, year: int = 2023) -> Dict[str, Dict]:
+        """批量获取多所大学的录取分数线"""
+        scores_data = {}
+        async for university, data in self.iter_batch_scores(universities, province, subject, year):
+            scores_data[university] = data
         
-        return scores_data
+        return {university: scores_data[university] for university in universities if university in scores_data}
     
     async def get_all_provinces_scores(self, university_name: str, subject: str, year: int = 2023) -> Dict[str, Dict]:
         """获取一所大学在所有省份的录取分数线"""
@@ -773,128 +830,135 @@ class RealtimeDataManager:
             '云南', '西藏', '陕西', '甘肃', '青海', '宁夏', '新疆'
         ]
         
-        tasks = []
+        cache_keys = {
+            province: self.ai_provider.get_cache_key(
+                'admission_scores', university_name=university_name,
+                province=province, subject=subject, year=year)
+            for province in provinces
+        }
+        cached = self.ai_provider.get_cached_many(list(cache_keys.values()))
+        
+        province_scores = {}
+        missing = []
         for province in provinces:
-            task = self.ai_provider.get_university_admission_scores(university_name, province, subject, year)
-            tasks.append(task)
+            if cache_keys[province] in cached:
+                province_scores[province] = cached[cache_keys[province]]
+            else:
+                missing.append(province)
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        factories = {
+            province: (lambda p=province: self.ai_provider.get_university_admission_scores(university_name, p, subject, year))
+            for province in missing
+        }
+        results = await fanout_scheduler.gather(factories)
         
-        province_scores = {}
-        for province, result in zip(provinces, results):
-            if not isinstance(result, Exception):
+        for province, result in results.items():
+            if not isinstance(result, BaseException):
                 province_scores[province] = result
         
-        return province_scores
+        return {province: province_scores[province] for province in provinces if province in province_scores}
     
     def get_realtime_recommendation(self, user_score: int, province: str, subject: str) -> Dict:
         """获取实时推荐数据"""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # 生成候选院校列表
+        candidate_universities = self._generate_candidate_universities(user_score, subject)
+        
+        recommendations = {'冲刺': [], '稳妥': [], '保底': []}
         
+        # 如果能连接AI服务，尝试获取实时数据
+        ai_available = False
         try:
-            # 生成候选院校列表
-            candidate_universities = self._generate_candidate_universities(user_score, subject)
-            
-            recommendations = {'冲刺': [], '稳妥': [], '保底': []}
+            # 批量获取分数线（最多取前10个测试AI可用性）
+            test_universities = candidate_universities[:min(10, len(candidate_universities))]
+            scores_data = async_runner.run(
+                self.batch_get_scores(test_universities, province, subject)
+            )
             
-            # 如果能连接AI服务，尝试获取实时数据
-            ai_available = False
-            try:
-                # 批量获取分数线（最多取前10个测试AI可用性）
-                test_universities = candidate_universities[:min(10, len(candidate_universities))]
-                scores_data = loop.run_until_complete(
-                    self.batch_get_scores(test_universities, province, subject)
-                )
-                
-                # 检查是否有非备用数据
+            # 检查是否有非备用数据
+            for uni_name, score_data in scores_data.items():
+                if not score_data.get('is_fallback', False):
+                    ai_available = True
+                    break
+                    
+            if ai_available:
+                logger.info("AI服务可用，使用实时数据生成推荐")
+                # 使用AI数据进行推荐
                 for uni_name, score_data in scores_data.items():
-                    if not score_data.get('is_fallback', False):
-                        ai_available = True
-                        break
-                        
-                if ai_available:
-                    logger.info("AI服务可用，使用实时数据生成推荐")
-                    # 使用AI数据进行推荐
-                    for uni_name, score_data in scores_data.items():
-                        if score_data.get('is_fallback'):
-                            continue
-                        
-                        min_score = score_data['min_score']
-                        score_diff = user_score - min_score
-                        
-                        if score_diff >= 30:
-                            recommendations['保底'].append({**score_data, 'score_difference': score_diff})
-                        elif score_diff >= 10:
-                            recommendations['稳妥'].append({**score_data, 'score_difference': score_diff})
-                        elif score_diff >= -30:
-                            recommendations['冲刺'].append({**score_data, 'score_difference': score_diff})
-                
-            except Exception as e:
-                logger.info(f"AI服务不可用，使用备用推荐算法: {e}")
-                ai_available = False
-            
-            # 如果AI服务不可用，使用基于分数的智能推荐
-            if not ai_available:
-                logger.info("使用基于分数的智能推荐算法")
-                
-                # 分数段映射到院校类型
-                score_ranges = {
-                    680: ['清华大学', '北京大学', '复旦大学', '上海交通大学', '浙江大学'],
-                    650: ['南京大学', '中山大学', '华中科技大学', '西安交通大学', '哈尔滨工业大学'],
-                    620: ['北京理工大学', '东南大学', '中南大学', '华南理工大学', '北京航空航天大学'],
-                    580: ['大连理工大学', '华东理工大学', '西北工业大学', '中国海洋大学', '湖南大学'],
-                    550: ['郑州大学', '西北大学', '苏州大学', '东北大学', '太原理工大学'],
-                    520: ['河北大学', '山西大学', '内蒙古大学', '燕山大学', '江南大学'],
-                    490: ['长春理工大学', '沈阳工业大学', '河北工业大学', '天津理工大学', '安徽理工大学']
-                }
-                
-                # 根据用户分数生成推荐
-                for base_score, universities in score_ranges.items():
-                    for university in universities:
-                        score_diff = user_score - base_score
-                        
-                        # 添加一些随机变化
-                        actual_score = base_score + random.randint(-10, 10)
-                        actual_diff = user_score - actual_score
-                        
-                        recommendation_data = {
-                            'university_name': university,
-                            'min_score': actual_score,
-                            'avg_score': actual_score + 15,
-                            'max_score': actual_score + 30,
-                            'score_difference': actual_diff,
-                            'rank': int((700 - actual_score) * 100),
-                            'enrollment': random.randint(80, 200),
-                            'batch': '本科一批' if actual_score >= 500 else '本科二批',
-                            'confidence': 0.7,
-                            'data_source': '智能推算',
-                            'year': 2023,
-                            'province': province,
-                            'subject': subject
-                        }
-                        
-                        # 分类推荐
-                        if actual_diff >= 30:
-                            recommendations['保底'].append(recommendation_data)
-                        elif actual_diff >= 10:
-                            recommendations['稳妥'].append(recommendation_data)
-                        elif actual_diff >= -30:
-                            recommendations['冲刺'].append(recommendation_data)
-            
-            # 限制数量并排序
-            for category in recommendations:
-                recommendations[category] = sorted(
-                    recommendations[category][:15], 
-                    key=lambda x: -x['score_difference']
-                )
+                    if score_data.get('is_fallback'):
+                        continue
+                    
+                    min_score = score_data['min_score']
+                    score_diff = user_score - min_score
+                    
+                    if score_diff >= 30:
+                        recommendations['保底'].append({**score_data, 'score_difference': score_diff})
+                    elif score_diff >= 10:
+                        recommendations['稳妥'].append({**score_data, 'score_difference': score_diff})
+                    elif score_diff >= -30:
+                        recommendations['冲刺'].append({**score_data, 'score_difference': score_diff})
             
-            logger.info(f"实时推荐生成完成: 冲刺{len(recommendations['冲刺'])}所, 稳妥{len(recommendations['稳妥'])}所, 保底{len(recommendations['保底'])}所")
+        except Exception as e:
+            logger.info(f"AI服务不可用，使用备用推荐算法: {e}")
+            ai_available = False
+        
+        # 如果AI服务不可用，使用基于分数的智能推荐
+        if not ai_available:
+            logger.info("使用基于分数的智能推荐算法")
             
-            return recommendations
+            # 分数段映射到院校类型
+            score_ranges = {
+                680: ['清华大学', '北京大学', '复旦大学', '上海交通大学', '浙江大学'],
+                650: ['南京大学', '中山大学', '华中科技大学', '西安交通大学', '哈尔滨工业大学'],
+                620: ['北京理工大学', '东南大学', '中南大学', '华南理工大学', '北京航空航天大学'],
+                580: ['大连理工大学', '华东理工大学', '西北工业大学', '中国海洋大学', '湖南大学'],
+                550: ['郑州大学', '西北大学', '苏州大学', '东北大学', '太原理工大学'],
+                520: ['河北大学', '山西大学', '内蒙古大学', '燕山大学', '江南大学'],
+                490: ['长春理工大学', '沈阳工业大学', '河北工业大学', '天津理工大学', '安徽理工大学']
+            }
             
-        finally:
-            loop.close()
+            # 根据用户分数生成推荐
+            for base_score, universities in score_ranges.items():
+                for university in universities:
+                    score_diff = user_score - base_score
+                    
+                    # 添加一些随机变化
+                    actual_score = base_score + random.randint(-10, 10)
+                    actual_diff = user_score - actual_score
+                    
+                    recommendation_data = {
+                        'university_name': university,
+                        'min_score': actual_score,
+                        'avg_score': actual_score + 15,
+                        'max_score': actual_score + 30,
+                        'score_difference': actual_diff,
+                        'rank': int((700 - actual_score) * 100),
+                        'enrollment': random.randint(80, 200),
+                        'batch': '本科一批' if actual_score >= 500 else '本科二批',
+                        'confidence': 0.7,
+                        'data_source': '智能推算',
+                        'year': 2023,
+                        'province': province,
+                        'subject': subject
+                    }
+                    
+                    # 分类推荐
+                    if actual_diff >= 30:
+                        recommendations['保底'].append(recommendation_data)
+                    elif actual_diff >= 10:
+                        recommendations['稳妥'].append(recommendation_data)
+                    elif actual_diff >= -30:
+                        recommendations['冲刺'].append(recommendation_data)
+        
+        # 限制数量并排序
+        for category in recommendations:
+            recommendations[category] = sorted(
+                recommendations[category][:15], 
+                key=lambda x: -x['score_difference']
+            )
+        
+        logger.info(f"实时推荐生成完成: 冲刺{len(recommendations['冲刺'])}所, 稳妥{len(recommendations['稳妥'])}所, 保底{len(recommendations['保底'])}所")
+        
+        return recommendations
     
     def _generate_candidate_universities(self, user_score: int, subject: str) -> List[str]:
         """根据用户分数生成候选院校列表"""
@@ -925,27 +989,20 @@ realtime_data_manager = RealtimeDataManager()
 
 def get_realtime_university_data(university_name: str, province: str, subject: str, year: int = 2023) -> Dict:
     """获取实时院校数据（同步接口）"""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    ai_provider = RealtimeAIDataProvider()
     
-    try:
-        ai_provider = RealtimeAIDataProvider()
-        
-        # 同时获取分数线和院校信息
-        scores_task = ai_provider.get_university_admission_scores(university_name, province, subject, year)
-        info_task = ai_provider.get_university_info(university_name)
-        
-        scores_data, info_data = loop.run_until_complete(asyncio.gather(scores_task, info_task))
-        
-        # 合并数据
-        result = {
-            'admission_scores': scores_data,
-            'university_info': info_data,
-            'last_updated': datetime.now().isoformat(),
-            'is_realtime': True
-        }
-        
-        return result
-        
-    finally:
-        loop.close() 
\ No newline at end of file
+    # 同时获取分数线和院校信息
+    scores_data, info_data = async_runner.gather([
+        ai_provider.get_university_admission_scores(university_name, province, subject, year),
+        ai_provider.get_university_info(university_name)
+    ], return_exceptions=False)
+    
+    # 合并数据
+    result = {
+        'admission_scores': scores_data,
+        'university_info': info_data,
+        'last_updated': datetime.now().isoformat(),
+        'is_realtime': True
+    }
+    
+    return result
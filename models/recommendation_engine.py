@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+录取分数线矩阵推荐引擎
+将各院校在各省份、科目、年份的录取分数线预计算为NumPy稠密矩阵，
+一次向量化计算即可完成全部院校的冲刺/稳妥/保底分类和排序
+"""
+
+import logging
+import threading
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 矩阵的省份维度
+PROVINCES = [
+    "北京", "天津", "河北", "山西", "内蒙古", "辽宁", "吉林", "黑龙江",
+    "上海", "江苏", "浙江", "安徽", "福建", "江西", "山东", "河南",
+    "湖北", "湖南", "广东", "广西", "海南", "重庆", "四川", "贵州",
+    "云南", "西藏", "陕西", "甘肃", "青海", "宁夏", "新疆"
+]
+
+# 矩阵的科目维度
+SUBJECTS = ["理科", "文科"]
+
+# 矩阵的年份维度
+YEARS = [2020, 2021, 2022, 2023, 2024]
+
+# 省份全称的后缀（如“北京市”“广西壮族自治区”），归一化时去掉
+PROVINCE_SUFFIXES = ["壮族自治区", "回族自治区", "维吾尔自治区", "自治区", "省", "市"]
+
+# 推荐类别
+CATEGORIES = ["冲刺", "稳妥", "保底"]
+
+# 分类档位：(分数差下限, 类别, 录取概率, 概率数值)，按从高到低的顺序匹配
+SCORE_TIERS = [
+    (30, "保底", "95%以上", 95),
+    (20, "保底", "90-95%", 92),
+    (10, "稳妥", "80-90%", 85),
+    (0, "稳妥", "70-80%", 75),
+    (-10, "冲刺", "50-70%", 60),
+    (-20, "冲刺", "30-50%", 40),
+    (-30, "冲刺", "15-30%", 25),
+]
+
+# 高分段特殊冲刺档位：分数差超过30分，但考生与院校均在高分段时仍作为冲刺推荐
+HIGH_SCORE_LINE = 650
+HIGH_SCORE_TIER = ("冲刺", "10-20%", 15)
+
+# 偏好不匹配时的概率扣减
+PREFERENCE_PENALTY = 10
+
+
+class RecommendationEngine:
+    """录取分数线矩阵推荐引擎"""
+
+    def __init__(self, universities: Dict[str, Any], professional_api=None):
+        """
+        初始化推荐引擎
+
+        Args:
+            universities: 院校数据字典（院校名称 -> 院校信息）
+            professional_api: 专业数据API实例，用于填充分数线矩阵
+        """
+        if professional_api is None:
+            from models.professional_data_api import professional_api
+        self.professional_api = professional_api
+
+        self.names = list(universities.keys())
+        self.types = [str(data.get('type', '')) for data in universities.values()]
+        self.name_index = {name: i for i, name in enumerate(self.names)}
+        self.province_index = {province: i for i, province in enumerate(PROVINCES)}
+        self.subject_index = {subject: i for i, subject in enumerate(SUBJECTS)}
+        self.year_index = {year: i for i, year in enumerate(YEARS)}
+
+        shape = (len(self.names), len(PROVINCES), len(SUBJECTS), len(YEARS))
+        self.min_scores = np.full(shape, np.nan)
+        self.avg_scores = np.full(shape, np.nan)
+        self.ranks = np.zeros(shape, dtype=np.int64)
+        self.confidences = np.zeros(shape)
+        self.source_codes = np.full(shape, -1, dtype=np.int16)
+        self.sources: List[str] = []
+
+        # 记录已填充的 (省份, 科目, 年份) 切片
+        self.filled = np.zeros(shape[1:], dtype=bool)
+        self._lock = threading.Lock()
+        # 每个切片单独加锁，不同切片可以并行填充
+        self._slice_locks: Dict[tuple, threading.Lock] = {}
+
+        self._tier_categories = np.array([tier[1] for tier in SCORE_TIERS] + [HIGH_SCORE_TIER[0]], dtype=object)
+        self._tier_probabilities = np.array([tier[2] for tier in SCORE_TIERS] + [HIGH_SCORE_TIER[1]], dtype=object)
+        self._tier_probability_nums = np.array([tier[3] for tier in SCORE_TIERS] + [HIGH_SCORE_TIER[2]])
+
+    @property
+    def size(self) -> int:
+        """矩阵中的院校数量"""
+        return len(self.names)
+
+    def supports(self, province: str, subject: str, year: int) -> bool:
+        """判断查询条件是否落在矩阵范围内"""
+        return (province in self.province_index and
+                subject in self.subject_index and
+                year in self.year_index)
+
+    def build(self, provinces: Iterable[str] = None, subjects: Iterable[str] = None,
+              years: Iterable[int] = None) -> int:
+        """
+        预先填充矩阵切片
+
+        Returns:
+            本次新填充的切片数量
+        """
+        built = 0
+        for province in provinces or PROVINCES:
+            for subject in subjects or SUBJECTS:
+                for year in years or YEARS:
+                    if self._ensure_slice(province, subject, year):
+                        built += 1
+        return built
+
+    def _slice_index(self, province: str, subject: str, year: int) -> Tuple[int, int, int]:
+        """切片在矩阵中的下标，查询条件不在矩阵范围内时抛出 ValueError"""
+        reason = unsupported_reason(province, subject, year)
+        if reason:
+            raise ValueError(reason)
+        return self.province_index[province], self.subject_index[subject], self.year_index[year]
+
+    def _ensure_slice(self, province: str, subject: str, year: int) -> bool:
+        """确保 (省份, 科目, 年份) 切片已填充，返回是否为本次新填充"""
+        p, s, y = self._slice_index(province, subject, year)
+
+        if self.filled[p, s, y]:
+            return False
+
+        with self._lock:
+            slice_lock = self._slice_locks.setdefault((p, s, y), threading.Lock())
+
+        with slice_lock:
+            if self.filled[p, s, y]:
+                return False
+
+            for i, name in enumerate(self.names):
+                try:
+                    result = self.professional_api.get_admission_scores(name, province, subject, year)
+                except Exception as e:
+                    logger.debug(f"获取{name}在{province}的分数线时出错: {e}")
+                    continue
+
+                if not result.get('success'):
+                    continue
+
+                score_data = result['data']
+                min_score = score_data.get('min_score', 0) or 0
+                self.min_scores[i, p, s, y] = min_score
+                self.avg_scores[i, p, s, y] = score_data.get('avg_score', min_score + 15)
+                self.ranks[i, p, s, y] = score_data.get('rank', 0) or 0
+                self.confidences[i, p, s, y] = result.get('confidence', 0.95)
+                self.source_codes[i, p, s, y] = self._source_code(result.get('source', '权威数据'))
+
+            self.filled[p, s, y] = True
+
+        logger.info(f"分数线矩阵切片已填充: {province} {subject} {year}")
+        return True
+
+    def _source_code(self, source: str) -> int:
+        """将数据来源名称编码为整数"""
+        with self._lock:
+            if source not in self.sources:
+                self.sources.append(source)
+            return self.sources.index(source)
+
+    def lookup(self, university: str, province: str, subject: str, year: int) -> Optional[Dict[str, Any]]:
+        """查询单个院校的分数线，不在矩阵范围内或无数据时返回None"""
+        if university not in self.name_index or not self.supports(province, subject, year):
+            return None
+
+        self._ensure_slice(province, subject, year)
+        i = self.name_index[university]
+        p, s, y = self._slice_index(province, subject, year)
+
+        if np.isnan(self.min_scores[i, p, s, y]):
+            return None
+
+        return {
+            'min_score': _to_native(self.min_scores[i, p, s, y]),
+            'avg_score': _to_native(self.avg_scores[i, p, s, y]),
+            'rank': int(self.ranks[i, p, s, y]),
+            'confidence': float(self.confidences[i, p, s, y]),
+            'source': self.sources[self.source_codes[i, p, s, y]]
+        }
+
+    def slice_scores(self, province: str, subject: str, year: int) -> List[Dict[str, Any]]:
+        """获取一个切片中全部有效分数线（按院校原顺序）"""
+        self._ensure_slice(province, subject, year)
+        p, s, y = self._slice_index(province, subject, year)
+
+        min_scores = self.min_scores[:, p, s, y]
+        valid = np.flatnonzero(~np.isnan(min_scores) & (min_scores > 0))
+        return [{
+            'university_name': self.names[i],
+            'min_score': _to_native(self.min_scores[i, p, s, y]),
+            'avg_score': _to_native(self.avg_scores[i, p, s, y]),
+            'rank': int(self.ranks[i, p, s, y]),
+            'confidence': float(self.confidences[i, p, s, y]),
+            'source': self.sources[self.source_codes[i, p, s, y]]
+        } for i in valid]
+
+    def rank(self, score: int, province: str, subject: str, year: int = 2023,
+             preferences: List[str] = None) -> Dict[str, Any]:
+        """
+        一次向量化计算完成全部院校的分类和排序
+
+        Returns:
+            包含排序后院校下标及各项分数、分类数组的字典
+        """
+        self._ensure_slice(province, subject, year)
+        p, s, y = self._slice_index(province, subject, year)
+
+        min_scores = self.min_scores[:, p, s, y]
+        valid = ~np.isnan(min_scores) & (min_scores > 0)
+        diff = score - min_scores
+
+        # 按档位从高到低匹配，最后一个档位为高分段特殊冲刺
+        conditions = [valid & (diff >= tier[0]) for tier in SCORE_TIERS]
+        conditions.append(valid & (score >= HIGH_SCORE_LINE) & (min_scores >= HIGH_SCORE_LINE))
+        tiers = np.select(conditions, list(range(len(conditions))), default=-1)
+
+        selected = np.flatnonzero(tiers >= 0)
+        tiers = tiers[selected]
+        probability_nums = self._tier_probability_nums[tiers].copy()
+
+        if preferences:
+            mismatched = np.array([
+                not any(pref in self.types[i] for pref in preferences) for i in selected
+            ], dtype=bool)
+            probability_nums[mismatched] -= PREFERENCE_PENALTY
+
+        score_diffs = diff[selected]
+        # 按概率降序、分数差降序排序（lexsort以最后一个键为主键）
+        order = np.lexsort((-score_diffs, -probability_nums))
+
+        return {
+            'indices': selected[order],
+            'tiers': tiers[order],
+            'probability_nums': np.maximum(probability_nums[order], 0),
+            'score_differences': score_diffs[order],
+            'province': province,
+            'subject': subject,
+            'year': year,
+            'score': score,
+            'total_count': int(selected.size),
+            'success_count': int(valid.sum()),
+            'failed_count': int(self.size - selected.size)
+        }
+
+    def top_by_category(self, ranked: Dict[str, Any], limits: Dict[str, int]) -> Dict[str, List[Dict[str, Any]]]:
+        """按类别截取排序结果的前若干所院校，并转换为推荐记录"""
+        p, s, y = self._slice_index(ranked['province'], ranked['subject'], ranked['year'])
+        categories = self._tier_categories[ranked['tiers']]
+
+        result = {}
+        for category in CATEGORIES:
+            positions = np.flatnonzero(categories == category)[:limits.get(category, 0)]
+            result[category] = [self._to_record(ranked, pos, p, s, y) for pos in positions]
+
+        return result
+
+    def _to_record(self, ranked: Dict[str, Any], pos: int, p: int, s: int, y: int) -> Dict[str, Any]:
+        """将排序结果中的一行转换为推荐记录"""
+        i = ranked['indices'][pos]
+        tier = ranked['tiers'][pos]
+        min_score = _to_native(self.min_scores[i, p, s, y])
+        avg_score = _to_native(self.avg_scores[i, p, s, y])
+
+        return {
+            'university_name': self.names[i],
+            'category': self._tier_categories[tier],
+            'probability': self._tier_probabilities[tier],
+            'probability_num': int(ranked['probability_nums'][pos]),
+            'min_score': min_score,
+            'avg_score': avg_score,
+            'score_difference': ranked['score'] - min_score,
+            'avg_difference': ranked['score'] - avg_score,
+            'rank': int(self.ranks[i, p, s, y]),
+            'confidence': float(self.confidences[i, p, s, y]),
+            'source': self.sources[self.source_codes[i, p, s, y]]
+        }
+
+
+def normalize_province(province: str) -> str:
+    """将省份全称（如“北京市”“内蒙古自治区”）归一化为矩阵使用的简称，无法识别时原样返回"""
+    if not province or province in PROVINCES:
+        return province
+    for suffix in PROVINCE_SUFFIXES:
+        if province.endswith(suffix) and province[:-len(suffix)] in PROVINCES:
+            return province[:-len(suffix)]
+    return province
+
+
+def unsupported_reason(province: str, subject: str, year: int) -> Optional[str]:
+    """查询条件不在矩阵范围内时返回原因，否则返回None"""
+    if province not in PROVINCES:
+        return f"不支持的省份: {province}"
+    if subject not in SUBJECTS:
+        return f"不支持的科目: {subject}（支持: {'、'.join(SUBJECTS)}）"
+    if year not in YEARS:
+        return f"不支持的年份: {year}"
+    return None
+
+
+def _to_native(value) -> Any:
+    """将NumPy数值转换为可JSON序列化的Python数值"""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+# 全局实例
+_engine = None
+_engine_lock = threading.Lock()
+
+def get_recommendation_engine(universities: Dict[str, Any]) -> RecommendationEngine:
+    """获取全局推荐引擎实例，院校集合变化时重建（数量相同但院校不同也会重建）"""
+    global _engine
+    with _engine_lock:
+        if _engine is None or _engine.name_index.keys() != universities.keys():
+            _engine = RecommendationEngine(universities)
+        return _engine
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+推荐结果快照模块
+为每个 (省份, 科目, 年份) 物化一份按最低分排序的院校列表（含补充了地理位置和排名的院校数据），
+任意分数的推荐只需二分查找冲刺/稳妥/保底三个分数窗口再截取；
+院校数据或地理位置索引变化时快照版本递增并按需重建，进行中的请求继续使用旧快照
+"""
+
+import logging
+import threading
+from bisect import bisect_right
+from typing import Dict, List, Any, Tuple
+
+from models.location_resolver import location_resolver
+from models.recommendation_engine import (
+    CATEGORIES, SCORE_TIERS, HIGH_SCORE_LINE, HIGH_SCORE_TIER, PREFERENCE_PENALTY,
+    get_recommendation_engine, unsupported_reason
+)
+
+logger = logging.getLogger(__name__)
+
+# 各类别对应的分数差区间（院校最低分相对考生分数）
+SAFE_MARGIN = 20      # 分数差 >= 20 为保底
+REACH_MARGIN = 30     # 分数差 >= -30 为冲刺下限
+
+
+def _tier(score_difference: float) -> Tuple[str, str, int]:
+    """按分数差匹配档位，返回 (类别, 录取概率, 概率数值)"""
+    for threshold, category, probability, probability_num in SCORE_TIERS:
+        if score_difference >= threshold:
+            return category, probability, probability_num
+    return HIGH_SCORE_TIER
+
+
+class RecommendationSnapshot:
+    """一个 (省份, 科目, 年份) 的只读推荐快照"""
+
+    def __init__(self, province: str, subject: str, year: int, version: Tuple[int, int],
+                 records: List[Dict[str, Any]], types: List[str], university_count: int):
+        """
+        Args:
+            version: (院校数据版本, 地理位置索引版本)
+            records: 按最低分升序排列的院校记录（不含与考生分数相关的字段）
+            types: 与records对应的院校类型，用于偏好匹配
+            university_count: 院校总数
+        """
+        self.province = province
+        self.subject = subject
+        self.year = year
+        self.version = version
+        self.records = tuple(records)
+        self.types = tuple(types)
+        self.min_scores = tuple(record['min_score'] for record in records)
+        self.university_count = university_count
+
+    def windows(self, score: int) -> Dict[str, Tuple[int, int]]:
+        """各类别在快照中的下标区间 [起, 止)"""
+        safe_end = bisect_right(self.min_scores, score - SAFE_MARGIN)
+        match_end = bisect_right(self.min_scores, score)
+        reach_end = bisect_right(self.min_scores, score + REACH_MARGIN)
+        # 高分段考生：最低分超出30分以上的高分段院校仍作为冲刺
+        if score >= HIGH_SCORE_LINE:
+            reach_end = len(self.min_scores)
+        return {
+            '保底': (0, safe_end),
+            '稳妥': (safe_end, match_end),
+            '冲刺': (match_end, reach_end)
+        }
+
+    def recommend(self, score: int, preferences: List[str] = None,
+                  limits: Dict[str, int] = None) -> Dict[str, Any]:
+        """
+        计算推荐结果
+
+        Returns:
+            recommendations（类别 -> 推荐记录列表）及院校数量统计
+        """
+        limits = limits or {}
+        windows = self.windows(score)
+
+        recommendations = {}
+        for category in CATEGORIES:
+            start, end = windows[category]
+            limit = limits.get(category, 0)
+            if preferences:
+                # 偏好不匹配会扣减概率，需要对整个窗口重新排序（稳定排序保持分数差降序）
+                candidates = sorted(
+                    ((self._probability(pos, score, preferences), pos) for pos in range(start, end)),
+                    key=lambda candidate: -candidate[0][2]
+                )[:limit]
+            else:
+                candidates = [(self._probability(pos, score), pos) for pos in range(start, min(end, start + limit))]
+
+            recommendations[category] = [self._to_item(pos, score, tier) for tier, pos in candidates]
+
+        total_count = windows['冲刺'][1]
+        return {
+            'recommendations': recommendations,
+            'total_count': total_count,
+            'success_count': len(self.records),
+            'failed_count': self.university_count - total_count
+        }
+
+    def _probability(self, pos: int, score: int, preferences: List[str] = None) -> Tuple[str, str, int]:
+        """计算一所院校的类别和录取概率"""
+        category, probability, probability_num = _tier(score - self.min_scores[pos])
+        if preferences and not any(pref in self.types[pos] for pref in preferences):
+            probability_num = max(probability_num - PREFERENCE_PENALTY, 0)
+        return category, probability, probability_num
+
+    def _to_item(self, pos: int, score: int, tier: Tuple[str, str, int]) -> Dict[str, Any]:
+        """生成一条推荐记录"""
+        record = self.records[pos]
+        category, probability, probability_num = tier
+        return dict(
+            record,
+            category=category,
+            probability=probability,
+            probability_num=probability_num,
+            score_difference=score - record['min_score'],
+            avg_difference=score - record['avg_score']
+        )
+
+
+class RecommendationSnapshotStore:
+    """推荐快照存储"""
+
+    def __init__(self, db):
+        """
+        Args:
+            db: 院校数据库（UniversityDatabase），数据变化时通过监听器使快照失效
+        """
+        self.db = db
+        self.data_version = 0
+        self._snapshots: Dict[Tuple[str, str, int], RecommendationSnapshot] = {}
+        self._lock = threading.Lock()
+        self._build_locks: Dict[Tuple[str, str, int], threading.Lock] = {}
+        self.stats = {'hits': 0, 'builds': 0, 'invalidations': 0}
+
+        db.add_change_listener(self.invalidate)
+
+    def invalidate(self, reason: str = None):
+        """使全部快照失效（已取得旧快照的请求不受影响）"""
+        with self._lock:
+            self.data_version += 1
+            self._snapshots = {}
+            self.stats['invalidations'] += 1
+        logger.info(f"推荐快照已失效: {reason or '数据变化'}")
+
+    def _current_version(self) -> Tuple[int, int]:
+        return self.data_version, location_resolver.version
+
+    def get(self, province: str, subject: str, year: int) -> RecommendationSnapshot:
+        """获取当前版本的快照，不存在或已过期时重建；查询条件不在分数线矩阵范围内时抛出 ValueError"""
+        reason = unsupported_reason(province, subject, year)
+        if reason:
+            raise ValueError(reason)
+
+        key = (province, subject, year)
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None and snapshot.version == self._current_version():
+            self.stats['hits'] += 1
+            return snapshot
+
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+
+        with build_lock:
+            snapshot = self._snapshots.get(key)
+            version = self._current_version()
+            if snapshot is not None and snapshot.version == version:
+                self.stats['hits'] += 1
+                return snapshot
+
+            snapshot = self._build(province, subject, year, version)
+            with self._lock:
+                # 构建期间数据发生变化时不保存，下次请求按新版本重建
+                if version[0] == self.data_version:
+                    self._snapshots[key] = snapshot
+            self.stats['builds'] += 1
+            return snapshot
+
+    def _build(self, province: str, subject: str, year: int,
+               version: Tuple[int, int]) -> RecommendationSnapshot:
+        """构建一个切片的快照"""
+        universities = self.db.get_all_universities()
+        engine = get_recommendation_engine(universities)
+
+        records = []
+        types = []
+        for scores in engine.slice_scores(province, subject, year):
+            name = scores['university_name']
+            uni_data = universities.get(name)
+            if uni_data is None:
+                continue
+
+            # 从地理位置索引获取准确的省份和城市
+            original_province, original_city = location_resolver.resolve(name, uni_data)
+
+            # 创建包含正确地理位置的院校数据副本
+            enhanced_uni_data = uni_data.copy()
+            enhanced_uni_data['province'] = original_province
+            enhanced_uni_data['city'] = original_city
+            enhanced_uni_data['location'] = dict(enhanced_uni_data.get('location') or {})
+            enhanced_uni_data['location']['province'] = original_province
+            enhanced_uni_data['location']['city'] = original_city
+
+            records.append({
+                'university_name': name,
+                'min_score': scores['min_score'],
+                'avg_score': scores['avg_score'],
+                'rank': scores['rank'],
+                'confidence': scores['confidence'],
+                'university_data': enhanced_uni_data,
+                'ranking': self.db.get_ranking(name),
+                'data_source': f"专业API - {scores['source']}",
+                'data_year': year,
+                'is_reference_data': False,  # 专业API数据
+                'accuracy_level': 'high',
+                'original_province': province
+            })
+            types.append(str(uni_data.get('type', '')))
+
+        # 按最低分升序稳定排序（即分数差降序，同分保持院校原顺序）
+        order = sorted(range(len(records)), key=lambda i: records[i]['min_score'])
+        logger.info(f"推荐快照已构建: {province} {subject} {year}，{len(records)}所院校")
+        return RecommendationSnapshot(
+            province, subject, year, version,
+            [records[i] for i in order], [types[i] for i in order], engine.size
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取快照统计"""
+        return {
+            **self.stats,
+            'data_version': self.data_version,
+            'snapshots': len(self._snapshots)
+        }
+
+
+# 全局实例
+_store = None
+_store_lock = threading.Lock()
+
+def get_recommendation_snapshots(db) -> RecommendationSnapshotStore:
+    """获取全局推荐快照存储"""
+    global _store
+    with _store_lock:
+        if _store is None or _store.db is not db:
+            _store = RecommendationSnapshotStore(db)
+        return _store
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+请求合并（单飞）模块
+同一缓存键的查询正在进行时，其他调用方等待同一个结果，而不是各自重复调用AI服务；
+结果以 concurrent.futures.Future 共享，因此可跨线程和事件循环等待
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class _LeaderCancelled(Exception):
+    """发起查询的调用方被取消，等待方需要重新发起"""
+
+
+class SingleFlight:
+    """按键合并并发调用"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            'calls': 0,
+            'executions': 0,
+            'coalesced': 0
+        }
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        执行（或等待正在进行的）键为key的调用
+
+        Args:
+            key: 合并键，通常为缓存键
+            factory: 创建查询协程的无参函数，只有首个调用方会执行
+
+        Returns:
+            查询结果；查询抛出的异常会传递给所有等待方
+        """
+        with self._lock:
+            self.stats['calls'] += 1
+
+        while True:
+            with self._lock:
+                future = self._inflight.get(key)
+                leader = future is None
+                if leader:
+                    future = concurrent.futures.Future()
+                    # 置为运行状态，等待方被取消时不会连带取消共享结果
+                    future.set_running_or_notify_cancel()
+                    self._inflight[key] = future
+                    self.stats['executions'] += 1
+
+            if leader:
+                return await self._execute(key, future, factory)
+
+            try:
+                result = await asyncio.wrap_future(future)
+            except _LeaderCancelled:
+                logger.debug(f"合并的查询{key}被取消，重新发起")
+                continue
+
+            with self._lock:
+                self.stats['coalesced'] += 1
+            return result
+
+    async def _execute(self, key: Hashable, future: concurrent.futures.Future,
+                       factory: Callable[[], Awaitable[Any]]) -> Any:
+        """执行查询并把结果发布给等待方"""
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            self._finish(key, future, exception=_LeaderCancelled())
+            raise
+        except Exception as e:
+            self._finish(key, future, exception=e)
+            raise
+        self._finish(key, future, result=result)
+        return result
+
+    def _finish(self, key: Hashable, future: concurrent.futures.Future,
+                result: Any = None, exception: BaseException = None):
+        """移除进行中的记录并设置共享结果"""
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取合并统计"""
+        with self._lock:
+            return {**self.stats, 'inflight': len(self._inflight)}
+
+
+# 全局实例
+single_flight = SingleFlight()
@@ -2,8 +2,17 @@ import pandas as pd
 import numpy as np
 import json
 import os
-from typing import List, Dict, Optional, Any
+import hashlib
+import pickle
+from typing import List, Dict, Optional, Any, Tuple, Callable
 from .data_crawler import UniversityDataCrawler, update_university_database
+from .university_index import UniversityIndex, SORT_FIELDS
+from .admission_score_store import AdmissionScoreStore
+from .university_statistics import UniversityStatistics
+from .university_storage import (
+    JSONUniversityStorage, SQLiteUniversityStorage, STORAGE_JSON, STORAGE_SQLITE,
+    KIND_UNIVERSITIES, KIND_SCORES, KIND_RANKINGS, migrate_to_sqlite
+)
 from datetime import datetime
 import logging
 
@@ -26,131 +35,215 @@ class UniversityDatabase:
         self.universities_file = os.path.join(self.data_dir, "universities.json")
         self.scores_file = os.path.join(self.data_dir, "admission_scores.json")
         self.rankings_file = os.path.join(self.data_dir, "rankings.json")
+        self.cache_file = os.path.join(self.data_dir, "university_data.json")
+        
+        # 二进制快照：以缓存文件的修改时间、大小和哈希为键，避免冷启动时重复解码JSON
+        self.snapshot_enabled = self.config.get('data_snapshot', True)
+        self.snapshot_file = f"{self.cache_file}.pkl"
         
         # 确保数据目录存在
         os.makedirs(self.data_dir, exist_ok=True)
         
-        # 加载数据
-        self.universities = self._load_universities_data()
-        self.admission_scores = self._load_scores_data()
-        self.rankings = self._load_rankings_data()
+        # 存储引擎：json（默认，整文件延迟写入）或 sqlite（分表按行写入）
+        self.storage = self._create_storage()
+        
+        # 加载数据（只解析一次数据文件，派生出院校、分数线、排名三个视图）
+        self.universities, self.admission_scores, self.rankings = self._load_from_storage()
+        
+        # 省份、类别、类型及关键词的二级索引
+        self.index = UniversityIndex(self.universities)
+        
+        # 录取分数线组合索引
+        self.score_store = AdmissionScoreStore(self.admission_scores)
+        
+        # 统计聚合（随院校、分数线、排名的变化增量更新）
+        self.statistics = UniversityStatistics(self.universities, self.admission_scores, self.rankings)
+        
+        # 数据变化监听器（例如推荐快照），院校或分数线数据变化时通知
+        self.data_version = 0
+        self._change_listeners: List[Callable[[str], None]] = []
         
         # 如果数据为空或数量过少，从网络获取更多数据
         if len(self.universities) < 20:
             self.logger.info("检测到院校数据较少，正在从网络获取更多数据...")
             self.fetch_web_data()
     
-    def _load_universities_data(self) -> Dict[str, Any]:
-        """加载院校数据"""
+    def add_change_listener(self, listener: Callable[[str], None]):
+        """注册数据变化监听器，参数为变化原因"""
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+    
+    def _notify_change(self, reason: str):
+        """数据变化后递增版本号并通知监听器"""
+        self.data_version += 1
+        for listener in list(self._change_listeners):
+            try:
+                listener(reason)
+            except Exception as e:
+                self.logger.warning(f"数据变化监听器执行失败: {e}")
+    
+    def _create_storage(self):
+        """按配置创建存储引擎"""
+        backend = self.config.get('storage', STORAGE_JSON)
+        sources = {
+            KIND_UNIVERSITIES: lambda: self.universities,
+            KIND_SCORES: lambda: self.admission_scores,
+            KIND_RANKINGS: lambda: self.rankings
+        }
+        
+        if backend == STORAGE_SQLITE:
+            sqlite_file = self.config.get('sqlite_file') or os.path.join(self.data_dir, "universities.db")
+            return SQLiteUniversityStorage(sqlite_file, sources)
+        
+        if backend != STORAGE_JSON:
+            raise ValueError(f"不支持的存储引擎: {backend}")
+        
+        # 修改只标记待写入，由后台线程合并后原子写盘
+        files = {
+            KIND_UNIVERSITIES: self.universities_file,
+            KIND_SCORES: self.scores_file,
+            KIND_RANKINGS: self.rankings_file
+        }
+        return JSONUniversityStorage(files, sources, self._load_dataset, self.config.get('flush_interval', 2.0))
+    
+    def _load_from_storage(self) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """从存储引擎加载数据，SQLite存储为空时先从JSON数据迁移"""
+        if self.storage.name == STORAGE_SQLITE and self.storage.is_empty():
+            self.logger.info("SQLite存储为空，从JSON数据文件迁移...")
+            dataset = self._load_dataset()
+            migrate_to_sqlite(dataset, self.storage)
+            return dataset
+        
+        return self.storage.load()
+    
+    def _load_dataset(self) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """加载院校、录取分数线和排名数据"""
         try:
             # 优先从更新的缓存文件加载
-            cache_file = "data/university_data.json"
-            if os.path.exists(cache_file):
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-                
-                # 检查数据格式
+            if os.path.exists(self.cache_file):
+                cache_data = self._load_cache_file()
                 if cache_data:
-                    first_key = next(iter(cache_data))
-                    first_value = cache_data[first_key]
-                    
-                    # 新格式：直接包含院校信息
-                    if isinstance(first_value, dict) and 'category' in first_value:
-                        print(f"从缓存文件加载了 {len(cache_data)} 所大学的数据（新格式）")
-                        return cache_data
-                    
-                    # 旧格式：包含basic_info字段
-                    elif isinstance(first_value, dict) and 'basic_info' in first_value:
-                        universities = {}
-                        for name, uni_data in cache_data.items():
-                            basic_info = uni_data.get('basic_info', {})
-                            location = uni_data.get('location', {})
-                            
-                            universities[name] = {
-                                'category': basic_info.get('category', ''),
-                                'type': basic_info.get('type', ''),
-                                'location': location,
-                                'establishment_year': basic_info.get('establishment_year', 1950),
-                                'motto': basic_info.get('motto', ''),
-                                'website': basic_info.get('website', ''),
-                                'is_double_first_class': basic_info.get('is_double_first_class', False),
-                                'key_disciplines': basic_info.get('key_disciplines', []),
-                                'campus_area': basic_info.get('campus_area', 500),
-                                'student_count': basic_info.get('student_count', 30000),
-                                'faculty_count': basic_info.get('faculty_count', 2000),
-                                'library_books': basic_info.get('library_books', 300),
-                                'research_funding': basic_info.get('research_funding', 20),
-                                'description': basic_info.get('description', ''),
-                                'data_source': uni_data.get('data_source', '未知')
-                            }
-                        
-                        print(f"从缓存文件加载了 {len(universities)} 所大学的数据（旧格式）")
-                        return universities
-            
-            # 回退到原有的文件
-            if os.path.exists(self.universities_file):
-                with open(self.universities_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    universities = self._derive_universities_view(cache_data)
+                    if universities:
+                        return (universities,
+                                self._derive_scores_view(cache_data),
+                                self._derive_rankings_view(cache_data))
         except Exception as e:
             self.logger.warning(f"加载院校数据失败: {e}")
         
-        return {}
+        # 回退到原有的文件
+        return (self._load_json_file(self.universities_file, "院校数据"),
+                self._load_json_file(self.scores_file, "分数线数据"),
+                self._load_json_file(self.rankings_file, "排名数据"))
     
-    def _load_scores_data(self) -> Dict[str, Any]:
-        """加载录取分数线数据"""
-        try:
-            # 优先从更新的缓存文件加载
-            cache_file = "data/university_data.json"
-            if os.path.exists(cache_file):
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-                
-                # 提取录取分数线数据
-                all_scores = {}
-                for name, uni_data in cache_data.items():
-                    if isinstance(uni_data, dict) and 'admission_scores' in uni_data:
-                        admission_scores = uni_data.get('admission_scores', {})
-                        if admission_scores:
-                            all_scores[name] = admission_scores
+    def _load_cache_file(self) -> Dict[str, Any]:
+        """解析缓存文件，优先使用与文件内容匹配的二进制快照"""
+        with open(self.cache_file, 'rb') as f:
+            raw = f.read()
+        
+        stat = os.stat(self.cache_file)
+        fingerprint = {
+            'mtime': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha1': hashlib.sha1(raw).hexdigest()
+        }
+        
+        if self.snapshot_enabled and os.path.exists(self.snapshot_file):
+            try:
+                with open(self.snapshot_file, 'rb') as f:
+                    snapshot = pickle.load(f)
+                if snapshot.get('fingerprint') == fingerprint:
+                    self.logger.info(f"从二进制快照加载院校数据: {self.snapshot_file}")
+                    return snapshot['data']
+            except Exception as e:
+                self.logger.warning(f"读取二进制快照失败: {e}")
+        
+        cache_data = json.loads(raw.decode('utf-8'))
+        
+        if self.snapshot_enabled:
+            try:
+                tmp_file = f"{self.snapshot_file}.tmp"
+                with open(tmp_file, 'wb') as f:
+                    pickle.dump({'fingerprint': fingerprint, 'data': cache_data}, f,
+                                protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_file, self.snapshot_file)
+            except Exception as e:
+                self.logger.warning(f"写入二进制快照失败: {e}")
+        
+        return cache_data
+    
+    def _derive_universities_view(self, cache_data: Dict[str, Any]) -> Dict[str, Any]:
+        """从缓存数据派生院校视图"""
+        if not cache_data:
+            return {}
+        
+        # 检查数据格式
+        first_key = next(iter(cache_data))
+        first_value = cache_data[first_key]
+        
+        # 新格式：直接包含院校信息，直接复用解析结果
+        if isinstance(first_value, dict) and 'category' in first_value:
+            print(f"从缓存文件加载了 {len(cache_data)} 所大学的数据（新格式）")
+            return cache_data
+        
+        # 旧格式：包含basic_info字段
+        elif isinstance(first_value, dict) and 'basic_info' in first_value:
+            universities = {}
+            for name, uni_data in cache_data.items():
+                basic_info = uni_data.get('basic_info', {})
+                location = uni_data.get('location', {})
                 
-                print(f"从缓存文件加载了 {len(all_scores)} 所大学的录取分数线")
-                return all_scores
+                universities[name] = {
+                    'category': basic_info.get('category', ''),
+                    'type': basic_info.get('type', ''),
+                    'location': location,
+                    'establishment_year': basic_info.get('establishment_year', 1950),
+                    'motto': basic_info.get('motto', ''),
+                    'website': basic_info.get('website', ''),
+                    'is_double_first_class': basic_info.get('is_double_first_class', False),
+                    'key_disciplines': basic_info.get('key_disciplines', []),
+                    'campus_area': basic_info.get('campus_area', 500),
+                    'student_count': basic_info.get('student_count', 30000),
+                    'faculty_count': basic_info.get('faculty_count', 2000),
+                    'library_books': basic_info.get('library_books', 300),
+                    'research_funding': basic_info.get('research_funding', 20),
+                    'description': basic_info.get('description', ''),
+                    'data_source': uni_data.get('data_source', '未知')
+                }
             
-            # 回退到原有的文件
-            if os.path.exists(self.scores_file):
-                with open(self.scores_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-        except Exception as e:
-            self.logger.warning(f"加载分数线数据失败: {e}")
+            print(f"从缓存文件加载了 {len(universities)} 所大学的数据（旧格式）")
+            return universities
         
         return {}
     
-    def _load_rankings_data(self) -> Dict[str, Any]:
-        """加载排名数据"""
+    def _derive_scores_view(self, cache_data: Dict[str, Any]) -> Dict[str, Any]:
+        """从缓存数据派生录取分数线视图（引用原数据，不复制）"""
+        all_scores = {}
+        for name, uni_data in cache_data.items():
+            if isinstance(uni_data, dict) and uni_data.get('admission_scores'):
+                all_scores[name] = uni_data['admission_scores']
+        
+        print(f"从缓存文件加载了 {len(all_scores)} 所大学的录取分数线")
+        return all_scores
+    
+    def _derive_rankings_view(self, cache_data: Dict[str, Any]) -> Dict[str, Any]:
+        """从缓存数据派生排名视图（引用原数据，不复制）"""
+        all_rankings = {}
+        for name, uni_data in cache_data.items():
+            if isinstance(uni_data, dict) and uni_data.get('ranking'):
+                all_rankings[name] = uni_data['ranking']
+        
+        print(f"从缓存文件加载了 {len(all_rankings)} 所大学的排名数据")
+        return all_rankings
+    
+    def _load_json_file(self, filepath: str, description: str) -> Dict[str, Any]:
+        """加载单个JSON数据文件"""
         try:
-            # 优先从更新的缓存文件加载
-            cache_file = "data/university_data.json"
-            if os.path.exists(cache_file):
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-                
-                # 提取排名数据
-                all_rankings = {}
-                for name, uni_data in cache_data.items():
-                    if isinstance(uni_data, dict) and 'ranking' in uni_data:
-                        ranking = uni_data.get('ranking', {})
-                        if ranking:
-                            all_rankings[name] = ranking
-                
-                print(f"从缓存文件加载了 {len(all_rankings)} 所大学的排名数据")
-                return all_rankings
-            
-            # 回退到原有的文件
-            if os.path.exists(self.rankings_file):
-                with open(self.rankings_file, 'r', encoding='utf-8') as f:
+            if os.path.exists(filepath):
+                with open(filepath, 'r', encoding='utf-8') as f:
                     return json.load(f)
         except Exception as e:
-            self.logger.warning(f"加载排名数据失败: {e}")
+            self.logger.warning(f"加载{description}失败: {e}")
         
         return {}
     
@@ -177,10 +270,13 @@ class UniversityDatabase:
                     if name in self.universities:
                         # 合并数据，保留现有的字段
                         self.universities[name].update(data)
+                        self.statistics.add_university(name, self.universities[name])
+                self._save_universities_data([name for name in real_universities if name in self.universities])
                 results["universities"] = True
             elif real_universities and len(real_universities) >= original_count:
                 # 新数据更完整，可以更新
                 self.universities = real_universities
+                self.statistics.build(self.universities, self.admission_scores, self.rankings)
                 self._save_universities_data()
                 results["universities"] = True
                 self.logger.info(f"成功更新 {len(real_universities)} 所院校数据")
@@ -188,6 +284,9 @@ class UniversityDatabase:
                 self.logger.info("网络数据源不可用，保持现有院校数据")
                 results["universities"] = True  # 标记为成功，因为保持了现有数据
             
+            # 院校数据可能已变化，重建索引
+            self.index.build(self.universities)
+            
             # 2. 更新录取分数线
             self.logger.info("正在更新录取分数线数据...")
             all_scores = {}
@@ -201,7 +300,10 @@ class UniversityDatabase:
             if all_scores:
                 # 合并到现有分数线数据中
                 self.admission_scores.update(all_scores)
-                self._save_scores_data()
+                for university_name, scores in all_scores.items():
+                    self.score_store.add(university_name, scores)
+                    self.statistics.set_scores(university_name, scores)
+                self._save_scores_data(list(all_scores))
                 results["scores"] = True
                 self.logger.info(f"成功更新 {updated_scores_count} 所院校的录取分数线")
             else:
@@ -221,12 +323,16 @@ class UniversityDatabase:
             if all_rankings:
                 # 合并到现有排名数据中
                 self.rankings.update(all_rankings)
-                self._save_rankings_data()
+                for university_name, ranking in all_rankings.items():
+                    self.statistics.set_ranking(university_name, ranking)
+                self._save_rankings_data(list(all_rankings))
                 results["rankings"] = True
                 self.logger.info(f"成功更新 {updated_rankings_count} 所院校的排名数据")
             else:
                 self.logger.info("保持现有排名数据")
                 results["rankings"] = True
+            
+            self._notify_change("数据刷新")
                 
             # 返回详细的刷新结果
             return {
@@ -250,46 +356,46 @@ class UniversityDatabase:
                 "error": str(e)
             }
     
-    def _save_universities_data(self):
-        """保存院校数据"""
-        try:
-            with open(self.universities_file, 'w', encoding='utf-8') as f:
-                json.dump(self.universities, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            self.logger.error(f"保存院校数据失败: {e}")
+    def _save_universities_data(self, names: List[str] = None):
+        """保存院校数据（names 为发生变化的院校，None 表示全部）"""
+        self.storage.save(KIND_UNIVERSITIES, names)
     
-    def _save_scores_data(self):
-        """保存录取分数线数据"""
-        try:
-            with open(self.scores_file, 'w', encoding='utf-8') as f:
-                json.dump(self.admission_scores, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            self.logger.error(f"保存分数线数据失败: {e}")
+    def _save_scores_data(self, names: List[str] = None):
+        """保存录取分数线数据（names 为发生变化的院校，None 表示全部）"""
+        self.storage.save(KIND_SCORES, names)
     
-    def _save_rankings_data(self):
-        """保存排名数据"""
-        try:
-            with open(self.rankings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.rankings, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            self.logger.error(f"保存排名数据失败: {e}")
+    def _save_rankings_data(self, names: List[str] = None):
+        """保存排名数据（names 为发生变化的院校，None 表示全部）"""
+        self.storage.save(KIND_RANKINGS, names)
+    
+    def flush(self) -> int:
+        """立即写入全部待保存的数据，返回写入的文件数量"""
+        return self.storage.flush()
+    
+    def close(self):
+        """写入待保存的数据并释放存储引擎的资源（后台线程、数据库连接）"""
+        self.storage.close()
     
     def get_all_universities(self) -> Dict[str, Any]:
         """获取所有院校数据"""
         return self.universities
     
-    def get_university_by_name(self, name: str) -> Optional[Dict[str, Any]]:
-        """根据名称获取院校信息，如果不存在则尝试从网络获取"""
-        # 首先从现有数据查找
-        university = self.universities.get(name)
+    def resolve_university_name(self, name: str) -> Optional[str]:
+        """返回名称对应的院校数据中的名称（先精确匹配，再模糊匹配），找不到时返回None"""
+        if name in self.universities:
+            return name
         
-        if university:
-            return university
-        
-        # 如果不存在，尝试模糊匹配
-        for uni_name, uni_data in self.universities.items():
+        for uni_name in self.universities:
             if name in uni_name or uni_name in name:
-                return uni_data
+                return uni_name
+        return None
+    
+    def get_university_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """根据名称获取院校信息，如果不存在则尝试从网络获取"""
+        # 首先从现有数据查找（精确匹配后模糊匹配）
+        resolved = self.resolve_university_name(name)
+        if resolved is not None:
+            return self.universities[resolved]
         
         # 如果仍然找不到，尝试从网络获取
         self.logger.info(f"院校 '{name}' 不存在，尝试从网络获取...")
@@ -301,21 +407,30 @@ class UniversityDatabase:
             if new_university_data:
                 # 添加到数据库
                 self.universities[name] = new_university_data
+                self.index.add(name, new_university_data)
+                self.statistics.add_university(name, new_university_data)
                 
                 # 生成录取分数线
                 scores = self.crawler.get_real_admission_scores(name)
                 if scores:
                     self.admission_scores[name] = scores
+                    self.score_store.add(name, scores)
+                    self.statistics.set_scores(name, scores)
                 
                 # 生成排名信息
                 ranking = self._generate_university_ranking(name, new_university_data.get('category', '普通本科'))
                 if ranking:
                     self.rankings[name] = ranking
+                    self.statistics.set_ranking(name, ranking)
                 
                 # 保存数据
-                self._save_universities_data()
-                self._save_scores_data()
-                self._save_rankings_data()
+                self._save_universities_data([name])
+                if scores:
+                    self._save_scores_data([name])
+                if ranking:
+                    self._save_rankings_data([name])
+                
+                self._notify_change(f"新增院校: {name}")
                 
                 self.logger.info(f"成功获取并保存院校 '{name}' 的数据")
                 return new_university_data
@@ -587,86 +702,115 @@ class UniversityDatabase:
             self.logger.error(f"从网络获取数据失败: {e}")
             return False
     
+    def _select(self, names) -> Dict[str, Any]:
+        """按原数据顺序返回指定名称的院校数据"""
+        return {name: self.universities[name] for name in self.index.ordered(names)
+                if name in self.universities}
+    
     def search_universities(self, keyword: str) -> Dict[str, Any]:
-        """搜索院校"""
-        results = {}
-        keyword_lower = keyword.lower()
-        
-        for name, data in self.universities.items():
-            if (keyword_lower in name.lower() or 
-                keyword_lower in data.get('location', {}).get('province', '').lower() or
-                keyword_lower in data.get('type', '').lower()):
-                results[name] = data
-        
-        return results
+        """搜索院校（匹配名称、所在省份和类型）"""
+        return self._select(self.index.search(keyword))
     
     def get_universities_by_category(self, category: str) -> Dict[str, Any]:
         """根据类别获取院校（985/211/双一流等）"""
-        results = {}
-        
-        for name, data in self.universities.items():
-            if category == "985" and data.get('category') == "985":
-                results[name] = data
-            elif category == "211" and data.get('category') in ["985", "211"]:
-                results[name] = data
-            elif category == "双一流" and data.get('is_double_first_class'):
-                results[name] = data
-            elif category == "普通本科" and data.get('category') not in ["985", "211"]:
-                results[name] = data
-        
-        return results
+        return self._select(self.index.category(category))
     
     def get_universities_by_province(self, province: str) -> Dict[str, Any]:
         """根据省份获取院校"""
-        results = {}
-        
-        for name, data in self.universities.items():
-            # 同时检查 province 字段和 location.province 字段
-            data_province = data.get('province') or data.get('location', {}).get('province')
-            if data_province == province:
-                results[name] = data
-        
-        return results
+        return self._select(self.index.province(province))
     
     def get_universities_by_type(self, university_type: str) -> Dict[str, Any]:
         """根据类型获取院校（综合类/理工类等）"""
-        results = {}
+        return self._select(self.index.university_type(university_type))
+    
+    def filter_universities(self, keyword: str = None, category: str = None,
+                            province: str = None, university_type: str = None) -> Dict[str, Any]:
+        """组合筛选院校，各条件同时满足"""
+        return self._select(self.index.filter(keyword, category, province, university_type))
+    
+    def page_universities(self, names: List[str], fields: List[str] = None, sort: str = None,
+                          limit: int = None, offset: int = 0) -> Dict[str, Any]:
+        """
+        对院校名称列表排序、分页并投影字段
         
-        for name, data in self.universities.items():
-            if data.get('type') == university_type:
-                results[name] = data
+        Args:
+            names: 院校名称（未指定排序时保持该顺序）
+            fields: 返回的字段，支持 ranking.domestic_rank 形式的嵌套字段和排序字段别名
+                    （如 rank 即 ranking.domestic_rank），None 返回完整数据
+            sort: 排序字段，前缀 - 表示降序（如 -student_count）
+            limit: 每页数量，None 返回全部
+            offset: 起始位置
+        
+        Returns:
+            total（总数）、offset、limit、next_offset（无下一页时为None）和 data（院校列表，含name字段）
+        """
+        names = [name for name in names if name in self.universities]
+        if sort:
+            names = self.index.sort_names(names, sort.lstrip('-'), descending=sort.startswith('-'))
         
-        return results
+        total = len(names)
+        end = total if limit is None else min(offset + limit, total)
+        data = [self._project(name, self.universities[name], fields) for name in names[offset:end]]
+        
+        return {
+            'total': total,
+            'offset': offset,
+            'limit': limit,
+            'next_offset': end if end < total else None,
+            'data': data
+        }
     
-    def get_admission_scores(self, university_name: str, province: str = None, year: int = None) -> Dict[str, Any]:
-        """获取录取分数线"""
+    @staticmethod
+    def _project(name: str, university: Dict[str, Any], fields: List[str] = None) -> Dict[str, Any]:
+        """按字段列表提取院校数据，排序字段别名与排序取值一致，不存在的字段忽略"""
+        if not fields:
+            return dict(university, name=name)
+        
+        projected = {'name': name}
+        for field in fields:
+            if field in SORT_FIELDS:
+                value = SORT_FIELDS[field](name, university)
+                if value is not None:
+                    projected[field] = value
+                continue
+            
+            # 嵌套字段：完整路径存在时才创建中间层，避免留下空字典
+            source = university
+            parts = field.split('.')
+            for part in parts:
+                if not isinstance(source, dict) or part not in source:
+                    break
+                source = source[part]
+            else:
+                target = projected
+                for part in parts[:-1]:
+                    target = target.setdefault(part, {})
+                target[parts[-1]] = source
+        return projected
+    
+    def get_admission_scores(self, university_name: str, province: str = None, year: int = None,
+                             subject: str = None) -> Dict[str, Any]:
+        """获取录取分数线（可按省份、年份、科目筛选）"""
         if university_name not in self.admission_scores:
             # 尝试从爬虫获取
             scores = self.crawler.get_real_admission_scores(university_name, province, year)
             if scores:
                 self.admission_scores[university_name] = scores
-                self._save_scores_data()
+                self.score_store.add(university_name, scores)
+                self.statistics.set_scores(university_name, scores)
+                self._save_scores_data([university_name])
             return scores
         
-        scores = self.admission_scores[university_name]
-        
-        # 如果指定了省份和年份，进行筛选
-        if province or year:
-            filtered_scores = {}
-            for key, value in scores.items():
-                score_province = value.get('province', '')
-                score_year = value.get('year', 0)
-                
-                if province and score_province != province:
-                    continue
-                if year and score_year != year:
-                    continue
-                
-                filtered_scores[key] = value
-            
-            return filtered_scores
+        # 如果指定了省份、年份或科目，通过组合索引筛选
+        if province or year or subject:
+            return self.score_store.get(university_name, province, year, subject)
         
-        return scores
+        return self.admission_scores[university_name]
+    
+    def get_scores_in_range(self, province: str, subject: str, year: int, low: float = None,
+                            high: float = None, field: str = 'min_score') -> List[tuple]:
+        """查询某省份、科目、年份分数在指定区间内的全部院校分数线"""
+        return self.score_store.range_query(province, subject, year, low, high, field)
     
     def get_score_trends(self, university_name: str, province: str = None) -> Dict[str, Any]:
         """获取录取分数趋势分析"""
@@ -681,16 +825,14 @@ class UniversityDatabase:
             "文科": {}
         }
         
-        for key, value in scores.items():
-            year = value.get('year', 0)
-            subject = value.get('subject', '')
-            min_score = value.get('min_score', 0)
-            
-            if subject in trends and year:
-                trends[subject][year] = min_score
+        for subject in list(trends):
+            for value in self.score_store.get(university_name, province, subject=subject).values():
+                year = value.get('year', 0)
+                if year:
+                    trends[subject][year] = value.get('min_score', 0)
         
         # 计算趋势
-        for subject in trends:
+        for subject in list(trends):
             if trends[subject]:
                 years = sorted(trends[subject].keys())
                 scores_list = [trends[subject][year] for year in years]
@@ -714,7 +856,8 @@ class UniversityDatabase:
             ranking = self.crawler.get_university_rankings(university_name)
             if ranking:
                 self.rankings[university_name] = ranking
-                self._save_rankings_data()
+                self.statistics.set_ranking(university_name, ranking)
+                self._save_rankings_data([university_name])
             return ranking
         
         return self.rankings[university_name]
@@ -795,38 +938,12 @@ class UniversityDatabase:
         return recommended_majors[:10]  # 返回前10个推荐
     
     def get_statistics(self) -> Dict[str, Any]:
-        """获取数据库统计信息"""
-        stats = {
-            "total_universities": len(self.universities),
-            "by_category": {},
-            "by_type": {},
-            "by_province": {},
-            "data_freshness": {}
-        }
-        
-        # 按类别统计
-        for name, data in self.universities.items():
-            category = data.get('category', '未知')
-            stats['by_category'][category] = stats['by_category'].get(category, 0) + 1
-        
-        # 按类型统计
-        for name, data in self.universities.items():
-            uni_type = data.get('type', '未知')
-            stats['by_type'][uni_type] = stats['by_type'].get(uni_type, 0) + 1
-        
-        # 按省份统计
-        for name, data in self.universities.items():
-            province = data.get('location', {}).get('province', '未知')
-            stats['by_province'][province] = stats['by_province'].get(province, 0) + 1
-        
-        # 数据新鲜度
-        stats['data_freshness'] = {
-            "universities_count": len(self.admission_scores),
-            "rankings_count": len(self.rankings),
-            "last_update": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
-        
-        return stats
+        """获取数据库统计信息（增量维护的聚合结果，只读）"""
+        return self.statistics.snapshot()
+    
+    def get_statistics_etag(self) -> str:
+        """获取统计信息的ETag"""
+        return self.statistics.etag
     
     def export_data(self, export_type: str = "json") -> str:
         """导出数据"""
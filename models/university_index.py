@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+院校二级索引模块
+维护省份、类别、类型、双一流标记的倒排索引，以及用于中文子串搜索的字符n-gram索引，
+多个筛选条件以集合交集方式组合
+"""
+
+import threading
+from typing import Dict, List, Optional, Any, Iterable, Set, Tuple
+
+# 类别筛选对应的院校类别取值
+CATEGORY_985 = "985"
+CATEGORY_211 = "211"
+CATEGORY_DOUBLE_FIRST_CLASS = "双一流"
+CATEGORY_REGULAR = "普通本科"
+
+# n-gram索引的最大长度
+NGRAM_SIZE = 2
+
+# 可排序字段 -> 取值函数（缺失值排在最后）
+SORT_FIELDS = {
+    'name': lambda name, data: name,
+    'rank': lambda name, data: (data.get('ranking') or {}).get('domestic_rank'),
+    'province': lambda name, data: data.get('province') or (data.get('location') or {}).get('province'),
+    'establishment_year': lambda name, data: data.get('establishment_year'),
+    'student_count': lambda name, data: data.get('student_count')
+}
+TEXT_SORT_FIELDS = {'name', 'province'}
+
+
+def _sortable(field: str, value: Any) -> Any:
+    """排序字段取值：文本字段取非空字符串，其余字段取数字（如排名"未知"视为缺失）"""
+    if field in TEXT_SORT_FIELDS:
+        return value if isinstance(value, str) and value else None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return None
+
+
+def _ngrams(text: str, size: int) -> Set[str]:
+    """生成文本中长度为size的所有子串"""
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class UniversityIndex:
+    """院校二级索引"""
+
+    def __init__(self, universities: Dict[str, Any] = None):
+        self._lock = threading.RLock()
+        self.build(universities or {})
+
+    def build(self, universities: Dict[str, Any]):
+        """根据院校数据重建全部索引"""
+        with self._lock:
+            # 院校名称 -> 插入顺序，用于按原数据顺序返回结果
+            self._order: Dict[str, int] = {}
+            # 院校名称 -> 已索引的字段，用于增量更新时移除旧索引
+            self._indexed: Dict[str, Tuple[str, str, str, bool, Tuple[str, ...]]] = {}
+
+            self.by_province: Dict[str, Set[str]] = {}
+            self.by_category: Dict[str, Set[str]] = {}
+            self.by_type: Dict[str, Set[str]] = {}
+            self.double_first_class: Set[str] = set()
+            self.ngrams: Dict[str, Set[str]] = {}
+            # 院校名称 -> 各排序字段的取值
+            self.sort_values: Dict[str, Dict[str, Any]] = {}
+
+            for name, data in universities.items():
+                self.add(name, data)
+
+    @staticmethod
+    def _fields(name: str, data: Dict[str, Any]) -> Tuple[str, str, str, bool, Tuple[str, ...]]:
+        """提取需要索引的字段：(省份, 类别, 类型, 是否双一流, 可搜索文本)"""
+        location = data.get('location') or {}
+        # 省份筛选同时检查 province 字段和 location.province 字段
+        province = data.get('province') or location.get('province') or ''
+        category = data.get('category') or ''
+        university_type = data.get('type') or ''
+        is_double_first_class = bool(data.get('is_double_first_class'))
+
+        # 关键词搜索匹配名称、所在省份和类型（不区分大小写）
+        search_texts = (
+            name.lower(),
+            (location.get('province') or '').lower(),
+            university_type.lower()
+        )
+        return province, category, university_type, is_double_first_class, search_texts
+
+    def add(self, name: str, data: Dict[str, Any]):
+        """增量添加（或更新）一所院校的索引"""
+        with self._lock:
+            if name in self._indexed:
+                self._unindex(name)
+            else:
+                self._order[name] = len(self._order)
+
+            fields = self._fields(name, data)
+            province, category, university_type, is_double_first_class, search_texts = fields
+
+            self.by_province.setdefault(province, set()).add(name)
+            self.by_category.setdefault(category, set()).add(name)
+            self.by_type.setdefault(university_type, set()).add(name)
+            if is_double_first_class:
+                self.double_first_class.add(name)
+
+            for gram in self._text_grams(search_texts):
+                self.ngrams.setdefault(gram, set()).add(name)
+
+            self._indexed[name] = fields
+            self.sort_values[name] = {field: _sortable(field, getter(name, data))
+                                      for field, getter in SORT_FIELDS.items()}
+
+    def _unindex(self, name: str):
+        """从各索引中移除一所院校"""
+        province, category, university_type, _, search_texts = self._indexed.pop(name)
+        self.by_province.get(province, set()).discard(name)
+        self.by_category.get(category, set()).discard(name)
+        self.by_type.get(university_type, set()).discard(name)
+        self.double_first_class.discard(name)
+        self.sort_values.pop(name, None)
+        for gram in self._text_grams(search_texts):
+            self.ngrams.get(gram, set()).discard(name)
+
+    @staticmethod
+    def _text_grams(texts: Iterable[str]) -> Set[str]:
+        """生成可搜索文本的全部1-gram和2-gram"""
+        grams = set()
+        for text in texts:
+            for size in range(1, NGRAM_SIZE + 1):
+                grams |= _ngrams(text, size)
+        return grams
+
+    def __len__(self) -> int:
+        return len(self._indexed)
+
+    def search(self, keyword: str) -> Set[str]:
+        """关键词子串搜索，返回匹配的院校名称集合"""
+        keyword = keyword.lower()
+        with self._lock:
+            if not keyword:
+                return set(self._indexed)
+
+            # 用关键词的n-gram求交集得到候选集合，再校验完整子串
+            size = min(len(keyword), NGRAM_SIZE)
+            candidates = None
+            for gram in _ngrams(keyword, size):
+                postings = self.ngrams.get(gram)
+                if not postings:
+                    return set()
+                candidates = set(postings) if candidates is None else candidates & postings
+
+            if len(keyword) <= NGRAM_SIZE:
+                return candidates
+            return {name for name in candidates
+                    if any(keyword in text for text in self._indexed[name][4])}
+
+    def category(self, category: str) -> Set[str]:
+        """按类别筛选（985/211/双一流/普通本科）"""
+        with self._lock:
+            if category == CATEGORY_985:
+                return set(self.by_category.get(CATEGORY_985, ()))
+            if category == CATEGORY_211:
+                return self.by_category.get(CATEGORY_985, set()) | self.by_category.get(CATEGORY_211, set())
+            if category == CATEGORY_DOUBLE_FIRST_CLASS:
+                return set(self.double_first_class)
+            if category == CATEGORY_REGULAR:
+                excluded = self.by_category.get(CATEGORY_985, set()) | self.by_category.get(CATEGORY_211, set())
+                return set(self._indexed) - excluded
+            return set()
+
+    def province(self, province: str) -> Set[str]:
+        """按省份筛选"""
+        with self._lock:
+            return set(self.by_province.get(province, ()))
+
+    def university_type(self, university_type: str) -> Set[str]:
+        """按类型筛选"""
+        with self._lock:
+            return set(self.by_type.get(university_type, ()))
+
+    def filter(self, keyword: str = None, category: str = None, province: str = None,
+               university_type: str = None) -> Set[str]:
+        """组合筛选：各条件取交集，未提供的条件不参与筛选"""
+        result: Optional[Set[str]] = None
+        for value, lookup in ((province, self.province),
+                              (university_type, self.university_type),
+                              (category, self.category),
+                              (keyword, self.search)):
+            if not value:
+                continue
+            names = lookup(value)
+            result = names if result is None else result & names
+            if not result:
+                return set()
+
+        if result is None:
+            with self._lock:
+                return set(self._indexed)
+        return result
+
+    def ordered(self, names: Iterable[str]) -> list:
+        """按院校原数据顺序排列名称"""
+        order = self._order
+        return sorted(names, key=lambda name: order.get(name, len(order)))
+
+    def sort_names(self, names: Iterable[str], field: str, descending: bool = False) -> List[str]:
+        """按排序字段排列名称，缺失值始终排在最后，同值保持原数据顺序"""
+        if field not in SORT_FIELDS:
+            raise ValueError(f"不支持的排序字段: {field}，可选: {', '.join(SORT_FIELDS)}")
+
+        with self._lock:
+            present, missing = [], []
+            for name in self.ordered(names):
+                value = self.sort_values.get(name, {}).get(field)
+                if value is None:
+                    missing.append(name)
+                else:
+                    present.append((value, name))
+
+        present.sort(key=lambda item: item[0], reverse=descending)
+        return [name for _, name in present] + missing
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+院校统计聚合模块
+按类别、类型、省份、分数线覆盖和数据新鲜度维护计数器，院校、分数线或排名变化时
+先减去该院校原有的贡献再加上新的贡献；统计结果按版本缓存并附带内容哈希作为ETag
+"""
+
+import hashlib
+import json
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Optional, Any, FrozenSet, Tuple
+
+UNKNOWN = '未知'
+
+# 院校对统计的贡献：(类别, 类型, 省份, 更新时间)
+UniversityContribution = Tuple[str, str, str, Optional[str]]
+# 分数线对统计的贡献：(覆盖的省份, 覆盖的年份, 分数线条数)
+ScoreContribution = Tuple[FrozenSet[str], FrozenSet[int], int]
+
+
+def _counter_dict(counter: Counter) -> Dict[str, int]:
+    """计数器转为字典（去掉已归零的项）"""
+    return {key: count for key, count in counter.items() if count > 0}
+
+
+class UniversityStatistics:
+    """院校统计聚合"""
+
+    def __init__(self, universities: Dict[str, Any] = None, admission_scores: Dict[str, Any] = None,
+                 rankings: Dict[str, Any] = None):
+        self._lock = threading.RLock()
+        self.build(universities or {}, admission_scores or {}, rankings or {})
+
+    def build(self, universities: Dict[str, Any], admission_scores: Dict[str, Any],
+              rankings: Dict[str, Any]):
+        """根据全部数据重建统计"""
+        with self._lock:
+            self._universities: Dict[str, UniversityContribution] = {}
+            self._scores: Dict[str, ScoreContribution] = {}
+            self._rankings = set()
+
+            self.by_category = Counter()
+            self.by_type = Counter()
+            self.by_province = Counter()
+            self.record_updates = Counter()
+            self.score_provinces = Counter()
+            self.score_years = Counter()
+            self.score_entries = 0
+
+            for name, data in universities.items():
+                self.add_university(name, data)
+            for name, scores in admission_scores.items():
+                self.set_scores(name, scores)
+            for name, ranking in rankings.items():
+                self.set_ranking(name, ranking)
+
+            self._touch()
+
+    def _touch(self):
+        """统计发生变化：使缓存的结果失效"""
+        self.last_change = datetime.now()
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._etag: Optional[str] = None
+
+    @staticmethod
+    def _university_contribution(data: Dict[str, Any]) -> UniversityContribution:
+        location = data.get('location') or {}
+        return (
+            data.get('category', UNKNOWN),
+            data.get('type', UNKNOWN),
+            location.get('province', UNKNOWN),
+            data.get('last_updated')
+        )
+
+    def add_university(self, name: str, data: Dict[str, Any]):
+        """新增（或更新）一所院校"""
+        with self._lock:
+            old = self._universities.get(name)
+            new = self._university_contribution(data)
+            if old == new:
+                return
+
+            for counter, old_value, new_value in zip(
+                    (self.by_category, self.by_type, self.by_province, self.record_updates),
+                    old or (None,) * 4, new):
+                if old is not None:
+                    counter[old_value] -= 1
+                counter[new_value] += 1
+
+            self._universities[name] = new
+            self._touch()
+
+    def remove_university(self, name: str):
+        """移除一所院校及其分数线、排名的统计"""
+        with self._lock:
+            old = self._universities.pop(name, None)
+            if old is not None:
+                for counter, value in zip(
+                        (self.by_category, self.by_type, self.by_province, self.record_updates), old):
+                    counter[value] -= 1
+            self.set_scores(name, None)
+            self.set_ranking(name, None)
+            self._touch()
+
+    def set_scores(self, name: str, scores: Optional[Dict[str, Any]]):
+        """设置一所院校的录取分数线（None 表示没有分数线）"""
+        with self._lock:
+            old = self._scores.pop(name, None)
+            if old is not None:
+                provinces, years, entries = old
+                self.score_provinces.subtract(provinces)
+                self.score_years.subtract(years)
+                self.score_entries -= entries
+
+            if scores:
+                values = [value for value in scores.values() if isinstance(value, dict)]
+                provinces = frozenset(value['province'] for value in values if value.get('province'))
+                years = frozenset(value['year'] for value in values if value.get('year'))
+                self.score_provinces.update(provinces)
+                self.score_years.update(years)
+                self.score_entries += len(values)
+                self._scores[name] = (provinces, years, len(values))
+
+            self._touch()
+
+    def set_ranking(self, name: str, ranking: Optional[Dict[str, Any]]):
+        """设置一所院校是否有排名数据"""
+        with self._lock:
+            if ranking:
+                self._rankings.add(name)
+            else:
+                self._rankings.discard(name)
+            self._touch()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """获取统计结果（数据未变化时返回缓存的同一对象，调用方不应修改）"""
+        with self._lock:
+            if self._snapshot is None:
+                latest_record = max((value for value, count in self.record_updates.items()
+                                     if isinstance(value, str) and count > 0), default=None)
+                self._snapshot = {
+                    "total_universities": len(self._universities),
+                    "by_category": _counter_dict(self.by_category),
+                    "by_type": _counter_dict(self.by_type),
+                    "by_province": _counter_dict(self.by_province),
+                    "score_coverage": {
+                        "universities_with_scores": len(self._scores),
+                        "score_entries": self.score_entries,
+                        "by_province": _counter_dict(self.score_provinces),
+                        "years": sorted(year for year, count in self.score_years.items() if count > 0)
+                    },
+                    "data_freshness": {
+                        "universities_count": len(self._scores),
+                        "rankings_count": len(self._rankings),
+                        "latest_record_update": latest_record,
+                        "last_update": self.last_change.strftime("%Y-%m-%d %H:%M:%S")
+                    }
+                }
+            return self._snapshot
+
+    @property
+    def etag(self) -> str:
+        """统计结果的内容哈希"""
+        with self._lock:
+            if self._etag is None:
+                payload = json.dumps(self.snapshot(), ensure_ascii=False, sort_keys=True, default=str)
+                self._etag = hashlib.sha1(payload.encode('utf-8')).hexdigest()
+            return self._etag
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+院校数据存储引擎
+- json: 整文件JSON存储（通过延迟写入批量保存），默认引擎
+- sqlite: 院校、录取分数线、排名分表存储，按行写入（upsert），支持多进程并发访问（WAL模式）
+两种引擎都只负责持久化：启动时一次性加载到内存，查询走内存中的索引；
+UniversityDatabase 通过 save(类型, 院校名称) 通知存储引擎哪些数据发生了变化
+"""
+
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+import weakref
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from .write_behind import WriteBehindPersister
+
+logger = logging.getLogger(__name__)
+
+STORAGE_JSON = 'json'
+STORAGE_SQLITE = 'sqlite'
+STORAGE_BACKENDS = (STORAGE_JSON, STORAGE_SQLITE)
+
+# 数据类型
+KIND_UNIVERSITIES = 'universities'
+KIND_SCORES = 'scores'
+KIND_RANKINGS = 'rankings'
+KINDS = (KIND_UNIVERSITIES, KIND_SCORES, KIND_RANKINGS)
+
+# (院校数据, 录取分数线, 排名)
+Dataset = Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]
+
+# 院校记录中单独存表的字段，读取时重新挂回院校记录（与JSON缓存文件的结构一致）
+NESTED_FIELDS = {'admission_scores': KIND_SCORES, 'ranking': KIND_RANKINGS}
+
+UPSERT_UNIVERSITY_SQL = """
+    INSERT INTO universities (name, category, type, province, city, is_double_first_class, data, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(name) DO UPDATE SET
+        category = excluded.category, type = excluded.type, province = excluded.province,
+        city = excluded.city, is_double_first_class = excluded.is_double_first_class,
+        data = excluded.data, updated_at = excluded.updated_at
+"""
+UPSERT_SCORE_SQL = """
+    INSERT INTO admission_scores
+    (university, score_key, province, year, subject, min_score, avg_score, max_score, rank, data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(university, score_key) DO UPDATE SET
+        province = excluded.province, year = excluded.year, subject = excluded.subject,
+        min_score = excluded.min_score, avg_score = excluded.avg_score,
+        max_score = excluded.max_score, rank = excluded.rank, data = excluded.data
+"""
+DELETE_SCORES_SQL = "DELETE FROM admission_scores WHERE university = ?"
+UPSERT_RANKING_SQL = """
+    INSERT INTO rankings (university, domestic_rank, data) VALUES (?, ?, ?)
+    ON CONFLICT(university) DO UPDATE SET domestic_rank = excluded.domestic_rank, data = excluded.data
+"""
+
+
+def _number(value: Any) -> Optional[float]:
+    """分数、位次等数值字段（非数字存为NULL）"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return None
+
+
+class JSONUniversityStorage:
+    """JSON文件存储：任何修改都标记整个文件待写入，由后台线程延迟保存"""
+
+    name = STORAGE_JSON
+
+    def __init__(self, files: Dict[str, str], sources: Dict[str, Callable[[], Dict[str, Any]]],
+                 loader: Callable[[], Dataset], flush_interval: float = 2.0):
+        """
+        Args:
+            files: 数据类型 -> 文件路径
+            sources: 数据类型 -> 返回当前内存数据的函数
+            loader: 加载全部数据的函数
+            flush_interval: 延迟写入的刷新间隔（秒）
+        """
+        self.loader = loader
+        self.persister = WriteBehindPersister(flush_interval, name="university-data-writer")
+        for kind in KINDS:
+            self.persister.register(kind, files[kind], sources[kind], kind)
+
+    def load(self) -> Dataset:
+        return self.loader()
+
+    def save(self, kind: str, names: Iterable[str] = None):
+        """整文件存储无法只写部分院校，忽略names"""
+        self.persister.mark_dirty(kind)
+
+    def flush(self) -> int:
+        return self.persister.flush()
+
+    def close(self):
+        """停止后台写入线程并写入全部待写入的数据"""
+        self.persister.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {'backend': self.name, **self.persister.get_stats()}
+
+
+class SQLiteUniversityStorage:
+    """SQLite存储：院校、录取分数线、排名分表保存，按院校行级写入"""
+
+    name = STORAGE_SQLITE
+
+    def __init__(self, db_path: str, sources: Dict[str, Callable[[], Dict[str, Any]]] = None):
+        """
+        Args:
+            db_path: SQLite数据库文件路径
+            sources: 数据类型 -> 返回当前内存数据的函数，save 时从中读取需要写入的院校数据
+        """
+        self.db_path = db_path
+        self.sources = sources or {}
+        self._local = threading.local()
+        # 全部线程的连接，close 时统一关闭；关闭后代数递增，各线程再次访问时重新连接
+        self._connections = []
+        self._generation = 0
+        self._connections_lock = threading.Lock()
+        self.stats = {'loads': 0, 'upserts': 0}
+        self.init_schema()
+        _storages.add(self)
+
+    def _connection(self) -> sqlite3.Connection:
+        """获取当前线程的长连接"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.generation != self._generation:
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with self._connections_lock:
+                self._connections.append(conn)
+                self._local.generation = self._generation
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        """关闭全部线程的数据库连接"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._generation += 1
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f"关闭SQLite连接失败: {e}")
+
+    def init_schema(self):
+        """初始化表结构"""
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS universities (
+                    name TEXT PRIMARY KEY,
+                    category TEXT,
+                    type TEXT,
+                    province TEXT,
+                    city TEXT,
+                    is_double_first_class INTEGER,
+                    data TEXT NOT NULL,
+                    updated_at TIMESTAMP
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_universities_province ON universities(province)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_universities_category ON universities(category)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_universities_type ON universities(type)")
+
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS admission_scores (
+                    university TEXT NOT NULL,
+                    score_key TEXT NOT NULL,
+                    province TEXT,
+                    year INTEGER,
+                    subject TEXT,
+                    min_score REAL,
+                    avg_score REAL,
+                    max_score REAL,
+                    rank INTEGER,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (university, score_key)
+                )
+            """)
+
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS rankings (
+                    university TEXT PRIMARY KEY,
+                    domestic_rank INTEGER,
+                    data TEXT NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_rankings_rank ON rankings(domestic_rank)")
+
+    def is_empty(self) -> bool:
+        """数据库中是否还没有院校数据"""
+        return self._connection().execute("SELECT 1 FROM universities LIMIT 1").fetchone() is None
+
+    def load(self) -> Dataset:
+        """读取全部数据，录取分数线和排名同时挂回院校记录"""
+        conn = self._connection()
+
+        rankings = {name: json.loads(data) for name, data in conn.execute(
+            "SELECT university, data FROM rankings")}
+
+        scores: Dict[str, Dict[str, Any]] = {}
+        for university, score_key, data in conn.execute(
+                "SELECT university, score_key, data FROM admission_scores ORDER BY rowid"):
+            scores.setdefault(university, {})[score_key] = json.loads(data)
+
+        universities = {}
+        for name, data in conn.execute("SELECT name, data FROM universities ORDER BY rowid"):
+            university = json.loads(data)
+            if name in scores:
+                university['admission_scores'] = scores[name]
+            if name in rankings:
+                university['ranking'] = rankings[name]
+            universities[name] = university
+
+        self.stats['loads'] += 1
+        logger.info(f"从SQLite加载了 {len(universities)} 所院校、{len(scores)} 所院校的分数线、"
+                    f"{len(rankings)} 所院校的排名")
+        return universities, scores, rankings
+
+    def save(self, kind: str, names: Iterable[str] = None):
+        """
+        写入指定院校的数据
+
+        Args:
+            kind: 数据类型（universities/scores/rankings）
+            names: 院校名称，None 表示写入该类型的全部数据
+        """
+        data = self.sources[kind]()
+        names = list(data) if names is None else list(names)
+        rows = {name: data[name] for name in names if name in data}
+        {
+            KIND_UNIVERSITIES: self.upsert_universities,
+            KIND_SCORES: self.upsert_scores,
+            KIND_RANKINGS: self.upsert_rankings
+        }[kind](rows)
+
+    def upsert_universities(self, universities: Dict[str, Dict[str, Any]]):
+        """新增或更新院校（分数线和排名字段单独存表，不写入院校记录）"""
+        now = datetime.now().isoformat()
+        rows = []
+        for name, university in universities.items():
+            record = {key: value for key, value in university.items() if key not in NESTED_FIELDS}
+            location = university.get('location') or {}
+            rows.append((
+                name,
+                university.get('category'),
+                university.get('type'),
+                university.get('province') or location.get('province'),
+                university.get('city') or location.get('city'),
+                int(bool(university.get('is_double_first_class'))),
+                json.dumps(record, ensure_ascii=False, default=str),
+                now
+            ))
+
+        with self._connection() as conn:
+            conn.executemany(UPSERT_UNIVERSITY_SQL, rows)
+        self.stats['upserts'] += len(rows)
+
+    def upsert_scores(self, admission_scores: Dict[str, Dict[str, Any]]):
+        """替换院校的全部录取分数线"""
+        deletes = []
+        rows = []
+        for university, scores in admission_scores.items():
+            deletes.append((university,))
+            for score_key, score in (scores or {}).items():
+                if not isinstance(score, dict):
+                    continue
+                rows.append((
+                    university, score_key, score.get('province'), score.get('year'), score.get('subject'),
+                    _number(score.get('min_score')), _number(score.get('avg_score')),
+                    _number(score.get('max_score')), _number(score.get('rank')),
+                    json.dumps(score, ensure_ascii=False, default=str)
+                ))
+
+        with self._connection() as conn:
+            conn.executemany(DELETE_SCORES_SQL, deletes)
+            conn.executemany(UPSERT_SCORE_SQL, rows)
+        self.stats['upserts'] += len(rows)
+
+    def upsert_rankings(self, rankings: Dict[str, Dict[str, Any]]):
+        """新增或更新院校排名"""
+        rows = [
+            (university, _number((ranking or {}).get('domestic_rank')),
+             json.dumps(ranking, ensure_ascii=False, default=str))
+            for university, ranking in rankings.items()
+        ]
+        with self._connection() as conn:
+            conn.executemany(UPSERT_RANKING_SQL, rows)
+        self.stats['upserts'] += len(rows)
+
+    def flush(self) -> int:
+        """按行写入时已同步保存，无需刷新"""
+        return 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        conn = self._connection()
+        counts = {table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                  for table in ('universities', 'admission_scores', 'rankings')}
+        return {'backend': self.name, 'db_path': self.db_path, **self.stats, 'rows': counts}
+
+
+# 全部SQLite存储实例（进程退出前关闭连接）
+_storages = weakref.WeakSet()
+
+@atexit.register
+def _close_all_storages():
+    """进程退出前关闭全部SQLite存储的连接"""
+    for storage in list(_storages):
+        storage.close()
+
+
+def migrate_to_sqlite(dataset: Dataset, storage: SQLiteUniversityStorage) -> Dict[str, int]:
+    """
+    将已加载的数据（通常来自 university_data.json）一次性写入SQLite存储
+
+    Returns:
+        写入的院校、分数线、排名数量
+    """
+    universities, admission_scores, rankings = dataset
+    storage.upsert_universities(universities)
+    storage.upsert_scores(admission_scores)
+    storage.upsert_rankings(rankings)
+
+    result = {
+        'universities': len(universities),
+        'admission_scores': sum(len(scores or {}) for scores in admission_scores.values()),
+        'rankings': len(rankings)
+    }
+    logger.info(f"已迁移到SQLite数据库 {storage.db_path}: {result}")
+    return result
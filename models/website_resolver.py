@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+院校官网解析模块
+每所院校的官网只通过搜索引擎解析一次，结果连同解析时间保存到 data/university_websites.json；
+请求路径只查内存中的索引，索引中没有或已超过有效期的院校在后台线程中（重新）解析，
+解析完成前返回预定义映射、院校数据中的官网或推测的域名，详情页不再等待搜索引擎。
+只有搜索引擎或预定义映射得到的官网才写入索引，推测的域名不保存
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from models.data_crawler import KNOWN_WEBSITES, guess_university_website
+from models.write_behind import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_DAYS = 30
+# 解析失败（搜索引擎和预定义映射都没有结果）后，间隔多久才重新尝试
+DEFAULT_RETRY_HOURS = 6
+
+
+class UniversityWebsiteResolver:
+    """院校官网索引"""
+
+    def __init__(self, index_file: str = "data/university_websites.json",
+                 ttl_days: float = DEFAULT_TTL_DAYS, workers: int = 2,
+                 retry_hours: float = DEFAULT_RETRY_HOURS):
+        """
+        Args:
+            index_file: 索引文件路径
+            ttl_days: 解析结果的有效期（天），过期后在后台重新解析
+            workers: 后台解析线程数（限制对搜索引擎的并发请求）
+            retry_hours: 解析失败后重新尝试的间隔（小时）
+        """
+        self.index_file = index_file
+        self.ttl_seconds = ttl_days * 86400
+        self.retry_seconds = retry_hours * 3600
+        self.workers = workers
+        # 用于后台解析的爬虫，未设置时首次解析时创建
+        self.crawler = None
+
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self._pending = set()
+        # 院校名称 -> 最近一次解析失败的时间（只在内存中保存）
+        self._failed: Dict[str, float] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+
+        self.stats = {
+            'hits': 0,
+            'stale_hits': 0,
+            'misses': 0,
+            'resolved': 0,
+            'failed': 0
+        }
+
+    def _get_crawler(self):
+        """延迟创建爬虫"""
+        if self.crawler is None:
+            from models.data_crawler import UniversityDataCrawler
+            self.crawler = UniversityDataCrawler()
+        return self.crawler
+
+    def load(self) -> int:
+        """从索引文件加载，返回条目数量"""
+        with self._lock:
+            if self._loaded:
+                return len(self._index)
+            try:
+                if os.path.exists(self.index_file):
+                    with open(self.index_file, 'r', encoding='utf-8') as f:
+                        websites = json.load(f).get('websites', {})
+                    # 丢弃早期版本保存的推测域名
+                    self._index = {name: entry for name, entry in websites.items()
+                                   if not self._is_guess(name, entry['url'])}
+                    logger.info(f"已加载{len(self._index)}所院校的官网索引")
+            except Exception as e:
+                logger.warning(f"加载官网索引失败: {e}")
+                self._index = {}
+            self._loaded = True
+            return len(self._index)
+
+    def save(self):
+        """原子写入索引文件"""
+        with self._lock:
+            payload = {
+                'updated_at': datetime.now().isoformat(),
+                'count': len(self._index),
+                'websites': dict(self._index)
+            }
+        with self._save_lock:
+            atomic_write_json(self.index_file, payload)
+
+    @staticmethod
+    def _is_guess(name: str, url: str) -> bool:
+        """官网地址是否只是根据名称推测的域名"""
+        return url != KNOWN_WEBSITES.get(name) and url == guess_university_website(name)
+
+    def _is_stale(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry.get('resolved_at', 0) > self.ttl_seconds
+
+    def get(self, name: str) -> Optional[str]:
+        """查询索引中的官网（不论是否过期）"""
+        if not self._loaded:
+            self.load()
+        entry = self._index.get(name)
+        return entry['url'] if entry else None
+
+    def resolve(self, name: str, uni_data: Optional[Dict[str, Any]] = None) -> str:
+        """
+        获取院校官网
+
+        索引命中时直接返回（已过期的同时在后台重新解析）；否则立即返回预定义映射、
+        院校数据中的官网或推测的域名，并在后台解析该院校，结果写入索引供后续请求使用
+        """
+        if not self._loaded:
+            self.load()
+
+        entry = self._index.get(name)
+        if entry is not None:
+            if self._is_stale(entry):
+                self.stats['stale_hits'] += 1
+                self.resolve_in_background([name])
+            else:
+                self.stats['hits'] += 1
+            return entry['url']
+
+        self.stats['misses'] += 1
+        self.resolve_in_background([name])
+        return (KNOWN_WEBSITES.get(name)
+                or (uni_data or {}).get('website')
+                or guess_university_website(name))
+
+    def resolve_in_background(self, names: List[str]):
+        """在后台线程中解析院校官网，每所院校完成后保存索引"""
+        now = time.time()
+        with self._lock:
+            names = [name for name in names if name not in self._pending
+                     and now - self._failed.get(name, 0) >= self.retry_seconds]
+            self._pending.update(names)
+            if not names:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                    thread_name_prefix="website-resolver")
+            executor = self._executor
+
+        for name in names:
+            executor.submit(self._resolve_one, name)
+
+    def _resolve_one(self, name: str):
+        """通过搜索引擎或预定义映射解析一所院校的官网，找不到时不写入索引"""
+        try:
+            url = self._get_crawler().find_university_website(name)
+            if url:
+                with self._lock:
+                    self._index[name] = {'url': url, 'resolved_at': time.time()}
+                    self._failed.pop(name, None)
+                self.stats['resolved'] += 1
+                self.save()
+                logger.info(f"已解析 {name} 的官网: {url}")
+            else:
+                with self._lock:
+                    self._failed[name] = time.time()
+                self.stats['failed'] += 1
+                logger.info(f"未找到 {name} 的官网，{self.retry_seconds / 3600:g}小时后再试")
+        except Exception as e:
+            with self._lock:
+                self._failed[name] = time.time()
+            self.stats['failed'] += 1
+            logger.warning(f"后台解析{name}官网失败: {e}")
+        finally:
+            with self._lock:
+                self._pending.discard(name)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取索引统计"""
+        with self._lock:
+            stale = sum(1 for entry in self._index.values() if self._is_stale(entry))
+            return {
+                **self.stats,
+                'entries': len(self._index),
+                'stale': stale,
+                'pending': len(self._pending),
+                'failed_recently': len(self._failed),
+                'ttl_days': round(self.ttl_seconds / 86400, 2),
+                'index_file': self.index_file
+            }
+
+
+# 全局实例
+website_resolver = UniversityWebsiteResolver()
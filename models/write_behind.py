@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+延迟写入（write-behind）持久化模块
+数据变化时只在内存中标记为待写入，由后台线程在一个刷新间隔后批量写盘：
+同一间隔内的多次修改合并为一次写入，写入使用临时文件加重命名保证原子性，
+进程崩溃最多丢失一个刷新间隔内的修改，请求线程不再等待磁盘
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL = 2.0
+
+# 序列化时数据被其他线程修改的重试次数
+SERIALIZE_RETRIES = 3
+
+
+def atomic_write_json(path: str, data: Any, indent: Optional[int] = 2):
+    """原子写入JSON文件：先写同目录下的临时文件并刷盘，再重命名覆盖"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_file = f"{path}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, path)
+
+
+class _Target:
+    """一个持久化目标"""
+
+    def __init__(self, path: str, source: Callable[[], Any], description: str):
+        self.path = path
+        self.source = source
+        self.description = description
+
+
+class WriteBehindPersister:
+    """延迟写入持久化"""
+
+    def __init__(self, flush_interval: float = DEFAULT_FLUSH_INTERVAL, name: str = "write-behind"):
+        """
+        Args:
+            flush_interval: 刷新间隔（秒），第一次修改后等待该时间再写入，期间的修改合并写入
+            name: 后台线程名称
+        """
+        self.flush_interval = flush_interval
+        self.name = name
+
+        self._targets: Dict[str, _Target] = {}
+        self._dirty: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.stats = {
+            'marks': 0,
+            'flushes': 0,
+            'writes': 0,
+            'errors': 0,
+            'last_flush_at': None,
+            'last_flush_ms': None
+        }
+
+        _persisters.add(self)
+
+    def register(self, key: str, path: str, source: Callable[[], Any], description: str = None):
+        """
+        注册持久化目标
+
+        Args:
+            key: 目标标识
+            path: 写入的文件路径
+            source: 返回当前数据的函数（写入时调用，取得最新数据）
+            description: 日志中的描述
+        """
+        self._targets[key] = _Target(path, source, description or key)
+
+    def mark_dirty(self, key: str):
+        """标记目标待写入（只修改内存状态，立即返回）"""
+        if key not in self._targets:
+            raise KeyError(f"未注册的持久化目标: {key}")
+        with self._lock:
+            self._dirty.setdefault(key, time.time())
+            self.stats['marks'] += 1
+        self._ensure_started()
+        self._wakeup.set()
+
+    @property
+    def pending(self) -> int:
+        """待写入的目标数量"""
+        return len(self._dirty)
+
+    def _ensure_started(self):
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._stop.clear()
+                    self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+                    self._thread.start()
+
+    def _loop(self):
+        """后台刷新循环：有修改时等待一个刷新间隔合并后续修改，再批量写入"""
+        while not self._stop.is_set():
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._stop.is_set():
+                break
+            self._stop.wait(self.flush_interval)
+            self.flush()
+
+    def flush(self, keys: Iterable[str] = None) -> int:
+        """
+        立即写入待写入的目标
+
+        Args:
+            keys: 只写入指定目标，默认全部
+
+        Returns:
+            写入的文件数量
+        """
+        with self._flush_lock:
+            with self._lock:
+                selected = [key for key in self._dirty if keys is None or key in keys]
+                for key in selected:
+                    del self._dirty[key]
+
+            if not selected:
+                return 0
+
+            started = time.time()
+            written = 0
+            for key in selected:
+                target = self._targets[key]
+                try:
+                    self._write(target)
+                    written += 1
+                except Exception as e:
+                    # 写入失败时重新标记，下一个间隔重试
+                    self.stats['errors'] += 1
+                    logger.error(f"保存{target.description}失败: {e}")
+                    with self._lock:
+                        self._dirty.setdefault(key, time.time())
+                    self._wakeup.set()
+
+            self.stats['flushes'] += 1
+            self.stats['writes'] += written
+            self.stats['last_flush_at'] = time.strftime("%Y-%m-%d %H:%M:%S")
+            self.stats['last_flush_ms'] = round((time.time() - started) * 1000, 1)
+            logger.debug(f"延迟写入完成: {written}个文件")
+            return written
+
+    def _write(self, target: _Target):
+        """序列化并原子写入一个目标"""
+        for attempt in range(SERIALIZE_RETRIES):
+            try:
+                data = target.source()
+                # 浅拷贝顶层字典，缩小与请求线程并发修改的窗口
+                if isinstance(data, dict):
+                    data = dict(data)
+                atomic_write_json(target.path, data)
+                return
+            except RuntimeError:
+                # 序列化期间数据被其他线程修改（dictionary changed size during iteration）
+                if attempt == SERIALIZE_RETRIES - 1:
+                    raise
+                time.sleep(0.01)
+
+    def close(self):
+        """停止后台线程并写入全部待写入的数据"""
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.flush_interval + 5)
+        self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取持久化统计"""
+        return {
+            **self.stats,
+            'pending': self.pending,
+            'flush_interval': self.flush_interval,
+            'targets': {key: target.path for key, target in self._targets.items()}
+        }
+
+
+# 全部持久化实例（进程退出前写入未保存的数据）
+_persisters = weakref.WeakSet()
+
+@atexit.register
+def _flush_all_persisters():
+    """进程退出前写入全部待写入的数据"""
+    for persister in list(_persisters):
+        try:
+            persister.close()
+        except Exception as e:
+            logger.error(f"退出前写入数据失败: {e}")
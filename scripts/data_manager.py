@@ -198,7 +198,16 @@ class DataManager:
                 sorted_provinces = sorted(by_province.items(), key=lambda x: x[1], reverse=True)
                 for province, count in sorted_provinces[:10]:
                     print(f"     {province}: {count} 所")
-            
+
+            # 分数线覆盖
+            score_coverage = stats.get('score_coverage', {})
+            if score_coverage:
+                print(f"\n   分数线覆盖:")
+                print(f"     有分数线的院校: {score_coverage.get('universities_with_scores', 0)} 所")
+                print(f"     分数线条数: {score_coverage.get('score_entries', 0)}")
+                print(f"     覆盖省份: {', '.join(score_coverage.get('by_province', {}))}")
+                print(f"     覆盖年份: {', '.join(str(year) for year in score_coverage.get('years', []))}")
+
             # 获取顶尖院校
             top_unis = self.db.get_top_universities(limit=10)
             if top_unis:
@@ -315,12 +324,114 @@ class DataManager:
         print(f"\n✅ 清理完成，删除了 {cleaned_count} 个文件")
         return True
 
+    def build_location_index(self, refresh=False):
+        """构建院校地理位置索引"""
+        print("=" * 60)
+        print("构建院校地理位置索引...")
+        print("=" * 60)
+        
+        try:
+            from models.location_resolver import location_resolver
+            
+            if not self.db:
+                self.db = UniversityDatabase()
+            
+            result = location_resolver.build(self.db.get_all_universities(), refresh=refresh)
+            
+            print(f"\n✅ 地理位置索引构建完成: {location_resolver.index_file}")
+            print(f"   索引院校总数: {result['total']}")
+            print(f"   直接采用院校数据: {result['from_data']}")
+            print(f"   AI/名称推断解析: {result['resolved']}")
+            print(f"   无法解析: {result['unresolved']}")
+            
+            return True
+            
+        except Exception as e:
+            print(f"❌ 构建地理位置索引失败: {e}")
+            return False
+
+    def warmup_caches(self, phases=None, years=None, provinces=None, workers=4, restart=False):
+        """预热分数线缓存"""
+        print("=" * 60)
+        print("预热分数线缓存...")
+        print("=" * 60)
+        
+        try:
+            from models.cache_warmer import cache_warmer
+            
+            if not self.db:
+                self.db = UniversityDatabase()
+            
+            def report(status):
+                finished = status['done'] + status['skipped']
+                print(f"   [{finished}/{status['total']}] {status['task']} "
+                      f"{status['result']} 预计剩余 {status.get('eta_seconds', 0):.0f} 秒")
+            
+            result = cache_warmer.run(
+                self.db.get_all_universities(),
+                phases=phases, years=years, provinces=provinces,
+                workers=workers, resume=not restart, on_progress=report
+            )
+            
+            print(f"\n✅ 缓存预热完成，耗时 {result['elapsed_seconds']} 秒")
+            print(f"   切片总数: {result['total']}")
+            print(f"   本次完成: {result['done']}")
+            print(f"   跳过已完成: {result['skipped']}")
+            print(f"   失败: {result['failed']}")
+            print(f"   进度文件: {cache_warmer.progress_file}")
+            
+            return result['failed'] == 0
+            
+        except KeyboardInterrupt:
+            print(f"\n⚠️  预热已中断，重新运行 warmup 命令将从中断处继续")
+            return False
+        except Exception as e:
+            print(f"❌ 缓存预热失败: {e}")
+            return False
+
+    def migrate_storage(self, sqlite_file, overwrite=False):
+        """将JSON院校数据迁移到SQLite存储"""
+        print("=" * 60)
+        print(f"迁移院校数据到SQLite: {sqlite_file}")
+        print("=" * 60)
+        
+        try:
+            from models.university_storage import SQLiteUniversityStorage, migrate_to_sqlite
+            
+            if os.path.exists(sqlite_file):
+                if not overwrite:
+                    print(f"❌ {sqlite_file} 已存在，使用 --overwrite 覆盖")
+                    return False
+                for suffix in ('', '-wal', '-shm'):
+                    if os.path.exists(sqlite_file + suffix):
+                        os.remove(sqlite_file + suffix)
+            
+            if not self.db:
+                self.db = UniversityDatabase({'storage': 'json'})
+            
+            result = migrate_to_sqlite(
+                (self.db.universities, self.db.admission_scores, self.db.rankings),
+                SQLiteUniversityStorage(sqlite_file)
+            )
+            
+            print(f"\n✅ 迁移完成")
+            print(f"   院校: {result['universities']} 所")
+            print(f"   录取分数线: {result['admission_scores']} 条")
+            print(f"   排名: {result['rankings']} 条")
+            print(f"   设置环境变量 UNIVERSITY_STORAGE=sqlite 启用SQLite存储")
+            
+            return True
+            
+        except Exception as e:
+            print(f"❌ 迁移失败: {e}")
+            return False
+
 def main():
     """主函数"""
     parser = argparse.ArgumentParser(description='高考志愿填报系统 - 数据管理工具')
     
     parser.add_argument('command', choices=[
-        'update', 'validate', 'stats', 'export', 'clean', 'all'
+        'update', 'validate', 'stats', 'export', 'clean', 'locations', 'warmup', 'migrate', 'all'
     ], help='执行的命令')
     
     parser.add_argument('--format', choices=['json', 'excel'], default='json',
@@ -329,6 +440,30 @@ def main():
     parser.add_argument('--days', type=int, default=7,
                        help='保留天数 (仅用于clean命令)')
     
+    parser.add_argument('--refresh', action='store_true',
+                       help='重新解析全部院校 (仅用于locations命令)')
+    
+    parser.add_argument('--phases', default='ai',
+                       help='预热阶段，逗号分隔: professional,ai (仅用于warmup命令)')
+    
+    parser.add_argument('--years', default='2023',
+                       help='预热年份，逗号分隔 (仅用于warmup命令)')
+    
+    parser.add_argument('--provinces', default='',
+                       help='预热省份，逗号分隔，默认全部 (仅用于warmup命令)')
+    
+    parser.add_argument('--workers', type=int, default=4,
+                       help='并行切片数量 (仅用于warmup命令)')
+    
+    parser.add_argument('--restart', action='store_true',
+                       help='忽略已保存的进度从头预热 (仅用于warmup命令)')
+    
+    parser.add_argument('--sqlite-file', default=os.path.join('data', 'universities.db'),
+                       help='SQLite数据库文件 (仅用于migrate命令)')
+    
+    parser.add_argument('--overwrite', action='store_true',
+                       help='覆盖已存在的SQLite数据库 (仅用于migrate命令)')
+    
     args = parser.parse_args()
     
     manager = DataManager()
@@ -354,6 +489,21 @@ def main():
     elif args.command == 'clean':
         success = manager.clean_old_files(args.days)
         
+    elif args.command == 'locations':
+        success = manager.build_location_index(args.refresh)
+        
+    elif args.command == 'warmup':
+        success = manager.warmup_caches(
+            phases=[phase for phase in args.phases.split(',') if phase],
+            years=[int(year) for year in args.years.split(',') if year],
+            provinces=[province for province in args.provinces.split(',') if province] or None,
+            workers=args.workers,
+            restart=args.restart
+        )
+        
+    elif args.command == 'migrate':
+        success = manager.migrate_storage(args.sqlite_file, args.overwrite)
+        
     elif args.command == 'all':
         success = (
             manager.update_all_data() and
@@ -668,7 +668,7 @@ function createUniversityCard(university, userProvince, userSubject) {
                     <div class="row align-items-center">
                         <div class="col-md-4">
                             <label for="provinceSelect_${uniqueId}" class="form-label">选择查询省份：</label>
-                            <select id="provinceSelect_${uniqueId}" class="form-select" onchange="loadScoresByProvinceCard('${name}', '${uniqueId}')">
+                            <select id="provinceSelect_${uniqueId}" class="form-select" data-university="${name}" onchange="loadScoresByProvinceCard('${name}', '${uniqueId}')">
                                 <option value="">请选择省份</option>
                             </select>
                         </div>
@@ -1324,19 +1324,7 @@ async function loadScoresByProvinceModal(universityName, modalUniqueId) {
     `;
     
     try {
-        const response = await fetch(`/api/university_scores_by_province/${encodeURIComponent(universityName)}`, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json'
-            },
-            body: JSON.stringify({
-                province: selectedProvince,
-                subject: selectedSubject,
-                year: selectedYear
-            })
-        });
-        
-        const result = await response.json();
+        const result = await fetchProvinceScores(universityName, selectedProvince, selectedSubject, selectedYear);
         
         if (result.success) {
             const data = result.data;
@@ -1902,19 +1890,7 @@ async function performScoreQuery(universityName, province, subject, year) {
     `;
     
     try {
-        const response = await fetch(`/api/university_scores_by_province/${encodeURIComponent(universityName)}`, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json'
-            },
-            body: JSON.stringify({
-                province: province,
-                subject: subject,
-                year: year
-            })
-        });
-        
-        const result = await response.json();
+        const result = await fetchProvinceScores(universityName, province, subject, year);
         
         if (result.success && result.data && result.data.scores) {
             displayScoreQueryResults(universityName, province, subject, year, result.data);
@@ -2156,19 +2132,7 @@ async function loadScoresByProvinceCard(universityName, uniqueId) {
     `;
     
     try {
-        const response = await fetch(`/api/university_scores_by_province/${encodeURIComponent(universityName)}`, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json'
-            },
-            body: JSON.stringify({
-                province: selectedProvince,
-                subject: selectedSubject,
-                year: selectedYear
-            })
-        });
-        
-        const result = await response.json();
+        const result = await fetchProvinceScores(universityName, selectedProvince, selectedSubject, selectedYear);
         
         if (result.success) {
             const data = result.data;
@@ -2249,6 +2213,91 @@ async function loadScoresByProvinceCard(universityName, uniqueId) {
     }
 }
 
+// 院校分数线缓存：键为 院校|省份|科目|年份，值为与单个查询接口相同格式的结果
+const provinceScoresCache = new Map();
+
+function provinceScoresKey(universityName, province, subject, year) {
+    return `${universityName}|${province}|${subject}|${year}`;
+}
+
+// 获取院校在指定省份的分数线（优先使用批量预取的结果）
+async function fetchProvinceScores(universityName, province, subject, year) {
+    const key = provinceScoresKey(universityName, province, subject, year);
+    if (provinceScoresCache.has(key)) {
+        return provinceScoresCache.get(key);
+    }
+    
+    const response = await fetch(`/api/university_scores_by_province/${encodeURIComponent(universityName)}`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json'
+        },
+        body: JSON.stringify({
+            province: province,
+            subject: subject,
+            year: year
+        })
+    });
+    
+    const result = await response.json();
+    if (result.success) {
+        provinceScoresCache.set(key, result);
+    }
+    return result;
+}
+
+// 批量预取分数线，queries 为 [{university_name, province, subject, year}]
+async function prefetchProvinceScores(queries) {
+    const pending = queries.filter(query =>
+        query.province && !provinceScoresCache.has(provinceScoresKey(query.university_name, query.province, query.subject, query.year))
+    );
+    if (pending.length === 0) return;
+    
+    try {
+        const response = await fetch('/api/university_scores_by_province/batch', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({ queries: pending })
+        });
+        
+        const result = await response.json();
+        if (!result.success) return;
+        
+        result.results.forEach(item => {
+            if (!item.success) return;
+            provinceScoresCache.set(
+                provinceScoresKey(item.university_name, item.province, item.subject, item.year),
+                { success: true, data: { scores: item.scores, last_updated: item.last_updated } }
+            );
+        });
+        console.log(`已批量预取 ${pending.length} 条分数线`);
+    } catch (error) {
+        // 预取失败不影响单个查询
+        console.warn('批量预取分数线失败:', error);
+    }
+}
+
+// 按推荐卡片当前的选择器状态预取分数线
+function prefetchCardProvinceScores(provinceSelectors) {
+    const queries = [];
+    provinceSelectors.forEach(provinceSelect => {
+        const uniqueId = provinceSelect.id.replace('provinceSelect_', '');
+        const subjectSelect = document.getElementById(`subjectSelect_${uniqueId}`);
+        const yearSelect = document.getElementById(`yearSelect_${uniqueId}`);
+        if (!provinceSelect.dataset.university || !subjectSelect || !yearSelect) return;
+        
+        queries.push({
+            university_name: provinceSelect.dataset.university,
+            province: provinceSelect.value,
+            subject: subjectSelect.value,
+            year: parseInt(yearSelect.value)
+        });
+    });
+    return prefetchProvinceScores(queries);
+}
+
 // 初始化推荐卡片中的省份选择器
 async function initCardProvinceSelectors() {
     try {
@@ -2325,6 +2374,9 @@ async function initCardProvinceSelectors() {
             
             console.log('推荐卡片省份选择器初始化完成');
             
+            // 一次批量请求预取所有卡片的分数线
+            prefetchCardProvinceScores(provinceSelectors);
+            
         } else {
             console.error('获取省份列表失败:', result.error);
             // 使用备用方案